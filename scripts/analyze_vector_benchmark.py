@@ -18,6 +18,8 @@ except ModuleNotFoundError as exc:
         "not allowed to silently degrade."
     ) from exc
 
+from sample_store import iter_samples, resolve_samples_path
+
 
 PROJECT_ROOT = Path(__file__).resolve().parents[1]
 QUALIFICATION_ROOT = PROJECT_ROOT / ".axon" / "qualification-runs"
@@ -114,17 +116,16 @@ def number(value: Any, default: float = 0.0) -> float:
         return default
 
 
+# Only these sample sections feed the analysis; columnar runs never decode
+# the sql/runtime_status payloads.
+SAMPLE_PREFIXES = ("timestamp", "elapsed_seconds", "pid", "proc", "gpu", "cockpit")
+
+
 def load_samples(samples_path: Path) -> pl.DataFrame:
     rows: list[dict[str, Any]] = []
     if not samples_path.exists():
         return pl.DataFrame()
-    for line in samples_path.read_text().splitlines():
-        if not line.strip():
-            continue
-        try:
-            sample = json.loads(line)
-        except json.JSONDecodeError:
-            continue
+    for sample in iter_samples(samples_path, prefixes=SAMPLE_PREFIXES):
         cockpit = nested(sample, "cockpit", default={})
         graph_queue = nested(cockpit, "graph_projection_queue", default={})
         gpu = nested(sample, "gpu", default={})
@@ -714,7 +715,7 @@ def summarize_batches(df: pl.DataFrame) -> dict[str, Any]:
 
 
 def build_report(run_dir: Path, benchmark_db: Path, thresholds: Thresholds) -> dict[str, Any]:
-    samples = load_samples(run_dir / "samples.ndjson")
+    samples = load_samples(resolve_samples_path(run_dir / "samples"))
     summary = read_json(run_dir / "summary.json")
     batches = load_batch_runs(benchmark_db)
     return {
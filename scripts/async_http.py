@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""HTTP/1.1 response parsing over raw ``asyncio`` streams (stdlib only).
+
+Shared by the stdio proxy (``mcp-stdio-proxy.py``), which streams bodies to
+stdout piece by piece, and the load engine (``mcp_async_load.py``), which
+reads them whole.
+
+Contract:
+- ``read_http_head`` returns the status, reason and headers; a malformed
+  status line raises ``ConnectionResetError`` like a dropped connection.
+- ``iter_http_body`` yields de-chunked pieces of at most ``read_size`` bytes
+  as they arrive, for ``Content-Length``, chunked and read-to-close framing.
+  Header names are looked up in lower case, which ``email.message.Message``
+  matches case-insensitively. A body cut short raises
+  ``asyncio.IncompleteReadError``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import email.message
+from typing import AsyncIterator, Mapping
+
+READ_SIZE = 64 * 1024
+
+
+async def read_http_head(
+    reader: asyncio.StreamReader,
+) -> tuple[int, str, email.message.Message]:
+    status_line = (await reader.readuntil(b"\r\n")).decode("latin-1").rstrip("\r\n")
+    parts = status_line.split(" ", 2)
+    if len(parts) < 2 or not parts[0].startswith("HTTP/"):
+        raise ConnectionResetError(f"malformed HTTP status line: {status_line!r}")
+    status = int(parts[1])
+    reason = parts[2] if len(parts) > 2 else ""
+    headers = email.message.Message()
+    while True:
+        line = await reader.readuntil(b"\r\n")
+        if line == b"\r\n":
+            break
+        name, _, value = line.decode("latin-1").partition(":")
+        headers[name.strip()] = value.strip()
+    return status, reason, headers
+
+
+async def iter_http_body(
+    reader: asyncio.StreamReader,
+    status: int,
+    headers: Mapping[str, str] | email.message.Message,
+    *,
+    idle_timeout_s: float | None = None,
+    read_size: int = READ_SIZE,
+) -> AsyncIterator[bytes]:
+    """Yield the response body as it arrives; every read waits at most ``idle_timeout_s``."""
+
+    async def bounded(read):
+        return await asyncio.wait_for(read, idle_timeout_s)
+
+    async def exactly(remaining: int) -> AsyncIterator[bytes]:
+        while remaining:
+            piece = await bounded(reader.read(min(remaining, read_size)))
+            if not piece:
+                raise asyncio.IncompleteReadError(b"", remaining)
+            remaining -= len(piece)
+            yield piece
+
+    if "chunked" in (headers.get("transfer-encoding") or "").lower():
+        while True:
+            size_line = await bounded(reader.readuntil(b"\r\n"))
+            size = int(size_line.split(b";", 1)[0].strip(), 16)
+            if size == 0:
+                # Trailers (usually none) end with an empty line.
+                while await bounded(reader.readuntil(b"\r\n")) != b"\r\n":
+                    pass
+                return
+            async for piece in exactly(size):
+                yield piece
+            await bounded(reader.readexactly(2))
+    length = headers.get("content-length")
+    if length is not None:
+        async for piece in exactly(int(length)):
+            yield piece
+    elif not (status in {204, 304} or 100 <= status < 200):
+        while piece := await bounded(reader.read(read_size)):
+            yield piece
+
+
+async def read_http_response(
+    reader: asyncio.StreamReader,
+) -> tuple[int, str, email.message.Message, bytes]:
+    status, reason, headers = await read_http_head(reader)
+    body = b"".join([piece async for piece in iter_http_body(reader, status, headers)])
+    return status, reason, headers, body
@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+"""Benchmark the Memgraph cypherl builder on a synthetic publication.
+
+Generates a graph-shaped publication with the exporter's schema (default
+5M nodes, 2 edges per node), builds the import file with the streaming
+encoder for each ``--workers`` value and, with ``--with-row-encoder``, with
+the historical row encoder too. Every output is hashed; the run fails if the
+encoders disagree.
+
+Usage:
+    python3 scripts/benchmark_memgraph_cypherl.py
+    python3 scripts/benchmark_memgraph_cypherl.py --nodes 500000 --workers 1,4,8 --with-row-encoder
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import sys
+import time
+from pathlib import Path
+
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
+
+import memgraph_build_cypherl as mb
+
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+BENCHMARK_ROOT = PROJECT_ROOT / ".axon" / "benchmarks"
+LABELS = ["Symbol", "Symbol", "Symbol", "IndexedFile", "Requirement", "Decision", "Evidence"]
+RELATIONS = ["CALLS", "CALLS", "CONTAINS", "IMPORTS", "SOLVES", "related to"]
+KINDS = ["function", "struct", "method", "trait", None]
+PROJECTS = ["AXO", "BKS", "LAB"]
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--nodes", type=int, default=5_000_000)
+    parser.add_argument("--edges-per-node", type=int, default=2)
+    parser.add_argument("--batch-size", type=int, default=500)
+    parser.add_argument("--workers", default="1,4,8", help="Comma-separated worker counts for the streaming encoder.")
+    parser.add_argument("--with-row-encoder", action="store_true", help="Also time the historical row encoder.")
+    parser.add_argument("--out-dir", type=Path, default=None, help="Default: .axon/benchmarks/<stamp>-memgraph-cypherl")
+    parser.add_argument("--keep-output", action="store_true", help="Keep the generated cypherl files.")
+    return parser.parse_args()
+
+
+def cycle(values: list, count: int, stride: int = 1) -> pa.Array:
+    positions = pc.remainder(pc.multiply(pa.array(range(count), pa.int64()), stride), len(values))
+    return pc.take(pa.array(values), positions)
+
+
+def prefixed(prefix: str, numbers: pa.Array) -> pa.Array:
+    return pc.binary_join_element_wise(prefix, pc.cast(numbers, pa.string()), "")
+
+
+def write_synthetic_publication(pub_dir: Path, nodes: int, edges_per_node: int) -> dict[str, int]:
+    pub_dir.mkdir(parents=True, exist_ok=True)
+    ids = pa.array(range(nodes), pa.int64())
+    titles = pc.binary_join_element_wise("fn handle_", pc.cast(ids, pa.string()), "(req: &Request<'_>)\n", "")
+    node_table = pa.table(
+        {
+            "id": prefixed("sym:", ids),
+            "label": cycle(LABELS, nodes),
+            "project_code": cycle(PROJECTS, nodes, 7),
+            "name": prefixed("handle_", ids),
+            "title": pc.if_else(pc.equal(pc.remainder(ids, 3), 0), titles, pa.nulls(nodes, pa.string())),
+            "kind": cycle(KINDS, nodes, 3),
+            "status": cycle(["current", None, "accepted"], nodes, 11),
+        }
+    )
+    pq.write_table(node_table, pub_dir / "nodes.parquet")
+    edge_count = nodes * edges_per_node
+    sources = pc.remainder(pa.array(range(edge_count), pa.int64()), nodes)
+    targets = pc.remainder(pc.add(pc.multiply(sources, 31), 17), nodes)
+    edge_table = pa.table(
+        {
+            "from_id": prefixed("sym:", sources),
+            "to_id": prefixed("sym:", targets),
+            "relation_type": cycle(RELATIONS, edge_count, 5),
+            "project_code": cycle(PROJECTS, edge_count, 13),
+        }
+    )
+    pq.write_table(edge_table, pub_dir / "edges.parquet")
+    manifest = {
+        "publication_id": "pub-benchmark",
+        "publication_kind": "memgraph_human_ist_soll_projection",
+        "human_only": True,
+        "llm_contract": "use_axon_mcp_not_memgraph",
+        "row_counts": {"nodes": nodes, "edges": edge_count},
+    }
+    (pub_dir / "manifest.json").write_text(json.dumps(manifest, indent=2))
+    return manifest["row_counts"]
+
+
+def file_sha256(path: Path) -> str:
+    digest = hashlib.sha256()
+    with path.open("rb") as handle:
+        for chunk in iter(lambda: handle.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def run_build(pub_dir: Path, out_path: Path, batch_size: int, *, workers: int, streaming: bool) -> dict:
+    started = time.perf_counter()
+    summary = mb.build_import(
+        pub_dir,
+        out_path,
+        batch_size,
+        False,
+        PROJECT_ROOT / "queries" / "memgraph",
+        workers=workers,
+        streaming=streaming,
+    )
+    wall_s = time.perf_counter() - started
+    rows = summary["nodes"] + summary["edges"]
+    return {
+        "encoder": summary["encoder"],
+        "workers": summary["workers"],
+        "wall_s": round(wall_s, 2),
+        "rows_per_s": round(rows / wall_s) if wall_s else None,
+        "output_bytes": out_path.stat().st_size,
+        "sha256": file_sha256(out_path),
+    }
+
+
+def main() -> int:
+    args = parse_args()
+    worker_counts = [int(part) for part in args.workers.split(",") if part.strip()]
+    if args.nodes <= 0 or not worker_counts or min(worker_counts) <= 0:
+        raise SystemExit("--nodes and --workers must be positive")
+    out_dir = args.out_dir or BENCHMARK_ROOT / f"{time.strftime('%Y%m%dT%H%M%SZ', time.gmtime())}-memgraph-cypherl"
+    pub_dir = out_dir / "publication"
+
+    started = time.perf_counter()
+    row_counts = write_synthetic_publication(pub_dir, args.nodes, args.edges_per_node)
+    generate_s = round(time.perf_counter() - started, 2)
+
+    runs = []
+    if args.with_row_encoder:
+        runs.append(run_build(pub_dir, out_dir / "rows.cypherl", args.batch_size, workers=1, streaming=False))
+    for workers in worker_counts:
+        out_path = out_dir / f"streaming-{workers}.cypherl"
+        runs.append(run_build(pub_dir, out_path, args.batch_size, workers=workers, streaming=True))
+    if not args.keep_output:
+        for path in out_dir.glob("*.cypherl"):
+            path.unlink()
+
+    identical = len({run["sha256"] for run in runs}) == 1
+    baseline = runs[0]["wall_s"]
+    for run in runs:
+        run["speedup_vs_first"] = round(baseline / run["wall_s"], 2) if run["wall_s"] else None
+    report = {
+        "publication_dir": str(pub_dir),
+        "row_counts": row_counts,
+        "batch_size": args.batch_size,
+        "generate_s": generate_s,
+        "byte_identical": identical,
+        "runs": runs,
+    }
+    (out_dir / "report.json").write_text(json.dumps(report, indent=2))
+    print(json.dumps(report, indent=2))
+    if not identical:
+        print("encoders produced different output", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+"""Benchmark the on-disk encoding of Memgraph publication files.
+
+Generates exporter-shaped nodes/edges tables with realistic ids (project ::
+path :: symbol) and labels in contiguous blocks, as the exporter's per-table
+branches produce them, in heap order — every fifth row re-inserted at the
+end, the way updated rows move in PostgreSQL — and writes them once with pyarrow's
+defaults in heap order (the historical exporter) and once per
+``--row-group-rows`` value with the publication encoding
+(`memgraph_build_cypherl.parquet_write_options`, sorted like the exporter's
+COPY). For each file it reports the size, the write time, a full
+`iter_batches` scan (what the builder and `iter_rows` do) and a `hash_table`
+pass (what every incremental diff does).
+
+Usage:
+    python3 scripts/benchmark_memgraph_parquet.py
+    python3 scripts/benchmark_memgraph_parquet.py --nodes 500000 --row-group-rows 65536,131072,524288
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import time
+from pathlib import Path
+
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
+
+import memgraph_build_cypherl as mb
+import memgraph_export_publication as me
+from benchmark_memgraph_cypherl import BENCHMARK_ROOT, KINDS, LABELS, PROJECTS, RELATIONS, cycle, prefixed
+
+SYMBOLS_PER_FILE = 40
+MODULES = 97
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--nodes", type=int, default=2_000_000)
+    parser.add_argument("--edges-per-node", type=int, default=2)
+    parser.add_argument(
+        "--row-group-rows",
+        default=str(me.ROW_GROUP_ROWS),
+        help="Comma-separated row-group sizes to try with the publication encoding.",
+    )
+    parser.add_argument("--out-dir", type=Path, default=None, help="Default: .axon/benchmarks/<stamp>-memgraph-parquet")
+    parser.add_argument("--keep-output", action="store_true", help="Keep the generated Parquet files.")
+    return parser.parse_args()
+
+
+def symbol_ids(numbers: pa.Array) -> pa.Array:
+    """`<project>::src/module_<m>/file_<f>.rs::handle_<n>` — ids sharing long prefixes per file."""
+    files = pc.divide(numbers, SYMBOLS_PER_FILE)
+    return pc.binary_join_element_wise(
+        cycle(PROJECTS, len(numbers), 7),
+        prefixed("::src/module_", pc.remainder(files, MODULES)),
+        prefixed("/file_", files),
+        prefixed(".rs::handle_", numbers),
+        "",
+    )
+
+
+def label_blocks(count: int) -> pa.Array:
+    """LABELS in contiguous blocks sized by their share of LABELS."""
+    positions = pc.divide(pc.multiply(pa.array(range(count), pa.int64()), len(LABELS)), count)
+    return pc.take(pa.array(LABELS), positions)
+
+
+def heap_order(count: int) -> pa.Array:
+    """Row positions in heap order: rows updated since insertion sit at the end."""
+    positions = pa.array(range(count), pa.int64())
+    updated = pc.equal(pc.remainder(positions, 5), 0)
+    return pa.concat_arrays([positions.filter(pc.invert(updated)), positions.filter(updated)])
+
+
+def synthetic_tables(nodes: int, edges_per_node: int) -> dict[str, pa.Table]:
+    numbers = pa.array(range(nodes), pa.int64())
+    ids = symbol_ids(numbers)
+    projects = cycle(PROJECTS, nodes, 7)
+    node_table = pa.table(
+        {
+            "id": ids,
+            "label": label_blocks(nodes),
+            "project_code": projects,
+            "name": prefixed("handle_", numbers),
+            "title": pc.if_else(pc.equal(pc.remainder(numbers, 9), 0), prefixed("Handle request ", numbers), None),
+            "kind": cycle(KINDS, nodes, 3),
+            "status": cycle(["current", None, "accepted"], nodes, 11),
+        }
+    )
+    edge_count = nodes * edges_per_node
+    sources = pc.remainder(pa.array(range(edge_count), pa.int64()), nodes)
+    # Mostly calls into the same or a neighbouring file.
+    targets = pc.remainder(pc.add(sources, pc.remainder(pc.multiply(sources, 31), 2 * SYMBOLS_PER_FILE)), nodes)
+    edge_table = pa.table(
+        {
+            "from_id": pc.take(ids, sources),
+            "to_id": pc.take(ids, targets),
+            "relation_type": cycle(RELATIONS, edge_count, 5),
+            "project_code": pc.take(projects, sources),
+        }
+    )
+    return {
+        "node": node_table.take(heap_order(nodes)),
+        "edge": edge_table.take(heap_order(edge_count)),
+    }
+
+
+def measure(table: pa.Table, path: Path, kind: str, **write_options) -> dict:
+    started = time.perf_counter()
+    pq.write_table(table, path, **write_options)
+    write_s = time.perf_counter() - started
+
+    started = time.perf_counter()
+    for _ in pq.ParquetFile(path).iter_batches(batch_size=mb.READ_BATCH_ROWS):
+        pass
+    scan_s = time.perf_counter() - started
+
+    started = time.perf_counter()
+    mb.hash_table(path, kind)
+    hash_s = time.perf_counter() - started
+    return {
+        "bytes": path.stat().st_size,
+        "row_groups": pq.ParquetFile(path).num_row_groups,
+        "write_s": round(write_s, 3),
+        "scan_s": round(scan_s, 3),
+        "scan_rows_per_s": round(table.num_rows / scan_s) if scan_s else None,
+        "hash_s": round(hash_s, 3),
+    }
+
+
+def main() -> int:
+    args = parse_args()
+    row_groups = [int(part) for part in args.row_group_rows.split(",") if part.strip()]
+    if args.nodes <= 0 or not row_groups or min(row_groups) <= 0:
+        raise SystemExit("--nodes and --row-group-rows must be positive")
+    out_dir = args.out_dir or BENCHMARK_ROOT / f"{time.strftime('%Y%m%dT%H%M%SZ', time.gmtime())}-memgraph-parquet"
+    out_dir.mkdir(parents=True, exist_ok=True)
+
+    started = time.perf_counter()
+    tables = synthetic_tables(args.nodes, args.edges_per_node)
+    generate_s = round(time.perf_counter() - started, 2)
+    sort_keys = {"node": me.NODE_SORT, "edge": me.EDGE_SORT}
+
+    results: dict[str, dict] = {}
+    for kind, table in tables.items():
+        runs = {"defaults_heap_order": measure(table, out_dir / f"{kind}-defaults.parquet", kind)}
+        ordered = table.sort_by([(name, "ascending") for name in sort_keys[kind]])
+        for rows in row_groups:
+            runs[f"publication_rg{rows}"] = measure(
+                ordered,
+                out_dir / f"{kind}-publication-{rows}.parquet",
+                kind,
+                row_group_size=rows,
+                **mb.parquet_write_options(ordered.schema),
+            )
+        baseline = runs["defaults_heap_order"]["bytes"]
+        for run in runs.values():
+            run["size_vs_defaults"] = round(run["bytes"] / baseline, 3)
+        results[kind] = {"rows": table.num_rows, "runs": runs}
+    if not args.keep_output:
+        for path in out_dir.glob("*.parquet"):
+            path.unlink()
+
+    report = {
+        "nodes": args.nodes,
+        "edges_per_node": args.edges_per_node,
+        "generate_s": generate_s,
+        "encoding": {
+            "compression": mb.PARQUET_COMPRESSION,
+            "compression_level": mb.PARQUET_COMPRESSION_LEVEL,
+            "dictionary_columns": sorted(mb.DICTIONARY_COLUMNS),
+            "sort": sort_keys,
+        },
+        "results": results,
+    }
+    (out_dir / "report.json").write_text(json.dumps(report, indent=2))
+    print(json.dumps(report, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,382 @@
+#!/usr/bin/env python3
+"""Minimal Bolt client for loading the Memgraph projection.
+
+The projection used to be loaded by piping a generated `.cypherl` file into a
+`mgconsole` container. `BoltConnection` talks to the Bolt port directly so a
+loader can stream parameterised statements instead: the batch travels as a
+PackStream `$rows` list, not as an escaped Cypher literal.
+
+Scope is what the loader needs and nothing more: Bolt 4.1–5.0 over plain TCP
+(no TLS, no routing), basic or no authentication, auto-commit `RUN` + `PULL`,
+and `RESET` after a failure. It is stdlib-only, like the rest of the runtime
+tooling. `encode_run` is separate from `run_encoded` so statements can be
+packed in worker processes and only the bytes cross to the sending thread.
+"""
+
+from __future__ import annotations
+
+import socket
+import struct
+import urllib.parse
+from typing import Any, NamedTuple
+
+DEFAULT_BOLT_PORT = 7687
+DEFAULT_TIMEOUT_S = 60.0
+BOLT_MAGIC = b"\x60\x60\xb0\x17"
+# Newest first. 5.0 is the last version that carries credentials in HELLO
+# (5.1 moved them to LOGON); Memgraph speaks every one of these.
+BOLT_VERSIONS = ((5, 0), (4, 4), (4, 3), (4, 1))
+MAX_CHUNK_BYTES = 0xFFFF
+
+MSG_HELLO = 0x01
+MSG_GOODBYE = 0x02
+MSG_RESET = 0x0F
+MSG_RUN = 0x10
+MSG_PULL = 0x3F
+MSG_SUCCESS = 0x70
+MSG_RECORD = 0x71
+MSG_IGNORED = 0x7E
+MSG_FAILURE = 0x7F
+
+_INT8 = struct.Struct(">b")
+_INT16 = struct.Struct(">h")
+_INT32 = struct.Struct(">i")
+_INT64 = struct.Struct(">q")
+_UINT8 = struct.Struct(">B")
+_UINT16 = struct.Struct(">H")
+_UINT32 = struct.Struct(">I")
+_FLOAT = struct.Struct(">d")
+
+
+class BoltError(RuntimeError):
+    """FAILURE response from the server."""
+
+    def __init__(self, code: str, message: str) -> None:
+        self.code = code
+        self.message = message
+        super().__init__(f"{code}: {message}")
+
+    @property
+    def transient(self) -> bool:
+        """True for conflicts and timeouts the server says are safe to retry."""
+        lowered = self.message.lower()
+        return (
+            ".TransientError." in self.code
+            or "conflicting transactions" in lowered
+            or "try again" in lowered
+        )
+
+
+class Structure(NamedTuple):
+    tag: int
+    fields: list[Any]
+
+
+STRING_MARKERS = (0xD0, 0xD1, 0xD2)
+LIST_MARKERS = (0xD4, 0xD5, 0xD6)
+MAP_MARKERS = (0xD8, 0xD9, 0xDA)
+BYTES_MARKERS = (0xCC, 0xCD, 0xCE)
+
+
+class Raw(bytes):
+    """A value that is already PackStream-encoded; `pack` copies it verbatim."""
+
+
+def pack_header(out: bytearray, size: int, tiny: int, markers: tuple[int, int, int]) -> None:
+    """Size header of a string (``tiny=0x80``), list (0x90), map (0xA0) or bytes (0)."""
+    if size < 16 and tiny:
+        out.append(tiny | size)
+    elif size < 0x100:
+        out.append(markers[0])
+        out += _UINT8.pack(size)
+    elif size < 0x10000:
+        out.append(markers[1])
+        out += _UINT16.pack(size)
+    else:
+        out.append(markers[2])
+        out += _UINT32.pack(size)
+
+
+def pack(value: Any, out: bytearray) -> None:
+    """Append the PackStream encoding of ``value`` to ``out``."""
+    if value is None:
+        out.append(0xC0)
+    elif isinstance(value, Raw):
+        out += value
+    elif value is True:
+        out.append(0xC3)
+    elif value is False:
+        out.append(0xC2)
+    elif isinstance(value, int):
+        if -16 <= value < 128:
+            out += _INT8.pack(value)
+        elif -128 <= value < 128:
+            out.append(0xC8)
+            out += _INT8.pack(value)
+        elif -0x8000 <= value < 0x8000:
+            out.append(0xC9)
+            out += _INT16.pack(value)
+        elif -0x80000000 <= value < 0x80000000:
+            out.append(0xCA)
+            out += _INT32.pack(value)
+        else:
+            out.append(0xCB)
+            out += _INT64.pack(value)  # struct.error past 64 bits
+    elif isinstance(value, float):
+        out.append(0xC1)
+        out += _FLOAT.pack(value)
+    elif isinstance(value, str):
+        encoded = value.encode("utf-8")
+        pack_header(out, len(encoded), 0x80, STRING_MARKERS)
+        out += encoded
+    elif isinstance(value, dict):
+        pack_header(out, len(value), 0xA0, MAP_MARKERS)
+        for key, item in value.items():
+            pack(str(key), out)
+            pack(item, out)
+    elif isinstance(value, Structure):
+        out.append(0xB0 | len(value.fields))
+        out.append(value.tag)
+        for item in value.fields:
+            pack(item, out)
+    elif isinstance(value, (list, tuple)):
+        pack_header(out, len(value), 0x90, LIST_MARKERS)
+        for item in value:
+            pack(item, out)
+    elif isinstance(value, (bytes, bytearray, memoryview)):
+        pack_header(out, len(value), 0, BYTES_MARKERS)
+        out += value
+    else:
+        raise TypeError(f"cannot pack {type(value).__name__} as PackStream")
+
+
+def unpack(data: bytes, offset: int = 0) -> tuple[Any, int]:
+    """Decode one PackStream value at ``offset``; returns ``(value, next_offset)``."""
+    marker = data[offset]
+    offset += 1
+    high = marker & 0xF0
+    if marker < 0x80:
+        return marker, offset
+    if marker >= 0xF0:
+        return marker - 0x100, offset
+    if high == 0x80:
+        return _text(data, offset, marker & 0x0F)
+    if high == 0x90:
+        return _list(data, offset, marker & 0x0F)
+    if high == 0xA0:
+        return _map(data, offset, marker & 0x0F)
+    if high == 0xB0:
+        return _structure(data, offset, marker & 0x0F)
+    if marker == 0xC0:
+        return None, offset
+    if marker in (0xC2, 0xC3):
+        return marker == 0xC3, offset
+    if marker == 0xC1:
+        return _FLOAT.unpack_from(data, offset)[0], offset + 8
+    for code, fmt in ((0xC8, _INT8), (0xC9, _INT16), (0xCA, _INT32), (0xCB, _INT64)):
+        if marker == code:
+            return fmt.unpack_from(data, offset)[0], offset + fmt.size
+    sized = {
+        0xCC: ("bytes", _UINT8), 0xCD: ("bytes", _UINT16), 0xCE: ("bytes", _UINT32),
+        0xD0: ("text", _UINT8), 0xD1: ("text", _UINT16), 0xD2: ("text", _UINT32),
+        0xD4: ("list", _UINT8), 0xD5: ("list", _UINT16), 0xD6: ("list", _UINT32),
+        0xD8: ("map", _UINT8), 0xD9: ("map", _UINT16), 0xDA: ("map", _UINT32),
+    }.get(marker)
+    if sized is None:
+        raise ValueError(f"unknown PackStream marker 0x{marker:02X}")
+    kind, fmt = sized
+    (size,) = fmt.unpack_from(data, offset)
+    offset += fmt.size
+    if kind == "bytes":
+        return bytes(data[offset : offset + size]), offset + size
+    return {"text": _text, "list": _list, "map": _map}[kind](data, offset, size)
+
+
+def _text(data: bytes, offset: int, size: int) -> tuple[str, int]:
+    return bytes(data[offset : offset + size]).decode("utf-8"), offset + size
+
+
+def _list(data: bytes, offset: int, size: int) -> tuple[list[Any], int]:
+    items = []
+    for _ in range(size):
+        item, offset = unpack(data, offset)
+        items.append(item)
+    return items, offset
+
+
+def _map(data: bytes, offset: int, size: int) -> tuple[dict[str, Any], int]:
+    items = {}
+    for _ in range(size):
+        key, offset = unpack(data, offset)
+        items[key], offset = unpack(data, offset)
+    return items, offset
+
+
+def _structure(data: bytes, offset: int, size: int) -> tuple[Structure, int]:
+    tag = data[offset]
+    fields, offset = _list(data, offset + 1, size)
+    return Structure(tag, fields), offset
+
+
+def chunk(payload: bytes | bytearray) -> bytes:
+    """Frame one message as Bolt chunks plus the zero-length terminator."""
+    frames = bytearray()
+    for start in range(0, len(payload), MAX_CHUNK_BYTES):
+        part = payload[start : start + MAX_CHUNK_BYTES]
+        frames += _UINT16.pack(len(part))
+        frames += part
+    frames += b"\x00\x00"
+    return bytes(frames)
+
+
+def encode_message(tag: int, *fields: Any) -> bytes:
+    payload = bytearray()
+    pack(Structure(tag, list(fields)), payload)
+    return chunk(payload)
+
+
+def encode_run(query: str, parameters: dict[str, Any] | None = None) -> bytes:
+    """Chunked auto-commit ``RUN`` for ``query``, ready for `run_encoded`."""
+    return encode_message(MSG_RUN, query, parameters or {}, {})
+
+
+PULL_ALL = encode_message(MSG_PULL, {"n": -1})
+RESET = encode_message(MSG_RESET)
+GOODBYE = encode_message(MSG_GOODBYE)
+
+
+class BoltConnection:
+    """One Bolt session: ``bolt://host:port`` with optional basic auth."""
+
+    def __init__(
+        self,
+        uri: str,
+        *,
+        user: str = "",
+        password: str = "",
+        timeout_s: float = DEFAULT_TIMEOUT_S,
+        user_agent: str = "axon-memgraph-loader/1.0",
+    ) -> None:
+        parsed = urllib.parse.urlsplit(uri if "://" in uri else f"bolt://{uri}")
+        if parsed.scheme != "bolt":
+            raise ValueError(f"unsupported Bolt URI (plain bolt:// only): {uri}")
+        self.uri = uri
+        self.host = parsed.hostname or "127.0.0.1"
+        self.port = parsed.port or DEFAULT_BOLT_PORT
+        self.timeout_s = timeout_s
+        self.user = urllib.parse.unquote(parsed.username or user)
+        self.password = urllib.parse.unquote(parsed.password or password)
+        self.user_agent = user_agent
+        self.version: tuple[int, int] | None = None
+        self.server: str | None = None
+        self._sock: socket.socket | None = None
+        self._buffer = bytearray()
+
+    def __enter__(self) -> "BoltConnection":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    def close(self) -> None:
+        if self._sock is not None:
+            try:
+                self._sock.sendall(GOODBYE)
+            except OSError:
+                pass
+            self._sock.close()
+            self._sock = None
+        self._buffer.clear()
+
+    def _connect(self) -> None:
+        sock = socket.create_connection((self.host, self.port), timeout=self.timeout_s)
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self._sock = sock
+        try:
+            proposals = b"".join(bytes((0, 0, minor, major)) for major, minor in BOLT_VERSIONS)
+            sock.sendall(BOLT_MAGIC + proposals)
+            agreed = self._read_exact(4)
+            if agreed == b"\x00\x00\x00\x00":
+                raise ConnectionError("Bolt server supports none of the proposed versions")
+            self.version = (agreed[3], agreed[2])
+            extra: dict[str, Any] = {"user_agent": self.user_agent}
+            if self.user:
+                extra.update(scheme="basic", principal=self.user, credentials=self.password)
+            else:
+                extra["scheme"] = "none"
+            sock.sendall(encode_message(MSG_HELLO, extra))
+            metadata = self._expect_success()
+            self.server = metadata.get("server")
+        except BaseException:
+            self.close()
+            raise
+
+    def _read_exact(self, size: int) -> bytes:
+        assert self._sock is not None
+        while len(self._buffer) < size:
+            data = self._sock.recv(max(65536, size - len(self._buffer)))
+            if not data:
+                raise ConnectionError("Bolt server closed the connection")
+            self._buffer += data
+        out = bytes(self._buffer[:size])
+        del self._buffer[:size]
+        return out
+
+    def _read_message(self) -> Structure:
+        payload = bytearray()
+        while True:
+            (size,) = _UINT16.unpack(self._read_exact(2))
+            if size == 0:
+                if payload:
+                    break
+                continue  # NOOP keep-alive chunk
+            payload += self._read_exact(size)
+        message, _ = unpack(payload)
+        if not isinstance(message, Structure):
+            raise ConnectionError("malformed Bolt message")
+        return message
+
+    def _expect_success(self) -> dict[str, Any]:
+        message = self._read_message()
+        if message.tag == MSG_FAILURE:
+            metadata = message.fields[0] if message.fields else {}
+            raise BoltError(metadata.get("code", ""), metadata.get("message", ""))
+        if message.tag != MSG_SUCCESS:
+            raise ConnectionError(f"unexpected Bolt message 0x{message.tag:02X}")
+        return message.fields[0] if message.fields else {}
+
+    def run_encoded(self, encoded_run: bytes) -> list[list[Any]]:
+        """Send a pre-encoded ``RUN`` plus ``PULL`` and return the records.
+
+        A FAILURE resets the session before `BoltError` is raised, so the
+        connection stays usable for a retry.
+        """
+        if self._sock is None:
+            self._connect()
+        assert self._sock is not None
+        try:
+            self._sock.sendall(encoded_run + PULL_ALL)
+            failure: BoltError | None = None
+            records: list[list[Any]] = []
+            for _ in range(2):  # RUN response, then PULL response
+                while True:
+                    message = self._read_message()
+                    if message.tag != MSG_RECORD:
+                        break
+                    records.append(message.fields[0])
+                if message.tag == MSG_FAILURE and failure is None:
+                    metadata = message.fields[0] if message.fields else {}
+                    failure = BoltError(metadata.get("code", ""), metadata.get("message", ""))
+                elif message.tag not in (MSG_SUCCESS, MSG_IGNORED, MSG_FAILURE):
+                    raise ConnectionError(f"unexpected Bolt message 0x{message.tag:02X}")
+            if failure is not None:
+                self._sock.sendall(RESET)
+                self._expect_success()
+                raise failure
+            return records
+        except (OSError, ValueError, struct.error):
+            self.close()
+            raise
+
+    def run(self, query: str, parameters: dict[str, Any] | None = None) -> list[list[Any]]:
+        return self.run_encoded(encode_run(query, parameters))
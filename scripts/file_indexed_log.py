@@ -0,0 +1,393 @@
+#!/usr/bin/env python3
+"""Incremental follower for `FileIndexed` bridge events in the runtime log.
+
+The qualification used to re-read a fixed 400-line tail once at the end of a
+run and keep only the maxima, so any event that scrolled out of that window
+between samples was lost. ``FileIndexedFollower`` is polled every sample
+instead: each source remembers where it stopped, every event is decoded
+exactly once, and the stage latencies between the event's ``t0``..``t4``
+stamps go into running histograms that report real percentiles.
+
+The stamps are the runtime's (microseconds since the epoch, as read by the
+dashboard's ``Watcher.Tracer``): ``t0`` discovery, ``t1`` receipt in a
+``PARSE_BATCH``, ``t2`` queue admission (``QueueStore::push_with_mode``),
+``t3`` hand-off to the writer and ``t4`` commit. Nothing is stamped when a
+task leaves the queue, so queue wait and parse are one stage
+(``queue_parse_us``).
+
+Two sources are supported:
+
+* ``FileLogSource`` follows a log file by byte offset and restarts from the
+  top when the file is truncated or replaced (process-compose
+  ``log_location``, e.g. ``/tmp/axon-dev-indexer.log``).
+* ``ProcessComposeLogSource`` polls the process-compose log endpoint, which
+  only ever returns a window of recent lines; it resumes after the last lines
+  it consumed and counts a gap when the window moved past them.
+
+``IngestCostBreakdown`` is an observer that groups the same events by parser
+class and size bucket — the runtime admission cost model's dimensions — to
+compare its estimates with the observed stage latencies and throughput.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import urllib.request
+from pathlib import Path
+from typing import Any, Callable, Iterable
+
+from latency_histogram import LatencyHistogram
+
+DEFAULT_LOG_PORTS = (8081, 8080)
+DEFAULT_LOG_PROCESS = "axon-brain"
+DEFAULT_LOG_URL_TEMPLATE = "http://localhost:{port}/process/logs/{process}"
+DEFAULT_FETCH_TIMEOUT_S = 5.0
+ANCHOR_LINES = 16
+READ_CHUNK_BYTES = 1 << 20
+FILE_INDEXED_MARKER = '"FileIndexed"'
+# (field, from stamp, to stamp) per stage; see the module docstring.
+STAGES = (
+    ("dispatch_us", "t0", "t1"),
+    ("admission_us", "t1", "t2"),
+    ("queue_parse_us", "t2", "t3"),
+    ("commit_us", "t3", "t4"),
+    ("total_us", "t0", "t4"),
+)
+LATENCY_FIELDS = tuple(field for field, _, _ in STAGES)
+SERVICE_FIELDS = ("queue_parse_us", "commit_us")
+# Same bucket edges as `size_bucket_for` in src/axon-core/src/queue.rs, so the
+# breakdown lines up with the admission cost model's estimation keys.
+SIZE_BUCKETS = (
+    ("tiny", 64 * 1024),
+    ("small", 256 * 1024),
+    ("medium", 1024 * 1024),
+)
+
+_DECODER = json.JSONDecoder()
+
+
+def decode_file_indexed(line: str) -> dict[str, Any] | None:
+    """Return the ``FileIndexed`` payload embedded in one log line, if any.
+
+    The event is the JSON object opening just before the marker; log prefixes
+    and trailing text on the same line are ignored.
+    """
+    marker = line.find(FILE_INDEXED_MARKER)
+    if marker == -1:
+        return None
+    start = line.rfind("{", 0, marker)
+    if start == -1:
+        return None
+    try:
+        payload, _ = _DECODER.raw_decode(line, start)
+    except ValueError:
+        return None
+    event = payload.get("FileIndexed") if isinstance(payload, dict) else None
+    return event if isinstance(event, dict) else None
+
+
+def _int_field(value: Any) -> int | None:
+    if isinstance(value, bool) or value is None:
+        return None
+    if isinstance(value, (int, float)):
+        return int(value)
+    if isinstance(value, str):
+        try:
+            return int(float(value))
+        except ValueError:
+            return None
+    return None
+
+
+def event_latencies(event: dict[str, Any]) -> dict[str, int]:
+    """Stage latencies of one event; stages with a missing (0) or reversed stamp are left out."""
+    stamps = {name: _int_field(event.get(name)) for name in ("t0", "t1", "t2", "t3", "t4")}
+    latencies = {}
+    for field, start, end in STAGES:
+        begin, finish = stamps[start], stamps[end]
+        if begin is not None and finish is not None and 0 < begin <= finish:
+            latencies[field] = finish - begin
+    return latencies
+
+
+class FileLogSource:
+    """Byte-offset follower for a log file; survives truncation and rotation."""
+
+    def __init__(self, path: Path | str, *, from_start: bool = True) -> None:
+        self.path = Path(path)
+        self.offset = 0
+        self.restarts = 0
+        self._inode: int | None = None
+        self._partial = b""
+        if not from_start:
+            try:
+                stat = self.path.stat()
+            except OSError:
+                return
+            self.offset = stat.st_size
+            self._inode = stat.st_ino
+
+    def read_lines(self) -> list[str]:
+        try:
+            stat = self.path.stat()
+        except OSError:
+            return []
+        if self._inode is not None and (stat.st_ino != self._inode or stat.st_size < self.offset):
+            self.offset = 0
+            self._partial = b""
+            self.restarts += 1
+        self._inode = stat.st_ino
+        if stat.st_size == self.offset:
+            return []
+        chunks = []
+        try:
+            with self.path.open("rb") as handle:
+                handle.seek(self.offset)
+                while True:
+                    chunk = handle.read(READ_CHUNK_BYTES)
+                    if not chunk:
+                        break
+                    chunks.append(chunk)
+                self.offset = handle.tell()
+        except OSError:
+            return []
+        data = self._partial + b"".join(chunks)
+        complete, newline, self._partial = data.rpartition(b"\n")
+        if not newline:
+            return []
+        return complete.decode("utf-8", "replace").split("\n")
+
+
+class ProcessComposeLogSource:
+    """Poll the process-compose log endpoint and return only unseen lines.
+
+    The endpoint serves a bounded window, so the source keeps the last
+    ``anchor_lines`` lines it consumed and resumes right after their latest
+    occurrence. When they are no longer in the window the whole window is new
+    and ``gaps`` is incremented: events may have been missed in between.
+    """
+
+    def __init__(
+        self,
+        process: str = DEFAULT_LOG_PROCESS,
+        *,
+        ports: Iterable[int] = DEFAULT_LOG_PORTS,
+        url_template: str = DEFAULT_LOG_URL_TEMPLATE,
+        timeout_s: float = DEFAULT_FETCH_TIMEOUT_S,
+        anchor_lines: int = ANCHOR_LINES,
+    ) -> None:
+        self.urls = [url_template.format(port=port, process=process) for port in ports]
+        self.timeout_s = timeout_s
+        self.anchor_lines = anchor_lines
+        self.gaps = 0
+        self._anchor: list[str] = []
+
+    def fetch_window(self) -> list[str] | None:
+        for url in self.urls:
+            try:
+                with urllib.request.urlopen(url, timeout=self.timeout_s) as response:
+                    body = response.read().decode("utf-8", "replace")
+            except Exception:
+                continue
+            if body.lstrip().startswith("{"):
+                try:
+                    logs = json.loads(body).get("logs")
+                except (json.JSONDecodeError, AttributeError):
+                    logs = None
+                if isinstance(logs, list):
+                    return [str(line) for line in logs]
+            if body:
+                return body.splitlines()
+        return None
+
+    def unseen(self, window: list[str]) -> list[str]:
+        """Lines of ``window`` after the last consumed anchor."""
+        fresh = window
+        if self._anchor:
+            size = len(self._anchor)
+            for start in range(len(window) - size, -1, -1):
+                if window[start : start + size] == self._anchor:
+                    fresh = window[start + size :]
+                    break
+            else:
+                self.gaps += 1
+        if window:
+            self._anchor = window[-self.anchor_lines :]
+        return fresh
+
+    def read_lines(self) -> list[str]:
+        window = self.fetch_window()
+        if window is None:
+            return []
+        return self.unseen(window)
+
+
+class FileIndexedFollower:
+    """Decode each `FileIndexed` event once and keep running latency histograms.
+
+    ``observers`` are called with every decoded event, for reports that need
+    more than the latency percentiles (per-parser breakdowns and the like).
+    """
+
+    def __init__(
+        self,
+        source: FileLogSource | ProcessComposeLogSource,
+        *,
+        observers: Iterable[Callable[[dict[str, Any]], None]] = (),
+    ) -> None:
+        self.source = source
+        self.observers = list(observers)
+        self.events = 0
+        self.lines_read = 0
+        self.histograms = {field: LatencyHistogram() for field in LATENCY_FIELDS}
+        self.maxima = dict.fromkeys(LATENCY_FIELDS, 0)
+
+    def feed(self, lines: Iterable[str]) -> int:
+        decoded = 0
+        for line in lines:
+            self.lines_read += 1
+            if FILE_INDEXED_MARKER not in line:
+                continue
+            event = decode_file_indexed(line)
+            if event is None:
+                continue
+            decoded += 1
+            for field, value in event_latencies(event).items():
+                self.histograms[field].record(value)
+                self.maxima[field] = max(self.maxima[field], value)
+            for observer in self.observers:
+                observer(event)
+        self.events += decoded
+        return decoded
+
+    def poll(self) -> int:
+        """Consume whatever the source has appended since the last poll."""
+        return self.feed(self.source.read_lines())
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "parsed_file_indexed_events": self.events,
+            "max_us": dict(self.maxima),
+            "latency_us": {field: self.histograms[field].summary() for field in LATENCY_FIELDS},
+            "log_lines_read": self.lines_read,
+            "log_gaps": getattr(self.source, "gaps", 0),
+        }
+
+
+def parser_key_for_path(path: str) -> str:
+    """Lower-cased extension, as `parser_key_for_path` in the Rust queue."""
+    suffix = Path(path).suffix
+    return suffix[1:].lower() if suffix else "unknown"
+
+
+def size_bucket_for(size_bytes: int | None) -> str:
+    if size_bytes is None:
+        return "unknown"
+    for name, upper in SIZE_BUCKETS:
+        if size_bytes <= upper:
+            return name
+    return "large"
+
+
+def event_size_bytes(event: dict[str, Any]) -> int | None:
+    """The indexed file's current size on disk.
+
+    ``FileIndexed`` does not carry the size the queue admitted the task with
+    (``Task::size_bytes``), so a file edited since it was indexed lands in the
+    bucket of its new size, and a deleted one in ``unknown``.
+    """
+    path = event.get("path")
+    if not isinstance(path, str) or not path:
+        return None
+    try:
+        return os.stat(path).st_size
+    except OSError:
+        return None
+
+
+class _CostGroup:
+    def __init__(self) -> None:
+        self.files = 0
+        self.sized_files = 0
+        self.bytes = 0
+        self.sized_service_us = 0
+        self.totals = dict.fromkeys(LATENCY_FIELDS, 0)
+        self.histograms = {field: LatencyHistogram() for field in LATENCY_FIELDS}
+        self.statuses: dict[str, int] = {}
+
+
+class IngestCostBreakdown:
+    """Aggregate FileIndexed events by parser class and file-size bucket.
+
+    Use as a ``FileIndexedFollower`` observer. Service time is queue_parse +
+    commit (admission to commit): the runtime stamps no dequeue, so queue wait
+    cannot be taken out of it. Throughput only counts files whose size is known.
+    """
+
+    def __init__(self) -> None:
+        self.groups: dict[tuple[str, str], _CostGroup] = {}
+
+    def __call__(self, event: dict[str, Any]) -> None:
+        path = event.get("path") if isinstance(event.get("path"), str) else ""
+        size = event_size_bytes(event)
+        key = (parser_key_for_path(path), size_bucket_for(size))
+        group = self.groups.get(key)
+        if group is None:
+            group = self.groups[key] = _CostGroup()
+        group.files += 1
+        status = str(event.get("status") or "unknown")
+        group.statuses[status] = group.statuses.get(status, 0) + 1
+        latencies = event_latencies(event)
+        for field, value in latencies.items():
+            group.totals[field] += value
+            group.histograms[field].record(value)
+        service_us = sum(latencies.get(field, 0) for field in SERVICE_FIELDS)
+        if size is not None:
+            group.sized_files += 1
+            group.bytes += size
+            group.sized_service_us += service_us
+
+    def table(self) -> list[dict[str, Any]]:
+        """One row per (parser class, size bucket), heaviest service time first."""
+        total_service_us = sum(
+            sum(group.totals[field] for field in SERVICE_FIELDS) for group in self.groups.values()
+        )
+        rows = []
+        for (parser_class, size_bucket), group in self.groups.items():
+            service_us = sum(group.totals[field] for field in SERVICE_FIELDS)
+            row: dict[str, Any] = {
+                "parser_class": parser_class,
+                "size_bucket": size_bucket,
+                "files": group.files,
+                "bytes": group.bytes,
+                "service_us_total": service_us,
+                "service_share": round(service_us / total_service_us, 4) if total_service_us else None,
+                "throughput_bytes_per_s": (
+                    round(group.bytes * 1_000_000 / group.sized_service_us, 1)
+                    if group.sized_service_us
+                    else None
+                ),
+                "statuses": dict(sorted(group.statuses.items())),
+            }
+            for field in LATENCY_FIELDS:
+                histogram = group.histograms[field]
+                row[field] = {
+                    "total": group.totals[field],
+                    **histogram.summary((0.50, 0.95)),
+                }
+            rows.append(row)
+        rows.sort(key=lambda row: (-row["service_us_total"], row["parser_class"], row["size_bucket"]))
+        return rows
+
+
+def source_for(log_path: str | None) -> FileLogSource | ProcessComposeLogSource:
+    """File follower when a log path is given (or AXON_RUNTIME_LOG), else the endpoint.
+
+    A file is followed from its current end, so lines written by earlier runs
+    are not attributed to this one.
+    """
+    path = log_path or os.environ.get("AXON_RUNTIME_LOG", "").strip()
+    if path:
+        return FileLogSource(path, from_start=False)
+    return ProcessComposeLogSource()
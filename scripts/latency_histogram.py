@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+"""Shared HDR-style histogram for qualification latencies and samples.
+
+Replaces the per-script ``percentile()`` helpers that sorted the full value
+list and disagreed on interpolation. Values are bucketed log-linearly
+(HdrHistogram layout): exact below ``2**sub_bucket_bits`` resolution units,
+then every power-of-two range is split into ``2**(sub_bucket_bits-1)`` linear
+slots, so the relative error stays under ``1 / 2**(sub_bucket_bits-1)``
+(0.8 % with the default 8 bits) while memory is bounded by the value range,
+not by the number of samples.
+
+Contract:
+- ``record()`` is O(1); ``merge()`` is exact when both sides share the same
+  ``sub_bucket_bits`` and ``resolution`` (ValueError otherwise).
+- Percentiles use the nearest-rank definition everywhere. ``min``/``max``
+  are tracked exactly and bound every reported percentile.
+- ``to_dict()`` / ``from_dict()`` round-trip through JSON run artifacts.
+"""
+
+from __future__ import annotations
+
+import math
+from typing import Any, Iterable
+
+SCHEMA = "axon.latency_histogram/v1"
+DEFAULT_SUB_BUCKET_BITS = 8
+DEFAULT_PERCENTILES = (0.50, 0.95, 0.99)
+
+
+class LatencyHistogram:
+    def __init__(
+        self,
+        *,
+        sub_bucket_bits: int = DEFAULT_SUB_BUCKET_BITS,
+        resolution: float = 1.0,
+    ) -> None:
+        if sub_bucket_bits < 2:
+            raise ValueError("sub_bucket_bits must be >= 2")
+        if resolution <= 0:
+            raise ValueError("resolution must be > 0")
+        self.sub_bucket_bits = sub_bucket_bits
+        self.resolution = float(resolution)
+        self._sub_count = 1 << sub_bucket_bits
+        self._half = self._sub_count >> 1
+        self.counts: dict[int, int] = {}
+        self.count = 0
+        self.total = 0.0
+        self.min: float | None = None
+        self.max: float | None = None
+
+    def _index(self, units: int) -> int:
+        if units < self._sub_count:
+            return units
+        shift = units.bit_length() - self.sub_bucket_bits
+        return self._sub_count + (shift - 1) * self._half + ((units >> shift) - self._half)
+
+    def _bounds(self, index: int) -> tuple[int, int]:
+        """Inclusive lower bound and width of a bucket, in resolution units."""
+        if index < self._sub_count:
+            return index, 1
+        offset = index - self._sub_count
+        shift = offset // self._half + 1
+        top = offset % self._half + self._half
+        return top << shift, 1 << shift
+
+    def record(self, value: float, count: int = 1) -> None:
+        if value < 0:
+            raise ValueError(f"histogram values must be >= 0, got {value}")
+        if count <= 0:
+            return
+        index = self._index(int(value / self.resolution))
+        self.counts[index] = self.counts.get(index, 0) + count
+        self.count += count
+        self.total += value * count
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = value if self.max is None else max(self.max, value)
+
+    def record_many(self, values: Iterable[float]) -> "LatencyHistogram":
+        for value in values:
+            self.record(value)
+        return self
+
+    def _check_compatible(self, other: "LatencyHistogram") -> None:
+        if (self.sub_bucket_bits, self.resolution) != (other.sub_bucket_bits, other.resolution):
+            raise ValueError(
+                "cannot merge histograms with different layouts: "
+                f"({self.sub_bucket_bits}, {self.resolution}) vs ({other.sub_bucket_bits}, {other.resolution})"
+            )
+
+    def merge(self, other: "LatencyHistogram") -> "LatencyHistogram":
+        self._check_compatible(other)
+        for index, count in other.counts.items():
+            self.counts[index] = self.counts.get(index, 0) + count
+        self.count += other.count
+        self.total += other.total
+        if other.min is not None:
+            self.min = other.min if self.min is None else min(self.min, other.min)
+        if other.max is not None:
+            self.max = other.max if self.max is None else max(self.max, other.max)
+        return self
+
+    def value_at(self, q: float) -> float | None:
+        """Nearest-rank percentile for ``q`` in [0, 1]; None when empty."""
+        if self.count == 0 or self.min is None or self.max is None:
+            return None
+        if q <= 0:
+            return self.min
+        if q >= 1:
+            return self.max
+        # Tolerance keeps q * count from overshooting an exact rank (0.95 * 20).
+        rank = max(1, math.ceil(q * self.count - 1e-9))
+        seen = 0
+        for index in sorted(self.counts):
+            seen += self.counts[index]
+            if seen >= rank:
+                low, width = self._bounds(index)
+                midpoint = (low + (width - 1) / 2.0) * self.resolution
+                return min(self.max, max(self.min, midpoint))
+        return self.max  # pragma: no cover - rank never exceeds count
+
+    def mean(self) -> float | None:
+        return self.total / self.count if self.count else None
+
+    def summary(self, percentiles: Iterable[float] = DEFAULT_PERCENTILES) -> dict[str, Any]:
+        payload: dict[str, Any] = {
+            "count": self.count,
+            "min": self.min,
+            "max": self.max,
+            "avg": self.mean(),
+        }
+        for q in percentiles:
+            payload[percentile_label(q)] = self.value_at(q)
+        return payload
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "schema": SCHEMA,
+            "sub_bucket_bits": self.sub_bucket_bits,
+            "resolution": self.resolution,
+            "count": self.count,
+            "total": self.total,
+            "min": self.min,
+            "max": self.max,
+            "buckets": [[index, self.counts[index]] for index in sorted(self.counts)],
+        }
+
+    @classmethod
+    def from_dict(cls, payload: dict[str, Any]) -> "LatencyHistogram":
+        if payload.get("schema") != SCHEMA:
+            raise ValueError(f"unsupported histogram schema: {payload.get('schema')!r}")
+        histogram = cls(
+            sub_bucket_bits=int(payload["sub_bucket_bits"]),
+            resolution=float(payload["resolution"]),
+        )
+        for index, count in payload.get("buckets", []):
+            histogram.counts[int(index)] = int(count)
+        histogram.count = int(payload.get("count", sum(histogram.counts.values())))
+        histogram.total = float(payload.get("total", 0.0))
+        histogram.min = payload.get("min")
+        histogram.max = payload.get("max")
+        return histogram
+
+
+def percentile_label(q: float) -> str:
+    label = f"{q * 100:g}".replace(".", "_")
+    return f"p{label}"
+
+
+def histogram_of(values: Iterable[float], *, resolution: float = 1.0) -> LatencyHistogram:
+    return LatencyHistogram(resolution=resolution).record_many(values)
+
+
+def merge_snapshots(snapshots: Iterable[dict[str, Any]]) -> LatencyHistogram | None:
+    merged: LatencyHistogram | None = None
+    for snapshot in snapshots:
+        histogram = LatencyHistogram.from_dict(snapshot)
+        merged = histogram if merged is None else merged.merge(histogram)
+    return merged
+
+
+def percentile(values: Iterable[float], q: float, *, resolution: float = 1.0) -> float | None:
+    """Nearest-rank percentile of ``values`` through the shared histogram."""
+    return histogram_of(values, resolution=resolution).value_at(q)
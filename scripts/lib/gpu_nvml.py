@@ -11,6 +11,8 @@ Contract:
 - On success it returns a canonical superset dict (see KEYS below) so every
   consumer can map to its own historical schema.
 - `nvmlShutdown()` is always called in a `finally`.
+- `NvmlSampler` keeps one NVML session open for periodic samplers; its
+  `sample()` follows the same never-raises contract.
 
 Environment:
 - ``AXON_NVML_LIBRARY_PATH``        explicit libnvidia-ml path (highest priority).
@@ -24,7 +26,8 @@ from __future__ import annotations
 import ctypes
 import ctypes.util
 import os
-from typing import Any
+import time
+from typing import Any, Callable
 
 NVML_TEMPERATURE_GPU = 0
 _DEFAULT_LIBRARY = "/usr/lib/wsl/lib/libnvidia-ml.so.1"
@@ -180,94 +183,215 @@ def _bind(library: ctypes.CDLL) -> dict[str, Any]:
     return fns
 
 
-def _status_for_library(candidate: str, device_index: int) -> dict[str, Any]:
-    library = ctypes.CDLL(candidate)
-    fns = _bind(library)
+def _unavailable(error: str) -> dict[str, Any]:
+    return {"available": False, "source": "nvml", "error": error}
 
-    if fns["init"]() != 0:
-        return {"available": False, "source": "nvml", "error": "nvml_init_failed"}
-    try:
+
+def _read_static(fns: dict[str, Any], device: ctypes.c_void_p) -> dict[str, Any]:
+    """Device facts that do not change while NVML stays initialised."""
+    static: dict[str, Any] = {
+        "name": None,
+        "driver_version": None,
+        "power_limit_w": None,
+        "compute_cap": None,
+    }
+
+    if fns["get_cuda_cc"] is not None:
+        major = ctypes.c_int(0)
+        minor = ctypes.c_int(0)
+        if fns["get_cuda_cc"](device, ctypes.byref(major), ctypes.byref(minor)) == 0:
+            static["compute_cap"] = f"{major.value}.{minor.value}"
+
+    if fns["get_name"] is not None:
+        name_buf = ctypes.create_string_buffer(_NVML_DEVICE_NAME_BUFFER_SIZE)
+        if fns["get_name"](device, name_buf, _NVML_DEVICE_NAME_BUFFER_SIZE) == 0:
+            static["name"] = name_buf.value.decode("utf-8", "replace") or None
+
+    if fns["get_driver"] is not None:
+        driver_buf = ctypes.create_string_buffer(
+            _NVML_SYSTEM_DRIVER_VERSION_BUFFER_SIZE
+        )
+        if fns["get_driver"](
+            driver_buf, _NVML_SYSTEM_DRIVER_VERSION_BUFFER_SIZE
+        ) == 0:
+            static["driver_version"] = (
+                driver_buf.value.decode("utf-8", "replace") or None
+            )
+
+    if fns["get_power_limit"] is not None:
+        limit_mw = ctypes.c_uint()
+        if fns["get_power_limit"](device, ctypes.byref(limit_mw)) == 0:
+            static["power_limit_w"] = round(limit_mw.value / 1000.0, 3)
+
+    return static
+
+
+def _read_dynamic(fns: dict[str, Any], device: ctypes.c_void_p) -> dict[str, Any]:
+    """Per-sample metrics. Returns an unavailable dict if memory info fails."""
+    memory = NvmlMemoryInfo()
+    if fns["get_memory"](device, ctypes.byref(memory)) != 0:
+        return _unavailable("nvml_memory_info_failed")
+
+    utilization = NvmlUtilizationInfo()
+    util_ok = fns["get_utilization"](device, ctypes.byref(utilization)) == 0
+
+    dynamic: dict[str, Any] = {
+        "memory_total_mb": int(memory.total // (1024 * 1024)),
+        "memory_used_mb": int(memory.used // (1024 * 1024)),
+        "memory_free_mb": int(memory.free // (1024 * 1024)),
+        "utilization_gpu": int(utilization.gpu) if util_ok else None,
+        "utilization_memory": int(utilization.memory) if util_ok else None,
+        "temperature_c": None,
+        "power_w": None,
+    }
+
+    if fns["get_temperature"] is not None:
+        temp = ctypes.c_uint()
+        if fns["get_temperature"](
+            device, NVML_TEMPERATURE_GPU, ctypes.byref(temp)
+        ) == 0:
+            dynamic["temperature_c"] = int(temp.value)
+
+    if fns["get_power"] is not None:
+        power_mw = ctypes.c_uint()
+        if fns["get_power"](device, ctypes.byref(power_mw)) == 0:
+            dynamic["power_w"] = round(power_mw.value / 1000.0, 3)
+
+    return dynamic
+
+
+class NvmlSampler:
+    """Persistent NVML session for high-cadence sampling.
+
+    ``gpu_status()`` pays dlopen + ``nvmlInit`` + handle lookup +
+    ``nvmlShutdown`` on every call, which is fine for a one-shot probe but
+    perturbs the runtime when a sampler ticks every 50-200 ms. This object
+    initialises NVML once, caches the device handle and the static device
+    facts (name, driver, compute capability, enforced power limit), and
+    ``sample()`` only issues the per-tick queries.
+
+    Contract (same as ``gpu_status``):
+    - ``sample()`` NEVER raises and returns the :data:`KEYS` superset on
+      success, ``{"available": False, "source": "nvml", "error": ...}``
+      otherwise.
+    - A failed open is retried at most every ``retry_interval_s`` so a host
+      without NVML costs one dict per tick, not one dlopen.
+    - A failing ``sample()`` drops the session; the next call reopens it.
+    - ``close()`` calls ``nvmlShutdown`` once; usable as a context manager.
+
+    ``loader`` (default ``ctypes.CDLL``) maps a library candidate to an object
+    exposing the NVML symbols, so tests can pass a fake binding.
+    """
+
+    def __init__(
+        self,
+        device_index: int | None = None,
+        *,
+        loader: Callable[[str], Any] = ctypes.CDLL,
+        candidates: list[str] | None = None,
+        retry_interval_s: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if device_index is None:
+            device_index = _env_int("AXON_GPU_TELEMETRY_DEVICE_INDEX") or 0
+        self.device_index = device_index
+        self._loader = loader
+        self._candidates = candidates
+        self._retry_interval_s = retry_interval_s
+        self._clock = clock
+        self._fns: dict[str, Any] | None = None
+        self._device: ctypes.c_void_p | None = None
+        self._static: dict[str, Any] = {}
+        self.library: str | None = None
+        self.last_error: str | None = None
+        self._next_open_at = 0.0
+        self.opens = 0
+
+    def __enter__(self) -> "NvmlSampler":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    @property
+    def is_open(self) -> bool:
+        return self._fns is not None
+
+    def _open_candidate(self, candidate: str) -> str | None:
+        """Initialise NVML from ``candidate``; returns an error code or None."""
+        fns = _bind(self._loader(candidate))
+        if fns["init"]() != 0:
+            return "nvml_init_failed"
         device = ctypes.c_void_p()
-        if fns["get_handle"](device_index, ctypes.byref(device)) != 0:
-            return {
-                "available": False,
-                "source": "nvml",
-                "error": "nvml_device_handle_failed",
-            }
-
-        memory = NvmlMemoryInfo()
-        if fns["get_memory"](device, ctypes.byref(memory)) != 0:
-            return {
-                "available": False,
-                "source": "nvml",
-                "error": "nvml_memory_info_failed",
-            }
-
-        utilization = NvmlUtilizationInfo()
-        util_ok = fns["get_utilization"](device, ctypes.byref(utilization)) == 0
-
-        result: dict[str, Any] = {
+        opened = False
+        try:
+            if fns["get_handle"](self.device_index, ctypes.byref(device)) != 0:
+                return "nvml_device_handle_failed"
+            static = _read_static(fns, device)
+            opened = True
+        finally:
+            if not opened:
+                _shutdown(fns)
+        self._fns, self._device, self._static = fns, device, static
+        self.library = candidate
+        return None
+
+    def open(self) -> bool:
+        """Open the session if needed. Never raises; False when unavailable."""
+        if self._fns is not None:
+            return True
+        if self._clock() < self._next_open_at:
+            return False
+        last_error = ""
+        candidates = self._candidates if self._candidates is not None else nvml_library_candidates()
+        for candidate in candidates:
+            try:
+                error = self._open_candidate(candidate)
+            except Exception as exc:  # dlopen / missing symbol / segfault-guard
+                last_error = type(exc).__name__
+                continue
+            if error is None:
+                self.opens += 1
+                self.last_error = None
+                return True
+            last_error = error
+        self.last_error = last_error or "nvml_unavailable"
+        self._next_open_at = self._clock() + self._retry_interval_s
+        return False
+
+    def sample(self) -> dict[str, Any]:
+        """Return canonical GPU telemetry from the live session. Never raises."""
+        if not self.open():
+            return _unavailable(self.last_error or "nvml_unavailable")
+        assert self._fns is not None
+        try:
+            dynamic = _read_dynamic(self._fns, self._device)
+        except Exception as exc:
+            dynamic = _unavailable(type(exc).__name__)
+        if dynamic.get("available") is False:
+            # Device lost or driver reset: start over on the next tick.
+            self.last_error = dynamic["error"]
+            self.close()
+            return dynamic
+        return {
             "available": True,
             "source": "nvml",
-            "library": candidate,
-            "name": None,
-            "driver_version": None,
-            "memory_total_mb": int(memory.total // (1024 * 1024)),
-            "memory_used_mb": int(memory.used // (1024 * 1024)),
-            "memory_free_mb": int(memory.free // (1024 * 1024)),
-            "utilization_gpu": int(utilization.gpu) if util_ok else None,
-            "utilization_memory": int(utilization.memory) if util_ok else None,
-            "temperature_c": None,
-            "power_w": None,
-            "power_limit_w": None,
-            "compute_cap": None,
+            "library": self.library,
+            **self._static,
+            **dynamic,
         }
 
-        if fns["get_cuda_cc"] is not None:
-            major = ctypes.c_int(0)
-            minor = ctypes.c_int(0)
-            if fns["get_cuda_cc"](device, ctypes.byref(major), ctypes.byref(minor)) == 0:
-                result["compute_cap"] = f"{major.value}.{minor.value}"
+    def close(self) -> None:
+        fns, self._fns, self._device = self._fns, None, None
+        if fns is not None:
+            _shutdown(fns)
 
-        if fns["get_name"] is not None:
-            name_buf = ctypes.create_string_buffer(_NVML_DEVICE_NAME_BUFFER_SIZE)
-            if fns["get_name"](device, name_buf, _NVML_DEVICE_NAME_BUFFER_SIZE) == 0:
-                result["name"] = name_buf.value.decode("utf-8", "replace") or None
 
-        if fns["get_driver"] is not None:
-            driver_buf = ctypes.create_string_buffer(
-                _NVML_SYSTEM_DRIVER_VERSION_BUFFER_SIZE
-            )
-            if fns["get_driver"](
-                driver_buf, _NVML_SYSTEM_DRIVER_VERSION_BUFFER_SIZE
-            ) == 0:
-                result["driver_version"] = (
-                    driver_buf.value.decode("utf-8", "replace") or None
-                )
-
-        if fns["get_temperature"] is not None:
-            temp = ctypes.c_uint()
-            if fns["get_temperature"](
-                device, NVML_TEMPERATURE_GPU, ctypes.byref(temp)
-            ) == 0:
-                result["temperature_c"] = int(temp.value)
-
-        if fns["get_power"] is not None:
-            power_mw = ctypes.c_uint()
-            if fns["get_power"](device, ctypes.byref(power_mw)) == 0:
-                result["power_w"] = round(power_mw.value / 1000.0, 3)
-
-        if fns["get_power_limit"] is not None:
-            limit_mw = ctypes.c_uint()
-            if fns["get_power_limit"](device, ctypes.byref(limit_mw)) == 0:
-                result["power_limit_w"] = round(limit_mw.value / 1000.0, 3)
-
-        return result
-    finally:
-        try:
-            fns["shutdown"]()
-        except Exception:
-            pass
+def _shutdown(fns: dict[str, Any]) -> None:
+    try:
+        fns["shutdown"]()
+    except Exception:
+        pass
 
 
 def gpu_status(device_index: int | None = None) -> dict[str, Any]:
@@ -275,25 +399,11 @@ def gpu_status(device_index: int | None = None) -> dict[str, Any]:
 
     On success returns a dict with the :data:`KEYS` superset; on any failure
     returns ``{"available": False, "source": "nvml", "error": "<reason>"}``.
+    One-shot: initialises and shuts NVML down around the call. Periodic
+    samplers should hold an :class:`NvmlSampler` instead.
     """
-    if device_index is None:
-        device_index = _env_int("AXON_GPU_TELEMETRY_DEVICE_INDEX") or 0
-
-    last_error = ""
-    for candidate in nvml_library_candidates():
-        try:
-            status = _status_for_library(candidate, device_index)
-        except Exception as exc:  # dlopen / missing symbol / segfault-guard
-            last_error = type(exc).__name__
-            continue
-        if status.get("available"):
-            return status
-        last_error = status.get("error", last_error)
-    return {
-        "available": False,
-        "source": "nvml",
-        "error": last_error or "nvml_unavailable",
-    }
+    with NvmlSampler(device_index, retry_interval_s=0.0) as sampler:
+        return sampler.sample()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,201 @@
+#!/usr/bin/env python3
+"""Shared /proc process sampler for the qualification / sensor scripts.
+
+Replaces the per-script ``parse_proc_status`` copies and the ``ps -o %cpu``
+/ ``ps -o %mem`` forks (one process per field per sample). Everything is read
+straight from ``/proc/<pid>``:
+
+- ``stat``          utime/stime jiffies, threads, start time
+- ``status``        VmRSS / RssAnon / RssFile / RssShmem / VmHWM
+- ``smaps_rollup``  Pss and its anon/file/shmem split, Swap
+- ``io``            rchar / wchar / read_bytes / write_bytes
+- ``fd``            open descriptor count
+
+Contract:
+- `ProcSampler.sample({role: pid})` NEVER raises. A role whose pid is None or
+  gone maps to ``{"alive": False}``; unreadable files (``io``/``smaps_rollup``
+  of another user's process) simply leave their keys out.
+- CPU% is computed from jiffy deltas against the previous sample of the same
+  process (same pid AND start time, so a recycled pid starts fresh). The first
+  sample of a process falls back to the lifetime average, which is what
+  ``ps %cpu`` reported. ``cpu_window`` says which one you got.
+- IO rates are deltas too, and absent on a process's first sample.
+- The legacy keys (``rss_bytes``, ``rss_anon_bytes``, ``rss_file_bytes``,
+  ``rss_shmem_bytes``, ``cpu_percent``, ``mem_percent``) keep their names;
+  ``cpu_percent`` / ``mem_percent`` are floats instead of ``ps`` strings.
+"""
+
+from __future__ import annotations
+
+import os
+import time
+from pathlib import Path
+from typing import Any, Callable, Mapping
+
+PROC_ROOT = Path("/proc")
+CLOCK_TICKS = os.sysconf("SC_CLK_TCK") if hasattr(os, "sysconf") else 100
+
+_STATUS_KEYS = {
+    "VmRSS:": "rss_bytes",
+    "RssAnon:": "rss_anon_bytes",
+    "RssFile:": "rss_file_bytes",
+    "RssShmem:": "rss_shmem_bytes",
+    "VmHWM:": "rss_peak_bytes",
+}
+_SMAPS_ROLLUP_KEYS = {
+    "Pss:": "pss_bytes",
+    "Pss_Anon:": "pss_anon_bytes",
+    "Pss_File:": "pss_file_bytes",
+    "Pss_Shmem:": "pss_shmem_bytes",
+    "Swap:": "swap_bytes",
+}
+_IO_KEYS = ("rchar", "wchar", "read_bytes", "write_bytes")
+LEGACY_EMPTY = {
+    "rss_bytes": 0,
+    "rss_anon_bytes": 0,
+    "rss_file_bytes": 0,
+    "rss_shmem_bytes": 0,
+}
+
+
+def _read_text(path: Path) -> str | None:
+    try:
+        return path.read_text()
+    except OSError:
+        return None
+
+
+def _kib_fields(text: str | None, keys: Mapping[str, str]) -> dict[str, int]:
+    result: dict[str, int] = {}
+    if text is None:
+        return result
+    for line in text.splitlines():
+        parts = line.split()
+        if len(parts) >= 2 and parts[0] in keys:
+            try:
+                result[keys[parts[0]]] = int(parts[1]) * 1024
+            except ValueError:
+                pass
+    return result
+
+
+def parse_stat(text: str) -> dict[str, int] | None:
+    """Fields of ``/proc/<pid>/stat`` that the sampler uses.
+
+    The command name may contain spaces and parentheses, so fields are split
+    after the LAST ``)``.
+    """
+    close = text.rfind(")")
+    if close == -1:
+        return None
+    fields = text[close + 2 :].split()
+    # fields[0] is field 3 (state) in proc(5) numbering.
+    try:
+        return {
+            "utime": int(fields[11]),
+            "stime": int(fields[12]),
+            "threads": int(fields[17]),
+            "start_ticks": int(fields[19]),
+        }
+    except (IndexError, ValueError):
+        return None
+
+
+class ProcSampler:
+    """Sample several processes per tick from /proc, keeping deltas per process."""
+
+    def __init__(
+        self,
+        *,
+        proc_root: Path = PROC_ROOT,
+        clock: Callable[[], float] = time.monotonic,
+        clock_ticks: int = CLOCK_TICKS,
+    ) -> None:
+        self.proc_root = Path(proc_root)
+        self.clock = clock
+        self.clock_ticks = clock_ticks
+        self._previous: dict[tuple[int, int], tuple[float, int, dict[str, int]]] = {}
+        self._mem_total_bytes: int | None = None
+
+    def _uptime_s(self) -> float | None:
+        text = _read_text(self.proc_root / "uptime")
+        try:
+            return float(text.split()[0]) if text else None
+        except (IndexError, ValueError):
+            return None
+
+    def _memory_total(self) -> int | None:
+        if self._mem_total_bytes is None:
+            fields = _kib_fields(_read_text(self.proc_root / "meminfo"), {"MemTotal:": "total"})
+            self._mem_total_bytes = fields.get("total")
+        return self._mem_total_bytes
+
+    def sample_pid(self, pid: int) -> dict[str, Any]:
+        root = self.proc_root / str(pid)
+        now = self.clock()
+        stat_text = _read_text(root / "stat")
+        stat = parse_stat(stat_text) if stat_text else None
+        if stat is None:
+            return {"alive": False, "pid": pid}
+
+        result: dict[str, Any] = {"alive": True, "pid": pid, **LEGACY_EMPTY}
+        result.update(_kib_fields(_read_text(root / "status"), _STATUS_KEYS))
+        result.update(_kib_fields(_read_text(root / "smaps_rollup"), _SMAPS_ROLLUP_KEYS))
+        result["threads"] = stat["threads"]
+        start_s = stat["start_ticks"] / self.clock_ticks
+        result["start_time_s"] = start_s
+        memory_total = self._memory_total()
+        if memory_total:
+            result["mem_percent"] = round(result["rss_bytes"] * 100.0 / memory_total, 2)
+        try:
+            result["fd_count"] = len(os.listdir(root / "fd"))
+        except OSError:
+            pass
+
+        io: dict[str, int] = {}
+        for line in (_read_text(root / "io") or "").splitlines():
+            key, _, value = line.partition(":")
+            if key in _IO_KEYS:
+                try:
+                    io[key] = int(value)
+                except ValueError:
+                    pass
+        result.update({f"io_{key}": value for key, value in io.items()})
+
+        cpu_ticks = stat["utime"] + stat["stime"]
+        identity = (pid, stat["start_ticks"])
+        previous = self._previous.get(identity)
+        if previous is not None and now > previous[0]:
+            elapsed = now - previous[0]
+            result["cpu_percent"] = round(
+                (cpu_ticks - previous[1]) / self.clock_ticks / elapsed * 100.0, 2
+            )
+            result["cpu_window"] = "delta"
+            result["cpu_window_s"] = round(elapsed, 3)
+            for key, value in io.items():
+                if key in previous[2]:
+                    result[f"io_{key}_per_s"] = round((value - previous[2][key]) / elapsed, 1)
+        else:
+            uptime = self._uptime_s()
+            lifetime = uptime - start_s if uptime is not None else 0.0
+            result["cpu_percent"] = (
+                round(cpu_ticks / self.clock_ticks / lifetime * 100.0, 2) if lifetime > 0 else 0.0
+            )
+            result["cpu_window"] = "lifetime"
+        self._previous[identity] = (now, cpu_ticks, io)
+        return result
+
+    def sample(self, pids: Mapping[str, int | None]) -> dict[str, dict[str, Any]]:
+        """One entry per role; processes no longer sampled drop their history."""
+        samples: dict[str, dict[str, Any]] = {}
+        for role, pid in pids.items():
+            if pid is None:
+                samples[role] = {"alive": False, "pid": None}
+                continue
+            try:
+                samples[role] = self.sample_pid(pid)
+            except Exception as exc:  # never raise from a sampler tick
+                samples[role] = {"alive": False, "pid": pid, "error": type(exc).__name__}
+        live = {pid for pid in pids.values() if pid is not None}
+        self._previous = {key: value for key, value in self._previous.items() if key[0] in live}
+        return samples
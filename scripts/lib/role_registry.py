@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+"""Role-aware Axon PID resolution from run-root pid files.
+
+Python counterpart of ``axon_detect_role_from_pid_files`` in
+``axon-role-layout.sh``. The samplers used to run ``pgrep -af axon-core`` and
+take the first match, which forks every sample and is wrong in the split
+brain/indexer topology: the brain and the indexer are separate processes and
+their metrics must not be attributed to whichever one pgrep listed first.
+
+`RoleRegistry.resolve()` returns ``{role: pid | None}`` for ``brain``,
+``indexer`` and, when a monolith is running, the legacy ``core`` role. Pid
+files are re-read only when their stat changes; a cached pid is revalidated
+on every call by comparing the process start time in ``/proc/<pid>/stat``,
+so a restart (new pid, or a recycled pid with a new start time) is seen on
+the next call without any subprocess.
+"""
+
+from __future__ import annotations
+
+import os
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterable
+
+PROC_ROOT = Path("/proc")
+ROLES = ("brain", "indexer")
+LEGACY_ROLE = "core"
+# Run-root relative pid files per role. Brain and indexer have their own run
+# roots (run-brain / run-indexer); the monolith keeps AXON_PID_FILE.
+ROLE_PID_FILES = {
+    "brain": ("run-brain/axon-brain.pid",),
+    "indexer": ("run-indexer/axon-indexer.pid",),
+}
+LEGACY_PID_FILES = {
+    "dev": ("run/axon-core.pid",),
+    "live": ("live-run/axon-core.pid",),
+}
+
+
+def instance_root(project_root: Path, instance_kind: str) -> Path:
+    return Path(project_root) / (".axon-dev" if instance_kind == "dev" else ".axon")
+
+
+def current_instance_kind() -> str:
+    raw = os.environ.get("AXON_INSTANCE_KIND", "").strip().lower()
+    return raw if raw in {"dev", "live"} else "dev"
+
+
+def process_start_ticks(pid: int, *, proc_root: Path = PROC_ROOT) -> int | None:
+    """Start time (field 22 of /proc/<pid>/stat) or None if the pid is gone."""
+    try:
+        text = (proc_root / str(pid) / "stat").read_text()
+    except OSError:
+        return None
+    fields = text[text.rfind(")") + 2 :].split()
+    try:
+        return int(fields[19])
+    except (IndexError, ValueError):
+        return None
+
+
+def process_binary(pid: int, *, proc_root: Path = PROC_ROOT) -> str | None:
+    """Basename of argv[0], or None when the cmdline is unreadable."""
+    try:
+        raw = (proc_root / str(pid) / "cmdline").read_bytes()
+    except OSError:
+        return None
+    argv0 = raw.split(b"\x00", 1)[0].decode("utf-8", "replace")
+    return os.path.basename(argv0) if argv0 else None
+
+
+@dataclass
+class _CachedPid:
+    file_key: tuple[int, int, int]
+    pid: int
+    start_ticks: int
+
+
+class RoleRegistry:
+    """Cached ``{role: pid}`` map for one Axon instance."""
+
+    def __init__(
+        self,
+        project_root: Path,
+        instance_kind: str | None = None,
+        *,
+        proc_root: Path = PROC_ROOT,
+        roles: Iterable[str] = ROLES,
+    ) -> None:
+        self.instance_kind = instance_kind or current_instance_kind()
+        self.root = instance_root(project_root, self.instance_kind)
+        self.proc_root = Path(proc_root)
+        self.pid_files: dict[str, tuple[Path, ...]] = {
+            role: tuple(self.root / relative for relative in ROLE_PID_FILES[role]) for role in roles
+        }
+        self.pid_files[LEGACY_ROLE] = tuple(
+            self.root / relative for relative in LEGACY_PID_FILES.get(self.instance_kind, ())
+        )
+        self._cache: dict[Path, _CachedPid] = {}
+        self.restarts = dict.fromkeys(self.pid_files, 0)
+        self._last: dict[str, tuple[int, int] | None] = dict.fromkeys(self.pid_files)
+
+    def _from_file(self, pid_file: Path) -> _CachedPid | None:
+        try:
+            stat = pid_file.stat()
+        except OSError:
+            self._cache.pop(pid_file, None)
+            return None
+        file_key = (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+        cached = self._cache.get(pid_file)
+        if cached is not None and cached.file_key == file_key:
+            if process_start_ticks(cached.pid, proc_root=self.proc_root) == cached.start_ticks:
+                return cached
+            # Same file, different process: re-validate from scratch below.
+            self._cache.pop(pid_file, None)
+        try:
+            pid = int(pid_file.read_text().strip())
+        except (OSError, ValueError):
+            self._cache.pop(pid_file, None)
+            return None
+        start_ticks = process_start_ticks(pid, proc_root=self.proc_root)
+        if start_ticks is None:
+            self._cache.pop(pid_file, None)
+            return None
+        binary = process_binary(pid, proc_root=self.proc_root)
+        if binary is not None and not binary.startswith("axon-"):
+            # Stale pid file whose pid was recycled by an unrelated process.
+            self._cache.pop(pid_file, None)
+            return None
+        resolved = _CachedPid(file_key, pid, start_ticks)
+        self._cache[pid_file] = resolved
+        return resolved
+
+    def resolve(self) -> dict[str, int | None]:
+        """Live pid per role; the legacy ``core`` role only when it is running."""
+        pids: dict[str, int | None] = {}
+        for role, pid_files in self.pid_files.items():
+            resolved = None
+            for pid_file in pid_files:
+                resolved = self._from_file(pid_file)
+                if resolved is not None:
+                    break
+            identity = (resolved.pid, resolved.start_ticks) if resolved is not None else None
+            previous = self._last[role]
+            if identity is not None and previous is not None and identity != previous:
+                self.restarts[role] += 1
+            if identity is not None:
+                self._last[role] = identity
+            if role != LEGACY_ROLE or resolved is not None:
+                pids[role] = resolved.pid if resolved is not None else None
+        return pids
+
+    def primary_pid(self, preferred_role: str | None = None) -> int | None:
+        return primary_role(self.resolve(), preferred_role)[1]
+
+
+def primary_role(
+    pids: dict[str, int | None], preferred_role: str | None = None
+) -> tuple[str | None, int | None]:
+    """``(role, pid)`` of ``preferred_role`` if alive, else the first live role.
+
+    Without a preference the indexer wins over the brain, as the historical
+    pid-file probe did: it is the process doing the ingestion work.
+    """
+    if preferred_role and pids.get(preferred_role) is not None:
+        return preferred_role, pids[preferred_role]
+    for role in ("indexer", "brain", LEGACY_ROLE):
+        if pids.get(role) is not None:
+            return role, pids[role]
+    return None, None
@@ -1,63 +1,723 @@
 #!/usr/bin/env python3
-import sys
-import os
+"""stdio <-> HTTP bridge for IDE clients that only speak MCP over stdio.
+
+Each stdin line is one JSON-RPC message. Requests are forwarded concurrently
+over a small pool of keep-alive HTTP/1.1 connections, so a slow
+``retrieve_context`` no longer blocks the ``status`` call queued behind it.
+Responses are written to stdout as they complete; the client matches them
+by JSON-RPC id. ``notifications/cancelled`` aborts the matching in-flight
+request.
+
+Bodies are streamed, never buffered whole: a ``text/event-stream`` reply is
+forwarded one event per line as each event completes, and a chunked (or
+large) JSON reply is copied to stdout piece by piece as it arrives, so the
+client sees the first byte of a multi-MB ``soll_export`` immediately and the
+proxy's memory stays bounded by ``READ_SIZE``. stdout is claimed only once a
+reply's first byte is in hand, never while waiting for a response head.
+Timeouts bound the wait for the response head and every gap between body
+reads.
+
+Upstream resolution: ``--url`` > ``AXON_MCP_URL`` > ``AXON_INSTANCE_KIND``
+(``dev`` -> 44139, otherwise the live 44129).
+
+Timeouts: ``--timeout`` / ``AXON_PROXY_TIMEOUT`` (default 10 s) applies to
+every call; ``--tool-timeout NAME=SECONDS`` (repeatable) or
+``AXON_PROXY_TOOL_TIMEOUTS="retrieve_context=60,soll_export=120"`` overrides
+it per ``tools/call`` tool name.
+
+Response cache (off by default): ``--cache`` enables an in-proxy LRU+TTL
+cache for the read-only tools agents poll (``status``, ``project_status``,
+``inspect``, ``query``); ``--cache-tool NAME=SECONDS`` or
+``AXON_PROXY_CACHE_TOOLS`` picks the allowlist and per-tool TTLs. Entries are
+keyed on tool name, canonical JSON arguments and ``X-Workspace-Path``. Any
+``tools/call`` outside ``READ_ONLY_TOOLS`` (``soll_manager``,
+``soll_apply_plan``, ...) drops every entry, so unknown tools are treated
+as mutations. The local ``axon_proxy/stats`` request returns hit/miss
+counters without reaching the brain.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import contextlib
 import json
-import urllib.request
-import urllib.error
+import os
+import sys
+import threading
+import time
+import urllib.parse
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, Callable
 
-def main():
-    while True:
-        line = sys.stdin.readline()
-        if not line:
-            break
-        line = line.strip()
+from async_http import iter_http_body, read_http_head
+
+LIVE_MCP_URL = "http://127.0.0.1:44129/mcp"
+DEV_MCP_URL = "http://127.0.0.1:44139/mcp"
+DEFAULT_TIMEOUT_S = 10.0
+DEFAULT_MAX_CONNECTIONS = 8
+READ_SIZE = 64 * 1024
+_LINE_BREAKS_TO_SPACES = bytes.maketrans(b"\r\n", b"  ")
+DEFAULT_TOOL_TIMEOUTS_S = {
+    "retrieve_context": 60.0,
+    "soll_export": 120.0,
+    "soll_apply_plan": 60.0,
+}
+# Tools that never change brain state. Only these may be cached; a call to
+# any other tool invalidates the cache.
+READ_ONLY_TOOLS = {
+    "help",
+    "status",
+    "project_status",
+    "project_registry_lookup",
+    "mcp_surface_diagnostics",
+    "inspect",
+    "query",
+    "why",
+    "path",
+    "anomalies",
+    "change_safety",
+    "conception_view",
+    "retrieve_context",
+    "retrieve_context_layered",
+    "soll_query_context",
+    "soll_work_plan",
+    "soll_roadmap",
+    "soll_validate",
+    "soll_id_registry",
+    "soll_relation_schema",
+    "snapshot_history",
+    "snapshot_diff",
+    "job_status",
+}
+DEFAULT_CACHE_TTLS_S = {
+    "status": 2.0,
+    "project_status": 5.0,
+    "inspect": 10.0,
+    "query": 10.0,
+}
+DEFAULT_CACHE_MAX_ENTRIES = 256
+CACHE_MAX_ENTRY_BYTES = 1024 * 1024
+STATS_METHOD = "axon_proxy/stats"
+
+
+def resolve_upstream_url(explicit: str | None = None) -> str:
+    if explicit:
+        return explicit
+    configured = os.environ.get("AXON_MCP_URL", "").strip()
+    if configured:
+        return configured
+    if os.environ.get("AXON_INSTANCE_KIND", "").strip().lower() == "dev":
+        return DEV_MCP_URL
+    return LIVE_MCP_URL
+
+
+def parse_tool_timeouts(entries: list[str], *, what: str = "tool timeout") -> dict[str, float]:
+    timeouts: dict[str, float] = {}
+    for entry in entries:
+        for item in entry.split(","):
+            name, sep, raw = item.strip().partition("=")
+            if not item.strip():
+                continue
+            if not sep or not name.strip():
+                raise ValueError(f"{what} must look like NAME=SECONDS, got {item!r}")
+            value = float(raw)
+            if value <= 0:
+                raise ValueError(f"{what} for {name} must be > 0")
+            timeouts[name.strip()] = value
+    return timeouts
+
+
+@dataclass
+class ProxyConfig:
+    url: str
+    timeout_s: float = DEFAULT_TIMEOUT_S
+    tool_timeouts_s: dict[str, float] = field(default_factory=lambda: dict(DEFAULT_TOOL_TIMEOUTS_S))
+    max_connections: int = DEFAULT_MAX_CONNECTIONS
+    workspace_path: str = field(default_factory=os.getcwd)
+    cache_ttls_s: dict[str, float] = field(default_factory=dict)
+    cache_max_entries: int = DEFAULT_CACHE_MAX_ENTRIES
+
+    def __post_init__(self) -> None:
+        unsafe = sorted(set(self.cache_ttls_s) - READ_ONLY_TOOLS)
+        if unsafe:
+            raise ValueError(f"refusing to cache non read-only tools: {', '.join(unsafe)}")
+
+    def timeout_for(self, message: Any) -> float:
+        name = tool_name(message)
+        if name is not None and name in self.tool_timeouts_s:
+            return self.tool_timeouts_s[name]
+        return self.timeout_s
+
+
+def tool_name(message: Any) -> str | None:
+    if isinstance(message, dict) and message.get("method") == "tools/call":
+        params = message.get("params")
+        name = params.get("name") if isinstance(params, dict) else None
+        if isinstance(name, str):
+            return name
+    return None
+
+
+class ResponseCache:
+    """LRU + per-tool TTL cache of successful ``tools/call`` results.
+
+    Results are stored without their JSON-RPC id and re-addressed on a hit.
+    ``generation`` moves on every invalidation so a read that was already in
+    flight when a mutation went out cannot store its possibly stale result.
+    """
+
+    def __init__(
+        self,
+        ttls_s: dict[str, float],
+        max_entries: int,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.ttls_s = dict(ttls_s)
+        self.max_entries = max(1, max_entries)
+        self._clock = clock
+        self._entries: OrderedDict[tuple[str, str, str], tuple[float, Any]] = OrderedDict()
+        self.generation = 0
+        self.hits = 0
+        self.misses = 0
+        self.stores = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    @staticmethod
+    def key(name: str, arguments: Any, workspace_path: str) -> tuple[str, str, str]:
+        canonical = json.dumps(arguments if arguments is not None else {}, sort_keys=True, separators=(",", ":"))
+        return name, canonical, workspace_path
+
+    def get(self, key: tuple[str, str, str]) -> Any | None:
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] > self._clock():
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+        if entry is not None:
+            del self._entries[key]
+        self.misses += 1
+        return None
+
+    def put(self, key: tuple[str, str, str], result: Any, generation: int) -> None:
+        if generation != self.generation:
+            return
+        self._entries[key] = (self._clock() + self.ttls_s[key[0]], result)
+        self._entries.move_to_end(key)
+        self.stores += 1
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def invalidate(self) -> None:
+        self.generation += 1
+        self.invalidations += 1
+        self._entries.clear()
+
+    def stats(self) -> dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "enabled": True,
+            "tools": dict(sorted(self.ttls_s.items())),
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": self.hits / lookups if lookups else None,
+            "stores": self.stores,
+            "evictions": self.evictions,
+            "invalidations": self.invalidations,
+        }
+
+
+class _Capture:
+    """Bounded copy of a streamed reply, kept only to fill the cache."""
+
+    def __init__(self, limit: int) -> None:
+        self.limit = limit
+        self.buffer: bytearray | None = bytearray()
+
+    def add(self, piece: bytes) -> None:
+        if self.buffer is not None:
+            self.buffer.extend(piece)
+            if len(self.buffer) > self.limit:
+                self.buffer = None
+
+    def replace(self, payload: bytes) -> None:
+        self.buffer = bytearray(payload) if len(payload) <= self.limit else None
+
+
+class UpstreamConnection:
+    def __init__(self, host: str, port: int) -> None:
+        self.host = host
+        self.port = port
+        self.reader: asyncio.StreamReader | None = None
+        self.writer: asyncio.StreamWriter | None = None
+
+    @property
+    def is_open(self) -> bool:
+        return self.writer is not None and not self.writer.is_closing()
+
+    async def open(self) -> None:
+        self.reader, self.writer = await asyncio.open_connection(self.host, self.port)
+
+    async def close(self) -> None:
+        writer, self.reader, self.writer = self.writer, None, None
+        if writer is not None:
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except OSError:
+                pass
+
+
+class UpstreamResponse:
+    """Response head plus an incremental body reader bound to one connection.
+
+    The body is never buffered whole: ``iter_body`` yields de-chunked pieces
+    of at most ``READ_SIZE`` bytes as they arrive, each read bounded by the
+    caller's idle timeout. The connection goes back to the pool only when
+    the body was read to its framed end.
+    """
+
+    def __init__(self, reader: asyncio.StreamReader, status: int, headers: dict[str, str]) -> None:
+        self._reader = reader
+        self.status = status
+        self.headers = headers
+        self.complete = False
+
+    @property
+    def is_event_stream(self) -> bool:
+        return self.headers.get("content-type", "").split(";", 1)[0].strip().lower() == "text/event-stream"
+
+    @property
+    def reusable(self) -> bool:
+        framed = (
+            "content-length" in self.headers
+            or "chunked" in self.headers.get("transfer-encoding", "").lower()
+            or self.status in {204, 304}
+        )
+        return self.complete and framed and self.headers.get("connection", "").lower() != "close"
+
+    async def iter_body(self, idle_timeout_s: float) -> AsyncIterator[bytes]:
+        body = iter_http_body(
+            self._reader, self.status, self.headers, idle_timeout_s=idle_timeout_s, read_size=READ_SIZE
+        )
+        async for piece in body:
+            yield piece
+        self.complete = True
+
+
+class UpstreamPool:
+    """Bounded pool of keep-alive HTTP/1.1 connections to the MCP endpoint."""
+
+    def __init__(self, url: str, max_connections: int) -> None:
+        parsed = urllib.parse.urlsplit(url)
+        if parsed.scheme != "http" or not parsed.hostname:
+            raise ValueError(f"unsupported upstream MCP URL: {url}")
+        self.url = url
+        self.host = parsed.hostname
+        self.port = parsed.port or 80
+        self.path = parsed.path or "/"
+        self._idle: list[UpstreamConnection] = []
+        self._slots = asyncio.Semaphore(max(1, max_connections))
+
+    async def close(self) -> None:
+        idle, self._idle = self._idle, []
+        for conn in idle:
+            await conn.close()
+
+    @contextlib.asynccontextmanager
+    async def request(
+        self,
+        body: bytes,
+        headers: dict[str, str],
+        timeout_s: float,
+    ) -> AsyncIterator[UpstreamResponse]:
+        """POST ``body`` and yield the response once its head has arrived.
+
+        A stale keep-alive connection is retried once on a fresh socket; no
+        body byte has been handed to the caller at that point, so the retry
+        is invisible.
+        """
+        async with self._slots:
+            conn = self._idle.pop() if self._idle else UpstreamConnection(self.host, self.port)
+            response: UpstreamResponse | None = None
+            try:
+                for attempt in range(2):
+                    reused = conn.is_open
+                    try:
+                        response = await asyncio.wait_for(self._send(conn, body, headers), timeout_s)
+                    except (ConnectionError, asyncio.IncompleteReadError):
+                        await conn.close()
+                        if reused and attempt == 0:
+                            continue
+                        raise
+                    break
+                assert response is not None
+                yield response
+            finally:
+                if response is not None and response.reusable and conn.is_open:
+                    self._idle.append(conn)
+                else:
+                    await conn.close()
+
+    async def _send(self, conn: UpstreamConnection, body: bytes, headers: dict[str, str]) -> UpstreamResponse:
+        if not conn.is_open:
+            await conn.open()
+        assert conn.reader is not None and conn.writer is not None
+        head = [f"POST {self.path} HTTP/1.1", f"Host: {self.host}:{self.port}"]
+        head.extend(f"{name}: {value}" for name, value in headers.items())
+        head.append(f"Content-Length: {len(body)}")
+        conn.writer.write(("\r\n".join(head) + "\r\n\r\n").encode("utf-8") + body)
+        await conn.writer.drain()
+        status, _reason, message_headers = await read_http_head(conn.reader)
+        return UpstreamResponse(
+            conn.reader,
+            status,
+            {name.lower(): value for name, value in message_headers.items()},
+        )
+
+
+def error_line(request_id: Any, code: int, message: str) -> bytes:
+    return json.dumps(
+        {"jsonrpc": "2.0", "id": request_id, "error": {"code": code, "message": message}}
+    ).encode("utf-8")
+
+
+def single_line(payload: bytes) -> bytes:
+    # Raw CR/LF can only be insignificant whitespace in valid JSON (string
+    # escapes are \n), so flattening them keeps newline-delimited framing.
+    return payload.translate(_LINE_BREAKS_TO_SPACES)
+
+
+class StdioProxy:
+    def __init__(self, config: ProxyConfig, write: Callable[[bytes], None]) -> None:
+        self.config = config
+        self.pool = UpstreamPool(config.url, config.max_connections)
+        self._write = write
+        # Held for one complete line (a streamed JSON body or an SSE event)
+        # so concurrent responses never interleave inside it.
+        self._stdout = asyncio.Lock()
+        self._inflight: dict[Any, asyncio.Task[None]] = {}
+        self._tasks: set[asyncio.Task[None]] = set()
+        self.protocol_version: str | None = None
+        self.cache = (
+            ResponseCache(config.cache_ttls_s, config.cache_max_entries) if config.cache_ttls_s else None
+        )
+
+    async def emit(self, line: bytes) -> None:
+        async with self._stdout:
+            self._write(single_line(line).strip() + b"\n")
+
+    def emit_nowait(self, line: bytes) -> None:
+        task = asyncio.create_task(self.emit(line))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    def stats_line(self, request_id: Any) -> bytes:
+        cache = self.cache.stats() if self.cache is not None else {"enabled": False}
+        result = {"cache": cache, "inflight": len(self._inflight), "upstream": self.config.url}
+        return json.dumps({"jsonrpc": "2.0", "id": request_id, "result": result}).encode("utf-8")
+
+    def cache_lookup(self, message: Any) -> tuple[tuple[str, str, str] | None, Any | None]:
+        """Return ``(key, cached_result)``; the key is None when uncacheable.
+
+        Calls to tools outside ``READ_ONLY_TOOLS`` invalidate the cache here,
+        before they are sent upstream.
+        """
+        name = tool_name(message)
+        if self.cache is None or name is None:
+            return None, None
+        if name not in READ_ONLY_TOOLS:
+            self.cache.invalidate()
+            return None, None
+        if name not in self.cache.ttls_s or message.get("id") is None:
+            return None, None
+        key = self.cache.key(name, message["params"].get("arguments"), self.config.workspace_path)
+        return key, self.cache.get(key)
+
+    def headers(self) -> dict[str, str]:
+        headers = {
+            "Content-Type": "application/json",
+            "Accept": "application/json, text/event-stream",
+            "X-Workspace-Path": self.config.workspace_path,
+        }
+        if self.protocol_version:
+            headers["MCP-Protocol-Version"] = self.protocol_version
+        return headers
+
+    def dispatch(self, raw: bytes) -> None:
+        line = raw.strip()
         if not line:
-            continue
-            
+            return
         try:
-            req_data = json.loads(line)
+            message = json.loads(line)
         except json.JSONDecodeError:
-            continue
-            
-        req_id = req_data.get("id", 1)
-        
+            return
+        if isinstance(message, dict) and message.get("method") == STATS_METHOD:
+            if message.get("id") is not None:
+                self.emit_nowait(self.stats_line(message["id"]))
+            return
+        if isinstance(message, dict) and message.get("method") == "notifications/cancelled":
+            params = message.get("params")
+            target = params.get("requestId") if isinstance(params, dict) else None
+            task = self._inflight.get(target)
+            if task is not None:
+                task.cancel()
+        task = asyncio.create_task(self.forward(line, message))
+        name = tool_name(message)
+        if self.cache is not None and name is not None and name not in READ_ONLY_TOOLS:
+            # Invalidated again on completion: reads issued while the
+            # mutation was in flight may carry pre-mutation state.
+            task.add_done_callback(lambda _task: self.cache.invalidate())
+        request_id = message.get("id") if isinstance(message, dict) else None
+        if request_id is not None:
+            self._inflight[request_id] = task
+            task.add_done_callback(lambda _task, key=request_id: self._inflight.pop(key, None))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def forward(self, line: bytes, message: Any) -> None:
+        request_id = message.get("id") if isinstance(message, dict) else None
+        timeout_s = self.config.timeout_for(message)
+        cache_key, cached = self.cache_lookup(message)
+        if cached is not None:
+            await self.emit(json.dumps({"jsonrpc": "2.0", "id": request_id, "result": cached}).encode("utf-8"))
+            return
+        capture = _Capture(CACHE_MAX_ENTRY_BYTES) if cache_key is not None else None
+        generation = self.cache.generation if self.cache is not None else 0
         try:
-            req = urllib.request.Request(
-                "http://127.0.0.1:44129/mcp", 
-                data=line.encode('utf-8'),
-                headers={
-                    'Content-Type': 'application/json',
-                    'X-Workspace-Path': os.getcwd()
-                },
-                method='POST'
-            )
-            with urllib.request.urlopen(req, timeout=10) as response:
-                result = response.read().decode('utf-8')
-                if result.strip():
-                    sys.stdout.write(result.strip() + "\n")
-                    sys.stdout.flush()
-        except urllib.error.URLError as e:
-            err_msg = json.dumps({
-                "jsonrpc": "2.0",
-                "id": req_id,
-                "error": {
-                    "code": -32000,
-                    "message": f"Axon Backend is unavailable or timed out: {e}"
-                }
-            })
-            sys.stdout.write(err_msg + "\n")
-            sys.stdout.flush()
-        except Exception as e:
-            err_msg = json.dumps({
-                "jsonrpc": "2.0",
-                "id": req_id,
-                "error": {
-                    "code": -32603,
-                    "message": f"Internal proxy error: {e}"
-                }
-            })
-            sys.stdout.write(err_msg + "\n")
-            sys.stdout.flush()
+            async with self.pool.request(line, self.headers(), timeout_s) as response:
+                negotiated = response.headers.get("mcp-protocol-version")
+                if negotiated and isinstance(message, dict) and message.get("method") == "initialize":
+                    self.protocol_version = negotiated
+                if response.status >= 400:
+                    if request_id is not None:
+                        await self.emit(
+                            error_line(
+                                request_id,
+                                -32000,
+                                f"Axon Backend is unavailable or timed out: HTTP {response.status}",
+                            )
+                        )
+                    return
+                if response.is_event_stream:
+                    await self.relay_events(response, timeout_s, capture)
+                else:
+                    await self.relay_body(response, timeout_s, capture)
+        except asyncio.CancelledError:
+            return
+        except (asyncio.TimeoutError, OSError, asyncio.IncompleteReadError) as exc:
+            if request_id is not None:
+                detail = f"timed out after {timeout_s:g}s" if isinstance(exc, asyncio.TimeoutError) else str(exc)
+                await self.emit(error_line(request_id, -32000, f"Axon Backend is unavailable or timed out: {detail}"))
+        except Exception as exc:  # noqa: BLE001 - surfaced to the client
+            if request_id is not None:
+                await self.emit(error_line(request_id, -32603, f"Internal proxy error: {exc}"))
+        else:
+            if capture is not None and capture.buffer is not None:
+                self.cache_store(cache_key, request_id, bytes(capture.buffer), generation)
+
+    def cache_store(self, key: tuple[str, str, str] | None, request_id: Any, payload: bytes, generation: int) -> None:
+        if self.cache is None or key is None:
+            return
+        try:
+            reply = json.loads(payload)
+        except (json.JSONDecodeError, UnicodeDecodeError):
+            return
+        if not isinstance(reply, dict) or reply.get("id") != request_id or "result" not in reply:
+            return
+        result = reply["result"]
+        if isinstance(result, dict) and result.get("isError"):
+            return
+        self.cache.put(key, result, generation)
+
+    async def relay_body(
+        self,
+        response: UpstreamResponse,
+        timeout_s: float,
+        capture: _Capture | None = None,
+    ) -> None:
+        """Copy a JSON body to stdout piece by piece as it arrives.
+
+        stdout is claimed when the first non-blank piece arrives, not while
+        waiting for the head, and each piece is written with its line breaks
+        flattened, so only one ``READ_SIZE`` piece is held at a time. The
+        per-read timeout bounds how long a stalled body keeps stdout. The
+        line is always terminated, even when the upstream fails mid-body;
+        the error for that id then follows on its own line.
+        """
+        body = response.iter_body(timeout_s)
+        async for piece in body:
+            if piece.strip():
+                break
+        else:
+            return
+        async with self._stdout:
+            try:
+                self._write(single_line(piece.lstrip()))
+                if capture is not None:
+                    capture.add(piece)
+                async for piece in body:
+                    self._write(single_line(piece))
+                    if capture is not None:
+                        capture.add(piece)
+            finally:
+                self._write(b"\n")
+
+    async def relay_events(
+        self,
+        response: UpstreamResponse,
+        timeout_s: float,
+        capture: _Capture | None = None,
+    ) -> None:
+        """Emit each SSE event's ``data`` as one stdout line when it completes.
+
+        Only the current partial line and the current event are held in
+        memory, whatever the total stream length.
+        """
+        pending = b""
+        data: list[bytes] = []
+        async for piece in response.iter_body(timeout_s):
+            pending += piece
+            while b"\n" in pending:
+                raw, pending = pending.split(b"\n", 1)
+                field_line = raw.rstrip(b"\r")
+                if not field_line:
+                    if data:
+                        await self.emit_event(data, capture)
+                        data = []
+                    continue
+                if field_line.startswith(b":"):
+                    continue
+                name, _, value = field_line.partition(b":")
+                if name == b"data":
+                    data.append(value[1:] if value.startswith(b" ") else value)
+        if pending.rstrip(b"\r").startswith(b"data:"):
+            value = pending.rstrip(b"\r")[5:]
+            data.append(value[1:] if value.startswith(b" ") else value)
+        if data:
+            await self.emit_event(data, capture)
+
+    async def emit_event(self, data: list[bytes], capture: _Capture | None) -> None:
+        event = b"\n".join(data)
+        if capture is not None:
+            # The final event carries the reply; progress notifications before
+            # it are not cacheable.
+            capture.replace(event)
+        await self.emit(event)
+
+    async def run(self, lines: AsyncIterator[bytes]) -> None:
+        try:
+            async for raw in lines:
+                self.dispatch(raw)
+            if self._tasks:
+                await asyncio.gather(*list(self._tasks), return_exceptions=True)
+        finally:
+            await self.pool.close()
+
+
+async def stdin_lines() -> AsyncIterator[bytes]:
+    # A reader thread works for pipes, files and ttys alike, and has no
+    # line-length limit, unlike connect_read_pipe + StreamReader.
+    loop = asyncio.get_running_loop()
+    queue: asyncio.Queue[bytes | None] = asyncio.Queue()
+
+    def pump() -> None:
+        for raw in sys.stdin.buffer:
+            loop.call_soon_threadsafe(queue.put_nowait, raw)
+        loop.call_soon_threadsafe(queue.put_nowait, None)
+
+    threading.Thread(target=pump, name="mcp-stdio-reader", daemon=True).start()
+    while True:
+        raw = await queue.get()
+        if raw is None:
+            return
+        yield raw
+
+
+def write_stdout(line: bytes) -> None:
+    sys.stdout.buffer.write(line)
+    sys.stdout.buffer.flush()
+
+
+def parse_args(argv: list[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Bridge MCP stdio clients to the Axon HTTP endpoint.")
+    parser.add_argument("--url", help="Upstream MCP URL (default: AXON_MCP_URL, else per AXON_INSTANCE_KIND)")
+    parser.add_argument(
+        "--timeout",
+        type=float,
+        default=float(os.environ.get("AXON_PROXY_TIMEOUT", DEFAULT_TIMEOUT_S)),
+        help=f"Default per-request timeout in seconds (default: {DEFAULT_TIMEOUT_S:g})",
+    )
+    parser.add_argument(
+        "--tool-timeout",
+        action="append",
+        default=[],
+        metavar="NAME=SECONDS",
+        help="Per-tool timeout override for tools/call; repeatable or comma-separated",
+    )
+    parser.add_argument(
+        "--max-connections",
+        type=int,
+        default=DEFAULT_MAX_CONNECTIONS,
+        help=f"Upstream keep-alive connections, i.e. max in-flight requests (default: {DEFAULT_MAX_CONNECTIONS})",
+    )
+    parser.add_argument(
+        "--cache",
+        action="store_true",
+        default=os.environ.get("AXON_PROXY_CACHE", "").strip().lower() in {"1", "true", "yes", "on"},
+        help="Cache read-only tool results (default allowlist: " + ", ".join(sorted(DEFAULT_CACHE_TTLS_S)) + ")",
+    )
+    parser.add_argument(
+        "--cache-tool",
+        action="append",
+        default=[],
+        metavar="NAME=SECONDS",
+        help="Cache allowlist entry with its TTL; replaces the default allowlist and implies --cache",
+    )
+    parser.add_argument(
+        "--cache-size",
+        type=int,
+        default=DEFAULT_CACHE_MAX_ENTRIES,
+        help=f"Maximum cached results before LRU eviction (default: {DEFAULT_CACHE_MAX_ENTRIES})",
+    )
+    return parser.parse_args(argv)
+
+
+def build_config(args: argparse.Namespace) -> ProxyConfig:
+    tool_timeouts = dict(DEFAULT_TOOL_TIMEOUTS_S)
+    tool_timeouts.update(parse_tool_timeouts([os.environ.get("AXON_PROXY_TOOL_TIMEOUTS", "")]))
+    tool_timeouts.update(parse_tool_timeouts(args.tool_timeout))
+    cache_ttls = parse_tool_timeouts(
+        [os.environ.get("AXON_PROXY_CACHE_TOOLS", ""), *args.cache_tool],
+        what="cache TTL",
+    )
+    if not cache_ttls and args.cache:
+        cache_ttls = dict(DEFAULT_CACHE_TTLS_S)
+    return ProxyConfig(
+        url=resolve_upstream_url(args.url),
+        timeout_s=args.timeout,
+        tool_timeouts_s=tool_timeouts,
+        max_connections=args.max_connections,
+        cache_ttls_s=cache_ttls,
+        cache_max_entries=args.cache_size,
+    )
+
+
+def main(argv: list[str]) -> int:
+    try:
+        config = build_config(parse_args(argv))
+    except ValueError as exc:
+        print(f"mcp-stdio-proxy: {exc}", file=sys.stderr)
+        return 2
+    asyncio.run(StdioProxy(config, write_stdout).run(stdin_lines()))
+    return 0
+
 
 if __name__ == "__main__":
-    main()
+    raise SystemExit(main(sys.argv[1:]))
@@ -0,0 +1,252 @@
+#!/usr/bin/env python3
+"""Asyncio load engine for MCP qualification (stdlib only).
+
+Speaks HTTP/1.1 over raw ``asyncio`` streams with one keep-alive connection
+per worker, so a single Python process can hold hundreds of requests in
+flight without the thread-per-request ceiling of ``urllib``.
+
+Two load shapes:
+- closed loop: ``concurrency`` workers each send the next request as soon as
+  the previous one answers. Latency is service time.
+- open loop: requests are *scheduled* at a fixed ``rate`` (req/s) whatever
+  the server does, and up to ``concurrency`` connections drain that
+  schedule. Latency is measured from the scheduled send time, not the
+  actual one, so queueing behind a stalled brain is counted instead of
+  silently omitted (coordinated-omission correction, wrk2 style).
+
+Errors are surfaced with the same exception types the urllib path raises
+(``urllib.error.HTTPError``, ``TimeoutError``, ``OSError``,
+``json.JSONDecodeError``) so callers keep one classification.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import io
+import json
+import time
+import urllib.error
+import urllib.parse
+from dataclasses import dataclass
+from typing import Any, Callable
+
+from async_http import read_http_response
+
+
+@dataclass
+class LoadOutcome:
+    worker: int
+    request: Any
+    intended_at: float
+    sent_at: float
+    finished_at: float
+    response: Any = None
+    error: BaseException | None = None
+
+    @property
+    def latency_ms(self) -> int:
+        """Coordinated-omission corrected latency (from the intended send time)."""
+        return int((self.finished_at - self.intended_at) * 1000)
+
+    @property
+    def service_ms(self) -> int:
+        return int((self.finished_at - self.sent_at) * 1000)
+
+
+class AsyncJsonConnection:
+    """One keep-alive HTTP/1.1 connection posting JSON bodies."""
+
+    def __init__(self, url: str) -> None:
+        parsed = urllib.parse.urlsplit(url)
+        if parsed.scheme != "http" or not parsed.hostname:
+            raise ValueError(f"unsupported MCP URL for async engine: {url}")
+        self.url = url
+        self.host = parsed.hostname
+        self.port = parsed.port or 80
+        self.path = parsed.path or "/"
+        self._reader: asyncio.StreamReader | None = None
+        self._writer: asyncio.StreamWriter | None = None
+
+    async def close(self) -> None:
+        writer, self._reader, self._writer = self._writer, None, None
+        if writer is not None:
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except OSError:
+                pass
+
+    async def post(self, payload: Any) -> Any:
+        body = json.dumps(payload).encode("utf-8")
+        for attempt in range(2):
+            reused = self._writer is not None
+            if self._writer is None:
+                self._reader, self._writer = await asyncio.open_connection(self.host, self.port)
+            assert self._reader is not None and self._writer is not None
+            try:
+                self._writer.write(
+                    (
+                        f"POST {self.path} HTTP/1.1\r\n"
+                        f"Host: {self.host}:{self.port}\r\n"
+                        "Content-Type: application/json\r\n"
+                        "Accept: application/json\r\n"
+                        f"Content-Length: {len(body)}\r\n"
+                        "\r\n"
+                    ).encode("latin-1")
+                    + body
+                )
+                await self._writer.drain()
+                status, reason, headers, raw = await read_http_response(self._reader)
+            except (ConnectionError, asyncio.IncompleteReadError) as exc:
+                await self.close()
+                if reused and attempt == 0:
+                    continue
+                if isinstance(exc, asyncio.IncompleteReadError):
+                    raise ConnectionResetError("connection closed mid-response") from exc
+                raise
+            except BaseException:
+                await self.close()
+                raise
+            if headers.get("Connection", "").lower() == "close":
+                await self.close()
+            if status >= 400:
+                raise urllib.error.HTTPError(self.url, status, reason, headers, io.BytesIO(raw))
+            return json.loads(raw.decode("utf-8")) if raw.strip() else None
+        raise RuntimeError("unreachable")  # pragma: no cover
+
+
+class _Clock:
+    """Monotonic timing mapped onto epoch seconds for event timestamps."""
+
+    def __init__(self) -> None:
+        self._wall0 = time.time()
+        self._mono0 = time.monotonic()
+
+    def now(self) -> float:
+        return self._wall0 + (time.monotonic() - self._mono0)
+
+
+async def _issue(
+    conn: AsyncJsonConnection,
+    worker: int,
+    request: Any,
+    payload: Any,
+    intended_at: float,
+    timeout_s: float,
+    clock: _Clock,
+    sent_at: float | None = None,
+) -> LoadOutcome:
+    if sent_at is None:
+        sent_at = clock.now()
+    try:
+        response = await asyncio.wait_for(conn.post(payload), timeout_s)
+        return LoadOutcome(worker, request, intended_at, sent_at, clock.now(), response=response)
+    except asyncio.TimeoutError as exc:
+        # The late response would desynchronise the stream; start fresh.
+        await conn.close()
+        return LoadOutcome(
+            worker,
+            request,
+            intended_at,
+            sent_at,
+            clock.now(),
+            error=TimeoutError(str(exc) or f"timed out after {timeout_s}s"),
+        )
+    except Exception as exc:  # noqa: BLE001 - classified by the caller
+        return LoadOutcome(worker, request, intended_at, sent_at, clock.now(), error=exc)
+
+
+async def run_closed_loop(
+    *,
+    url: str,
+    next_request: Callable[[], tuple[Any, Any]],
+    concurrency: int,
+    duration_s: float,
+    timeout_s: float,
+    record: Callable[[LoadOutcome], None],
+) -> None:
+    """Keep ``concurrency`` requests in flight for ``duration_s`` seconds.
+
+    ``next_request`` returns ``(request, payload)``; ``request`` is an opaque
+    caller tag echoed back on the outcome.
+    """
+    clock = _Clock()
+    deadline = time.monotonic() + duration_s
+
+    async def worker(worker_id: int) -> None:
+        conn = AsyncJsonConnection(url)
+        try:
+            while time.monotonic() < deadline:
+                request, payload = next_request()
+                # Closed loop sends at the intended time: one clock read for both.
+                now = clock.now()
+                record(await _issue(conn, worker_id, request, payload, now, timeout_s, clock, sent_at=now))
+        finally:
+            await conn.close()
+
+    await asyncio.gather(*(worker(worker_id) for worker_id in range(concurrency)))
+
+
+async def run_open_loop(
+    *,
+    url: str,
+    next_request: Callable[[], tuple[Any, Any]],
+    rate: float,
+    concurrency: int,
+    duration_s: float,
+    timeout_s: float,
+    record: Callable[[LoadOutcome], None],
+) -> None:
+    """Schedule ``rate`` requests/second for ``duration_s`` seconds.
+
+    Up to ``concurrency`` connections serve the schedule. Requests still
+    queued ``timeout_s`` after the schedule ends are recorded as timeouts
+    against their intended time rather than dropped.
+    """
+    if rate <= 0:
+        raise ValueError("rate must be > 0")
+    clock = _Clock()
+    queue: asyncio.Queue[tuple[float, Any, Any] | None] = asyncio.Queue()
+    interval = 1.0 / rate
+    total = max(1, int(duration_s * rate))
+    started = time.monotonic()
+    drain_deadline = started + duration_s + timeout_s
+
+    async def scheduler() -> None:
+        for index in range(total):
+            due = started + index * interval
+            delay = due - time.monotonic()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            request, payload = next_request()
+            intended_at = clock.now() - max(0.0, time.monotonic() - due)
+            queue.put_nowait((intended_at, request, payload))
+        for _ in range(concurrency):
+            queue.put_nowait(None)
+
+    async def worker(worker_id: int) -> None:
+        conn = AsyncJsonConnection(url)
+        try:
+            while True:
+                item = await queue.get()
+                if item is None:
+                    return
+                intended_at, request, payload = item
+                if time.monotonic() >= drain_deadline:
+                    now = clock.now()
+                    record(
+                        LoadOutcome(
+                            worker_id,
+                            request,
+                            intended_at,
+                            now,
+                            now,
+                            error=TimeoutError("open-loop drain deadline exceeded before send"),
+                        )
+                    )
+                    continue
+                record(await _issue(conn, worker_id, request, payload, intended_at, timeout_s, clock))
+        finally:
+            await conn.close()
+
+    await asyncio.gather(scheduler(), *(worker(worker_id) for worker_id in range(concurrency)))
@@ -11,11 +11,10 @@ from typing import Any
 
 from mcp_probe_common import (
     DEFAULT_URL,
-    call_tool,
-    initialize_session,
+    McpSession,
+    open_session,
     response_data,
     response_text,
-    rpc_call,
 )
 
 
@@ -80,22 +79,20 @@ def load_tool_args(args: argparse.Namespace) -> dict[str, Any]:
         raise SystemExit(f"Cannot read --args-file {args.args_file}: {exc}") from exc
 
 
-def initialize(url: str, timeout: int) -> None:
-    initialize_session(url, timeout, "axon-mcp-call")
+def initialize(url: str, timeout: int) -> McpSession:
+    return open_session(url, timeout, "axon-mcp-call")
 
 
 def run_list(url: str, timeout: int, output_format: str) -> int:
-    initialize(url, timeout)
-    _, response = rpc_call(
-        url,
-        {
-            "jsonrpc": "2.0",
-            "id": 1,
-            "method": "tools/list",
-            "params": {},
-        },
-        timeout,
-    )
+    with initialize(url, timeout) as session:
+        _, response = session.rpc(
+            {
+                "jsonrpc": "2.0",
+                "id": 1,
+                "method": "tools/list",
+                "params": {},
+            }
+        )
     if output_format == "json":
         print(json.dumps(response, indent=2, ensure_ascii=False))
         return 0
@@ -110,8 +107,8 @@ def run_list(url: str, timeout: int, output_format: str) -> int:
 
 
 def run_call(url: str, timeout: int, tool: str, args: dict[str, Any], output_format: str) -> int:
-    initialize(url, timeout)
-    _, response = call_tool(url, timeout, tool, args)
+    with initialize(url, timeout) as session:
+        _, response = session.call_tool(tool, args)
     if output_format == "json":
         print(json.dumps(response, indent=2, ensure_ascii=False))
         return 0
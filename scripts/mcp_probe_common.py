@@ -3,8 +3,12 @@
 
 from __future__ import annotations
 
+import http.client
+import io
 import json
 import time
+import urllib.error
+import urllib.parse
 import urllib.request
 from typing import Any
 
@@ -13,6 +17,9 @@ DEFAULT_URL = "http://127.0.0.1:44129/mcp"
 DEFAULT_SQL_URL = "http://127.0.0.1:44129/sql"
 DEFAULT_PROTOCOL_VERSION = "2025-11-25"
 NEGOTIATED_PROTOCOL_BY_URL: dict[str, str] = {}
+# HTTP statuses meaning "this endpoint does not take JSON-RPC batches" rather
+# than "the brain is unhealthy"; anything else propagates to the caller.
+BATCH_REJECTED_STATUSES = {400, 404, 405, 413, 415, 422}
 
 
 def rpc_call(
@@ -58,21 +65,256 @@ def rpc_call(
     return duration_ms, parsed
 
 
-def initialize_session(url: str, timeout: int, client_name: str) -> None:
-    rpc_call(
-        url,
-        {
-            "jsonrpc": "2.0",
-            "id": 1,
-            "method": "initialize",
-            "params": {
-                "protocolVersion": DEFAULT_PROTOCOL_VERSION,
-                "clientInfo": {"name": client_name, "version": "1.0"},
-                "capabilities": {},
-            },
+def tool_call_payload(
+    tool_name: str,
+    arguments: dict[str, Any],
+    request_id: int = 1,
+) -> dict[str, Any]:
+    return {
+        "jsonrpc": "2.0",
+        "id": request_id,
+        "method": "tools/call",
+        "params": {"name": tool_name, "arguments": arguments},
+    }
+
+
+def _initialize_payload(client_name: str) -> dict[str, Any]:
+    return {
+        "jsonrpc": "2.0",
+        "id": 1,
+        "method": "initialize",
+        "params": {
+            "protocolVersion": DEFAULT_PROTOCOL_VERSION,
+            "clientInfo": {"name": client_name, "version": "1.0"},
+            "capabilities": {},
         },
-        timeout,
-    )
+    }
+
+
+class McpSession:
+    """Keep-alive JSON-RPC session against one MCP endpoint.
+
+    Holds a single HTTP/1.1 connection that is reused across calls, so probe
+    latencies measure the brain rather than TCP setup. The negotiated protocol
+    version is kept on the session instead of the module-level URL map. A
+    dropped idle connection is reopened once transparently.
+    """
+
+    def __init__(self, url: str, timeout: int) -> None:
+        parsed = urllib.parse.urlsplit(url)
+        if parsed.scheme not in {"http", "https"} or not parsed.hostname:
+            raise ValueError(f"unsupported MCP URL: {url}")
+        self.url = url
+        self.timeout = timeout
+        self.protocol_version: str | None = None
+        self._scheme = parsed.scheme
+        self._host = parsed.hostname
+        self._port = parsed.port
+        self._path = parsed.path or "/"
+        if parsed.query:
+            self._path += "?" + parsed.query
+        self._conn: http.client.HTTPConnection | None = None
+        self.connections_opened = 0
+        # None until the first batch attempt, then whether the server took it.
+        self.batch_supported: bool | None = None
+
+    def __enter__(self) -> "McpSession":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    def close(self) -> None:
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    def _connection(self) -> http.client.HTTPConnection:
+        if self._conn is None:
+            factory = (
+                http.client.HTTPSConnection
+                if self._scheme == "https"
+                else http.client.HTTPConnection
+            )
+            self._conn = factory(self._host, self._port, timeout=self.timeout)
+            self.connections_opened += 1
+        return self._conn
+
+    def post(
+        self,
+        body: bytes,
+        headers: dict[str, str],
+        *,
+        path: str | None = None,
+        timeout: float | None = None,
+    ) -> tuple[float, int, http.client.HTTPMessage, bytes]:
+        """POST raw bytes over the pooled connection.
+
+        Returns ``(duration_ms, status, headers, body)``. Raises
+        ``urllib.error.HTTPError`` on HTTP >= 400, like ``urllib.request``.
+        ``timeout`` overrides the session timeout for this call only.
+        """
+        target = path or self._path
+        request_headers = {"Content-Type": "application/json", **headers}
+        effective_timeout = self.timeout if timeout is None else timeout
+        for attempt in range(2):
+            reused = self._conn is not None
+            conn = self._connection()
+            conn.timeout = effective_timeout
+            if conn.sock is not None:
+                conn.sock.settimeout(effective_timeout)
+            started = time.perf_counter()
+            try:
+                conn.request("POST", target, body=body, headers=request_headers)
+                response = conn.getresponse()
+                raw = response.read()
+            except (http.client.RemoteDisconnected, ConnectionError, http.client.BadStatusLine):
+                self.close()
+                if reused and attempt == 0:
+                    continue
+                raise
+            except Exception:
+                self.close()
+                raise
+            duration_ms = (time.perf_counter() - started) * 1000.0
+            if response.will_close:
+                self.close()
+            if response.status >= 400:
+                raise urllib.error.HTTPError(
+                    self.url,
+                    response.status,
+                    response.reason,
+                    response.headers,
+                    io.BytesIO(raw),
+                )
+            return duration_ms, response.status, response.headers, raw
+        raise RuntimeError("unreachable")  # pragma: no cover
+
+    def rpc(
+        self,
+        payload: dict[str, Any],
+        *,
+        allow_empty_body: bool = False,
+    ) -> tuple[float, Any]:
+        headers: dict[str, str] = {}
+        method = payload.get("method")
+        if method != "initialize" and self.protocol_version:
+            headers["MCP-Protocol-Version"] = self.protocol_version
+        duration_ms, _, response_headers, body = self.post(
+            json.dumps(payload).encode("utf-8"), headers
+        )
+        response_protocol = response_headers.get("MCP-Protocol-Version")
+        raw = body.decode("utf-8")
+        if not raw.strip():
+            if response_protocol and method == "notifications/initialized":
+                self.protocol_version = response_protocol
+            if allow_empty_body:
+                return duration_ms, None
+            raise ValueError("empty MCP response body")
+        parsed = json.loads(raw)
+        if method == "initialize":
+            negotiated = (
+                response_protocol
+                or parsed.get("result", {}).get("protocolVersion")
+                or DEFAULT_PROTOCOL_VERSION
+            )
+            if isinstance(negotiated, str) and negotiated:
+                self.protocol_version = negotiated
+        return duration_ms, parsed
+
+    def rpc_batch(self, payloads: list[dict[str, Any]]) -> list[tuple[float, Any]]:
+        """Send payloads as one JSON-RPC batch, falling back to sequential calls.
+
+        Returns one ``(latency_ms, response)`` per payload, in input order.
+        Batched items all report the shared round-trip latency; notifications
+        map to ``None``. Once the server rejects a batch the session stops
+        trying, and sequential calls report their own latency per item.
+        """
+        if len(payloads) > 1 and self.batch_supported is not False:
+            batched = self._try_batch(payloads)
+            if batched is not None:
+                return batched
+        return [self.rpc(payload, allow_empty_body="id" not in payload) for payload in payloads]
+
+    def _try_batch(self, payloads: list[dict[str, Any]]) -> list[tuple[float, Any]] | None:
+        # Re-number requests so responses can be matched back to their slot
+        # even when callers reuse the same id for every call.
+        wire = [
+            {**payload, "id": index} if "id" in payload else payload
+            for index, payload in enumerate(payloads)
+        ]
+        headers: dict[str, str] = {}
+        if self.protocol_version:
+            headers["MCP-Protocol-Version"] = self.protocol_version
+        try:
+            duration_ms, _, _, body = self.post(json.dumps(wire).encode("utf-8"), headers)
+        except urllib.error.HTTPError as exc:
+            if exc.code in BATCH_REJECTED_STATUSES:
+                self.batch_supported = False
+                return None
+            raise
+        raw = body.decode("utf-8")
+        parsed = json.loads(raw) if raw.strip() else []
+        if not isinstance(parsed, list):
+            # A single error object (e.g. -32600 Invalid Request) is how a
+            # JSON-RPC server without batch support answers an array.
+            self.batch_supported = False
+            return None
+        by_id = {
+            item.get("id"): item
+            for item in parsed
+            if isinstance(item, dict) and isinstance(item.get("id"), int)
+        }
+        self.batch_supported = True
+        results: list[tuple[float, Any]] = []
+        for index, payload in enumerate(payloads):
+            if "id" not in payload:
+                results.append((duration_ms, None))
+            elif index in by_id:
+                response = dict(by_id[index])
+                response["id"] = payload["id"]
+                results.append((duration_ms, response))
+            else:
+                results.append(self.rpc(payload))
+        return results
+
+    def initialize(self, client_name: str) -> None:
+        self.rpc(_initialize_payload(client_name))
+        self.rpc(
+            {"jsonrpc": "2.0", "method": "notifications/initialized"},
+            allow_empty_body=True,
+        )
+
+    def call_tool(
+        self,
+        tool_name: str,
+        arguments: dict[str, Any],
+    ) -> tuple[float, dict[str, Any]]:
+        return self.rpc(tool_call_payload(tool_name, arguments))
+
+    def sql_query(self, query: str) -> list[list[Any]]:
+        """Run a `/sql` gateway query on the same keep-alive connection."""
+        sql_path = urllib.parse.urlsplit(default_sql_url(self.url)).path
+        _, _, _, body = self.post(
+            json.dumps({"query": query}).encode("utf-8"), {}, path=sql_path
+        )
+        response = json.loads(body.decode("utf-8")) if body.strip() else None
+        return response if isinstance(response, list) else []
+
+
+def open_session(url: str, timeout: int, client_name: str) -> McpSession:
+    """Open a keep-alive session and run the MCP initialize handshake once."""
+    session = McpSession(url, timeout)
+    try:
+        session.initialize(client_name)
+    except Exception:
+        session.close()
+        raise
+    return session
+
+
+def initialize_session(url: str, timeout: int, client_name: str) -> None:
+    rpc_call(url, _initialize_payload(client_name), timeout)
     rpc_call(
         url,
         {"jsonrpc": "2.0", "method": "notifications/initialized"},
@@ -87,16 +329,7 @@ def call_tool(
     tool_name: str,
     arguments: dict[str, Any],
 ) -> tuple[float, dict[str, Any]]:
-    return rpc_call(
-        url,
-        {
-            "jsonrpc": "2.0",
-            "id": 1,
-            "method": "tools/call",
-            "params": {"name": tool_name, "arguments": arguments},
-        },
-        timeout,
-    )
+    return rpc_call(url, tool_call_payload(tool_name, arguments), timeout)
 
 
 def response_text(response: dict[str, Any]) -> str:
@@ -140,13 +373,15 @@ def sql_query(sql_url: str, timeout: int, query: str) -> list[list[Any]]:
     return response if isinstance(response, list) else []
 
 
-def discover_symbol_probe(url: str, timeout: int, project: str) -> dict[str, str]:
-    sql_url = default_sql_url(url)
+def discover_symbol_probe(
+    url: str,
+    timeout: int,
+    project: str,
+    *,
+    session: McpSession | None = None,
+) -> dict[str, str]:
     escaped_project = project.replace("'", "''")
-    rows = sql_query(
-        sql_url,
-        timeout,
-        f"""
+    query = f"""
         SELECT id, name
         FROM Symbol
         WHERE project_code = '{escaped_project}'
@@ -163,8 +398,11 @@ def discover_symbol_probe(url: str, timeout: int, project: str) -> dict[str, str
           tested ASC,
           name ASC
         LIMIT 1
-        """.strip(),
-    )
+        """.strip()
+    if session is not None:
+        rows = session.sql_query(query)
+    else:
+        rows = sql_query(default_sql_url(url), timeout, query)
     if rows and len(rows[0]) >= 2:
         symbol_id = rows[0][0]
         symbol_name = rows[0][1]
@@ -15,6 +15,8 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
+from mcp_probe_common import McpSession
+
 
 DEFAULT_URL = "http://127.0.0.1:44129/mcp"
 PROJECT_ROOT = Path(__file__).resolve().parents[1]
@@ -1102,26 +1104,44 @@ def run(args: argparse.Namespace) -> int:
         print(f"FATAL: initialize returned error: {init_resp['error']}")
         return 2
 
-    # 2) Tools catalogs
-    try:
-        public_tools_resp = rpc_call(
-            args.url,
-            {"jsonrpc": "2.0", "id": 2, "method": "tools/list", "params": {}},
-            args.timeout,
-        )
-        internal_tools_resp = rpc_call(
-            args.url,
-            {
-                "jsonrpc": "2.0",
-                "id": 3,
-                "method": "tools/list",
-                "params": {"include_internal": True},
-            },
-            args.timeout,
-        )
-    except (urllib.error.URLError, TimeoutError, OSError, json.JSONDecodeError) as e:
-        print(f"FATAL: tools/list failed: {type(e).__name__}: {e}")
-        return 2
+    # 2) Tools catalogs + status prefetch (independent reads, batchable)
+    catalog_payloads = [
+        {"jsonrpc": "2.0", "id": 2, "method": "tools/list", "params": {}},
+        {
+            "jsonrpc": "2.0",
+            "id": 3,
+            "method": "tools/list",
+            "params": {"include_internal": True},
+        },
+        {
+            "jsonrpc": "2.0",
+            "id": 4,
+            "method": "tools/call",
+            "params": {"name": "status", "arguments": {"mode": "brief"}},
+        },
+    ]
+    if args.batch:
+        try:
+            with McpSession(args.url, args.timeout) as session:
+                public_tools_resp, internal_tools_resp, status_prefetch = (
+                    resp for _, resp in session.rpc_batch(catalog_payloads)
+                )
+        except (urllib.error.URLError, TimeoutError, OSError, ValueError) as e:
+            print(f"FATAL: batched tools/list + status prefetch failed: {type(e).__name__}: {e}")
+            return 2
+    else:
+        try:
+            public_tools_resp = rpc_call(args.url, catalog_payloads[0], args.timeout)
+            internal_tools_resp = rpc_call(args.url, catalog_payloads[1], args.timeout)
+        except (urllib.error.URLError, TimeoutError, OSError, json.JSONDecodeError) as e:
+            print(f"FATAL: tools/list failed: {type(e).__name__}: {e}")
+            return 2
+
+        try:
+            status_prefetch = rpc_call(args.url, catalog_payloads[2], args.timeout)
+        except (urllib.error.URLError, TimeoutError, OSError, json.JSONDecodeError) as e:
+            print(f"FATAL: status prefetch failed: {type(e).__name__}: {e}")
+            return 2
 
     public_tools = (
         public_tools_resp.get("result", {}).get("tools", [])
@@ -1140,21 +1160,6 @@ def run(args: argparse.Namespace) -> int:
         print("FATAL: tools/list(include_internal=true) returned no tools")
         return 2
 
-    try:
-        status_prefetch = rpc_call(
-            args.url,
-            {
-                "jsonrpc": "2.0",
-                "id": 4,
-                "method": "tools/call",
-                "params": {"name": "status", "arguments": {"mode": "brief"}},
-            },
-            args.timeout,
-        )
-    except (urllib.error.URLError, TimeoutError, OSError, json.JSONDecodeError) as e:
-        print(f"FATAL: status prefetch failed: {type(e).__name__}: {e}")
-        return 2
-
     expected_async_tools = extract_async_allowlisted_tools(status_prefetch)
     if not expected_async_tools:
         print("FATAL: status prefetch did not expose async allowlisted tools")
@@ -1422,6 +1427,11 @@ def parse_args(argv: list[str]) -> argparse.Namespace:
     p.add_argument("--top-slowest", type=int, default=5, help="Top N slowest tools in JSON report")
     p.add_argument("--json-out", default="", help="Optional JSON output path")
     p.add_argument("--scenario-file", default="", help="Optional JSON scenario file for sequential validation")
+    p.add_argument(
+        "--batch",
+        action="store_true",
+        help="Fetch tool catalogs and the status prefetch in one JSON-RPC batch (sequential fallback if rejected)",
+    )
     return p.parse_args(argv)
 
 
@@ -10,12 +10,12 @@ from typing import Any
 
 from mcp_probe_common import (
     DEFAULT_URL,
-    call_tool,
     discover_symbol_probe,
-    initialize_session,
+    open_session,
     preview_text,
     response_data,
     response_text,
+    tool_call_payload,
 )
 
 
@@ -53,6 +53,26 @@ def build_probe_rows(project: str, symbol: str, exact_symbol: str) -> list[tuple
     ]
 
 
+def probe_result_row(tool_name: str, latency_ms: float, response: dict[str, Any]) -> dict[str, Any]:
+    text = response_text(response)
+    data = response_data(response)
+    row: dict[str, Any] = {
+        "tool": tool_name,
+        "latency_ms": round(latency_ms, 1),
+        "ok": not bool(response.get("result", {}).get("isError")),
+        "text_preview": preview_text(text),
+    }
+    if tool_name == "retrieve_context":
+        planner = data.get("planner", {})
+        packet = data.get("packet", {})
+        row["route"] = planner.get("route")
+        row["direct_evidence"] = len(packet.get("direct_evidence", []) or [])
+        row["supporting_chunks"] = len(packet.get("supporting_chunks", []) or [])
+    elif isinstance(data, dict):
+        row["data_keys"] = list(data.keys())[:10]
+    return row
+
+
 def main() -> int:
     parser = argparse.ArgumentParser(description="Measure core MCP tools against the live Axon server.")
     parser.add_argument("--url", default=DEFAULT_URL, help=f"MCP URL (default: {DEFAULT_URL})")
@@ -61,51 +81,56 @@ def main() -> int:
     parser.add_argument("--exact-symbol", help="Exact symbol probe for path/impact/change_safety; defaults to live discovery")
     parser.add_argument("--timeout", type=int, default=20, help="Per-request timeout in seconds")
     parser.add_argument("--json-out", type=Path, help="Optional JSON output path")
+    parser.add_argument(
+        "--batch",
+        action="store_true",
+        help="Send all probes as one JSON-RPC batch (falls back to sequential calls if rejected)",
+    )
     args = parser.parse_args()
 
-    initialize_session(args.url, args.timeout, "measure_mcp_core_latency")
-    probe = discover_symbol_probe(args.url, args.timeout, args.project)
-    symbol = args.symbol or probe["symbol"]
-    exact_symbol = args.exact_symbol or probe["exact_symbol"]
+    with open_session(args.url, args.timeout, "measure_mcp_core_latency") as session:
+        probe = discover_symbol_probe(args.url, args.timeout, args.project, session=session)
+        symbol = args.symbol or probe["symbol"]
+        exact_symbol = args.exact_symbol or probe["exact_symbol"]
 
-    results: list[dict[str, Any]] = []
-    for tool_name, tool_args in build_probe_rows(args.project, symbol, exact_symbol):
-        try:
-            latency_ms, response = call_tool(args.url, args.timeout, tool_name, tool_args)
-            text = response_text(response)
-            data = response_data(response)
-            row: dict[str, Any] = {
-                "tool": tool_name,
-                "latency_ms": round(latency_ms, 1),
-                "ok": not bool(response.get("result", {}).get("isError")),
-                "text_preview": preview_text(text),
-            }
-            if tool_name == "retrieve_context":
-                planner = data.get("planner", {})
-                packet = data.get("packet", {})
-                row["route"] = planner.get("route")
-                row["direct_evidence"] = len(packet.get("direct_evidence", []) or [])
-                row["supporting_chunks"] = len(packet.get("supporting_chunks", []) or [])
-            elif isinstance(data, dict):
-                row["data_keys"] = list(data.keys())[:10]
-            results.append(row)
-        except Exception as exc:  # pragma: no cover - live probe path
-            results.append(
-                {
-                    "tool": tool_name,
-                    "ok": False,
-                    "error": f"{type(exc).__name__}: {exc}",
-                }
-            )
+        rows = build_probe_rows(args.project, symbol, exact_symbol)
+        results: list[dict[str, Any]] = []
+        if args.batch:
+            payloads = [
+                tool_call_payload(tool_name, tool_args, request_id=index)
+                for index, (tool_name, tool_args) in enumerate(rows, start=1)
+            ]
+            try:
+                for (tool_name, _), (latency_ms, response) in zip(rows, session.rpc_batch(payloads)):
+                    results.append(probe_result_row(tool_name, latency_ms, response))
+            except Exception as exc:  # pragma: no cover - live probe path
+                results = [
+                    {"tool": tool_name, "ok": False, "error": f"{type(exc).__name__}: {exc}"}
+                    for tool_name, _ in rows
+                ]
+        else:
+            for tool_name, tool_args in rows:
+                try:
+                    latency_ms, response = session.call_tool(tool_name, tool_args)
+                    results.append(probe_result_row(tool_name, latency_ms, response))
+                except Exception as exc:  # pragma: no cover - live probe path
+                    results.append(
+                        {
+                            "tool": tool_name,
+                            "ok": False,
+                            "error": f"{type(exc).__name__}: {exc}",
+                        }
+                    )
 
-    payload = {
-        "url": args.url,
-        "project": args.project,
-        "symbol": symbol,
-        "exact_symbol": exact_symbol,
-        "discovered_probe": probe,
-        "results": results,
-    }
+        payload = {
+            "url": args.url,
+            "project": args.project,
+            "symbol": symbol,
+            "exact_symbol": exact_symbol,
+            "discovered_probe": probe,
+            "batch": {"requested": args.batch, "server_accepted": session.batch_supported},
+            "results": results,
+        }
     rendered = json.dumps(payload, ensure_ascii=False, indent=2)
     print(rendered)
     if args.json_out:
@@ -67,6 +67,14 @@ def summarize_core(core_payload: dict[str, Any] | None) -> dict[str, Any]:
     }
 
 
+def summarize_batch(requested: bool, core_payload: dict[str, Any] | None) -> dict[str, Any]:
+    batch = core_payload.get("batch") if isinstance(core_payload, dict) else None
+    return {
+        "requested": requested,
+        "server_accepted": batch.get("server_accepted") if isinstance(batch, dict) else None,
+    }
+
+
 def suite_mode_label(warm_cache: bool) -> str:
     return "steady_state" if warm_cache else "cold"
 
@@ -165,6 +173,11 @@ def main() -> int:
         action="store_true",
         help="Run one full warmup pass before recording the suite, for steady-state measurements",
     )
+    parser.add_argument(
+        "--batch",
+        action="store_true",
+        help="Send the core latency probes as one JSON-RPC batch (sequential fallback if rejected)",
+    )
     parser.add_argument("--output-root", type=Path, default=RUNS_ROOT, help=f"Artifacts root (default: {RUNS_ROOT})")
     args = parser.parse_args()
 
@@ -214,6 +227,8 @@ def main() -> int:
         commands["symbol_flow"][4:4] = ["--symbol", args.exact_symbol]
     elif args.symbol:
         commands["symbol_flow"][4:4] = ["--symbol", args.symbol]
+    if args.batch:
+        commands["core_latency"].append("--batch")
 
     script_map = {
         "core_latency": "measure_mcp_core_latency.py",
@@ -249,6 +264,7 @@ def main() -> int:
         "project": args.project,
         "warm_cache": args.warm_cache,
         "suite_mode": suite_mode_label(args.warm_cache),
+        "batch": summarize_batch(args.batch, step_results["core_latency"]["payload"]),
         "load_state": collect_load_state(args.url, args.project, args.timeout),
         "probe": resolved_probe(step_results, args.symbol, args.exact_symbol),
         "steps": {
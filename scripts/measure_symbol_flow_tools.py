@@ -9,9 +9,8 @@ from pathlib import Path
 
 from mcp_probe_common import (
     DEFAULT_URL,
-    call_tool,
     discover_symbol_probe,
-    initialize_session,
+    open_session,
     preview_text,
     response_text,
 )
@@ -28,39 +27,39 @@ def main() -> int:
     parser.add_argument("--json-out", type=Path, help="Optional JSON output path")
     args = parser.parse_args()
 
-    initialize_session(args.url, args.timeout, "measure_symbol_flow_tools")
-    probe = discover_symbol_probe(args.url, args.timeout, args.project)
-    symbol = args.symbol or probe["exact_symbol"]
+    with open_session(args.url, args.timeout, "measure_symbol_flow_tools") as session:
+        probe = discover_symbol_probe(args.url, args.timeout, args.project, session=session)
+        symbol = args.symbol or probe["exact_symbol"]
 
-    probes = [
-        ("inspect", {"project": args.project, "symbol": symbol, "mode": "brief"}),
-        ("path", {"project": args.project, "source": symbol, "mode": "brief"}),
-        ("impact", {"project": args.project, "symbol": symbol, "mode": "brief"}),
-    ]
+        probes = [
+            ("inspect", {"project": args.project, "symbol": symbol, "mode": "brief"}),
+            ("path", {"project": args.project, "source": symbol, "mode": "brief"}),
+            ("impact", {"project": args.project, "symbol": symbol, "mode": "brief"}),
+        ]
 
-    results = []
-    for tool_name, tool_args in probes:
-        try:
-            latency_ms, response = call_tool(args.url, args.timeout, tool_name, tool_args)
-            text = response_text(response)
-            results.append(
-                {
-                    "tool": tool_name,
-                    "latency_ms": round(latency_ms, 1),
-                    "ok": not bool(response.get("result", {}).get("isError")),
-                    "text_preview": preview_text(text, limit=220),
-                }
-            )
-        except Exception as exc:  # pragma: no cover - live probe path
-            results.append({"tool": tool_name, "ok": False, "error": f"{type(exc).__name__}: {exc}"})
+        results = []
+        for tool_name, tool_args in probes:
+            try:
+                latency_ms, response = session.call_tool(tool_name, tool_args)
+                text = response_text(response)
+                results.append(
+                    {
+                        "tool": tool_name,
+                        "latency_ms": round(latency_ms, 1),
+                        "ok": not bool(response.get("result", {}).get("isError")),
+                        "text_preview": preview_text(text, limit=220),
+                    }
+                )
+            except Exception as exc:  # pragma: no cover - live probe path
+                results.append({"tool": tool_name, "ok": False, "error": f"{type(exc).__name__}: {exc}"})
 
-    payload = {
-        "url": args.url,
-        "project": args.project,
-        "symbol": symbol,
-        "discovered_probe": probe,
-        "results": results,
-    }
+        payload = {
+            "url": args.url,
+            "project": args.project,
+            "symbol": symbol,
+            "discovered_probe": probe,
+            "results": results,
+        }
     rendered = json.dumps(payload, ensure_ascii=False, indent=2)
     print(rendered)
     if args.json_out:
@@ -15,8 +15,12 @@ Commands:
   status                        Show Docker Compose status
   build-query-pack [--out FILE]  Build the standalone Lab-visible PreparedQuery bootstrap file
   build-import --publication-dir DIR [--out FILE] [--batch-size N]
-  validate --publication-dir DIR [--require-import-file]
+  validate --publication-dir DIR [--require-import-file] [--deep [--allow-dangling-edges]]
   load --publication-dir DIR     Load generated memgraph_import.cypherl through mgconsole container
+  load-bolt --publication-dir DIR [--uri bolt://HOST:PORT] [--sessions-per-label N]
+                                Stream the import straight to Memgraph over Bolt (no cypherl file)
+  store put|materialize|list|prune [options]
+                                Deduplicating publication retention store (.axon/memgraph/store)
   query-pack-status              Show installed PreparedQuery pack count from active Memgraph
   smoke-queries [--query-dir DIR] [--mode explain|execute]
                                 Validate the prepared human query pack; default is compact EXPLAIN
@@ -106,6 +110,12 @@ case "$cmd" in
       exit 1
     done
     ;;
+  load-bolt)
+    exec python3 "$SCRIPT_DIR/memgraph_load_bolt.py" "$@"
+    ;;
+  store)
+    exec python3 "$SCRIPT_DIR/memgraph_publication_store.py" "$@"
+    ;;
   query-pack-status)
     need_docker
     docker run --rm -i --network container:axon-memgraph "${AXON_MGCONSOLE_IMAGE:-memgraph/mgconsole:1.5.0}" <<'CYPHER'
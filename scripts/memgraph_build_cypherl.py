@@ -4,15 +4,27 @@
 from __future__ import annotations
 
 import argparse
+import collections
+import contextlib
+import functools
 import hashlib
 import json
 import math
+import os
 import re
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Iterable
+from typing import Any, Callable, Iterable
 
+import pyarrow as pa
 import pyarrow.parquet as pq
 
+try:
+    import pyarrow.compute as pc
+except ImportError:  # pragma: no cover - minimal pyarrow builds; the row encoder still works
+    pc = None
+
 
 # REQ-AXO-310 — incremental projection (content_hash diff, soll_generate_docs_v3
 # model). The injected publication fields change every run, so they are excluded
@@ -20,20 +32,6 @@ import pyarrow.parquet as pq
 _INJECTED_FIELDS = ("publication_id", "human_only")
 
 
-def row_content_hash(row: dict[str, Any]) -> str:
-    """Stable short content hash of a source row, ignoring injected publication
-    fields. Two rows with the same source content hash equal, so an unchanged
-    node/edge is skipped on the next publication."""
-    items = sorted((k, v) for k, v in row.items() if k not in _INJECTED_FIELDS)
-    digest = hashlib.sha256()
-    for key, value in items:
-        digest.update(repr(key).encode("utf-8"))
-        digest.update(b"=")
-        digest.update(repr(value).encode("utf-8"))
-        digest.update(b";")
-    return digest.hexdigest()[:16]
-
-
 def edge_diff_key(row: dict[str, Any]) -> str:
     """Identity of an edge for the incremental diff: (from, to, relation). The
     relation is normalised exactly like the emitted Memgraph type (safe_ident +
@@ -42,25 +40,6 @@ def edge_diff_key(row: dict[str, Any]) -> str:
     return f"{row.get('from_id')}\x1f{row.get('to_id')}\x1f{relation}"
 
 
-def load_prior_hashes(prior_dir: Path | None) -> tuple[dict[str, str], dict[str, str]]:
-    """Read a previous publication's parquet and return `(node id -> hash,
-    edge key -> hash)` for the diff. Returns empty maps when no prior
-    publication exists — the first incremental run then MERGEs everything."""
-    node_hashes: dict[str, str] = {}
-    edge_hashes: dict[str, str] = {}
-    if prior_dir is None:
-        return node_hashes, edge_hashes
-    nodes_path = prior_dir / "nodes.parquet"
-    edges_path = prior_dir / "edges.parquet"
-    if nodes_path.exists():
-        for row in iter_rows(nodes_path):
-            node_hashes[str(row.get("id"))] = row_content_hash(row)
-    if edges_path.exists():
-        for row in iter_rows(edges_path):
-            edge_hashes[edge_diff_key(row)] = row_content_hash(row)
-    return node_hashes, edge_hashes
-
-
 IDENT_RE = re.compile(r"[^A-Za-z0-9_]")
 
 
@@ -84,6 +63,25 @@ def parse_args() -> argparse.Namespace:
         default=None,
         help="Previous publication dir to diff against in --incremental mode.",
     )
+    parser.add_argument(
+        "--prior-publication-id",
+        default=None,
+        help="Diff against this publication from the retention store instead of a directory "
+        "(memgraph_publication_store.py; only its hash sidecar is materialized).",
+    )
+    parser.add_argument("--store-dir", type=Path, default=DEFAULT_STORE_DIR, help="Publication retention store.")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Processes encoding node/edge statements (default: min(8, cpu count); 1 encodes in-process).",
+    )
+    parser.add_argument(
+        "--row-encoder",
+        action="store_true",
+        help="Use the historical row-by-row encoder instead of the streaming Arrow encoder "
+        "(same output, much slower on large publications).",
+    )
     parser.add_argument(
         "--query-dir",
         type=Path,
@@ -150,6 +148,744 @@ def write_batch(out, statement_prefix: str, rows: list[dict[str, Any]], statemen
     out.write("\n\n")
 
 
+# Streaming encoder. `iter_rows` + `cypher_map` build a dict and a string per
+# row on one core, which dominates multi-million-row publications. The
+# streaming path reads record batches, cuts them into the exact statements the
+# row loop would flush (same grouping, same flush order), encodes each
+# statement with pyarrow.compute kernels in a process pool and writes the
+# results in submission order, so the output is byte-identical.
+READ_BATCH_ROWS = 65_536
+PIPELINE_DEPTH_PER_WORKER = 4
+_CYPHER_STRING_ESCAPES = (("\\", "\\\\"), ("'", "\\'"), ("\n", "\\n"), ("\r", "\\r"))
+
+
+@functools.lru_cache(maxsize=None)
+def _text(value: str) -> pa.Scalar:
+    # Kernels convert Python literals on every call, which costs more than the
+    # kernel itself on a 500-row statement; reuse one scalar per literal.
+    return pa.scalar(value, pa.string())
+
+
+def default_workers() -> int:
+    return max(1, min(8, os.cpu_count() or 1))
+
+
+def encode_cypher_values(array: pa.Array) -> pa.Array:
+    """Vectorised `cypher_value` for one column.
+
+    Returns a string array that is null where the value is null, so the
+    property is left out of the map exactly like `cypher_map` does. Strings,
+    booleans and integers are encoded with compute kernels; floats (Python
+    `repr`) and any other type go through `cypher_value` per value.
+    """
+    if pa.types.is_dictionary(array.type):
+        array = array.dictionary_decode()
+    if pa.types.is_large_string(array.type):
+        array = array.cast(pa.string())
+    if pa.types.is_string(array.type):
+        escaped = array
+        for needle, replacement in _CYPHER_STRING_ESCAPES:
+            escaped = pc.replace_substring(escaped, needle, replacement)
+        return pc.binary_join_element_wise(_text("'"), escaped, _text("'"), _text(""))
+    if pa.types.is_boolean(array.type):
+        return pc.if_else(array, _text("true"), _text("false"))
+    if pa.types.is_integer(array.type):
+        return pc.cast(array, pa.string())
+    return pa.array(
+        [None if value is None else cypher_value(value) for value in array.to_pylist()],
+        pa.string(),
+    )
+
+
+def encode_maps(batch: pa.RecordBatch, keys: list[str]) -> pa.Array:
+    """`"  " + cypher_map(row)` for every row of ``batch``."""
+    # Each present property becomes ", key: value" (absent ones ""), the
+    # parts are concatenated and the leading ", " sliced off. Joining with
+    # null_handling="skip" is not used: it drops all-null rows.
+    parts = [
+        pc.binary_join_element_wise(_text(f", {key}: "), encode_cypher_values(column), _text("")).fill_null(_text(""))
+        for key, column in zip(keys, batch.columns)
+    ]
+    if parts:
+        joined = pc.utf8_slice_codeunits(pc.binary_join_element_wise(*parts, _text("")), 2)
+    else:
+        joined = pa.array([""] * batch.num_rows, pa.string())
+    return pc.binary_join_element_wise(_text("  {"), joined, _text("}"), _text(""))
+
+
+def encode_statement(
+    pieces: list[pa.RecordBatch], keys: list[str], statement_prefix: str, statement_suffix: str
+) -> str:
+    """Text `write_batch` would write for the rows of ``pieces``."""
+    maps = pa.chunked_array([encode_maps(piece, keys) for piece in pieces], pa.string()).combine_chunks()
+    offsets = pa.array([0, len(maps)], pa.int32())
+    body = pc.binary_join(pa.ListArray.from_arrays(offsets, maps), ",\n")[0].as_py()
+    return f"{statement_prefix}[\n{body}\n]\n{statement_suffix}\n\n"
+
+
+def inject_publication_fields(batch: pa.RecordBatch, publication_id: str) -> pa.RecordBatch:
+    """Columnar `row["publication_id"] = ...; row["human_only"] = True`: an
+    existing column is overwritten in place, a missing one is appended."""
+    for name, value in (("publication_id", publication_id), ("human_only", True)):
+        column = pa.repeat(value, batch.num_rows)
+        index = batch.schema.get_field_index(name)
+        if index == -1:
+            batch = batch.append_column(name, column)
+        else:
+            batch = batch.set_column(index, name, column)
+    return batch
+
+
+def group_positions(
+    batch: pa.RecordBatch, column: str, name_for: Callable[[Any], str]
+) -> list[tuple[str, pa.Array]]:
+    """Row positions of ``batch`` per group name, groups in first-appearance order."""
+    index = batch.schema.get_field_index(column)
+    values = batch.column(index) if index != -1 else pa.nulls(batch.num_rows)
+    if pa.types.is_string(values.type) or pa.types.is_large_string(values.type):
+        # `str(value or fallback)` treats null and "" alike.
+        encoded = values.fill_null("").dictionary_encode()
+        names = [name_for(value) for value in encoded.dictionary.to_pylist()]
+    else:
+        encoded = pa.array([name_for(value) for value in values.to_pylist()], pa.string()).dictionary_encode()
+        names = encoded.dictionary.to_pylist()
+    # Dictionary values come in first-occurrence order; several raw values can
+    # normalise to the same name.
+    group_ids: dict[str, int] = {}
+    ids = [group_ids.setdefault(name, len(group_ids)) for name in names]
+    codes = pc.take(pa.array(ids, pa.int32()), encoded.indices)
+    order = pc.sort_indices(codes)  # stable: positions stay ascending per group
+    counts = dict.fromkeys(range(len(group_ids)), 0)
+    for entry in pc.value_counts(codes).to_pylist():
+        counts[entry["values"]] = entry["counts"]
+    groups = []
+    offset = 0
+    for name, group_id in group_ids.items():
+        groups.append((name, order.slice(offset, counts[group_id])))
+        offset += counts[group_id]
+    return groups
+
+
+class StatementChunker:
+    """Cut grouped rows into the statements the row loop would flush.
+
+    The row loop flushes a group when it reaches ``batch_size`` rows, i.e. at
+    the position of that group's ``batch_size``-th pending row, and flushes the
+    leftovers at the end in first-appearance order. `add` returns the full
+    statements completed by one record batch sorted by that position; `drain`
+    returns the leftovers.
+    """
+
+    def __init__(self, batch_size: int) -> None:
+        self.batch_size = batch_size
+        self.pending: dict[str, list[pa.RecordBatch]] = {}
+        self.pending_rows: dict[str, int] = {}
+        self.counts: dict[str, int] = {}
+
+    def add(
+        self, batch: pa.RecordBatch, groups: list[tuple[str, pa.Array]]
+    ) -> list[tuple[str, list[pa.RecordBatch]]]:
+        completed = []
+        for name, positions in groups:
+            if len(positions) == 0:
+                continue
+            self.counts[name] = self.counts.get(name, 0) + len(positions)
+            pieces = self.pending.setdefault(name, [])
+            pending_rows = self.pending_rows.get(name, 0)
+            start = 0
+            while len(positions) - start >= self.batch_size - pending_rows:
+                end = start + self.batch_size - pending_rows
+                pieces.append(batch.take(positions.slice(start, end - start)))
+                completed.append((positions[end - 1].as_py(), name, pieces))
+                pieces = self.pending[name] = []
+                pending_rows = 0
+                start = end
+            if start < len(positions):
+                pieces.append(batch.take(positions.slice(start)))
+                pending_rows += len(positions) - start
+            self.pending_rows[name] = pending_rows
+        completed.sort(key=lambda item: item[0])
+        return [(name, pieces) for _, name, pieces in completed]
+
+    def drain(self) -> list[tuple[str, list[pa.RecordBatch]]]:
+        leftovers = [(name, pieces) for name, pieces in self.pending.items() if pieces]
+        self.pending = {name: [] for name in self.pending}
+        self.pending_rows = dict.fromkeys(self.pending_rows, 0)
+        return leftovers
+
+
+def write_statements_streaming(
+    out,
+    path: Path,
+    *,
+    group_column: str,
+    name_for: Callable[[Any], str],
+    suffix_for: Callable[[str], str],
+    batch_size: int,
+    publication_id: str,
+    keep: Callable[[pa.RecordBatch], pa.Array | None] | None = None,
+    pool: ProcessPoolExecutor | None = None,
+    depth: int = 1,
+) -> dict[str, int]:
+    """Streaming equivalent of one node or edge loop in `build_import`.
+
+    ``keep`` returns a boolean mask of the rows to emit (None keeps all).
+    Returns the emitted row count per group, in first-appearance order.
+    """
+    chunker = StatementChunker(batch_size)
+
+    def statements() -> Iterable[tuple]:
+        keys: list[str] | None = None
+        for name, pieces in iter_statement_pieces(
+            chunker, path, group_column=group_column, name_for=name_for, publication_id=publication_id, keep=keep
+        ):
+            keys = keys or statement_keys(pieces)
+            yield pieces, keys, "UNWIND ", suffix_for(name)
+
+    for text in ordered_map(pool, encode_statement, statements(), depth):
+        out.write(text)
+    return chunker.counts
+
+
+def iter_statement_pieces(
+    chunker: StatementChunker,
+    path: Path,
+    *,
+    group_column: str,
+    name_for: Callable[[Any], str],
+    publication_id: str,
+    keep: Callable[[pa.RecordBatch], pa.Array | None] | None = None,
+) -> Iterable[tuple[str, list[pa.RecordBatch]]]:
+    """``(group, row pieces)`` of every UNWIND statement for one publication
+    file, in emit order; ``chunker.counts`` holds the totals once exhausted."""
+    for batch in pq.ParquetFile(path).iter_batches(batch_size=READ_BATCH_ROWS):
+        if keep is not None:
+            mask = keep(batch)
+            if mask is not None:
+                batch = batch.filter(mask)
+        if batch.num_rows == 0:
+            continue
+        batch = inject_publication_fields(batch, publication_id)
+        yield from chunker.add(batch, group_positions(batch, group_column, name_for))
+    yield from chunker.drain()
+
+
+def statement_keys(pieces: list[pa.RecordBatch]) -> list[str]:
+    """Property names of a statement's rows, as `cypher_map` spells them."""
+    return [safe_ident(name, "prop") for name in pieces[0].schema.names]
+
+
+# Columnar content-hash diff (REQ-AXO-310). Every row is reduced to a
+# canonical text — sorted `name:type=value;` parts, strings length-prefixed,
+# nulls as `null` — hashed to an int64 with BLAKE2b. Current and prior
+# publications become narrow (key, hash, row) tables, and the diff is one
+# semi-join (unchanged rows) plus one anti-join (removed keys). Canonical
+# texts, keys and joins stay in Arrow, but Arrow has no row hash kernel: the
+# digest is one Python `hashlib` call per row (about 1 µs), so hashing a file
+# costs per row, not per changed row. A publication's `hashes.parquet` sidecar
+# lets the next diff skip re-hashing its prior side.
+HASH_DIGEST_BYTES = 8
+
+
+def canonical_values(array: pa.Array) -> pa.Array:
+    """Injective text form of one column for hashing (never null)."""
+    if pa.types.is_dictionary(array.type):
+        array = array.dictionary_decode()
+    if pa.types.is_string(array.type) or pa.types.is_large_string(array.type):
+        # Length-prefixed, so no escaping is needed to keep it injective.
+        values = pc.binary_join_element_wise(
+            pc.cast(pc.binary_length(array), pa.string()), array.cast(pa.string()), _text(":")
+        )
+    else:
+        try:
+            values = pc.cast(array, pa.string())
+        except (pa.ArrowNotImplementedError, pa.ArrowInvalid):
+            values = pa.array(
+                [None if value is None else repr(value) for value in array.to_pylist()], pa.string()
+            )
+    return values.fill_null(_text("null"))
+
+
+def content_hashes(batch: pa.RecordBatch) -> pa.Array:
+    """Stable int64 content hash per row, ignoring injected publication fields.
+
+    Two rows with the same source content hash equal, so an unchanged
+    node/edge is skipped on the next publication. The canonical text is built
+    in Arrow; the BLAKE2b digest is one Python call per row.
+    """
+    parts = [
+        pc.binary_join_element_wise(
+            _text(f"{field.name}:{field.type}="), canonical_values(batch.column(index)), _text(";"), _text("")
+        )
+        for index, field in sorted(enumerate(batch.schema), key=lambda item: item[1].name)
+        if field.name not in _INJECTED_FIELDS
+    ]
+    if not parts:
+        parts = [pa.array([""] * batch.num_rows, pa.string())]
+    texts = pc.binary_join_element_wise(*parts, _text("")).cast(pa.binary())
+    digests = b"".join(
+        hashlib.blake2b(text, digest_size=HASH_DIGEST_BYTES).digest() for text in texts.to_pylist()
+    )
+    return pa.FixedSizeBinaryArray.from_buffers(
+        pa.binary(HASH_DIGEST_BYTES), batch.num_rows, [None, pa.py_buffer(digests)]
+    ).view(pa.int64())
+
+
+def _key_strings(batch: pa.RecordBatch, column: str) -> pa.Array:
+    """`str(row.get(column))` for every row (a missing column reads as None)."""
+    index = batch.schema.get_field_index(column)
+    if index == -1:
+        return pa.array(["None"] * batch.num_rows, pa.string())
+    values = batch.column(index)
+    if pa.types.is_dictionary(values.type):
+        values = values.dictionary_decode()
+    try:
+        values = pc.cast(values, pa.string())
+    except (pa.ArrowNotImplementedError, pa.ArrowInvalid):
+        values = pa.array([None if value is None else str(value) for value in values.to_pylist()], pa.string())
+    return values.fill_null(_text("None"))
+
+
+def diff_keys(batch: pa.RecordBatch, kind: str) -> pa.Array:
+    """Node id, or `edge_diff_key` for edges, of every row."""
+    if kind == "node":
+        return _key_strings(batch, "id")
+    index = batch.schema.get_field_index("relation_type")
+    values = batch.column(index) if index != -1 else pa.nulls(batch.num_rows)
+    if pa.types.is_string(values.type) or pa.types.is_large_string(values.type):
+        encoded = values.fill_null("").dictionary_encode()
+        names = [edge_relation_for(value) for value in encoded.dictionary.to_pylist()]
+        relations = pc.take(pa.array(names, pa.string()), encoded.indices)
+    else:
+        relations = pa.array([edge_relation_for(value) for value in values.to_pylist()], pa.string())
+    return pc.binary_join_element_wise(
+        _key_strings(batch, "from_id"), _key_strings(batch, "to_id"), relations, _text("\x1f")
+    )
+
+
+def hash_rows(batch: pa.RecordBatch, kind: str) -> pa.RecordBatch:
+    return pa.record_batch({"key": diff_keys(batch, kind), "hash": content_hashes(batch)})
+
+
+def column_counts(path: Path, column: str) -> dict[str, int]:
+    """Row count per value of a low-cardinality column (null counted as "")."""
+    counts: collections.Counter[str] = collections.Counter()
+    parquet = pq.ParquetFile(path)
+    for index in range(parquet.num_row_groups):
+        values = parquet.read_row_group(index, columns=[column]).column(0)
+        for entry in pc.value_counts(values).to_pylist():
+            counts["" if entry["values"] is None else str(entry["values"])] += entry["counts"]
+    return dict(sorted(counts.items()))
+
+
+def ordered_map(pool: ProcessPoolExecutor | None, fn: Callable, items: Iterable[tuple], depth: int):
+    """``fn(*args)`` for each item, through ``pool`` with at most ``depth``
+    tasks in flight; results come back in submission order."""
+    if pool is None:
+        for args in items:
+            yield fn(*args)
+        return
+    inflight: collections.deque = collections.deque()
+    for args in items:
+        inflight.append(pool.submit(fn, *args))
+        while len(inflight) >= depth:
+            yield inflight.popleft().result()
+    while inflight:
+        yield inflight.popleft().result()
+
+
+HASH_TABLE_SCHEMA = pa.schema([("key", pa.string()), ("hash", pa.int64()), ("row", pa.int64())])
+PUBLICATION_FILES = {"node": "nodes.parquet", "edge": "edges.parquet"}
+# Sidecar written next to nodes/edges.parquet by the exporter: one row per
+# node/edge with its kind, row position, diff key and content hash, each
+# kind's rows sorted by (key, row). A prior publication then costs a
+# sequential scan of narrow columns instead of a re-hash.
+HASHES_FILE = "hashes.parquet"
+# memgraph_publication_store.py: retained publications, deduplicated by chunk.
+DEFAULT_STORE_DIR = Path(__file__).resolve().parents[1] / ".axon" / "memgraph" / "store"
+HASH_VERSION = "1"
+HASH_MERGE_ROWS = 262_144
+
+# On-disk encoding of every publication file (see
+# scripts/benchmark_memgraph_parquet.py). zstd level 1 compresses as well as
+# level 3 on publication data at half the write time. Only the
+# low-cardinality columns are dictionary-encoded: ids, titles and hashes
+# would overflow the dictionary page and fall back to plain anyway.
+PARQUET_COMPRESSION = "zstd"
+PARQUET_COMPRESSION_LEVEL = 1
+DICTIONARY_COLUMNS = frozenset({"label", "kind", "status", "project_code", "relation_type", "source"})
+
+
+def parquet_write_options(schema: pa.Schema) -> dict[str, Any]:
+    """`pq.write_table` / `pq.ParquetWriter` options for a publication file."""
+    return {
+        "compression": PARQUET_COMPRESSION,
+        "compression_level": PARQUET_COMPRESSION_LEVEL,
+        "use_dictionary": [name for name in schema.names if name in DICTIONARY_COLUMNS],
+    }
+
+
+def hash_table(
+    path: Path | None, kind: str, pool: ProcessPoolExecutor | None = None, depth: int = 1
+) -> pa.Table:
+    """Narrow ``(key, hash, row)`` table of a publication file; empty when absent."""
+    if path is None or not path.exists():
+        return HASH_TABLE_SCHEMA.empty_table()
+    batches = ((batch, kind) for batch in pq.ParquetFile(path).iter_batches(batch_size=READ_BATCH_ROWS))
+    hashed = list(ordered_map(pool, hash_rows, batches, depth))
+    if not hashed:
+        return HASH_TABLE_SCHEMA.empty_table()
+    table = pa.Table.from_batches(hashed)
+    return table.append_column("row", row_numbers(table.num_rows))
+
+
+def row_numbers(count: int) -> pa.Array:
+    """``0 .. count - 1`` as int64, built in Arrow rather than from a Python range."""
+    if count == 0:
+        return pa.array([], pa.int64())
+    return pc.subtract(pc.cumulative_sum(pa.repeat(pa.scalar(1, pa.int64()), count)), 1)
+
+
+def write_hash_sidecar(
+    publication_dir: Path, pool: ProcessPoolExecutor | None = None, depth: int = 1
+) -> dict[str, Any]:
+    """Write `hashes.parquet` for a publication; returns its manifest entry."""
+    parts = []
+    rows: dict[str, int] = {}
+    for kind, name in PUBLICATION_FILES.items():
+        table = hash_table(publication_dir / name, kind, pool, depth)
+        table = table.sort_by([("key", "ascending"), ("row", "ascending")])
+        rows[kind] = table.num_rows
+        parts.append(table.add_column(0, "kind", pa.repeat(kind, table.num_rows)))
+    sidecar = pa.concat_tables(parts).replace_schema_metadata(
+        {"axon.hash_version": HASH_VERSION, **{f"axon.rows.{kind}": str(count) for kind, count in rows.items()}}
+    )
+    pq.write_table(sidecar, publication_dir / HASHES_FILE, **parquet_write_options(sidecar.schema))
+    return {"file": HASHES_FILE, "hash_version": HASH_VERSION, "rows": rows}
+
+
+def write_delta_hash_sidecar(
+    publication_dir: Path, prior_dir: Path, deleted: dict[str, list[str]]
+) -> dict[str, Any] | None:
+    """Write the cumulative `hashes.parquet` of a delta publication.
+
+    A delta only carries changed rows, so its sidecar describes the projected
+    state instead: the prior sidecar minus deleted and re-exported keys, plus
+    the delta rows. The next publication then diffs against it like against a
+    full one. Returns None (no sidecar) when the prior has no usable sidecar.
+    """
+    parts = []
+    rows: dict[str, int] = {}
+    for kind, name in PUBLICATION_FILES.items():
+        prior_batches = sidecar_hashes(prior_dir, kind)
+        if prior_batches is None:
+            return None
+        prior = pa.concat_tables([HASH_TABLE_SCHEMA.empty_table(), *prior_batches]).cast(HASH_TABLE_SCHEMA)
+        delta = hash_table(publication_dir / name, kind)
+        replaced = pa.chunked_array(
+            [*delta.column("key").chunks, pa.array(deleted.get(kind, []), pa.string())], pa.string()
+        )
+        kept = prior.filter(pc.invert(pc.is_in(prior.column("key"), value_set=replaced.combine_chunks())))
+        # Keep row numbers distinct; they only order removed keys on the next diff.
+        offset = (pc.max(prior.column("row")).as_py() + 1) if prior.num_rows else 0
+        delta = delta.set_column(2, "row", pc.add(delta.column("row"), offset))
+        table = pa.concat_tables([kept, delta]).sort_by([("key", "ascending"), ("row", "ascending")])
+        rows[kind] = table.num_rows
+        parts.append(table.add_column(0, "kind", pa.repeat(kind, table.num_rows)))
+    sidecar = pa.concat_tables(parts).replace_schema_metadata(
+        {
+            "axon.hash_version": HASH_VERSION,
+            "axon.cumulative": "1",
+            **{f"axon.rows.{kind}": str(count) for kind, count in rows.items()},
+        }
+    )
+    pq.write_table(sidecar, publication_dir / HASHES_FILE, **parquet_write_options(sidecar.schema))
+    return {"file": HASHES_FILE, "hash_version": HASH_VERSION, "rows": rows, "cumulative": True}
+
+
+def sidecar_hashes(publication_dir: Path, kind: str) -> Iterable[pa.Table] | None:
+    """Sorted ``(key, hash, row)`` batches of ``kind`` from the sidecar.
+
+    None when the sidecar is missing, from another hash version, or does not
+    match the publication file's row count (a stale sidecar is never trusted).
+    A hash-only prior (`memgraph_publication_store.py thin_prior`) has no data
+    file; its manifest row count stands in. The cumulative sidecar of a delta
+    publication describes the projected state, not its own file, so only its
+    version is checked.
+    """
+    sidecar_path = publication_dir / HASHES_FILE
+    data_path = publication_dir / PUBLICATION_FILES[kind]
+    if not sidecar_path.exists():
+        return None
+    sidecar = pq.ParquetFile(sidecar_path)
+    metadata = sidecar.schema_arrow.metadata or {}
+    if metadata.get(b"axon.hash_version") != HASH_VERSION.encode():
+        return None
+    if metadata.get(b"axon.cumulative") != b"1":
+        if data_path.exists():
+            rows = pq.ParquetFile(data_path).metadata.num_rows
+        elif (publication_dir / "manifest.json").exists():
+            manifest = json.loads((publication_dir / "manifest.json").read_text())
+            rows = manifest.get("row_counts", {}).get(f"{kind}s")
+        else:
+            return None
+        if metadata.get(f"axon.rows.{kind}".encode()) != str(rows).encode():
+            return None
+
+    def batches() -> Iterable[pa.Table]:
+        for batch in sidecar.iter_batches(batch_size=HASH_MERGE_ROWS, columns=["kind", "key", "hash", "row"]):
+            selected = batch.filter(pc.equal(batch.column(0), _text(kind)))
+            if selected.num_rows:
+                yield pa.Table.from_batches([selected]).drop_columns(["kind"])
+
+    return batches()
+
+
+def sorted_hashes(
+    publication_dir: Path | None, kind: str, pool: ProcessPoolExecutor | None = None, depth: int = 1
+) -> Iterable[pa.Table]:
+    """Key-sorted hashes of one publication file: the sidecar when usable,
+    else hashed and sorted in memory."""
+    if publication_dir is None:
+        return iter(())
+    streamed = sidecar_hashes(publication_dir, kind)
+    if streamed is not None:
+        return streamed
+    table = hash_table(publication_dir / PUBLICATION_FILES[kind], kind, pool, depth)
+    return iter([table.sort_by([("key", "ascending"), ("row", "ascending")])])
+
+
+@dataclass
+class DiffSide:
+    """Incremental diff of one publication file against its prior version."""
+
+    keep: pa.Array  # emit mask in the current file's row order
+    skipped: int
+    deleted: list[str]  # prior keys absent from the current file, in prior order
+
+
+class _SortedRun:
+    """Buffered cursor over key-sorted hash tables."""
+
+    def __init__(self, tables: Iterable[pa.Table]) -> None:
+        self.tables = iter(tables)
+        self.buffer = HASH_TABLE_SCHEMA.empty_table()
+        self.done = False
+
+    def fill(self, rows: int) -> None:
+        pending = [self.buffer]
+        buffered = self.buffer.num_rows
+        while not self.done and buffered < rows:
+            table = next(self.tables, None)
+            if table is None:
+                self.done = True
+                break
+            pending.append(table.select(HASH_TABLE_SCHEMA.names).cast(HASH_TABLE_SCHEMA))
+            buffered += table.num_rows
+        if len(pending) > 1:
+            self.buffer = pa.concat_tables(pending)
+
+    def last_key(self) -> str | None:
+        if self.done or self.buffer.num_rows == 0:
+            return None
+        return self.buffer.column("key")[-1].as_py()
+
+    def take_below(self, bound: str | None) -> pa.Table:
+        """Pop every buffered row with key < ``bound`` (all rows when None)."""
+        if bound is None:
+            count = self.buffer.num_rows
+        else:
+            count = pc.sum(pc.less(self.buffer.column("key"), _text(bound))).as_py() or 0
+        head = self.buffer.slice(0, count)
+        self.buffer = self.buffer.slice(count)
+        return head
+
+
+def merge_diff(current: Iterable[pa.Table], prior: Iterable[pa.Table], current_rows: int) -> DiffSide:
+    """Streaming merge-join of two key-sorted hash streams.
+
+    Both streams are consumed in windows that end strictly below the smallest
+    last buffered key, so every occurrence of a key lands in the same window;
+    each window is diffed with an anti-join per side. Memory is one window
+    plus the changed rows, the removed keys and the ``keep`` bitmap (one bit
+    per current row).
+    """
+    current_run, prior_run = _SortedRun(current), _SortedRun(prior)
+    changed_rows: list[pa.Array] = []
+    removed: list[pa.Table] = []
+    window = HASH_MERGE_ROWS
+    while True:
+        current_run.fill(window)
+        prior_run.fill(window)
+        bounds = [key for key in (current_run.last_key(), prior_run.last_key()) if key is not None]
+        bound = min(bounds) if bounds else None
+        current_part = current_run.take_below(bound)
+        prior_part = prior_run.take_below(bound)
+        if bound is not None and current_part.num_rows == 0 and prior_part.num_rows == 0:
+            window *= 2  # every buffered key equals the bound; read further
+            continue
+        window = HASH_MERGE_ROWS
+        changed = current_part.join(prior_part.select(["key", "hash"]), keys=["key", "hash"], join_type="left anti")
+        changed_rows.append(changed.column("row").combine_chunks())
+        gone = prior_part.join(current_part.select(["key"]), keys="key", join_type="left anti")
+        if gone.num_rows:
+            removed.append(gone.group_by("key").aggregate([("row", "min")]))
+        if bound is None:
+            break
+    changed = pa.concat_arrays(changed_rows) if changed_rows else pa.array([], pa.int64())
+    keep = changed_mask(changed, current_rows)
+    deleted = pa.concat_tables(removed).sort_by("row_min").column("key").to_pylist() if removed else []
+    return DiffSide(keep=keep, skipped=current_rows - len(changed), deleted=deleted)
+
+
+def changed_mask(changed: pa.Array, rows: int) -> pa.Array:
+    """Boolean mask of ``rows`` rows with the ``changed`` row numbers set.
+
+    Written straight into an Arrow validity-style bitmap, so the Python work
+    is proportional to the changed rows, not to ``rows``.
+    """
+    bitmap = bytearray((rows + 7) // 8)
+    for row in changed.to_pylist():
+        bitmap[row >> 3] |= 1 << (row & 7)
+    return pa.Array.from_buffers(pa.bool_(), rows, [None, pa.py_buffer(bitmap)])
+
+
+def diff_publication_file(
+    publication_dir: Path,
+    prior_dir: Path | None,
+    kind: str,
+    pool: ProcessPoolExecutor | None = None,
+    depth: int = 1,
+) -> DiffSide:
+    current_path = publication_dir / PUBLICATION_FILES[kind]
+    current_rows = pq.ParquetFile(current_path).metadata.num_rows if current_path.exists() else 0
+    return merge_diff(
+        sorted_hashes(publication_dir, kind, pool, depth),
+        sorted_hashes(prior_dir, kind, pool, depth),
+        current_rows,
+    )
+
+
+# Delta publications (`memgraph_export_publication.py --since`) hold only the
+# rows changed since the publication they were cut against, plus the removed
+# keys in `deletions.parquet` (kind, key — node id or `edge_diff_key`).
+DELETIONS_FILE = "deletions.parquet"
+DELETIONS_SCHEMA = pa.schema([("kind", pa.string()), ("key", pa.string())])
+
+
+def delta_diff(publication_dir: Path, manifest: dict[str, Any], kind: str) -> DiffSide:
+    """Apply a delta publication as-is: every row is emitted, the listed keys deleted."""
+    path = publication_dir / PUBLICATION_FILES[kind]
+    rows = pq.ParquetFile(path).metadata.num_rows if path.exists() else 0
+    deletions = pq.read_table(publication_dir / manifest["delta"].get("file", DELETIONS_FILE))
+    keys = deletions.filter(pc.equal(deletions.column("kind"), _text(kind))).column("key")
+    return DiffSide(keep=pa.repeat(True, rows), skipped=0, deleted=keys.to_pylist())
+
+
+def state_projects(manifest: dict[str, Any]) -> list[str] | None:
+    """Projects the projected state covers; None for every project."""
+    if "export_state" in manifest:
+        return manifest["export_state"].get("projects") or None
+    return manifest.get("projects") or None
+
+
+def usable_prior(manifest: dict[str, Any], prior_dir: Path | None) -> Path | None:
+    """``prior_dir`` when it can stand for the projected graph, else None.
+
+    A prior scoped to other projects would turn every row outside the shared
+    scope into a delete, and a delta prior only stands for the full state
+    through its cumulative sidecar. Without a usable prior the load degrades
+    to a full MERGE (idempotent, nothing deleted).
+    """
+    if prior_dir is None:
+        return None
+    prior_manifest_path = prior_dir / "manifest.json"
+    prior_manifest = json.loads(prior_manifest_path.read_text()) if prior_manifest_path.exists() else {}
+    if state_projects(prior_manifest) != state_projects(manifest):
+        return None
+    if "delta" in prior_manifest and any(sidecar_hashes(prior_dir, kind) is None for kind in PUBLICATION_FILES):
+        return None
+    return prior_dir
+
+
+def publication_diffs(
+    publication_dir: Path,
+    manifest: dict[str, Any],
+    prior_dir: Path | None,
+    pool: ProcessPoolExecutor | None = None,
+    depth: int = 1,
+) -> tuple[DiffSide, DiffSide]:
+    """Node and edge diffs of an incremental load (a delta publication carries its own)."""
+    if "delta" in manifest:
+        return delta_diff(publication_dir, manifest, "node"), delta_diff(publication_dir, manifest, "edge")
+    prior_dir = usable_prior(manifest, prior_dir)
+    return (
+        diff_publication_file(publication_dir, prior_dir, "node", pool, depth),
+        diff_publication_file(publication_dir, prior_dir, "edge", pool, depth),
+    )
+
+
+def mask_slicer(mask: pa.Array) -> Callable[[pa.RecordBatch], pa.Array]:
+    """``keep`` callback for `write_statements_streaming` reading ``mask`` in order."""
+    offset = 0
+
+    def keep(batch: pa.RecordBatch) -> pa.Array:
+        nonlocal offset
+        part = mask.slice(offset, batch.num_rows)
+        offset += batch.num_rows
+        return part
+
+    return keep
+
+
+@contextlib.contextmanager
+def encoder_pool(workers: int):
+    """Process pool for `encode_statement`, or None to encode in-process."""
+    if workers <= 1:
+        yield None
+        return
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        yield pool
+
+
+def node_label_for(value: Any) -> str:
+    return safe_ident(str(value or "AxonNode"), "AxonNode")
+
+
+def edge_relation_for(value: Any) -> str:
+    return safe_ident(str(value or "RELATED_TO"), "RELATED_TO").upper()
+
+
+def node_statement_suffix(label: str, incremental: bool) -> str:
+    if incremental:
+        return f"AS row MERGE (n:AxonNode {{id: row.id}}) SET n:{label}, n += row;"
+    return f"AS row CREATE (n:AxonNode:{label}) SET n += row;"
+
+
+def edge_statement_suffix(relation: str, incremental: bool) -> str:
+    verb = "MERGE" if incremental else "CREATE"
+    return (
+        "AS row MATCH (a:AxonNode {id: row.from_id}), (b:AxonNode {id: row.to_id}) "
+        f"{verb} (a)-[r:{relation}]->(b) SET r += row;"
+    )
+
+
+NODE_DELETE_SUFFIX = "AS id MATCH (n:AxonNode {id: id}) DETACH DELETE n;"
+EDGE_DELETE_SUFFIX = (
+    "AS row MATCH (a:AxonNode {id: row.from_id})-[r]->(b:AxonNode {id: row.to_id}) "
+    "WHERE type(r) = row.rel DELETE r;"
+)
+
+
+def deleted_edge_rows(keys: list[str]) -> list[dict[str, str]]:
+    """`edge_diff_key` values back as the rows of the edge DELETE statement."""
+    rows = []
+    for key in keys:
+        parts = key.split("\x1f")
+        rows.append({"from_id": parts[0], "to_id": parts[1], "rel": parts[2]})
+    return rows
+
+
 QUERY_DESCRIPTIONS = {
     "calls_hotspots_with_file": "CALLS hotspots grouped by file for dependency and blast-radius inspection.",
     "cross_project_links": "Relationships crossing project boundaries.",
@@ -294,6 +1030,8 @@ def build_import(
     query_dir: Path,
     incremental: bool = False,
     prior_publication_dir: Path | None = None,
+    workers: int | None = None,
+    streaming: bool = True,
 ) -> dict[str, Any]:
     manifest_path = publication_dir / "manifest.json"
     nodes_path = publication_dir / "nodes.parquet"
@@ -303,10 +1041,10 @@ def build_import(
     # REQ-AXO-310 — incremental mode diffs against the previous publication and
     # emits MERGE deltas (changed/new) + DETACH DELETE (removed), skipping
     # unchanged rows; it never wipes the graph. With no prior publication it
-    # degrades to a full MERGE (idempotent, no duplicates).
-    prior_node_hashes, prior_edge_hashes = (
-        load_prior_hashes(prior_publication_dir) if incremental else ({}, {})
-    )
+    # degrades to a full MERGE (idempotent, no duplicates). A delta publication
+    # is always applied incrementally — wiping would lose every unchanged row.
+    incremental = incremental or "delta" in manifest
+    prior_dir = prior_publication_dir if incremental else None
 
     labels: dict[str, int] = {}
     relations: dict[str, int] = {}
@@ -316,101 +1054,105 @@ def build_import(
     edges_skipped = 0
     nodes_deleted = 0
     edges_deleted = 0
-    current_node_ids: set[str] = set()
-    current_edge_keys: set[str] = set()
     query_rows = prepared_query_rows(query_dir, manifest["publication_id"])
 
-    def node_suffix(label: str) -> str:
-        if incremental:
-            return f"AS row MERGE (n:AxonNode {{id: row.id}}) SET n:{label}, n += row;"
-        return f"AS row CREATE (n:AxonNode:{label}) SET n += row;"
+    node_suffix = functools.partial(node_statement_suffix, incremental=incremental)
+    edge_suffix = functools.partial(edge_statement_suffix, incremental=incremental)
 
-    def edge_suffix(relation: str) -> str:
-        verb = "MERGE" if incremental else "CREATE"
-        return (
-            "AS row MATCH (a:AxonNode {id: row.from_id}), (b:AxonNode {id: row.to_id}) "
-            f"{verb} (a)-[r:{relation}]->(b) SET r += row;"
-        )
+    streaming = streaming and pc is not None
+    workers = default_workers() if workers is None else max(1, workers)
+    depth = workers * PIPELINE_DEPTH_PER_WORKER
 
-    with out_path.open("w", encoding="utf-8") as out:
+    with out_path.open("w", encoding="utf-8") as out, encoder_pool(workers if streaming else 1) as pool:
         write_drop_indexes(out)
         if not keep_existing and not incremental:
             out.write("MATCH (n) DETACH DELETE n;\n\n")
         write_indexes(out)
 
-        node_batches: dict[str, list[dict[str, Any]]] = {}
-        for row in iter_rows(nodes_path):
-            label = safe_ident(str(row.get("label") or "AxonNode"), "AxonNode")
-            if incremental:
-                node_id = str(row.get("id"))
-                current_node_ids.add(node_id)
-                if prior_node_hashes.get(node_id) == row_content_hash(row):
-                    nodes_skipped += 1
-                    continue
-            row["publication_id"] = manifest["publication_id"]
-            row["human_only"] = True
-            node_batches.setdefault(label, []).append(row)
-            labels[label] = labels.get(label, 0) + 1
-            total_nodes += 1
-            if len(node_batches[label]) >= batch_size:
-                write_batch(out, "UNWIND ", node_batches[label], node_suffix(label))
-                node_batches[label] = []
-
-        for label, rows in node_batches.items():
-            write_batch(out, "UNWIND ", rows, node_suffix(label))
-
+        node_diff = edge_diff = None
         if incremental:
-            deleted_nodes = [nid for nid in prior_node_hashes if nid not in current_node_ids]
+            node_diff, edge_diff = publication_diffs(publication_dir, manifest, prior_dir, pool, depth)
+            nodes_skipped, edges_skipped = node_diff.skipped, edge_diff.skipped
+
+        if streaming:
+            labels = write_statements_streaming(
+                out,
+                nodes_path,
+                group_column="label",
+                name_for=node_label_for,
+                suffix_for=node_suffix,
+                batch_size=batch_size,
+                publication_id=manifest["publication_id"],
+                keep=mask_slicer(node_diff.keep) if node_diff else None,
+                pool=pool,
+                depth=depth,
+            )
+            total_nodes = sum(labels.values())
+        else:
+            keep_nodes = node_diff.keep.to_pylist() if node_diff else None
+            node_batches: dict[str, list[dict[str, Any]]] = {}
+            for index, row in enumerate(iter_rows(nodes_path)):
+                label = safe_ident(str(row.get("label") or "AxonNode"), "AxonNode")
+                if keep_nodes is not None and not keep_nodes[index]:
+                    continue
+                row["publication_id"] = manifest["publication_id"]
+                row["human_only"] = True
+                node_batches.setdefault(label, []).append(row)
+                labels[label] = labels.get(label, 0) + 1
+                total_nodes += 1
+                if len(node_batches[label]) >= batch_size:
+                    write_batch(out, "UNWIND ", node_batches[label], node_suffix(label))
+                    node_batches[label] = []
+
+            for label, rows in node_batches.items():
+                write_batch(out, "UNWIND ", rows, node_suffix(label))
+
+        if node_diff:
+            deleted_nodes = node_diff.deleted
             nodes_deleted = len(deleted_nodes)
             for start in range(0, len(deleted_nodes), batch_size):
                 chunk = deleted_nodes[start : start + batch_size]
-                out.write(
-                    "UNWIND "
-                    + json.dumps(chunk)
-                    + " AS id MATCH (n:AxonNode {id: id}) DETACH DELETE n;\n\n"
-                )
-
-        edge_batches: dict[str, list[dict[str, Any]]] = {}
-        for row in iter_rows(edges_path):
-            relation = safe_ident(str(row.get("relation_type") or "RELATED_TO"), "RELATED_TO").upper()
-            if incremental:
-                key = edge_diff_key(row)
-                current_edge_keys.add(key)
-                if prior_edge_hashes.get(key) == row_content_hash(row):
-                    edges_skipped += 1
-                    continue
-            row["publication_id"] = manifest["publication_id"]
-            row["human_only"] = True
-            edge_batches.setdefault(relation, []).append(row)
-            relations[relation] = relations.get(relation, 0) + 1
-            total_edges += 1
-            if len(edge_batches[relation]) >= batch_size:
-                write_batch(out, "UNWIND ", edge_batches[relation], edge_suffix(relation))
-                edge_batches[relation] = []
-
-        for relation, rows in edge_batches.items():
-            write_batch(out, "UNWIND ", rows, edge_suffix(relation))
+                out.write(f"UNWIND {json.dumps(chunk)} {NODE_DELETE_SUFFIX}\n\n")
 
-        if incremental:
-            deleted_edges = [
-                {
-                    "from_id": key.split("\x1f")[0],
-                    "to_id": key.split("\x1f")[1],
-                    "rel": key.split("\x1f")[2],
-                }
-                for key in prior_edge_hashes
-                if key not in current_edge_keys
-            ]
+        if streaming:
+            relations = write_statements_streaming(
+                out,
+                edges_path,
+                group_column="relation_type",
+                name_for=edge_relation_for,
+                suffix_for=edge_suffix,
+                batch_size=batch_size,
+                publication_id=manifest["publication_id"],
+                keep=mask_slicer(edge_diff.keep) if edge_diff else None,
+                pool=pool,
+                depth=depth,
+            )
+            total_edges = sum(relations.values())
+        else:
+            keep_edges = edge_diff.keep.to_pylist() if edge_diff else None
+            edge_batches: dict[str, list[dict[str, Any]]] = {}
+            for index, row in enumerate(iter_rows(edges_path)):
+                relation = safe_ident(str(row.get("relation_type") or "RELATED_TO"), "RELATED_TO").upper()
+                if keep_edges is not None and not keep_edges[index]:
+                    continue
+                row["publication_id"] = manifest["publication_id"]
+                row["human_only"] = True
+                edge_batches.setdefault(relation, []).append(row)
+                relations[relation] = relations.get(relation, 0) + 1
+                total_edges += 1
+                if len(edge_batches[relation]) >= batch_size:
+                    write_batch(out, "UNWIND ", edge_batches[relation], edge_suffix(relation))
+                    edge_batches[relation] = []
+
+            for relation, rows in edge_batches.items():
+                write_batch(out, "UNWIND ", rows, edge_suffix(relation))
+
+        if edge_diff:
+            deleted_edges = deleted_edge_rows(edge_diff.deleted)
             edges_deleted = len(deleted_edges)
             for start in range(0, len(deleted_edges), batch_size):
                 chunk = deleted_edges[start : start + batch_size]
-                write_batch(
-                    out,
-                    "UNWIND ",
-                    chunk,
-                    "AS row MATCH (a:AxonNode {id: row.from_id})-[r]->(b:AxonNode {id: row.to_id}) "
-                    "WHERE type(r) = row.rel DELETE r;",
-                )
+                write_batch(out, "UNWIND ", chunk, EDGE_DELETE_SUFFIX)
 
         out.write("MATCH (q:PreparedQuery) DETACH DELETE q;\n\n")
         out.write("MATCH (p:PreparedQueryPack) DETACH DELETE p;\n\n")
@@ -440,6 +1182,9 @@ def build_import(
         "input_manifest": str(manifest_path),
         "output": str(out_path),
         "incremental": incremental,
+        "delta_of": manifest.get("delta", {}).get("since"),
+        "encoder": "arrow_streaming" if streaming else "rows",
+        "workers": workers if streaming else 1,
         "nodes": total_nodes,
         "edges": total_edges,
         "nodes_emitted": total_nodes,
@@ -496,24 +1241,39 @@ def main() -> int:
     out_path = args.out or publication_dir / "memgraph_import.cypherl"
     if args.batch_size <= 0:
         raise SystemExit("--batch-size must be positive")
+    if args.workers is not None and args.workers <= 0:
+        raise SystemExit("--workers must be positive")
     for name in ["manifest.json", "nodes.parquet", "edges.parquet"]:
         path = publication_dir / name
         if not path.exists():
             raise SystemExit(f"missing publication artifact: {path}")
+    if args.prior_publication_dir is not None and args.prior_publication_id is not None:
+        raise SystemExit("--prior-publication-dir and --prior-publication-id are exclusive")
     prior_dir = (
         args.prior_publication_dir.resolve()
         if args.incremental and args.prior_publication_dir is not None
         else None
     )
-    summary = build_import(
-        publication_dir,
-        out_path,
-        args.batch_size,
-        args.keep_existing,
-        args.query_dir.resolve(),
-        incremental=args.incremental,
-        prior_publication_dir=prior_dir,
-    )
+    with contextlib.ExitStack() as stack:
+        if args.incremental and args.prior_publication_id is not None:
+            # Imported here: the store builds on this module.
+            from memgraph_publication_store import thin_prior
+
+            try:
+                prior_dir = stack.enter_context(thin_prior(args.store_dir.resolve(), args.prior_publication_id))
+            except KeyError as exc:
+                raise SystemExit(exc.args[0]) from exc
+        summary = build_import(
+            publication_dir,
+            out_path,
+            args.batch_size,
+            args.keep_existing,
+            args.query_dir.resolve(),
+            incremental=args.incremental,
+            prior_publication_dir=prior_dir,
+            workers=args.workers,
+            streaming=not args.row_encoder,
+        )
     print(json.dumps(summary, indent=2, sort_keys=True))
     return 0
 
@@ -13,56 +13,156 @@ Dependency-light by design: reads PG via `psql … COPY … TO STDOUT (FORMAT cs
 the downstream scripts). Docker is NOT required to run this — only the final
 `memgraph-projection.sh load` step needs it.
 
+Each UNION ALL branch (soll.Node, ist.Symbol, ist.IndexedFile, soll.Edge,
+ist.edge) is its own COPY, run ``--jobs`` at a time. psql's stdout is parsed
+block by block with `pyarrow.csv.open_csv` and written out in row groups, so
+memory stays at a few blocks per stream whatever the tenant size. The branch
+files are then concatenated in union order.
+
 Node schema : id, label, project_code, name, title, kind, status
 Edge schema : from_id, to_id, relation_type, project_code
+
+`hashes.parquet` (kind, key, hash, row; sorted by key per kind) carries the
+content hashes `memgraph_build_cypherl.py --incremental` merge-joins against
+the next publication, so the prior side is never re-hashed.
+
+`--project CODE` (repeatable) restricts every branch to those projects.
+`export_state.parquet` snapshots each branch's (key, version) — the write
+timestamp where the table has one (ist.edge), else an md5 of the projected
+columns. `--since PUB_ID` diffs a fresh snapshot against that publication's
+and COPYs only the changed rows: a delta publication whose `deletions.parquet`
+lists the removed keys and whose manifest carries `delta.since`. The builder
+and the Bolt loader apply it directly (MERGE + DELETE, no prior diff).
 """
 
 from __future__ import annotations
 
 import argparse
-import io
 import json
+import shutil
 import subprocess
 import sys
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import Any, Callable, Iterable, NamedTuple, Sequence
 
 import pyarrow as pa
+import pyarrow.compute as pc
 import pyarrow.csv as pacsv
 import pyarrow.parquet as pq
 
+from memgraph_build_cypherl import (
+    DELETIONS_FILE,
+    DELETIONS_SCHEMA,
+    column_counts,
+    diff_keys,
+    parquet_write_options,
+    state_projects,
+    write_delta_hash_sidecar,
+    write_hash_sidecar,
+)
+
 # All columns are exported as text so node ids stay strings (Cypher matches on
 # `{id: row.from_id}` — a numeric-looking id must not become an int).
 NODE_COLUMNS = ["id", "label", "project_code", "name", "title", "kind", "status"]
 EDGE_COLUMNS = ["from_id", "to_id", "relation_type", "project_code"]
 
-# IST + SOLL node union. Every branch projects the 7 NODE_COLUMNS in order.
-NODE_QUERY = """
-COPY (
-    SELECT id, type AS label, project_code, NULL::text AS name, title, NULL::text AS kind, status
-      FROM soll.Node
-    UNION ALL
-    SELECT id, 'Symbol' AS label, project_code, name, NULL::text AS title, kind, NULL::text AS status
-      FROM ist.Symbol
-    UNION ALL
-    SELECT path AS id, 'IndexedFile' AS label, project_code, path AS name,
-           NULL::text AS title, NULL::text AS kind, NULL::text AS status
-      FROM ist.IndexedFile
-) TO STDOUT WITH (FORMAT csv, HEADER true)
-"""
+class Branch(NamedTuple):
+    """One UNION branch: a table projected onto NODE_COLUMNS / EDGE_COLUMNS."""
+
+    source: str  # schema-qualified table
+    projection: str  # SELECT list, in column order
+    key: str  # row identity across publications (the table's primary key)
+    version: str  # changes whenever the projected columns do
+    updated_at: bool = False  # version is a write timestamp, filterable server-side
+
+
+EDGE_KEY = "source_id || E'\\x1f' || target_id || E'\\x1f' || relation_type"
+
+# IST + SOLL node union, one branch per table in union order. Only ist.edge has
+# a write timestamp covering its projected columns (rows are immutable past
+# `ON CONFLICT DO NOTHING`); the other tables are versioned by an md5 of the
+# projected columns.
+NODE_BRANCHES = (
+    Branch(
+        "soll.Node",
+        "id, type AS label, project_code, NULL::text AS name, title, NULL::text AS kind, status",
+        "id",
+        "md5(ROW(id, type, project_code, title, status)::text)",
+    ),
+    Branch(
+        "ist.Symbol",
+        "id, 'Symbol' AS label, project_code, name, NULL::text AS title, kind, NULL::text AS status",
+        "id",
+        "md5(ROW(id, project_code, name, kind)::text)",
+    ),
+    Branch(
+        "ist.IndexedFile",
+        "path AS id, 'IndexedFile' AS label, project_code, path AS name,"
+        " NULL::text AS title, NULL::text AS kind, NULL::text AS status",
+        "path",
+        "md5(ROW(path, project_code)::text)",
+    ),
+)
 
 # IST + SOLL edge union (4 EDGE_COLUMNS in order).
-EDGE_QUERY = """
-COPY (
-    SELECT source_id AS from_id, target_id AS to_id, relation_type, project_code FROM soll.Edge
-    UNION ALL
-    SELECT source_id AS from_id, target_id AS to_id, relation_type, project_code FROM ist.edge
-) TO STDOUT WITH (FORMAT csv, HEADER true)
-"""
+EDGE_BRANCHES = (
+    Branch(
+        "soll.Edge",
+        "source_id AS from_id, target_id AS to_id, relation_type, project_code",
+        EDGE_KEY,
+        "md5(ROW(source_id, target_id, relation_type, project_code)::text)",
+    ),
+    Branch(
+        "ist.edge",
+        "source_id AS from_id, target_id AS to_id, relation_type, project_code",
+        f"{EDGE_KEY} || E'\\x1f' || project_code",
+        "created_at_ms",
+        updated_at=True,
+    ),
+)
+
+# Per-row (key, version) snapshot of every branch, written with each
+# publication: the watermark a later `--since` export is diffed against.
+STATE_FILE = "export_state.parquet"
+STATE_COLUMNS = ["key", "version", "project_code"]
+STATE_SCHEMA = pa.schema([("source", pa.string()), *((name, pa.string()) for name in STATE_COLUMNS)])
+# Changed keys per `= ANY(ARRAY[…])` COPY of a hash-versioned branch.
+DELTA_KEY_CHUNK = 5_000
+
+# Each branch is COPYed sorted (scripts/benchmark_memgraph_parquet.py): the
+# label and project columns collapse into long runs, zstd sees neighbouring
+# ids with common prefixes, and a node's outgoing edges sit together. Edges
+# are not led by relation_type — that splits one source's edges apart and
+# doubles the file — the dictionary already makes the relation column tiny.
+NODE_SORT = ["label", "project_code", "id"]
+EDGE_SORT = ["project_code", "from_id", "to_id", "relation_type"]
+
+
+class Output(NamedTuple):
+    """One publication file and the branches unioned into it."""
+
+    name: str  # row_counts key
+    kind: str  # builder kind (`PUBLICATION_FILES`)
+    file: str
+    branches: tuple[Branch, ...]
+    columns: list[str]
+    order: list[str]
+
+
+OUTPUTS = (
+    Output("nodes", "node", "nodes.parquet", NODE_BRANCHES, NODE_COLUMNS, NODE_SORT),
+    Output("edges", "edge", "edges.parquet", EDGE_BRANCHES, EDGE_COLUMNS, EDGE_SORT),
+)
+
+COPY_BLOCK_BYTES = 4 << 20
+ROW_GROUP_ROWS = 131_072
+PARTS_DIR = ".export-parts"
 
 
 def parse_args() -> argparse.Namespace:
-    parser = argparse.ArgumentParser(description=__doc__)
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
     parser.add_argument("--db-url", required=True, help="PostgreSQL connection URL.")
     parser.add_argument("--out-dir", required=True, type=Path, help="Publication directory to write.")
     parser.add_argument(
@@ -71,23 +171,350 @@ def parse_args() -> argparse.Namespace:
         help="Stable id for this publication (default: pub-<unix_ms>).",
     )
     parser.add_argument("--source-commit", default="", help="Optional git sha for provenance.")
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=len(NODE_BRANCHES) + len(EDGE_BRANCHES),
+        help="Parallel COPY streams (default: one per UNION branch).",
+    )
+    parser.add_argument(
+        "--project",
+        action="append",
+        default=[],
+        metavar="CODE",
+        help="Only export this project's rows (repeatable; default: every project).",
+    )
+    parser.add_argument(
+        "--since",
+        default=None,
+        metavar="PUBLICATION_ID",
+        help="Delta export: only rows changed since this publication (must carry export_state.parquet).",
+    )
+    parser.add_argument(
+        "--publications-root",
+        type=Path,
+        default=None,
+        help="Directory holding the --since publication (default: the parent of --out-dir).",
+    )
     return parser.parse_args()
 
 
-def copy_to_table(db_url: str, query: str, columns: list[str]) -> pa.Table:
-    """Run a `COPY … TO STDOUT (CSV)` and parse it into an all-string table."""
-    proc = subprocess.run(
-        ["psql", db_url, "--no-psqlrc", "--quiet", "-c", query],
-        capture_output=True,
-        check=False,
+def copy_query(select: str) -> str:
+    return f"COPY ({select}) TO STDOUT WITH (FORMAT csv, HEADER true)"
+
+
+def sql_literal(value: str) -> str:
+    return "'" + value.replace("'", "''") + "'"
+
+
+def branch_select(
+    projection: str, source: str, where: Sequence[str] = (), order: Sequence[str] = ()
+) -> str:
+    select = f"SELECT {projection} FROM {source}"
+    if where:
+        select = f"{select} WHERE {' AND '.join(where)}"
+    return f"{select} ORDER BY {', '.join(order)}" if order else select
+
+
+def project_filter(projects: Sequence[str]) -> list[str]:
+    if not projects:
+        return []
+    return [f"project_code IN ({', '.join(sql_literal(code) for code in projects)})"]
+
+
+def state_select(branch: Branch, projects: Sequence[str]) -> str:
+    return branch_select(
+        f"{branch.key} AS key, ({branch.version})::text AS version, project_code",
+        branch.source,
+        project_filter(projects),
+    )
+
+
+def string_schema(columns: list[str]) -> pa.Schema:
+    return pa.schema([(name, pa.string()) for name in columns])
+
+
+class RowGroupWriter:
+    """`pq.ParquetWriter` that buffers batches into ROW_GROUP_ROWS row groups."""
+
+    def __init__(self, path: Path, schema: pa.Schema) -> None:
+        self.schema = schema
+        self.writer = pq.ParquetWriter(path, schema, **parquet_write_options(schema))
+        self.pending: list[pa.RecordBatch] = []
+        self.pending_rows = 0
+        self.rows = 0
+
+    def write(self, batch: pa.RecordBatch) -> None:
+        self.pending.append(batch)
+        self.pending_rows += batch.num_rows
+        self.rows += batch.num_rows
+        if self.pending_rows >= ROW_GROUP_ROWS:
+            self.flush()
+
+    def flush(self) -> None:
+        if self.pending:
+            self.writer.write_table(pa.Table.from_batches(self.pending, self.schema), row_group_size=ROW_GROUP_ROWS)
+        self.pending = []
+        self.pending_rows = 0
+
+    def close(self) -> None:
+        self.flush()
+        self.writer.close()
+
+
+# Every column psql hands back is read as text.
+ROW_KEY = "_key"
+TEXT_COLUMNS = {*NODE_COLUMNS, *EDGE_COLUMNS, *STATE_COLUMNS, ROW_KEY}
+
+
+def copy_batches(db_url: str, select: str) -> Iterable[pa.RecordBatch]:
+    """Stream a `COPY … TO STDOUT (CSV)` of ``select`` as record batches.
+
+    The query goes through stdin: a delta's key lists can outgrow the
+    command-line limit of a single argument.
+    """
+    proc = subprocess.Popen(
+        ["psql", db_url, "--no-psqlrc", "--quiet", "-v", "ON_ERROR_STOP=1", "-f", "-"],
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
     )
-    if proc.returncode != 0:
-        sys.stderr.write(proc.stderr.decode("utf-8", "replace"))
-        raise SystemExit(f"psql COPY failed (rc={proc.returncode})")
-    convert = pacsv.ConvertOptions(column_types={c: pa.string() for c in columns})
-    table = pacsv.read_csv(io.BytesIO(proc.stdout), convert_options=convert)
-    # Preserve a deterministic column order for the downstream cypher builder.
-    return table.select(columns)
+    assert proc.stdin is not None and proc.stdout is not None and proc.stderr is not None
+    parse_error: pa.ArrowInvalid | None = None
+    try:
+        try:
+            proc.stdin.write(f"{copy_query(select)};\n".encode())
+            proc.stdin.close()
+        except BrokenPipeError:  # psql exited early; its return code tells why
+            pass
+        reader = pacsv.open_csv(
+            proc.stdout,
+            read_options=pacsv.ReadOptions(block_size=COPY_BLOCK_BYTES),
+            # Titles can carry line breaks; COPY quotes them.
+            parse_options=pacsv.ParseOptions(newlines_in_values=True),
+            convert_options=pacsv.ConvertOptions(column_types={name: pa.string() for name in TEXT_COLUMNS}),
+        )
+        yield from reader
+    except pa.ArrowInvalid as exc:  # e.g. empty stdout when psql failed
+        parse_error = exc
+    finally:
+        proc.stdout.close()
+        stderr = proc.stderr.read()
+        returncode = proc.wait()
+    if returncode != 0:
+        sys.stderr.write(stderr.decode("utf-8", "replace"))
+        raise SystemExit(f"psql COPY failed (rc={returncode})")
+    if parse_error is not None:
+        raise parse_error
+
+
+def copy_to_parquet(
+    db_url: str,
+    selects: Sequence[str],
+    columns: list[str],
+    out_path: Path,
+    keep: Callable[[pa.RecordBatch], pa.Array] | None = None,
+) -> int:
+    """Stream the COPY of each of ``selects`` into one all-string Parquet file.
+
+    ``keep`` filters every parsed batch and may read columns beyond
+    ``columns``. Returns the row count. Only one CSV block and one pending
+    row group are held in memory at a time.
+    """
+    schema = string_schema(columns)
+    writer = RowGroupWriter(out_path, schema)
+    try:
+        for select in selects:
+            for batch in copy_batches(db_url, select):
+                if keep is not None:
+                    batch = batch.filter(keep(batch))
+                # Preserve a deterministic column order for the downstream cypher builder.
+                writer.write(pa.record_batch([batch.column(name) for name in columns], schema=schema))
+    finally:
+        writer.close()
+    return writer.rows
+
+
+def concat_parquet(parts: list[Path], out_path: Path, schema: pa.Schema) -> int:
+    """Concatenate branch files in order, one row group at a time."""
+    writer = RowGroupWriter(out_path, schema)
+    try:
+        for part in parts:
+            for batch in pq.ParquetFile(part).iter_batches(batch_size=ROW_GROUP_ROWS):
+                writer.write(batch)
+    finally:
+        writer.close()
+    return writer.rows
+
+
+def read_state(publication_dir: Path) -> pa.Table | None:
+    path = publication_dir / STATE_FILE
+    return pq.read_table(path).cast(STATE_SCHEMA) if path.exists() else None
+
+
+def prior_branch_state(prior_state: pa.Table, source: str, projects: Sequence[str]) -> pa.Table:
+    """The prior snapshot of one branch, restricted to the exported projects."""
+    mask = pc.equal(prior_state.column("source"), source)
+    if projects:
+        mask = pc.and_(mask, pc.is_in(prior_state.column("project_code"), value_set=pa.array(projects, pa.string())))
+    return prior_state.filter(mask).drop_columns(["source"])
+
+
+def branch_delta(current: pa.Table, prior: pa.Table) -> tuple[pa.Array, pa.Array]:
+    """(changed or new keys, removed keys) of one branch between two snapshots."""
+    changed = current.join(prior.select(["key", "version"]), keys=["key", "version"], join_type="left anti")
+    removed = prior.join(current.select(["key"]), keys="key", join_type="left anti")
+    return changed.column("key").combine_chunks(), removed.column("key").combine_chunks()
+
+
+def changed_row_selects(
+    branch: Branch, projects: Sequence[str], current: pa.Table, changed: pa.Array, order: Sequence[str] = ()
+) -> tuple[list[str], Callable[[pa.RecordBatch], pa.Array] | None]:
+    """COPY selects (and a batch filter) fetching only the ``changed`` rows.
+
+    A timestamped branch is scanned from its oldest changed version on and
+    narrowed to the changed keys client-side; the others are fetched by
+    primary key, DELTA_KEY_CHUNK keys per COPY.
+    """
+    if len(changed) == 0:
+        return [], None
+    where = project_filter(projects)
+    if branch.updated_at:
+        versions = current.filter(pc.is_in(current.column("key"), value_set=changed)).column("version")
+        oldest = pc.min(pc.cast(versions, pa.int64())).as_py()
+        select = branch_select(
+            f"{branch.projection}, {branch.key} AS {ROW_KEY}",
+            branch.source,
+            [*where, f"{branch.version} >= {int(oldest)}"],
+            order,
+        )
+        return [select], lambda batch: pc.is_in(batch.column(ROW_KEY), value_set=changed)
+    keys = changed.to_pylist()
+    return [
+        branch_select(
+            branch.projection,
+            branch.source,
+            [*where, f"{branch.key} = ANY(ARRAY[{', '.join(map(sql_literal, chunk))}]::text[])"],
+            order,
+        )
+        for chunk in (keys[start : start + DELTA_KEY_CHUNK] for start in range(0, len(keys), DELTA_KEY_CHUNK))
+    ], None
+
+
+def edge_state_keys(keys: pa.Array) -> pa.Array:
+    """Edge branch keys (from, to, relation[, project]) as `edge_diff_key` values."""
+    parts = pc.split_pattern(keys, "\x1f")
+    return diff_keys(
+        pa.record_batch(
+            {
+                "from_id": pc.list_element(parts, 0),
+                "to_id": pc.list_element(parts, 1),
+                "relation_type": pc.list_element(parts, 2),
+            }
+        ),
+        "edge",
+    )
+
+
+def deletion_keys(kind: str, removed: list[pa.Array], current: list[pa.Array]) -> pa.Array:
+    """Builder keys of removed rows, minus any another row still projects
+    (an ist.edge moved to another project keeps its Memgraph edge)."""
+    to_key = edge_state_keys if kind == "edge" else (lambda keys: keys)
+    gone = pc.unique(to_key(pa.concat_arrays([pa.array([], pa.string()), *removed])))
+    live = to_key(pa.concat_arrays([pa.array([], pa.string()), *current]))
+    gone = gone.filter(pc.invert(pc.is_in(gone, value_set=live)))
+    return pc.take(gone, pc.sort_indices(gone))
+
+
+def export_tables(
+    db_url: str,
+    out_dir: Path,
+    jobs: int,
+    projects: Sequence[str] = (),
+    prior_state: pa.Table | None = None,
+) -> dict[str, Any]:
+    """COPY every UNION branch in parallel and assemble the publication files.
+
+    Writes nodes/edges.parquet and the export_state.parquet snapshot. With
+    ``prior_state`` (a `--since` delta) only changed or new rows are fetched
+    and the removed keys land in deletions.parquet. Returns ``row_counts``,
+    ``state_rows`` and, for a delta, ``deleted`` per kind.
+    """
+    parts_dir = out_dir / PARTS_DIR
+    parts_dir.mkdir(parents=True, exist_ok=True)
+    try:
+        with ThreadPoolExecutor(max_workers=max(1, jobs)) as executor:
+            # Versions are snapshotted before rows are read: a row written in
+            # between is exported newer than its version and simply re-exported
+            # by the next delta, never missed.
+            state_parts = {
+                branch.source: parts_dir / f"state-{branch.source}.parquet"
+                for output in OUTPUTS
+                for branch in output.branches
+            }
+            futures = [
+                executor.submit(copy_to_parquet, db_url, [state_select(branch, projects)], STATE_COLUMNS, path)
+                for branch in (*NODE_BRANCHES, *EDGE_BRANCHES)
+                for path in [state_parts[branch.source]]
+            ]
+            for future in futures:
+                future.result()
+            states = {source: pq.read_table(path) for source, path in state_parts.items()}
+
+            parts: dict[str, list[Path]] = {}
+            removed: dict[str, list[pa.Array]] = {}
+            futures = []
+            for output in OUTPUTS:
+                for branch in output.branches:
+                    part = parts_dir / f"{output.name}-{branch.source}.parquet"
+                    parts.setdefault(output.name, []).append(part)
+                    if prior_state is None:
+                        where = project_filter(projects)
+                        selects = [branch_select(branch.projection, branch.source, where, output.order)]
+                        keep = None
+                    else:
+                        current = states[branch.source]
+                        changed, gone = branch_delta(current, prior_branch_state(prior_state, branch.source, projects))
+                        removed.setdefault(output.kind, []).append(gone)
+                        selects, keep = changed_row_selects(branch, projects, current, changed, output.order)
+                    futures.append(executor.submit(copy_to_parquet, db_url, selects, output.columns, part, keep))
+            for future in futures:
+                future.result()
+
+        result: dict[str, Any] = {
+            "row_counts": {
+                output.name: concat_parquet(
+                    parts[output.name], out_dir / output.file, string_schema(output.columns)
+                )
+                for output in OUTPUTS
+            }
+        }
+        snapshot = [
+            table.add_column(0, "source", pa.repeat(source, table.num_rows).cast(pa.string()))
+            for source, table in states.items()
+        ]
+        if prior_state is not None and projects:
+            # Keep the watermark of every project this export did not look at.
+            outside = pc.invert(pc.is_in(prior_state.column("project_code"), value_set=pa.array(projects, pa.string())))
+            snapshot.append(prior_state.filter(outside))
+        state = pa.concat_tables([table.cast(STATE_SCHEMA) for table in snapshot])
+        pq.write_table(state, out_dir / STATE_FILE, **parquet_write_options(state.schema))
+        result["state_rows"] = state.num_rows
+        if prior_state is not None:
+            deletions = []
+            for output in OUTPUTS:
+                live = [states[branch.source].column("key").combine_chunks() for branch in output.branches]
+                keys = deletion_keys(output.kind, removed[output.kind], live)
+                deletions.append(pa.table({"kind": pa.repeat(output.kind, len(keys)).cast(pa.string()), "key": keys}))
+            deletions_table = pa.concat_tables(deletions).cast(DELETIONS_SCHEMA)
+            pq.write_table(deletions_table, out_dir / DELETIONS_FILE, **parquet_write_options(DELETIONS_SCHEMA))
+            result["deleted"] = {
+                output.kind: pc.sum(pc.equal(deletions_table.column("kind"), output.kind)).as_py() or 0
+                for output in OUTPUTS
+            }
+        return result
+    finally:
+        shutil.rmtree(parts_dir, ignore_errors=True)
 
 
 def main() -> int:
@@ -95,22 +522,50 @@ def main() -> int:
     out_dir: Path = args.out_dir
     out_dir.mkdir(parents=True, exist_ok=True)
     publication_id = args.publication_id or f"pub-{int(time.time() * 1000)}"
+    if args.jobs <= 0:
+        raise SystemExit("--jobs must be positive")
+    projects = sorted(set(args.project))
 
-    nodes = copy_to_table(args.db_url, NODE_QUERY, NODE_COLUMNS)
-    edges = copy_to_table(args.db_url, EDGE_QUERY, EDGE_COLUMNS)
-
-    pq.write_table(nodes, out_dir / "nodes.parquet")
-    pq.write_table(edges, out_dir / "edges.parquet")
+    if args.since:
+        since_dir = (args.publications_root or out_dir.resolve().parent) / args.since
+        prior_state = read_state(since_dir)
+        if prior_state is None:
+            raise SystemExit(f"--since {args.since}: no {STATE_FILE} in {since_dir} (export a full publication first)")
+        prior_manifest = json.loads((since_dir / "manifest.json").read_text())
+        prior_projects = state_projects(prior_manifest)
+        exported = export_tables(args.db_url, out_dir, args.jobs, projects, prior_state)
+        deleted = pq.read_table(out_dir / DELETIONS_FILE)
+        hashes = write_delta_hash_sidecar(
+            out_dir,
+            since_dir,
+            {
+                kind: deleted.filter(pc.equal(deleted.column("kind"), kind)).column("key").to_pylist()
+                for kind in ("node", "edge")
+            },
+        )
+        state_scope = None if prior_projects is None or not projects else sorted({*prior_projects, *projects})
+    else:
+        exported = export_tables(args.db_url, out_dir, args.jobs, projects)
+        hashes = write_hash_sidecar(out_dir)
+        state_scope = projects or None
+    row_counts = exported["row_counts"]
+    label_counts = column_counts(out_dir / "nodes.parquet", "label")
 
     manifest = {
         "publication_id": publication_id,
         "publication_kind": "memgraph_human_ist_soll_projection",
         "human_only": True,
         "llm_contract": "use_axon_mcp_not_memgraph",
-        "row_counts": {"nodes": nodes.num_rows, "edges": edges.num_rows},
+        "row_counts": row_counts,
+        "label_counts": label_counts,
+        "hashes": hashes,
+        "projects": projects or None,
+        "export_state": {"file": STATE_FILE, "rows": exported["state_rows"], "projects": state_scope},
         "generated_at_ms": int(time.time() * 1000),
         "source_commit": args.source_commit,
     }
+    if args.since:
+        manifest["delta"] = {"since": args.since, "file": DELETIONS_FILE, "deleted": exported["deleted"]}
     (out_dir / "manifest.json").write_text(json.dumps(manifest, indent=2))
 
     print(
@@ -119,8 +574,10 @@ def main() -> int:
                 "status": "ok",
                 "publication_id": publication_id,
                 "out_dir": str(out_dir),
-                "nodes": nodes.num_rows,
-                "edges": edges.num_rows,
+                "nodes": row_counts["nodes"],
+                "edges": row_counts["edges"],
+                "delta_of": args.since,
+                "deleted": exported.get("deleted"),
             },
             indent=2,
         )
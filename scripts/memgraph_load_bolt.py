@@ -0,0 +1,563 @@
+#!/usr/bin/env python3
+# Copyright (c) Didier Stadelmann. All rights reserved.
+"""Load an Axon graph-shaped Parquet publication into Memgraph over Bolt.
+
+The same statements `memgraph_build_cypherl.py` writes to
+`memgraph_import.cypherl`, sent straight to a Bolt endpoint: no intermediate
+file and no mgconsole container. Every UNWIND batch is a parameterised
+`UNWIND $rows ...` whose rows travel as PackStream values, so nothing is
+escaped into Cypher literals. Batches are cut by the builder's
+`StatementChunker` and packed in its encoder process pool.
+
+Phases keep the file's order (indexes, wipe, nodes, node deletes, edges, edge
+deletes, query pack) with a barrier between them. Inside a phase up to
+``--sessions-per-label`` batches of one label (or relation type) run at once,
+over at most ``--max-sessions`` Bolt sessions. Each statement is an
+auto-commit transaction, so a transient failure (conflicting transactions on
+shared endpoints, storage access timeout) rolled it back entirely and is
+retried with exponential backoff.
+
+Usage:
+    python3 scripts/memgraph_load_bolt.py --publication-dir DIR
+    python3 scripts/memgraph_load_bolt.py --publication-dir DIR --incremental \\
+        --prior-publication-dir PRIOR --uri bolt://127.0.0.1:7687 --sessions-per-label 4
+    python3 scripts/memgraph_load_bolt.py --publication-dir DIR --incremental --prior-publication-id PUB_ID
+"""
+
+from __future__ import annotations
+
+import argparse
+import array
+import contextlib
+import functools
+import json
+import os
+import struct
+import sys
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import wait as wait_futures
+from pathlib import Path
+from typing import Any, Callable
+
+import pyarrow as pa
+import pyarrow.compute as pc
+
+import memgraph_build_cypherl as mb
+from bolt_client import (
+    LIST_MARKERS,
+    MAP_MARKERS,
+    STRING_MARKERS,
+    BoltConnection,
+    BoltError,
+    Raw,
+    encode_run,
+    pack,
+    pack_header,
+)
+from memgraph_publication_store import thin_prior
+
+URI_ENV = "AXON_MEMGRAPH_BOLT_URI"
+DEFAULT_BATCH_SIZE = 1000
+DEFAULT_SESSIONS_PER_LABEL = 2
+DEFAULT_MAX_SESSIONS = 8
+DEFAULT_RETRIES = 5
+# Above Memgraph's --query-execution-timeout-sec=600 (docker-compose), so the
+# server reports a slow statement before the socket gives up on it.
+DEFAULT_TIMEOUT_S = 900.0
+RETRY_BACKOFF_S = 0.05
+RETRY_BACKOFF_MAX_S = 2.0
+QUERY_PACK_ID = "axon_memgraph_query_pack"
+
+
+def default_uri() -> str:
+    return os.environ.get(URI_ENV) or f"bolt://127.0.0.1:{os.environ.get('AXON_MEMGRAPH_BOLT_PORT', '7687')}"
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--publication-dir", required=True, type=Path)
+    parser.add_argument("--uri", default=default_uri(), help=f"Bolt endpoint (default: ${URI_ENV} or bolt://127.0.0.1:7687).")
+    parser.add_argument("--user", default=os.environ.get("AXON_MEMGRAPH_USER", ""))
+    parser.add_argument("--password", default=os.environ.get("AXON_MEMGRAPH_PASSWORD", ""))
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE)
+    parser.add_argument("--keep-existing", action="store_true")
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="REQ-AXO-310: load MERGE/DELETE deltas vs --prior-publication-dir instead of a full wipe+rebuild.",
+    )
+    parser.add_argument("--prior-publication-dir", type=Path, default=None)
+    parser.add_argument(
+        "--prior-publication-id",
+        default=None,
+        help="Diff against this publication from the retention store (memgraph_publication_store.py).",
+    )
+    parser.add_argument("--store-dir", type=Path, default=mb.DEFAULT_STORE_DIR, help="Publication retention store.")
+    parser.add_argument(
+        "--sessions-per-label",
+        type=int,
+        default=DEFAULT_SESSIONS_PER_LABEL,
+        help="Batches of one label / relation type in flight at once.",
+    )
+    parser.add_argument("--max-sessions", type=int, default=DEFAULT_MAX_SESSIONS, help="Bolt sessions in total.")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Processes packing batches (default: min(8, cpu count); 1 packs in-process).",
+    )
+    parser.add_argument("--retries", type=int, default=DEFAULT_RETRIES, help="Retries per statement on transient failures.")
+    parser.add_argument("--timeout", type=float, default=DEFAULT_TIMEOUT_S, help="Socket timeout per statement, seconds.")
+    parser.add_argument(
+        "--query-dir",
+        type=Path,
+        default=Path(__file__).resolve().parents[1] / "queries" / "memgraph",
+        help="Directory containing prepared .cypher queries to install in Memgraph.",
+    )
+    return parser.parse_args()
+
+
+# PackStream encoding with compute kernels, the Bolt counterpart of
+# `mb.encode_maps`: every column becomes the packed ``key + value`` bytes of
+# each row (null where the property is left out), and a row is its map header
+# followed by its columns' bytes. Only types without a kernel path are packed
+# value by value.
+STRING_HEADER_LIMIT = 0x10000
+_TINY_INT_MIN = -16
+_TINY_INT_MAX = 127
+
+
+@functools.lru_cache(maxsize=None)
+def _blob(value: bytes) -> pa.Scalar:
+    return pa.scalar(value, pa.binary())
+
+
+@functools.lru_cache(maxsize=None)
+def _size_headers(tiny: int, markers: tuple[int, int, int], count: int) -> pa.Array:
+    """PackStream size headers for 0..count-1, as a `pc.take` lookup table."""
+    headers = []
+    for size in range(count):
+        header = bytearray()
+        pack_header(header, size, tiny, markers)
+        headers.append(bytes(header))
+    return pa.array(headers, pa.binary())
+
+
+@functools.lru_cache(maxsize=None)
+def _tiny_ints() -> pa.Array:
+    return pa.array([struct.pack(">b", value) for value in range(_TINY_INT_MIN, _TINY_INT_MAX + 1)], pa.binary())
+
+
+def _big_endian(values: pa.Array, arrow_type: pa.DataType, typecode: str, marker: bytes) -> pa.Array:
+    """``marker`` + 8-byte big-endian value per row (nulls packed as zero)."""
+    values = pc.fill_null(values.cast(arrow_type), 0)
+    width = arrow_type.byte_width
+    raw = array.array(typecode)
+    raw.frombytes(values.buffers()[1].to_pybytes()[values.offset * width : (values.offset + len(values)) * width])
+    if sys.byteorder == "little":
+        raw.byteswap()
+    fixed = pa.FixedSizeBinaryArray.from_buffers(pa.binary(width), len(values), [None, pa.py_buffer(raw.tobytes())])
+    return pc.binary_join_element_wise(_blob(marker), fixed.cast(pa.binary()), _blob(b""))
+
+
+def packed_values(column: pa.Array) -> pa.Array:
+    """PackStream bytes of every value, null where `cypher_map` leaves the property out.
+
+    NaN/inf floats are nulls, as in `cypher_value`; types without a Cypher
+    literal travel as their `str` form, which is what the file path renders.
+    So do unsigned integers past int64, which Bolt cannot carry.
+    """
+    if pa.types.is_dictionary(column.type):
+        column = column.dictionary_decode()
+    kind = column.type
+    if pa.types.is_null(kind):
+        return pa.nulls(len(column), pa.binary())
+    if pa.types.is_string(kind) or pa.types.is_large_string(kind):
+        data = column.cast(pa.binary())
+        lengths = pc.binary_length(data)
+        longest = pc.max(lengths).as_py() or 0
+        if longest < STRING_HEADER_LIMIT:
+            table = _size_headers(0x80, STRING_MARKERS, 0x100 if longest < 0x100 else STRING_HEADER_LIMIT)
+            return pc.binary_join_element_wise(pc.take(table, lengths), data, _blob(b""))
+    elif pa.types.is_boolean(kind):
+        return pc.if_else(column, _blob(b"\xc3"), _blob(b"\xc2"))
+    elif pa.types.is_integer(kind) and not (pa.types.is_uint64(kind) and (pc.max(column).as_py() or 0) >= 2**63):
+        values = column.cast(pa.int64())
+        tiny = pc.and_(pc.greater_equal(values, _TINY_INT_MIN), pc.less_equal(values, _TINY_INT_MAX))
+        positions = pc.if_else(tiny, pc.subtract(values, _TINY_INT_MIN), 0)
+        return pc.if_else(tiny, pc.take(_tiny_ints(), positions), _big_endian(values, pa.int64(), "q", b"\xcb"))
+    elif pa.types.is_floating(kind):
+        values = column.cast(pa.float64())
+        finite = pc.and_kleene(pc.is_valid(values), pc.is_finite(values))
+        return pc.if_else(finite, _big_endian(values, pa.float64(), "d", b"\xc1"), pa.scalar(None, pa.binary()))
+    packed = []
+    for value in column.to_pylist():
+        if value is None:
+            packed.append(None)
+            continue
+        out = bytearray()
+        pack(str(value), out)
+        packed.append(bytes(out))
+    return pa.array(packed, pa.binary())
+
+
+def packed_rows(batch: pa.RecordBatch, keys: list[str]) -> pa.Array:
+    """One PackStream map per row of ``batch``, null properties left out."""
+    parts = []
+    present = []
+    for key, column in zip(keys, batch.columns):
+        values = packed_values(column)
+        key_bytes = bytearray()
+        pack(key, key_bytes)
+        parts.append(pc.binary_join_element_wise(_blob(bytes(key_bytes)), values, _blob(b"")).fill_null(_blob(b"")))
+        present.append(pc.cast(pc.is_valid(values), pa.int32()))
+    counts = functools.reduce(pc.add, present) if present else pa.array([0] * batch.num_rows, pa.int32())
+    headers = pc.take(_size_headers(0xA0, MAP_MARKERS, len(keys) + 1), counts)
+    return pc.binary_join_element_wise(headers, *parts, _blob(b""))
+
+
+def encode_batch_run(group: str, pieces: list[pa.RecordBatch], keys: list[str], query: str) -> tuple[str, bytes]:
+    """Pack one UNWIND batch into a ready-to-send Bolt ``RUN`` (runs in the encoder pool)."""
+    rows = pa.chunked_array([packed_rows(piece, keys) for piece in pieces], pa.binary()).combine_chunks()
+    header = bytearray()
+    pack_header(header, len(rows), 0x90, LIST_MARKERS)
+    offsets = pa.array([0, len(rows)], pa.int32())
+    body = pc.binary_join(pa.ListArray.from_arrays(offsets, rows), _blob(b""))[0].as_py()
+    return group, encode_run(query, {"rows": Raw(bytes(header) + body)})
+
+
+def unwind_query(suffix: str) -> str:
+    return f"UNWIND $rows {suffix}".rstrip(";")
+
+
+class SessionPool:
+    """Bolt sessions for one load, with at most ``sessions_per_label`` busy per group.
+
+    Each executor thread owns one connection. A transient FAILURE is retried
+    on the same session with exponential backoff; any other error aborts the
+    load at the next `submit`, `wait` or `run`. Connection errors are not
+    retried: the outcome of an auto-commit statement is unknown then.
+    """
+
+    def __init__(
+        self,
+        connect: Callable[[], BoltConnection],
+        *,
+        sessions_per_label: int = DEFAULT_SESSIONS_PER_LABEL,
+        max_sessions: int = DEFAULT_MAX_SESSIONS,
+        retries: int = DEFAULT_RETRIES,
+        backoff_s: float = RETRY_BACKOFF_S,
+    ) -> None:
+        self.connect = connect
+        self.sessions_per_label = sessions_per_label
+        self.retries = retries
+        self.backoff_s = backoff_s
+        self._executor = ThreadPoolExecutor(max_workers=max_sessions, thread_name_prefix="bolt-session")
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._connections: list[BoltConnection] = []
+        self._slots: dict[str, threading.Semaphore] = {}
+        self._inflight: list[Future] = []
+        self._error: BaseException | None = None
+        self.statements = 0
+        self.retried = 0
+
+    def __enter__(self) -> "SessionPool":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    @property
+    def sessions_opened(self) -> int:
+        return len(self._connections)
+
+    def close(self) -> None:
+        self._executor.shutdown(wait=True, cancel_futures=True)
+        for connection in self._connections:
+            connection.close()
+        self._connections.clear()
+
+    def _connection(self) -> BoltConnection:
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            connection = self._local.connection = self.connect()
+            with self._lock:
+                self._connections.append(connection)
+        return connection
+
+    def _execute(self, encoded_run: bytes) -> list[list[Any]]:
+        connection = self._connection()
+        attempt = 0
+        while True:
+            try:
+                records = connection.run_encoded(encoded_run)
+            except BoltError as exc:
+                if not exc.transient or attempt >= self.retries:
+                    raise
+                with self._lock:
+                    self.retried += 1
+                time.sleep(min(self.backoff_s * 2**attempt, RETRY_BACKOFF_MAX_S))
+                attempt += 1
+                continue
+            with self._lock:
+                self.statements += 1
+            return records
+
+    def _done(self, slot: threading.Semaphore, future: Future) -> None:
+        slot.release()
+        if not future.cancelled() and future.exception() is not None:
+            with self._lock:
+                self._error = self._error or future.exception()
+
+    def submit(self, group: str, encoded_run: bytes) -> None:
+        """Queue a statement; blocks while ``group`` already has its sessions busy."""
+        if self._error is not None:
+            raise self._error
+        slot = self._slots.get(group)
+        if slot is None:
+            slot = self._slots[group] = threading.Semaphore(self.sessions_per_label)
+        slot.acquire()
+        future = self._executor.submit(self._execute, encoded_run)
+        future.add_done_callback(functools.partial(self._done, slot))
+        self._inflight.append(future)
+        if len(self._inflight) > 1024:
+            self._inflight = [pending for pending in self._inflight if not pending.done()]
+
+    def wait(self) -> None:
+        """Barrier: every submitted statement has committed (or the load fails)."""
+        inflight, self._inflight = self._inflight, []
+        wait_futures(inflight)
+        if self._error is not None:
+            raise self._error
+
+    def run(self, query: str, parameters: dict[str, Any] | None = None, *, tolerate: bool = False) -> list[list[Any]] | None:
+        """Run one statement after a barrier and return its records.
+
+        With ``tolerate`` a non-transient failure returns None (DROP INDEX on
+        an index that does not exist yet).
+        """
+        self.wait()
+        try:
+            return self._executor.submit(self._execute, encode_run(query, parameters)).result()
+        except BoltError as exc:
+            if tolerate and not exc.transient:
+                return None
+            raise
+
+
+def load_statements(
+    sessions: SessionPool,
+    path: Path,
+    *,
+    group_column: str,
+    name_for: Callable[[Any], str],
+    suffix_for: Callable[[str], str],
+    batch_size: int,
+    publication_id: str,
+    keep: Callable[[pa.RecordBatch], pa.Array | None] | None = None,
+    pool=None,
+    depth: int = 1,
+) -> dict[str, int]:
+    """Bolt counterpart of `mb.write_statements_streaming`; same batches, same counts."""
+    chunker = mb.StatementChunker(batch_size)
+
+    def batches():
+        keys: list[str] | None = None
+        for name, pieces in mb.iter_statement_pieces(
+            chunker, path, group_column=group_column, name_for=name_for, publication_id=publication_id, keep=keep
+        ):
+            keys = keys or mb.statement_keys(pieces)
+            yield name, pieces, keys, unwind_query(suffix_for(name))
+
+    for group, encoded_run in mb.ordered_map(pool, encode_batch_run, batches(), depth):
+        sessions.submit(group, encoded_run)
+    sessions.wait()
+    return chunker.counts
+
+
+def submit_chunks(sessions: SessionPool, group: str, query: str, rows: list[Any], batch_size: int) -> None:
+    for start in range(0, len(rows), batch_size):
+        sessions.submit(group, encode_run(query, {"rows": rows[start : start + batch_size]}))
+    sessions.wait()
+
+
+def load_publication(
+    publication_dir: Path,
+    connect: Callable[[], BoltConnection],
+    batch_size: int,
+    keep_existing: bool,
+    query_dir: Path,
+    incremental: bool = False,
+    prior_publication_dir: Path | None = None,
+    *,
+    sessions_per_label: int = DEFAULT_SESSIONS_PER_LABEL,
+    max_sessions: int = DEFAULT_MAX_SESSIONS,
+    workers: int | None = None,
+    retries: int = DEFAULT_RETRIES,
+) -> dict[str, Any]:
+    manifest_path = publication_dir / "manifest.json"
+    manifest = json.loads(manifest_path.read_text())
+    publication_id = manifest["publication_id"]
+    incremental = incremental or "delta" in manifest
+    prior_dir = prior_publication_dir if incremental else None
+    query_rows = mb.prepared_query_rows(query_dir, publication_id)
+    workers = mb.default_workers() if workers is None else max(1, workers)
+    depth = workers * mb.PIPELINE_DEPTH_PER_WORKER
+    started = time.perf_counter()
+
+    with mb.encoder_pool(workers) as pool, SessionPool(
+        connect, sessions_per_label=sessions_per_label, max_sessions=max_sessions, retries=retries
+    ) as sessions:
+        for label, property_name in mb.MEMGRAPH_INDEXES:
+            sessions.run(f"DROP INDEX ON :{label}({property_name})", tolerate=True)
+        if not keep_existing and not incremental:
+            sessions.run("MATCH (n) DETACH DELETE n")
+        for label, property_name in mb.MEMGRAPH_INDEXES:
+            sessions.run(f"CREATE INDEX ON :{label}({property_name})")
+
+        node_diff = edge_diff = None
+        if incremental:
+            node_diff, edge_diff = mb.publication_diffs(publication_dir, manifest, prior_dir, pool, depth)
+
+        labels = load_statements(
+            sessions,
+            publication_dir / "nodes.parquet",
+            group_column="label",
+            name_for=mb.node_label_for,
+            suffix_for=functools.partial(mb.node_statement_suffix, incremental=incremental),
+            batch_size=batch_size,
+            publication_id=publication_id,
+            keep=mb.mask_slicer(node_diff.keep) if node_diff else None,
+            pool=pool,
+            depth=depth,
+        )
+        if node_diff:
+            submit_chunks(sessions, "node_delete", unwind_query(mb.NODE_DELETE_SUFFIX), node_diff.deleted, batch_size)
+
+        relations = load_statements(
+            sessions,
+            publication_dir / "edges.parquet",
+            group_column="relation_type",
+            name_for=mb.edge_relation_for,
+            suffix_for=functools.partial(mb.edge_statement_suffix, incremental=incremental),
+            batch_size=batch_size,
+            publication_id=publication_id,
+            keep=mb.mask_slicer(edge_diff.keep) if edge_diff else None,
+            pool=pool,
+            depth=depth,
+        )
+        deleted_edges = mb.deleted_edge_rows(edge_diff.deleted) if edge_diff else []
+        submit_chunks(sessions, "edge_delete", unwind_query(mb.EDGE_DELETE_SUFFIX), deleted_edges, batch_size)
+
+        sessions.run("MATCH (q:PreparedQuery) DETACH DELETE q")
+        sessions.run("MATCH (p:PreparedQueryPack) DETACH DELETE p")
+        sessions.run(
+            f"CREATE (:PreparedQueryPack {{id: '{QUERY_PACK_ID}', name: 'Axon Memgraph Query Pack', "
+            "publication_id: $publication_id, human_only: true, llm_contract: 'use_axon_mcp_not_memgraph'})",
+            {"publication_id": publication_id},
+        )
+        if query_rows:
+            sessions.run("UNWIND $rows AS row CREATE (q:PreparedQuery) SET q += row", {"rows": query_rows})
+            sessions.run(
+                f"MATCH (p:PreparedQueryPack {{id: '{QUERY_PACK_ID}'}}), (q:PreparedQuery) "
+                "CREATE (p)-[:HAS_PREPARED_QUERY]->(q)"
+            )
+
+        imported = {}
+        for name, query in (
+            ("imported_nodes", "MATCH (n:AxonNode) RETURN count(n)"),
+            ("imported_edges", "MATCH (:AxonNode)-[r]->(:AxonNode) RETURN count(r)"),
+            ("installed_prepared_queries", "MATCH (q:PreparedQuery) RETURN count(q)"),
+        ):
+            records = sessions.run(query) or []
+            imported[name] = records[0][0] if records and records[0] else None
+        statements, retried, sessions_opened = sessions.statements, sessions.retried, sessions.sessions_opened
+
+    total_nodes = sum(labels.values())
+    total_edges = sum(relations.values())
+    return {
+        "publication_id": publication_id,
+        "input_manifest": str(manifest_path),
+        "loader": "bolt",
+        "incremental": incremental,
+        "delta_of": manifest.get("delta", {}).get("since"),
+        "workers": workers,
+        "sessions_per_label": sessions_per_label,
+        "max_sessions": max_sessions,
+        "sessions_opened": sessions_opened,
+        "statements": statements,
+        "retried": retried,
+        "elapsed_s": round(time.perf_counter() - started, 2),
+        "nodes": total_nodes,
+        "edges": total_edges,
+        "nodes_emitted": total_nodes,
+        "nodes_skipped": node_diff.skipped if node_diff else 0,
+        "nodes_deleted": len(node_diff.deleted) if node_diff else 0,
+        "edges_emitted": total_edges,
+        "edges_skipped": edge_diff.skipped if edge_diff else 0,
+        "edges_deleted": len(deleted_edges),
+        "prepared_queries": len(query_rows),
+        "query_dir": str(query_dir),
+        "labels": labels,
+        "relations": relations,
+        **imported,
+    }
+
+
+def main() -> int:
+    args = parse_args()
+    publication_dir = args.publication_dir.resolve()
+    for name, value in (
+        ("--batch-size", args.batch_size),
+        ("--sessions-per-label", args.sessions_per_label),
+        ("--max-sessions", args.max_sessions),
+    ):
+        if value <= 0:
+            raise SystemExit(f"{name} must be positive")
+    if args.workers is not None and args.workers <= 0:
+        raise SystemExit("--workers must be positive")
+    if args.retries < 0:
+        raise SystemExit("--retries must not be negative")
+    for name in ["manifest.json", "nodes.parquet", "edges.parquet"]:
+        path = publication_dir / name
+        if not path.exists():
+            raise SystemExit(f"missing publication artifact: {path}")
+    if args.prior_publication_dir is not None and args.prior_publication_id is not None:
+        raise SystemExit("--prior-publication-dir and --prior-publication-id are exclusive")
+    prior_dir = (
+        args.prior_publication_dir.resolve()
+        if args.incremental and args.prior_publication_dir is not None
+        else None
+    )
+    connect = functools.partial(
+        BoltConnection, args.uri, user=args.user, password=args.password, timeout_s=args.timeout
+    )
+    with contextlib.ExitStack() as stack:
+        if args.incremental and args.prior_publication_id is not None:
+            try:
+                prior_dir = stack.enter_context(thin_prior(args.store_dir.resolve(), args.prior_publication_id))
+            except KeyError as exc:
+                raise SystemExit(exc.args[0]) from exc
+        summary = load_publication(
+            publication_dir,
+            connect,
+            args.batch_size,
+            args.keep_existing,
+            args.query_dir.resolve(),
+            incremental=args.incremental,
+            prior_publication_dir=prior_dir,
+            sessions_per_label=args.sessions_per_label,
+            max_sessions=args.max_sessions,
+            workers=args.workers,
+            retries=args.retries,
+        )
+    summary["uri"] = args.uri
+    print(json.dumps(summary, indent=2, sort_keys=True))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
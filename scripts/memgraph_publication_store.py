@@ -0,0 +1,315 @@
+#!/usr/bin/env python3
+# Copyright (c) Didier Stadelmann. All rights reserved.
+"""Retention store for Memgraph publications, deduplicated by content.
+
+Every publication directory is a full copy of the projection, while an
+incremental publish only needs the previous one. The store keeps history at
+the cost of its churn: each Parquet file of a publication is cut into chunks
+of rows, every chunk is written once under ``objects/<hh>/<hash>.parquet``
+(``hash`` = blake2b of the chunk's Arrow IPC bytes), and
+``index/<publication_id>.json`` records the manifest plus, per file, its
+schema and ordered chunk list.
+
+Chunk boundaries are content-defined: a chunk ends after a row whose CRC32
+is 0 modulo AVG_CHUNK_ROWS (within MIN_CHUNK_ROWS..MAX_CHUNK_ROWS rows), so an
+inserted or deleted row only changes the chunks around it and the following
+boundaries resynchronise. The exporter's sorted output keeps unchanged rows
+adjacent from one publication to the next. `hashes.parquet` dedupes less well:
+its ``row`` column shifts with every insert ahead of it.
+
+`materialize` writes a publication back out (same rows, same schemas);
+`thin_prior` materializes only what an incremental diff reads (the manifest,
+the hash sidecar and the export state), which is what
+``--prior-publication-id`` on `memgraph_build_cypherl.py` and
+`memgraph_load_bolt.py` uses.
+
+Usage:
+    python3 scripts/memgraph_publication_store.py put --publication-dir DIR
+    python3 scripts/memgraph_publication_store.py materialize --publication-id ID --out-dir DIR
+    python3 scripts/memgraph_publication_store.py list
+    python3 scripts/memgraph_publication_store.py prune --keep 20
+"""
+
+from __future__ import annotations
+
+import argparse
+import base64
+import contextlib
+import hashlib
+import json
+import os
+import tempfile
+import time
+import zlib
+from pathlib import Path
+from typing import Iterator, Sequence
+
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
+
+from memgraph_build_cypherl import DEFAULT_STORE_DIR, HASHES_FILE, READ_BATCH_ROWS, parquet_write_options
+from memgraph_export_publication import STATE_FILE, RowGroupWriter
+
+AVG_CHUNK_ROWS = 16_384
+MIN_CHUNK_ROWS = AVG_CHUNK_ROWS // 4
+MAX_CHUNK_ROWS = AVG_CHUNK_ROWS * 4
+OBJECT_DIGEST_BYTES = 16
+ROW_SEPARATOR = "\x1f"
+INDEX_VERSION = 1
+# What an incremental diff reads from its prior, besides manifest.json.
+THIN_FILES = (HASHES_FILE, STATE_FILE)
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--store-dir", type=Path, default=DEFAULT_STORE_DIR)
+    commands = parser.add_subparsers(dest="command", required=True)
+    put = commands.add_parser("put", help="Store a publication directory.")
+    put.add_argument("--publication-dir", required=True, type=Path)
+    materialize = commands.add_parser("materialize", help="Write a stored publication back out.")
+    materialize.add_argument("--publication-id", required=True)
+    materialize.add_argument("--out-dir", required=True, type=Path)
+    materialize.add_argument(
+        "--thin",
+        action="store_true",
+        help="Only the manifest and what an incremental diff reads (hash sidecar, export state).",
+    )
+    commands.add_parser("list", help="List stored publications and the store's size.")
+    prune = commands.add_parser("prune", help="Drop all but the newest publications and their unshared chunks.")
+    prune.add_argument("--keep", required=True, type=int)
+    return parser.parse_args()
+
+
+def chunk_ends(batch: pa.RecordBatch, carried: int) -> list[int]:
+    """Offsets in ``batch`` after which a chunk ends; ``carried`` rows are already pending."""
+    text = pc.binary_join_element_wise(
+        *[pc.fill_null(pc.cast(column, pa.string()), "") for column in batch.columns], ROW_SEPARATOR
+    )
+    ends = []
+    count = carried
+    for index, row in enumerate(text.cast(pa.binary()).to_pylist()):
+        count += 1
+        if count >= MAX_CHUNK_ROWS or (count >= MIN_CHUNK_ROWS and zlib.crc32(row) % AVG_CHUNK_ROWS == 0):
+            ends.append(index + 1)
+            count = 0
+    return ends
+
+
+def iter_chunks(path: Path) -> Iterator[pa.Table]:
+    """The rows of a Parquet file in content-defined chunks, without schema metadata."""
+    parquet = pq.ParquetFile(path)
+    schema = parquet.schema_arrow.remove_metadata()
+    pending: list[pa.RecordBatch] = []
+    pending_rows = 0
+    for batch in parquet.iter_batches(batch_size=READ_BATCH_ROWS):
+        batch = batch.replace_schema_metadata(None)
+        start = 0
+        for end in chunk_ends(batch, pending_rows):
+            pending.append(batch.slice(start, end - start))
+            yield pa.Table.from_batches(pending, schema).combine_chunks()
+            pending, pending_rows, start = [], 0, end
+        if start < batch.num_rows:
+            pending.append(batch.slice(start))
+            pending_rows += batch.num_rows - start
+    if pending_rows:
+        yield pa.Table.from_batches(pending, schema).combine_chunks()
+
+
+def chunk_hash(table: pa.Table) -> str:
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    return hashlib.blake2b(sink.getvalue(), digest_size=OBJECT_DIGEST_BYTES).hexdigest()
+
+
+def encode_schema(schema: pa.Schema) -> str:
+    return base64.b64encode(schema.serialize().to_pybytes()).decode("ascii")
+
+
+def decode_schema(text: str) -> pa.Schema:
+    return pa.ipc.read_schema(pa.py_buffer(base64.b64decode(text)))
+
+
+def write_atomic(path: Path, data: bytes) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f".{path.name}.tmp")
+    tmp.write_bytes(data)
+    os.replace(tmp, path)
+
+
+class PublicationStore:
+    """Content-addressed chunks plus one index file per publication."""
+
+    def __init__(self, root: Path) -> None:
+        self.root = root
+        self.objects = root / "objects"
+        self.index = root / "index"
+
+    def object_path(self, digest: str) -> Path:
+        return self.objects / digest[:2] / f"{digest}.parquet"
+
+    def index_path(self, publication_id: str) -> Path:
+        return self.index / f"{publication_id}.json"
+
+    def put_chunk(self, table: pa.Table) -> tuple[str, int]:
+        """Store a chunk unless already present; (digest, bytes written)."""
+        digest = chunk_hash(table)
+        path = self.object_path(digest)
+        if path.exists():
+            return digest, 0
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(f".{path.name}.tmp")
+        pq.write_table(table, tmp, row_group_size=max(table.num_rows, 1), **parquet_write_options(table.schema))
+        os.replace(tmp, path)
+        return digest, path.stat().st_size
+
+    def put(self, publication_dir: Path) -> dict:
+        """Store every Parquet file of a publication and index it under its publication_id."""
+        manifest = json.loads((publication_dir / "manifest.json").read_text())
+        publication_id = manifest["publication_id"]
+        files: dict[str, dict] = {}
+        summary = {"publication_id": publication_id, "chunks": 0, "new_chunks": 0, "new_bytes": 0, "publication_bytes": 0}
+        for path in sorted(publication_dir.glob("*.parquet")):
+            chunks = []
+            new_chunks = 0
+            for table in iter_chunks(path):
+                digest, written = self.put_chunk(table)
+                chunks.append([digest, table.num_rows])
+                new_chunks += written > 0
+                summary["new_bytes"] += written
+            files[path.name] = {
+                "schema": encode_schema(pq.ParquetFile(path).schema_arrow),
+                "rows": sum(rows for _, rows in chunks),
+                "bytes": path.stat().st_size,
+                "chunks": chunks,
+            }
+            summary["chunks"] += len(chunks)
+            summary["new_chunks"] += new_chunks
+            summary["publication_bytes"] += path.stat().st_size
+        entry = {
+            "index_version": INDEX_VERSION,
+            "publication_id": publication_id,
+            "stored_at_ms": int(time.time() * 1000),
+            "manifest": manifest,
+            "files": files,
+        }
+        write_atomic(self.index_path(publication_id), json.dumps(entry, indent=2, sort_keys=True).encode())
+        return summary
+
+    def entry(self, publication_id: str) -> dict:
+        path = self.index_path(publication_id)
+        if not path.exists():
+            raise KeyError(f"publication {publication_id!r} is not in the store {self.root}")
+        return json.loads(path.read_text())
+
+    def entries(self) -> list[dict]:
+        """Every index entry, oldest first."""
+        entries = [json.loads(path.read_text()) for path in self.index.glob("*.json")] if self.index.exists() else []
+        return sorted(entries, key=lambda entry: (entry["stored_at_ms"], entry["publication_id"]))
+
+    def materialize(self, publication_id: str, out_dir: Path, files: Sequence[str] | None = None) -> Path:
+        """Write a stored publication (or only ``files`` of it) plus its manifest to ``out_dir``."""
+        entry = self.entry(publication_id)
+        out_dir.mkdir(parents=True, exist_ok=True)
+        for name, stored in entry["files"].items():
+            if files is not None and name not in files:
+                continue
+            writer = RowGroupWriter(out_dir / name, decode_schema(stored["schema"]))
+            try:
+                for digest, _ in stored["chunks"]:
+                    for batch in pq.read_table(self.object_path(digest)).to_batches():
+                        writer.write(batch)
+            finally:
+                writer.close()
+        (out_dir / "manifest.json").write_text(json.dumps(entry["manifest"], indent=2, sort_keys=True))
+        return out_dir
+
+    def prune(self, keep: int) -> dict:
+        """Drop all but the ``keep`` newest publications, then every chunk no publication references."""
+        entries = self.entries()
+        dropped = entries[: max(len(entries) - keep, 0)]
+        for entry in dropped:
+            self.index_path(entry["publication_id"]).unlink()
+        referenced = {
+            digest
+            for entry in entries[len(dropped) :]
+            for stored in entry["files"].values()
+            for digest, _ in stored["chunks"]
+        }
+        removed = removed_bytes = 0
+        for path in self.objects.glob("*/*.parquet") if self.objects.exists() else []:
+            if path.stem not in referenced:
+                removed_bytes += path.stat().st_size
+                path.unlink()
+                removed += 1
+        return {
+            "dropped": [entry["publication_id"] for entry in dropped],
+            "removed_chunks": removed,
+            "removed_bytes": removed_bytes,
+        }
+
+    def usage(self) -> dict:
+        paths = list(self.objects.glob("*/*.parquet")) if self.objects.exists() else []
+        entries = self.entries()
+        return {
+            "store_dir": str(self.root),
+            "objects": len(paths),
+            "store_bytes": sum(path.stat().st_size for path in paths),
+            "retained_publication_bytes": sum(
+                stored["bytes"] for entry in entries for stored in entry["files"].values()
+            ),
+            "publications": [
+                {
+                    "publication_id": entry["publication_id"],
+                    "stored_at_ms": entry["stored_at_ms"],
+                    "delta_of": entry["manifest"].get("delta", {}).get("since"),
+                    "rows": {name: stored["rows"] for name, stored in entry["files"].items()},
+                    "chunks": sum(len(stored["chunks"]) for stored in entry["files"].values()),
+                }
+                for entry in entries
+            ],
+        }
+
+
+@contextlib.contextmanager
+def thin_prior(store_dir: Path, publication_id: str) -> Iterator[Path]:
+    """A temporary prior publication dir holding what an incremental diff reads.
+
+    A publication stored without a hash sidecar is materialized in full, since
+    the diff then re-hashes its Parquet files.
+    """
+    store = PublicationStore(store_dir)
+    stored = store.entry(publication_id)["files"]
+    store.root.mkdir(parents=True, exist_ok=True)
+    with tempfile.TemporaryDirectory(prefix=f".prior-{publication_id}-", dir=store.root) as tmp:
+        yield store.materialize(publication_id, Path(tmp), THIN_FILES if HASHES_FILE in stored else None)
+
+
+def main() -> int:
+    args = parse_args()
+    store = PublicationStore(args.store_dir.resolve())
+    if args.command == "put":
+        publication_dir = args.publication_dir.resolve()
+        if not (publication_dir / "manifest.json").exists():
+            raise SystemExit(f"missing publication artifact: {publication_dir / 'manifest.json'}")
+        summary = store.put(publication_dir)
+    elif args.command == "materialize":
+        files = THIN_FILES if args.thin else None
+        try:
+            out_dir = store.materialize(args.publication_id, args.out_dir.resolve(), files)
+        except KeyError as exc:
+            raise SystemExit(exc.args[0]) from exc
+        summary = {"publication_id": args.publication_id, "out_dir": str(out_dir), "thin": args.thin}
+    elif args.command == "list":
+        summary = store.usage()
+    else:
+        if args.keep < 0:
+            raise SystemExit("--keep must not be negative")
+        summary = store.prune(args.keep)
+    print(json.dumps(summary, indent=2, sort_keys=True))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -5,15 +5,36 @@ from __future__ import annotations
 
 import argparse
 import json
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+import pyarrow as pa
+import pyarrow.compute as pc
 import pyarrow.parquet as pq
 
+from memgraph_build_cypherl import READ_BATCH_ROWS, column_counts, diff_keys, sidecar_hashes
+
+# Offending keys listed per deep check.
+SAMPLE_SIZE = 5
+EDGE_KEY_SCHEMA = pa.schema([("key", pa.string()), ("project_code", pa.string())])
+
 
 def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(description="Validate an Axon Memgraph Parquet publication.")
     parser.add_argument("--publication-dir", required=True, type=Path)
     parser.add_argument("--require-import-file", action="store_true")
+    parser.add_argument(
+        "--deep",
+        action="store_true",
+        help="Also check referential integrity: dangling edge endpoints, duplicate node ids and "
+        "edge keys within a project, per-label counts against the manifest.",
+    )
+    parser.add_argument(
+        "--allow-dangling-edges",
+        action="store_true",
+        help="--deep: report dangling edge endpoints without failing (Memgraph's MATCH skips those edges).",
+    )
     return parser.parse_args()
 
 
@@ -21,6 +42,157 @@ def count_rows(path: Path) -> int:
     return pq.ParquetFile(path).metadata.num_rows
 
 
+def file_keys(path: Path, kind: str) -> pa.Array:
+    """Node ids, or `edge_diff_key` values, of every row of a publication file."""
+    chunks = [diff_keys(batch, kind) for batch in pq.ParquetFile(path).iter_batches(batch_size=READ_BATCH_ROWS)]
+    return pa.chunked_array(chunks, pa.string()).combine_chunks()
+
+
+def duplicate_keys(keys: pa.Array) -> dict[str, object]:
+    """Keys occurring more than once: how many, the surplus rows, a sample."""
+    counts = pa.table({"key": keys}).group_by("key").aggregate([("key", "count")])
+    duplicated = counts.filter(pc.greater(counts.column("key_count"), 1))
+    surplus = pc.sum(duplicated.column("key_count")).as_py() or 0
+    return {
+        "keys": duplicated.num_rows,
+        "extra_rows": surplus - duplicated.num_rows,
+        "sample": sorted(duplicated.column("key").to_pylist())[:SAMPLE_SIZE],
+    }
+
+
+def edge_project_keys(path: Path) -> pa.Table:
+    """`edge_diff_key` and project_code (null read as "") of every edge."""
+    parts = []
+    for batch in pq.ParquetFile(path).iter_batches(batch_size=READ_BATCH_ROWS):
+        index = batch.schema.get_field_index("project_code")
+        projects = (
+            pa.repeat(pa.scalar("", pa.string()), batch.num_rows)
+            if index == -1
+            else batch.column(index).cast(pa.string()).fill_null("")
+        )
+        parts.append(pa.table({"key": diff_keys(batch, "edge"), "project_code": projects}))
+    return pa.concat_tables(parts) if parts else EDGE_KEY_SCHEMA.empty_table()
+
+
+def duplicate_edge_keys(path: Path) -> tuple[dict[str, object], dict[str, object]]:
+    """Edge keys repeated within one project, and keys shared across projects.
+
+    ist.Edge is keyed on (from, to, relation, project_code), so the same edge
+    key under several projects is valid; only the first dict is an error.
+    """
+    edges = edge_project_keys(path)
+    counts = edges.group_by(["key", "project_code"]).aggregate([("key", "count")])
+    duplicated = counts.filter(pc.greater(counts.column("key_count"), 1))
+    surplus = pc.sum(duplicated.column("key_count")).as_py() or 0
+    projects = counts.group_by("key").aggregate([("project_code", "count")])
+    shared = projects.filter(pc.greater(projects.column("project_code_count"), 1))
+    return (
+        {
+            "keys": duplicated.num_rows,
+            "extra_rows": surplus - duplicated.num_rows,
+            "sample": sorted(set(duplicated.column("key").to_pylist()))[:SAMPLE_SIZE],
+        },
+        {"keys": shared.num_rows, "sample": sorted(shared.column("key").to_pylist())[:SAMPLE_SIZE]},
+    )
+
+
+def endpoint_ids(batch: pa.RecordBatch, column: str) -> pa.Array:
+    """Endpoint ids of an edge batch; a null endpoint reads as "" (never a node)."""
+    return batch.column(column).cast(pa.string()).fill_null("")
+
+
+def dangling_endpoints(edges_path: Path, node_ids: pa.Array) -> dict[str, object]:
+    """Edges whose from_id or to_id matches no node.
+
+    Endpoints are deduplicated per batch and anti-joined against the node
+    ids once; only the (usually empty) missing set is then probed per edge.
+    """
+    parquet = pq.ParquetFile(edges_path)
+    columns = ["from_id", "to_id"]
+    endpoints = [
+        pc.unique(pa.chunked_array([endpoint_ids(batch, name) for name in ("from_id", "to_id")]))
+        for batch in parquet.iter_batches(batch_size=READ_BATCH_ROWS, columns=columns)
+    ]
+    unique_endpoints = pc.unique(pa.chunked_array(endpoints, pa.string())) if endpoints else pa.array([], pa.string())
+    missing = (
+        pa.table({"id": unique_endpoints})
+        .join(pa.table({"id": node_ids}), keys="id", join_type="left anti")
+        .column("id")
+        .combine_chunks()
+    )
+    edges = from_missing = to_missing = 0
+    if len(missing):
+        for batch in parquet.iter_batches(batch_size=READ_BATCH_ROWS, columns=columns):
+            from_bad = pc.is_in(endpoint_ids(batch, "from_id"), value_set=missing)
+            to_bad = pc.is_in(endpoint_ids(batch, "to_id"), value_set=missing)
+            edges += pc.sum(pc.or_(from_bad, to_bad).cast(pa.int64())).as_py() or 0
+            from_missing += pc.sum(from_bad.cast(pa.int64())).as_py() or 0
+            to_missing += pc.sum(to_bad.cast(pa.int64())).as_py() or 0
+    return {
+        "edges": edges,
+        "from_id": from_missing,
+        "to_id": to_missing,
+        "missing_ids": len(missing),
+        "sample": sorted(missing.to_pylist())[:SAMPLE_SIZE],
+    }
+
+
+def deep_checks(
+    publication_dir: Path, manifest: dict, allow_dangling_edges: bool = False
+) -> tuple[dict[str, object], list[str]]:
+    """Columnar referential checks of a publication; returns (report, errors).
+
+    A delta publication only holds changed rows, so its edges are resolved
+    against the projected state (its cumulative hash sidecar) as well.
+    """
+    started = time.perf_counter()
+    errors: list[str] = []
+    nodes_path = publication_dir / "nodes.parquet"
+    edges_path = publication_dir / "edges.parquet"
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        # Arrow kernels release the GIL: the edge-key pass overlaps the node checks.
+        edge_duplicates = executor.submit(duplicate_edge_keys, edges_path)
+        node_ids = file_keys(nodes_path, "node")
+        report: dict[str, object] = {"duplicate_node_ids": duplicate_keys(node_ids)}
+        known_ids: pa.Array | None = node_ids
+        if manifest.get("delta"):
+            state = sidecar_hashes(publication_dir, "node")
+            known_ids = (
+                None
+                if state is None
+                else pa.chunked_array([node_ids, *(table.column("key").combine_chunks() for table in state)])
+                .combine_chunks()
+            )
+        dangling = None if known_ids is None else dangling_endpoints(edges_path, known_ids)
+        report["duplicate_edge_keys"], report["cross_project_edge_keys"] = edge_duplicates.result()
+    if report["duplicate_node_ids"]["keys"]:
+        errors.append(f"duplicate node ids: {report['duplicate_node_ids']['keys']}")
+    if report["duplicate_edge_keys"]["keys"]:
+        errors.append(f"duplicate edge keys within a project: {report['duplicate_edge_keys']['keys']}")
+
+    if dangling is None:
+        report["dangling_endpoints"] = "skipped: delta publication without a cumulative hash sidecar"
+    else:
+        report["dangling_endpoints"] = dangling
+        if dangling["edges"] and not allow_dangling_edges:
+            errors.append(f"dangling edges: {dangling['edges']} (missing node ids: {dangling['missing_ids']})")
+
+    expected_labels = manifest.get("label_counts")
+    labels = column_counts(nodes_path, "label")
+    report["label_counts"] = labels
+    if expected_labels is None:
+        report["label_counts_check"] = "skipped: manifest has no label_counts"
+    else:
+        for label in sorted({*labels, *expected_labels}):
+            if labels.get(label, 0) != expected_labels.get(label, 0):
+                errors.append(
+                    f"label count mismatch for {label!r}: "
+                    f"manifest={expected_labels.get(label, 0)} parquet={labels.get(label, 0)}"
+                )
+    report["elapsed_s"] = round(time.perf_counter() - started, 3)
+    return report, errors
+
+
 def main() -> int:
     args = parse_args()
     publication_dir = args.publication_dir.resolve()
@@ -54,6 +226,21 @@ def main() -> int:
         errors.append("human_only must be true")
     if manifest.get("publication_kind") != "memgraph_human_ist_soll_projection":
         errors.append("publication_kind mismatch")
+    delta = manifest.get("delta")
+    if delta:
+        deletions_path = publication_dir / delta.get("file", "deletions.parquet")
+        expected_deleted = sum(int(count) for count in delta.get("deleted", {}).values())
+        if not deletions_path.exists():
+            errors.append(f"missing artifact: {deletions_path}")
+        elif count_rows(deletions_path) != expected_deleted:
+            errors.append(
+                f"deletion count mismatch: manifest={expected_deleted} parquet={count_rows(deletions_path)}"
+            )
+
+    deep = None
+    if args.deep and not errors:
+        deep, deep_errors = deep_checks(publication_dir, manifest, args.allow_dangling_edges)
+        errors.extend(deep_errors)
 
     summary = {
         "status": "failed" if errors else "ok",
@@ -61,10 +248,13 @@ def main() -> int:
         "publication_dir": str(publication_dir),
         "nodes": node_count,
         "edges": edge_count,
+        "delta_of": delta.get("since") if delta else None,
         "has_import_file": import_path.exists(),
         "import_file_size_bytes": import_path.stat().st_size if import_path.exists() else 0,
         "errors": errors,
     }
+    if deep is not None:
+        summary["deep"] = deep
     print(json.dumps(summary, indent=2, sort_keys=True))
     return 1 if errors else 0
 
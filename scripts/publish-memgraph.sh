@@ -2,15 +2,19 @@
 # REQ-AXO-902052 #6-B — end-to-end Memgraph publication refresh.
 #
 # Rebuilds the missing orchestrator: export live PG → publication-dir
-# (memgraph_export_publication.py) → build import cypherl (memgraph_build_cypherl.py)
-# → validate (memgraph_validate_publication.py) → load into Memgraph
-# (memgraph-projection.sh load, the ONLY Docker-dependent step).
+# (memgraph_export_publication.py) → validate (memgraph_validate_publication.py)
+# → load into Memgraph over Bolt (memgraph_load_bolt.py, straight from the
+# Parquet files). AXON_MEMGRAPH_LOADER=mgconsole keeps the historical path:
+# build import cypherl (memgraph_build_cypherl.py) → memgraph-projection.sh load.
+# Docker is only needed to run the Memgraph container itself.
 #
 # GRACEFUL by contract (PIL-AXO-009 + DEC-901640 trigger #3): any missing tool
 # or a down Docker daemon => clean skip + a `last_publish.json` marker, exit 0.
 # NEVER fails its caller — safe to fire-and-forget from promote_live_safe.sh.
 # Single-flight (flock) + min-interval throttle so two close promotes don't run
-# two 200 MB exports concurrently. Publications live in a dedicated reaped dir.
+# two 200 MB exports concurrently. Publications live in a dedicated reaped dir;
+# older ones are kept in the deduplicating retention store
+# (memgraph_publication_store.py), where history costs only its churn.
 set -uo pipefail
 
 SCRIPT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
@@ -20,8 +24,11 @@ DB_URL="${AXON_LIVE_DATABASE_URL:-postgres://axon@127.0.0.1:44144/axon_live}"
 PUB_ROOT="${AXON_MEMGRAPH_PUB_DIR:-$ROOT_DIR/.axon/memgraph/publications}"
 MARKER="$ROOT_DIR/.axon/memgraph/last_publish.json"
 LOCKFILE="$ROOT_DIR/.axon/memgraph/.publish.lock"
-KEEP=3                              # publications to retain
+KEEP="${AXON_MEMGRAPH_KEEP_DIRS:-1}"          # publication dirs to retain
+STORE_DIR="${AXON_MEMGRAPH_STORE_DIR:-$ROOT_DIR/.axon/memgraph/store}"
+STORE_KEEP="${AXON_MEMGRAPH_STORE_KEEP:-20}"  # publications kept in the store
 MIN_INTERVAL_SECONDS="${AXON_MEMGRAPH_MIN_INTERVAL_SECONDS:-600}"
+LOADER="${AXON_MEMGRAPH_LOADER:-bolt}"   # bolt | mgconsole
 SOURCE_COMMIT="$(git -C "$ROOT_DIR" rev-parse --short HEAD 2>/dev/null || echo unknown)"
 
 mkdir -p "$PUB_ROOT" "$(dirname "$MARKER")"
@@ -81,40 +88,82 @@ PUB_DIR="$PUB_ROOT/$PUB_ID"
 # The prior dir is captured BEFORE the new one is created; with no prior the
 # builder degrades to a full idempotent MERGE. Set AXON_MEMGRAPH_FULL_REBUILD=1
 # to force a clean wipe+rebuild (e.g. after a projection schema change).
+#
+# When the prior carries an export_state.parquet snapshot the export itself is a
+# delta (`--since`): only rows changed since the prior are COPYed, and the
+# builder/loader apply them directly. AXON_MEMGRAPH_DELTA=0 forces a full
+# export diffed client-side. AXON_MEMGRAPH_PROJECTS="AXO BKS" scopes the export.
 BUILD_INCREMENTAL=()
+EXPORT_ARGS=()
+for project in ${AXON_MEMGRAPH_PROJECTS:-}; do
+  EXPORT_ARGS+=(--project "$project")
+done
 if [ -z "${AXON_MEMGRAPH_FULL_REBUILD:-}" ]; then
   PRIOR_DIR="$(ls -1dt "$PUB_ROOT"/pub-* 2>/dev/null | head -1 || true)"
   if [ -n "${PRIOR_DIR:-}" ] && [ -f "$PRIOR_DIR/nodes.parquet" ] && [ "$PRIOR_DIR" != "$PUB_DIR" ]; then
     BUILD_INCREMENTAL=(--incremental --prior-publication-dir "$PRIOR_DIR")
+    if [ "${AXON_MEMGRAPH_DELTA:-1}" != "0" ] && [ -f "$PRIOR_DIR/export_state.parquet" ]; then
+      EXPORT_ARGS+=(--since "$(basename "$PRIOR_DIR")" --publications-root "$PUB_ROOT")
+    fi
   fi
 fi
 
+# AXON_MEMGRAPH_DEEP_VALIDATE=1 adds the referential checks (dangling edges,
+# duplicate ids/edge keys, per-label counts) before anything reaches Memgraph.
+VALIDATE_ARGS=()
+if [ "${AXON_MEMGRAPH_DEEP_VALIDATE:-0}" = "1" ]; then
+  VALIDATE_ARGS=(--deep)
+fi
+
 mkdir -p "$PUB_DIR"
 
 if ! python3 "$SCRIPT_DIR/memgraph_export_publication.py" \
       --db-url "$DB_URL" --out-dir "$PUB_DIR" \
-      --publication-id "$PUB_ID" --source-commit "$SOURCE_COMMIT"; then
+      --publication-id "$PUB_ID" --source-commit "$SOURCE_COMMIT" "${EXPORT_ARGS[@]}"; then
   write_marker "failed" "export step failed"
   exit 0
 fi
-if ! python3 "$SCRIPT_DIR/memgraph_build_cypherl.py" \
-      --publication-dir "$PUB_DIR" --out "$PUB_DIR/memgraph_import.cypherl" \
-      "${BUILD_INCREMENTAL[@]}" >/dev/null; then
-  write_marker "failed" "build_cypherl step failed"
-  exit 0
-fi
-if ! python3 "$SCRIPT_DIR/memgraph_validate_publication.py" \
-      --publication-dir "$PUB_DIR" --require-import-file >/dev/null; then
-  write_marker "failed" "validation step failed"
-  exit 0
-fi
-if ! bash "$SCRIPT_DIR/memgraph-projection.sh" load --publication-dir "$PUB_DIR" >/dev/null 2>&1; then
-  write_marker "failed" "memgraph load step failed"
-  exit 0
+if [ "$LOADER" = "mgconsole" ]; then
+  if ! python3 "$SCRIPT_DIR/memgraph_build_cypherl.py" \
+        --publication-dir "$PUB_DIR" --out "$PUB_DIR/memgraph_import.cypherl" \
+        "${BUILD_INCREMENTAL[@]}" >/dev/null; then
+    write_marker "failed" "build_cypherl step failed"
+    exit 0
+  fi
+  if ! python3 "$SCRIPT_DIR/memgraph_validate_publication.py" \
+        --publication-dir "$PUB_DIR" --require-import-file "${VALIDATE_ARGS[@]}" >/dev/null; then
+    write_marker "failed" "validation step failed"
+    exit 0
+  fi
+  if ! bash "$SCRIPT_DIR/memgraph-projection.sh" load --publication-dir "$PUB_DIR" >/dev/null 2>&1; then
+    write_marker "failed" "memgraph load step failed"
+    exit 0
+  fi
+else
+  if ! python3 "$SCRIPT_DIR/memgraph_validate_publication.py" \
+        --publication-dir "$PUB_DIR" "${VALIDATE_ARGS[@]}" >/dev/null; then
+    write_marker "failed" "validation step failed"
+    exit 0
+  fi
+  if ! python3 "$SCRIPT_DIR/memgraph_load_bolt.py" \
+        --publication-dir "$PUB_DIR" "${BUILD_INCREMENTAL[@]}" >/dev/null 2>&1; then
+    write_marker "failed" "memgraph bolt load step failed"
+    exit 0
+  fi
 fi
 
-# Reap old publications (keep the most recent $KEEP).
-ls -1dt "$PUB_ROOT"/pub-* 2>/dev/null | tail -n +$((KEEP + 1)) | xargs -r rm -rf
+# Retain the publication in the store, then reap old publication dirs (keep the
+# most recent $KEEP: the next incremental run diffs against the newest one, and
+# any older one materializes from the store). If the store put fails, fall back
+# to the historical three dirs.
+REAP_KEEP=3
+if python3 "$SCRIPT_DIR/memgraph_publication_store.py" --store-dir "$STORE_DIR" \
+      put --publication-dir "$PUB_DIR" >/dev/null 2>&1; then
+  python3 "$SCRIPT_DIR/memgraph_publication_store.py" --store-dir "$STORE_DIR" \
+    prune --keep "$STORE_KEEP" >/dev/null 2>&1 || true
+  REAP_KEEP="$KEEP"
+fi
+ls -1dt "$PUB_ROOT"/pub-* 2>/dev/null | tail -n +$((REAP_KEEP + 1)) | xargs -r rm -rf
 
 write_marker "ok" "published $PUB_ID"
 exit 0
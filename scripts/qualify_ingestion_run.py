@@ -27,9 +27,18 @@ from runtime_contracts import (
     mode_contract,
     runtime_authority_contract,
 )
+import sample_store
+from axon_client import AxonClient, PgError
+from file_indexed_log import (
+    FileIndexedFollower,
+    IngestCostBreakdown,
+    source_for as file_indexed_source_for,
+)
 
 sys.path.insert(0, str(Path(__file__).resolve().parent / "lib"))
 import gpu_nvml  # noqa: E402
+from proc_sampler import LEGACY_EMPTY as PROC_EMPTY, ProcSampler  # noqa: E402
+from role_registry import RoleRegistry, primary_role  # noqa: E402
 
 PROJECT_ROOT = Path(__file__).resolve().parents[1]
 RUNS_ROOT = PROJECT_ROOT / ".axon" / "qualification-runs"
@@ -423,7 +432,7 @@ def wait_for_runtime_contract(mode: str, timeout_s: int = 180) -> tuple[int | No
     last_pid: int | None = None
     last_reason = "unknown"
     while time.time() < deadline:
-        last_pid = detect_axon_pid()
+        last_pid = detect_axon_pid(shadow_role_for_mode(mode))
         if last_pid is None:
             time.sleep(1)
             continue
@@ -495,6 +504,82 @@ ORDER BY c DESC, 1 ASC
 LIMIT 5;
 """.strip()
 
+# One statement, one snapshot: the four queries above folded into a single
+# JSON document. File is scanned once into (status, stage, reason, readiness)
+# groups and every section is derived from those groups, so the overview, the
+# stage split and the top reasons always add up within a sample.
+SQL_INGESTION_OVERVIEW_PACK = """
+WITH file_groups AS (
+  SELECT
+    status,
+    COALESCE(file_stage, 'unknown') AS stage,
+    COALESCE(status_reason, 'unknown') AS reason,
+    COALESCE(graph_ready, false) AS graph_ready,
+    COALESCE(vector_ready, false) AS vector_ready,
+    count(*) AS c
+  FROM File
+  GROUP BY 1, 2, 3, 4, 5
+),
+overview AS (
+  SELECT
+    COALESCE(SUM(c), 0) AS known,
+    COALESCE(SUM(CASE WHEN status IN ('indexed','indexed_degraded','skipped','deleted') THEN c ELSE 0 END), 0) AS completed,
+    COALESCE(SUM(CASE WHEN status = 'pending' THEN c ELSE 0 END), 0) AS pending,
+    COALESCE(SUM(CASE WHEN status = 'indexing' THEN c ELSE 0 END), 0) AS indexing,
+    COALESCE(SUM(CASE WHEN status = 'indexed_degraded' THEN c ELSE 0 END), 0) AS degraded,
+    COALESCE(SUM(CASE WHEN status = 'skipped' THEN c ELSE 0 END), 0) AS skipped,
+    COALESCE(SUM(CASE WHEN status = 'oversized_for_current_budget' THEN c ELSE 0 END), 0) AS oversized,
+    COALESCE(SUM(CASE WHEN graph_ready THEN c ELSE 0 END), 0) AS graph_ready,
+    COALESCE(SUM(CASE WHEN vector_ready THEN c ELSE 0 END), 0) AS vector_ready
+  FROM file_groups
+),
+stages AS (
+  SELECT stage, SUM(c) AS c
+  FROM file_groups
+  GROUP BY stage
+),
+top_reasons AS (
+  SELECT reason, SUM(c) AS c
+  FROM file_groups
+  WHERE status IN ('pending', 'indexing')
+  GROUP BY reason
+  ORDER BY c DESC, reason ASC
+  LIMIT 5
+),
+graph_projection_queue AS (
+  SELECT
+    COALESCE(SUM(CASE WHEN status = 'queued' THEN 1 ELSE 0 END), 0) AS queued,
+    COALESCE(SUM(CASE WHEN status = 'inflight' THEN 1 ELSE 0 END), 0) AS inflight,
+    COALESCE(COUNT(*), 0) AS total
+  FROM GraphProjectionQueue
+)
+SELECT json_build_object(
+  'overview', (SELECT row_to_json(overview) FROM overview),
+  'top_reasons', COALESCE(
+    (SELECT json_agg(json_build_object('reason', reason, 'count', c) ORDER BY c DESC, reason ASC) FROM top_reasons),
+    '[]'::json
+  ),
+  'stages', COALESCE(
+    (SELECT json_agg(json_build_object('stage', stage, 'count', c) ORDER BY c DESC, stage ASC) FROM stages),
+    '[]'::json
+  ),
+  'graph_projection_queue', (SELECT row_to_json(graph_projection_queue) FROM graph_projection_queue)
+) AS pack;
+""".strip()
+
+SQL_OVERVIEW_KEYS = (
+    "known",
+    "completed",
+    "pending",
+    "indexing",
+    "degraded",
+    "skipped",
+    "oversized",
+    "graph_ready",
+    "vector_ready",
+)
+SQL_GRAPH_PROJECTION_QUEUE_KEYS = ("queued", "inflight", "total")
+
 
 def utc_now_iso() -> str:
     return datetime.now(timezone.utc).isoformat(timespec="seconds")
@@ -538,23 +623,27 @@ def parse_json_payload(text: str) -> Any:
     return json.loads(text)
 
 
+_RUNTIME_CLIENT: AxonClient | None = None
+RUNTIME_CLIENT_TIMEOUT_S = 30.0
+MCP_CALL_TIMEOUT_S = 5.0
+
+
+def runtime_client() -> AxonClient:
+    """Shared keep-alive client, rebuilt if the instance URLs change mid-run."""
+    global _RUNTIME_CLIENT
+    mcp_url, sql_url = current_mcp_url(), current_sql_url()
+    client = _RUNTIME_CLIENT
+    if client is None or (client.mcp_url, client.sql_url) != (mcp_url, sql_url):
+        if client is not None:
+            client.close()
+        client = _RUNTIME_CLIENT = AxonClient.from_env(
+            mcp_url, sql_url, timeout_s=RUNTIME_CLIENT_TIMEOUT_S
+        )
+    return client
+
+
 def sql_query(query: str) -> Any:
-    payload = json.dumps({"query": query})
-    proc = shell(
-        [
-            "curl",
-            "-sS",
-            "-X",
-            "POST",
-            current_sql_url(),
-            "-H",
-            "Content-Type: application/json",
-            "-d",
-            payload,
-        ],
-        capture=True,
-    )
-    return parse_json_payload(proc.stdout)
+    return runtime_client().sql(query)
 
 
 def nested_value(payload: dict[str, Any], *path: str) -> Any:
@@ -912,77 +1001,37 @@ def runtime_sql_ready() -> bool:
     try:
         sql_query("SELECT 1 AS ok")
         return True
-    except subprocess.CalledProcessError:
+    except (OSError, PgError):
         return False
     except json.JSONDecodeError:
         return False
 
 
 def runtime_mcp_ready() -> bool:
-    payload = {
-        "jsonrpc": "2.0",
-        "id": "qualify-ready",
-        "method": "tools/call",
-        "params": {"name": "status", "arguments": {"surface": "summary"}},
-    }
     try:
-        proc = shell(
-            [
-                "curl",
-                "-sS",
-                "-X",
-                "POST",
-                current_mcp_url(),
-                "-H",
-                "Content-Type: application/json",
-                "-d",
-                json.dumps(payload),
-            ],
-            capture=True,
+        parsed = runtime_client().mcp_call(
+            "status", {"surface": "summary"}, request_id="qualify-ready"
         )
-        parsed = parse_json_payload(proc.stdout)
         return isinstance(parsed, dict) and "result" in parsed
-    except subprocess.CalledProcessError:
+    except OSError:
         return False
     except json.JSONDecodeError:
         return False
 
 
-def detect_axon_pid() -> int | None:
-    pid_files = [
-        current_run_root("indexer") / "axon-indexer.pid",
-        current_run_root("brain") / "axon-brain.pid",
-    ]
-    for pid_file in pid_files:
-        try:
-            pid = int(pid_file.read_text().strip())
-        except (OSError, ValueError):
-            continue
-        if (Path("/proc") / str(pid)).exists():
-            return pid
+_ROLE_REGISTRIES: dict[str, RoleRegistry] = {}
 
-    try:
-        proc = shell(["pgrep", "-af", "axon-core|axon-indexer|axon-brain"], capture=True)
-    except subprocess.CalledProcessError:
-        return None
 
-    for line in proc.stdout.splitlines():
-        parts = line.split(maxsplit=1)
-        if len(parts) != 2:
-            continue
-        cmdline = parts[1]
-        if (
-            "bin/axon-core" in cmdline
-            or "/axon-indexer" in cmdline
-            or "/axon-brain" in cmdline
-            or ".axon/cargo-target/debug/axon-indexer" in cmdline
-            or ".axon/cargo-target/debug/axon-brain" in cmdline
-        ):
-            try:
-                return int(parts[0])
-            except ValueError:
-                continue
-    return None
+def role_registry() -> RoleRegistry:
+    kind = current_instance_kind()
+    registry = _ROLE_REGISTRIES.get(kind)
+    if registry is None:
+        registry = _ROLE_REGISTRIES[kind] = RoleRegistry(PROJECT_ROOT, kind)
+    return registry
+
+
+def detect_axon_pid(preferred_role: str | None = None) -> int | None:
+    return role_registry().primary_pid(preferred_role)
 
 
 def git_context() -> dict[str, str]:
@@ -999,44 +1048,6 @@ def git_context() -> dict[str, str]:
     }
 
 
-def parse_proc_status(pid: int) -> dict[str, int]:
-    status_path = Path("/proc") / str(pid) / "status"
-    result = {
-        "rss_bytes": 0,
-        "rss_anon_bytes": 0,
-        "rss_file_bytes": 0,
-        "rss_shmem_bytes": 0,
-    }
-
-    try:
-        text = status_path.read_text()
-    except OSError:
-        return result
-
-    key_map = {
-        "VmRSS:": "rss_bytes",
-        "RssAnon:": "rss_anon_bytes",
-        "RssFile:": "rss_file_bytes",
-        "RssShmem:": "rss_shmem_bytes",
-    }
-
-    for line in text.splitlines():
-        parts = line.split()
-        if len(parts) >= 2 and parts[0] in key_map:
-            try:
-                result[key_map[parts[0]]] = int(parts[1]) * 1024
-            except ValueError:
-                pass
-    return result
-
-
-def ps_value(pid: int, field: str) -> str:
-    try:
-        return shell(["ps", "-o", f"{field}=", "-p", str(pid)], capture=True).stdout.strip()
-    except subprocess.CalledProcessError:
-        return ""
-
-
 def file_size(path: Path) -> int:
     try:
         return path.stat().st_size
@@ -1211,145 +1222,138 @@ def classify_dominant_bottleneck(
     }
 
 
-def parse_file_indexed_stats(tail: str) -> dict[str, int]:
-    queue_wait_max = 0
-    parse_us_max = 0
-    commit_us_max = 0
-    parsed_events = 0
-
-    for line in tail.splitlines():
-        if '"FileIndexed"' not in line:
-            continue
-        start = line.find('"FileIndexed"')
-        if start == -1:
-            continue
-        obj_start = line.rfind("{", 0, start)
-        if obj_start == -1:
-            continue
-
-        depth = 0
-        obj_end = None
-        for idx in range(obj_start, len(line)):
-            if line[idx] == "{":
-                depth += 1
-            elif line[idx] == "}":
-                depth -= 1
-                if depth == 0:
-                    obj_end = idx + 1
-                    break
-
-        if obj_end is None:
-            continue
-
-        try:
-            payload = json.loads(line[obj_start:obj_end])
-        except (json.JSONDecodeError, ValueError):
-            continue
-
-        file_indexed = payload.get("FileIndexed")
-        if not isinstance(file_indexed, dict):
-            continue
-
-        parsed_events += 1
-        queue_wait_max = max(queue_wait_max, parse_int(file_indexed.get("queue_wait_us")))
-        parse_us_max = max(parse_us_max, parse_int(file_indexed.get("parse_us")))
-        commit_us_max = max(commit_us_max, parse_int(file_indexed.get("commit_us")))
-
-    return {
-        "parsed_file_indexed_events": parsed_events,
-        "max_queue_wait_us": queue_wait_max,
-        "max_parse_us": parse_us_max,
-        "max_commit_us": commit_us_max,
-    }
-
-
 def sql_overview() -> dict[str, int]:
     rows = sql_query(SQL_OVERVIEW)
-    if not isinstance(rows, list) or not rows:
-        return {
-            "known": 0,
-            "completed": 0,
-            "pending": 0,
-            "indexing": 0,
-            "degraded": 0,
-            "skipped": 0,
-            "oversized": 0,
-            "graph_ready": 0,
-            "vector_ready": 0,
-        }
+    if not isinstance(rows, list) or not rows or not isinstance(rows[0], list):
+        return dict.fromkeys(SQL_OVERVIEW_KEYS, 0)
     row = rows[0]
-    if not isinstance(row, list):
-        return {
-            "known": 0,
-            "completed": 0,
-            "pending": 0,
-            "indexing": 0,
-            "degraded": 0,
-            "skipped": 0,
-            "oversized": 0,
-            "graph_ready": 0,
-            "vector_ready": 0,
-        }
-    padded = row + [0] * (9 - len(row))
-    return {
-        "known": parse_int(padded[0]),
-        "completed": parse_int(padded[1]),
-        "pending": parse_int(padded[2]),
-        "indexing": parse_int(padded[3]),
-        "degraded": parse_int(padded[4]),
-        "skipped": parse_int(padded[5]),
-        "oversized": parse_int(padded[6]),
-        "graph_ready": parse_int(padded[7]),
-        "vector_ready": parse_int(padded[8]),
-    }
+    padded = row + [0] * (len(SQL_OVERVIEW_KEYS) - len(row))
+    return {key: parse_int(value) for key, value in zip(SQL_OVERVIEW_KEYS, padded)}
 
 
-def sql_top_reasons() -> list[dict[str, Any]]:
-    rows = sql_query(SQL_TOP_REASONS)
+def counted_rows(rows: Any, label: str) -> list[dict[str, Any]]:
     if not isinstance(rows, list):
         return []
-    reasons = []
+    counted = []
     for row in rows:
         if isinstance(row, list) and len(row) >= 2:
-            reasons.append({"reason": str(row[0]), "count": parse_int(row[1])})
-    return reasons
+            counted.append({label: str(row[0]), "count": parse_int(row[1])})
+    return counted
+
+
+def sql_top_reasons() -> list[dict[str, Any]]:
+    return counted_rows(sql_query(SQL_TOP_REASONS), "reason")
 
 
 def sql_stage_counts() -> list[dict[str, Any]]:
-    rows = sql_query(SQL_STAGE_COUNTS)
-    if not isinstance(rows, list):
-        return []
-    stages = []
-    for row in rows:
-        if isinstance(row, list) and len(row) >= 2:
-            stages.append({"stage": str(row[0]), "count": parse_int(row[1])})
-    return stages
+    return counted_rows(sql_query(SQL_STAGE_COUNTS), "stage")
 
 
 def sql_graph_projection_queue() -> dict[str, int]:
     rows = sql_query(SQL_GRAPH_PROJECTION_QUEUE)
     if not isinstance(rows, list) or not rows:
-        return {
-            "queued": 0,
-            "inflight": 0,
-            "total": 0,
-        }
+        return dict.fromkeys(SQL_GRAPH_PROJECTION_QUEUE_KEYS, 0)
+    row = rows[0]
+    if not isinstance(row, list) or len(row) < len(SQL_GRAPH_PROJECTION_QUEUE_KEYS):
+        return dict.fromkeys(SQL_GRAPH_PROJECTION_QUEUE_KEYS, 0)
+    return {key: parse_int(value) for key, value in zip(SQL_GRAPH_PROJECTION_QUEUE_KEYS, row)}
+
+
+def decode_ingestion_overview_pack(rows: Any) -> dict[str, Any] | None:
+    """Decode `SQL_INGESTION_OVERVIEW_PACK` into the per-sample `sql` dict.
 
+    Yields exactly what `sql_overview()` plus the `top_reasons`, `stages` and
+    `graph_projection_queue` helpers assemble. Returns None when the response
+    is not the expected single JSON document (gateway error payload, a backend
+    without json_build_object), so the caller can fall back to the helpers.
+    """
+    if not isinstance(rows, list) or len(rows) != 1:
+        return None
     row = rows[0]
-    if not isinstance(row, list) or len(row) < 3:
-        return {
-            "queued": 0,
-            "inflight": 0,
-            "total": 0,
-        }
+    if not isinstance(row, list) or len(row) != 1:
+        return None
+    document = row[0]
+    if isinstance(document, str):
+        try:
+            document = json.loads(document)
+        except json.JSONDecodeError:
+            return None
+    if not isinstance(document, dict):
+        return None
+    overview = document.get("overview")
+    queue = document.get("graph_projection_queue")
+    if not isinstance(overview, dict) or not isinstance(queue, dict):
+        return None
+
+    def counted(items: Any, label: str) -> list[dict[str, Any]]:
+        if not isinstance(items, list):
+            return []
+        return counted_rows(
+            [[item.get(label), item.get("count")] for item in items if isinstance(item, dict)],
+            label,
+        )
 
     return {
-        "queued": parse_int(row[0]),
-        "inflight": parse_int(row[1]),
-        "total": parse_int(row[2]),
+        **{key: parse_int(overview.get(key)) for key in SQL_OVERVIEW_KEYS},
+        "top_reasons": counted(document.get("top_reasons"), "reason"),
+        "stages": counted(document.get("stages"), "stage"),
+        "graph_projection_queue": {
+            key: parse_int(queue.get(key)) for key in SQL_GRAPH_PROJECTION_QUEUE_KEYS
+        },
     }
 
 
+# A pack that failed for another reason (an empty or garbled body under load,
+# a timeout inside the brain) is retried this many samples later.
+OVERVIEW_PACK_RETRY_SAMPLES = 10
+# Undefined function, column and table: the brain cannot run the pack at all.
+OVERVIEW_PACK_UNSUPPORTED_SQLSTATES = {"42883", "42703", "42P01"}
+OVERVIEW_PACK_MISSING_RE = re.compile(
+    r"\b(?:function|column|relation|table)\b[^\n]*?\b(?:does not exist|not found)\b"
+    r"|\b(?:unknown|no such) (?:function|column|relation|table)\b",
+    re.IGNORECASE,
+)
+
+# Set once the brain definitely cannot run the overview pack (an older schema,
+# no json_build_object): later samples go straight to the four queries instead
+# of paying for a doomed pack on every sample.
+_OVERVIEW_PACK_UNSUPPORTED = False
+# Samples left before a pack that failed transiently is tried again.
+_OVERVIEW_PACK_SKIP = 0
+
+
+def overview_pack_unsupported(failure: Any) -> bool:
+    """Whether a failed pack response names something the brain lacks."""
+    if isinstance(failure, PgError):
+        return failure.sqlstate in OVERVIEW_PACK_UNSUPPORTED_SQLSTATES
+    error = failure.get("error") if isinstance(failure, dict) else None
+    return isinstance(error, str) and OVERVIEW_PACK_MISSING_RE.search(error) is not None
+
+
+def sql_ingestion_snapshot() -> dict[str, Any]:
+    """Per-sample SQL truth in one round trip, falling back to four queries."""
+    global _OVERVIEW_PACK_UNSUPPORTED, _OVERVIEW_PACK_SKIP
+    if _OVERVIEW_PACK_SKIP > 0:
+        _OVERVIEW_PACK_SKIP -= 1
+    elif not _OVERVIEW_PACK_UNSUPPORTED:
+        try:
+            response: Any = sql_query(SQL_INGESTION_OVERVIEW_PACK)
+        except PgError as exc:
+            response = exc
+        snapshot = decode_ingestion_overview_pack(response)
+        if snapshot is not None:
+            return snapshot
+        if overview_pack_unsupported(response):
+            _OVERVIEW_PACK_UNSUPPORTED = True
+        else:
+            _OVERVIEW_PACK_SKIP = OVERVIEW_PACK_RETRY_SAMPLES - 1
+    snapshot = sql_overview()
+    snapshot["top_reasons"] = sql_top_reasons()
+    snapshot["stages"] = sql_stage_counts()
+    snapshot["graph_projection_queue"] = sql_graph_projection_queue()
+    return snapshot
+
+
 def capture_tmux_tail(lines: int = 400) -> str:
     for port in (8081, 8080):
         try:
@@ -1378,32 +1382,10 @@ def wait_for_runtime(timeout_s: int = 180) -> int:
 
 
 def mcp_call(tool_name: str, arguments: dict[str, Any] | None = None) -> dict[str, Any]:
-    payload = {
-        "jsonrpc": "2.0",
-        "id": 1,
-        "method": "tools/call",
-        "params": {"name": tool_name, "arguments": arguments or {}},
-    }
-    proc = shell(
-        [
-            "curl",
-            "-sS",
-            "--max-time",
-            "5",
-            "-X",
-            "POST",
-            current_mcp_url(),
-            "-H",
-            "Content-Type: application/json",
-            "-d",
-            json.dumps(payload),
-        ],
-        capture=True,
-    )
-    parsed = parse_json_payload(proc.stdout)
+    parsed = runtime_client().mcp_call(tool_name, arguments, timeout_s=MCP_CALL_TIMEOUT_S)
     if isinstance(parsed, dict):
         return parsed
-    return {"error": "invalid_mcp_response", "raw": proc.stdout}
+    return {"error": "invalid_mcp_response", "raw": "" if parsed is None else json.dumps(parsed)}
 
 
 def runtime_is_up() -> bool:
@@ -1427,6 +1409,8 @@ class Args:
     include_rich_mcp_diagnostics: bool
     label: str
     output_root: Path
+    sample_format: str = "ndjson"
+    runtime_log: str | None = None
 
 
 def build_arg_parser() -> argparse.ArgumentParser:
@@ -1476,6 +1460,20 @@ def build_arg_parser() -> argparse.ArgumentParser:
         action="store_true",
         help="Include expensive MCP diagnostics like truth_check and diagnose_indexing in the final summary.",
     )
+    parser.add_argument(
+        "--sample-format",
+        choices=sample_store.FORMATS,
+        default="ndjson",
+        help="Sample file format: ndjson (default), arrow (IPC stream, crash-tolerant) or parquet. Columnar needs pyarrow.",
+    )
+    parser.add_argument(
+        "--runtime-log",
+        default=None,
+        help=(
+            "Runtime log file to follow for FileIndexed events (default: AXON_RUNTIME_LOG, "
+            "else the process-compose log endpoint)."
+        ),
+    )
     return parser
 
 
@@ -1487,6 +1485,11 @@ def parse_args() -> Args:
         raise SystemExit("--interval must be > 0")
     if ns.interval > ns.duration:
         raise SystemExit("--interval must be <= --duration")
+    if ns.sample_format != "ndjson":
+        try:
+            sample_store.require_pyarrow(f"--sample-format {ns.sample_format}")
+        except RuntimeError as exc:
+            raise SystemExit(str(exc)) from exc
     return Args(
         duration=ns.duration,
         interval=ns.interval,
@@ -1498,6 +1501,8 @@ def parse_args() -> Args:
         include_rich_mcp_diagnostics=ns.include_rich_mcp_diagnostics,
         label=sanitize_label(ns.label),
         output_root=Path(ns.output_root),
+        sample_format=ns.sample_format,
+        runtime_log=ns.runtime_log,
     )
 
 
@@ -1582,7 +1587,7 @@ def main() -> int:
     run_dir.mkdir(parents=True, exist_ok=False)
 
     lock_path = run_dir / "run.lock.json"
-    samples_path = run_dir / "samples.ndjson"
+    samples_path = sample_store.samples_path_for(run_dir / "samples", args.sample_format)
     summary_path = run_dir / "summary.json"
     notes_path = run_dir / "notes.txt"
     tmux_tail_path = run_dir / "tmux-tail.log"
@@ -1625,6 +1630,11 @@ def main() -> int:
     stop_output = "[qualify] stop skipped because --reuse-runtime was requested\n"
     start_output = "[qualify] start skipped because --reuse-runtime was requested\n"
 
+    ingest_breakdown = IngestCostBreakdown()
+    file_indexed_follower = FileIndexedFollower(
+        file_indexed_source_for(args.runtime_log), observers=[ingest_breakdown]
+    )
+
     if not args.reuse_runtime:
         stop_code, stop_output = run_script("scripts/stop.sh", check=False)
         stop_log_path.write_text(stop_output)
@@ -1680,43 +1690,33 @@ def main() -> int:
     write_json(lock_path, lock)
 
     samples: list[dict[str, Any]] = []
-    samples_path.touch()
     started_monotonic = time.time()
     sample_count = args.duration // args.interval
     if args.duration % args.interval:
         sample_count += 1
 
-    with samples_path.open("a", encoding="utf-8") as handle:
+    proc_sampler = ProcSampler()
+    writer_options = {"ensure_ascii": True} if args.sample_format == "ndjson" else {}
+    with sample_store.open_sample_writer(samples_path, args.sample_format, **writer_options) as sample_writer:
         for _ in range(sample_count):
             ts = utc_now_iso()
-            current_pid = detect_axon_pid()
+            role_pids = role_registry().resolve()
+            current_role, current_pid = primary_role(role_pids, shadow_role_for_mode(args.mode))
             sample: dict[str, Any] = {
                 "timestamp": ts,
                 "elapsed_seconds": int(time.time() - started_monotonic),
                 "pid": current_pid,
+                "pids": role_pids,
             }
-            if current_pid is not None:
-                sample["proc"] = {
-                    **parse_proc_status(current_pid),
-                    "cpu_percent": ps_value(current_pid, "%cpu"),
-                }
-            else:
-                sample["proc"] = {
-                    "rss_bytes": 0,
-                    "rss_anon_bytes": 0,
-                    "rss_file_bytes": 0,
-                    "rss_shmem_bytes": 0,
-                    "cpu_percent": "",
-                }
+            sample["procs"] = proc_sampler.sample(role_pids)
+            proc = sample["procs"].get(current_role) if current_role else None
+            sample["proc"] = proc if proc and proc["alive"] else {**PROC_EMPTY, "cpu_percent": ""}
 
             sample["db"] = db_sizes()
             sample["gpu"] = gpu_status()
 
             try:
-                sample["sql"] = sql_overview()
-                sample["sql"]["top_reasons"] = sql_top_reasons()
-                sample["sql"]["stages"] = sql_stage_counts()
-                sample["sql"]["graph_projection_queue"] = sql_graph_projection_queue()
+                sample["sql"] = sql_ingestion_snapshot()
             except Exception as exc:
                 sample["sql_error"] = type(exc).__name__
                 sample["sql"] = {}
@@ -1732,9 +1732,9 @@ def main() -> int:
                 sample["cockpit_error"] = type(exc).__name__
                 sample["cockpit"] = {}
 
-            handle.write(json.dumps(sample, ensure_ascii=True) + "\n")
-            handle.flush()
+            sample_writer.append(sample)
             samples.append(sample)
+            file_indexed_follower.poll()
 
             sql = sample.get("sql", {})
             cockpit = sample.get("cockpit", {})
@@ -1832,7 +1832,8 @@ def main() -> int:
 
     tail = capture_tmux_tail()
     tmux_tail_path.write_text(tail)
-    file_indexed_stats = parse_file_indexed_stats(tail)
+    file_indexed_follower.poll()
+    file_indexed_stats = file_indexed_follower.stats()
 
     max_rss_anon = max(
         int(sample.get("proc", {}).get("rss_anon_bytes", 0)) for sample in samples
@@ -2011,9 +2012,11 @@ def main() -> int:
         "dominant_bottleneck": bottleneck["dominant_bottleneck"],
         "dominant_bottleneck_evidence": bottleneck["evidence"],
         "parsed_file_indexed_events": file_indexed_stats["parsed_file_indexed_events"],
-        "max_file_queue_wait_us": file_indexed_stats["max_queue_wait_us"],
-        "max_file_parse_us": file_indexed_stats["max_parse_us"],
-        "max_file_commit_us": file_indexed_stats["max_commit_us"],
+        "max_file_stage_us": file_indexed_stats["max_us"],
+        "file_indexed_latency_us": file_indexed_stats["latency_us"],
+        "file_indexed_log_gaps": file_indexed_stats["log_gaps"],
+        "file_ingest_breakdown": ingest_breakdown.table(),
+        "runtime_role_restarts": dict(role_registry().restarts),
         "max_graph_projection_queue_total": max_graph_projection_queue_total,
         "max_graph_projection_queue_queued": max_graph_projection_queue_queued,
         "max_graph_projection_queue_inflight": max_graph_projection_queue_inflight,
@@ -2083,6 +2086,7 @@ def main() -> int:
                     truth_text = str(first.get("text", ""))
         truth_drift_detected = "drift_detected" in truth_text.lower()
         summary["truth_drift_detected"] = truth_drift_detected
+    summary["runtime_client"] = runtime_client().stats()
     write_json(summary_path, summary)
 
     notes = [
@@ -2132,9 +2136,18 @@ def main() -> int:
         f"VRAM overshoot fail MB: {gpu_memory_envelope['overshoot_fail_mb']}",
         f"MCP truth drift detected: {truth_drift_detected}",
         f"FileIndexed events parsed from runtime log: {file_indexed_stats['parsed_file_indexed_events']}",
-        f"Max FileIndexed queue_wait_us: {file_indexed_stats['max_queue_wait_us']}",
-        f"Max FileIndexed parse_us: {file_indexed_stats['max_parse_us']}",
-        f"Max FileIndexed commit_us: {file_indexed_stats['max_commit_us']}",
+        *(f"Max FileIndexed {field}: {value}" for field, value in file_indexed_stats["max_us"].items()),
+        *(
+            f"FileIndexed {field} p50/p95/p99: "
+            f"{latency['p50']}/{latency['p95']}/{latency['p99']}"
+            for field, latency in file_indexed_stats["latency_us"].items()
+        ),
+        *(
+            f"Ingest cost {row['parser_class']}/{row['size_bucket']}: "
+            f"files={row['files']} service_share={row['service_share']} "
+            f"throughput_bytes_per_s={row['throughput_bytes_per_s']}"
+            for row in summary["file_ingest_breakdown"][:5]
+        ),
     ]
     notes_path.write_text("\n".join(notes) + "\n")
 
@@ -4,6 +4,8 @@
 from __future__ import annotations
 
 import argparse
+import asyncio
+import http.client
 import json
 import os
 import re
@@ -20,6 +22,13 @@ from pathlib import Path
 from statistics import mean
 from typing import Any
 
+import mcp_async_load
+from latency_histogram import histogram_of
+from mcp_probe_common import McpSession
+
+sys.path.insert(0, str(Path(__file__).resolve().parent / "lib"))
+from role_registry import RoleRegistry  # noqa: E402
+
 
 PROJECT_ROOT = Path(__file__).resolve().parents[1]
 GRAPH_ROOT = PROJECT_ROOT / ".axon" / "graph_v2"
@@ -99,20 +108,11 @@ def parse_error_text(resp: dict[str, Any]) -> str:
     return "\n".join(chunks)
 
 
+LIVE_ROLES = RoleRegistry(PROJECT_ROOT, "live")
+
+
 def detect_axon_pid() -> int | None:
-    try:
-        proc = shell(["pgrep", "-af", "axon-core"], capture=True)
-    except subprocess.CalledProcessError:
-        return None
-
-    for line in proc.stdout.splitlines():
-        parts = line.split(maxsplit=1)
-        if len(parts) == 2 and "bin/axon-core" in parts[1]:
-            try:
-                return int(parts[0])
-            except ValueError:
-                continue
-    return None
+    return LIVE_ROLES.primary_pid()
 
 
 def wait_for_mcp_ready(url: str, timeout_s: int) -> int:
@@ -148,16 +148,6 @@ def wait_for_mcp_ready(url: str, timeout_s: int) -> int:
     raise RuntimeError(f"MCP runtime not ready after {timeout_s}s (last pid={last_pid})")
 
 
-def percentile(values: list[int], q: float) -> int:
-    if not values:
-        return 0
-    if len(values) == 1:
-        return values[0]
-    ordered = sorted(values)
-    index = max(0, min(len(ordered) - 1, int(round((len(ordered) - 1) * q))))
-    return ordered[index]
-
-
 def classify_response(resp: dict[str, Any]) -> tuple[str, bool, str]:
     if resp.get("error") is not None:
         message = json.dumps(resp["error"], ensure_ascii=False)
@@ -180,6 +170,24 @@ def classify_response(resp: dict[str, Any]) -> tuple[str, bool, str]:
     return "ok_result", True, text
 
 
+def classify_exception(exc: Exception) -> tuple[str, str]:
+    if isinstance(exc, urllib.error.HTTPError):
+        return "transport_error", f"HTTPError: {exc}"
+    if isinstance(exc, urllib.error.URLError):
+        return "transport_error", f"URLError: {exc}"
+    if isinstance(exc, TimeoutError):
+        return "timeout", f"TimeoutError: {exc}"
+    if isinstance(exc, json.JSONDecodeError):
+        return "invalid_json", f"JSONDecodeError: {exc}"
+    if isinstance(exc, ValueError):
+        # Empty or non-UTF-8 bodies from McpSession.rpc: the same unusable
+        # reply the urllib path reports as a JSONDecodeError.
+        return "invalid_json", f"{type(exc).__name__}: {exc}"
+    if isinstance(exc, OSError):
+        return "transport_error", f"OSError: {exc}"
+    return "transport_error", f"{type(exc).__name__}: {exc}"
+
+
 def build_request_specs(project: str, soll_project: str, query: str, symbol: str) -> list[RequestSpec]:
     return [
         RequestSpec(
@@ -296,7 +304,8 @@ def summarize_events(mode: str, events: list[dict[str, Any]], thresholds: dict[s
 
     responsive_rate = responded / total if total else 0.0
     success_rate = ok_result / total if total else 0.0
-    p95_latency_ms = percentile(responded_latencies, 0.95)
+    responded_histogram = histogram_of(responded_latencies)
+    p95_latency_ms = int(round(responded_histogram.value_at(0.95) or 0))
     verdict = "pass"
     if (
         responsive_rate < thresholds["responsive_rate_degraded"]
@@ -342,9 +351,14 @@ def summarize_events(mode: str, events: list[dict[str, Any]], thresholds: dict[s
         "latency_ms": {
             "avg": int(mean(latencies)) if latencies else 0,
             "avg_responded": int(mean(responded_latencies)) if responded_latencies else 0,
+            "p50": int(round(responded_histogram.value_at(0.50) or 0)),
             "p95": p95_latency_ms,
+            "p99": int(round(responded_histogram.value_at(0.99) or 0)),
             "max": max(latencies) if latencies else 0,
         },
+        # Mergeable snapshot of responded latencies, so runs can be pooled
+        # and compared exactly (latency_histogram.merge_snapshots).
+        "latency_histogram": responded_histogram.to_dict(),
         "rates": {
             "responsive": round(responsive_rate, 4),
             "success": round(success_rate, 4),
@@ -399,6 +413,9 @@ def run_mode(
     timeout: int,
     reset_ist: bool,
     run_dir: Path,
+    batch_size: int = 1,
+    engine: str = "threads",
+    rate: float | None = None,
 ) -> dict[str, Any]:
     # REQ-AXO-901653 slice-5d (DDL DROP TABLE) + GUI-AXO-1023 — canonical
     # 4-verb wrapper (./scripts/axon --instance live ...) loads the right
@@ -447,6 +464,7 @@ def run_mode(
     counter_lock = threading.Lock()
     events: list[dict[str, Any]] = []
     events_lock = threading.Lock()
+    batch_support: dict[int, bool | None] = {}
 
     def next_spec() -> RequestSpec:
         nonlocal counter
@@ -455,6 +473,31 @@ def run_mode(
             counter += 1
             return spec
 
+    def record(
+        worker_id: int,
+        spec: RequestSpec,
+        category: str,
+        responded: bool,
+        duration_ms: int,
+        started_at_ms: int,
+        excerpt: str,
+        service_ms: int | None = None,
+    ) -> None:
+        event = {
+            "worker": worker_id,
+            "request": spec.name,
+            "category": category,
+            "responded": responded,
+            "duration_ms": duration_ms,
+            "started_at_ms": started_at_ms,
+            "excerpt": excerpt[:500],
+        }
+        if service_ms is not None:
+            # Async engine: duration_ms counts from the intended send time.
+            event["service_ms"] = service_ms
+        with events_lock:
+            events.append(event)
+
     def worker_loop(worker_id: int) -> None:
         while time.time() < deadline:
             spec = next_spec()
@@ -466,38 +509,90 @@ def run_mode(
             try:
                 resp = rpc_call(url, spec.payload, timeout)
                 category, responded, excerpt = classify_response(resp)
-            except urllib.error.HTTPError as exc:
-                category = "transport_error"
-                excerpt = f"HTTPError: {exc}"
-            except urllib.error.URLError as exc:
-                category = "transport_error"
-                excerpt = f"URLError: {exc}"
-            except TimeoutError as exc:
-                category = "timeout"
-                excerpt = f"TimeoutError: {exc}"
-            except json.JSONDecodeError as exc:
-                category = "invalid_json"
-                excerpt = f"JSONDecodeError: {exc}"
-            except OSError as exc:
-                category = "transport_error"
-                excerpt = f"OSError: {exc}"
+            except (urllib.error.URLError, TimeoutError, json.JSONDecodeError, OSError) as exc:
+                category, excerpt = classify_exception(exc)
             duration_ms = int((time.time() - t0) * 1000)
-            with events_lock:
-                events.append(
-                    {
-                        "worker": worker_id,
-                        "request": spec.name,
-                        "category": category,
-                        "responded": responded,
-                        "duration_ms": duration_ms,
-                        "started_at_ms": started_at_ms,
-                        "excerpt": excerpt[:500],
-                    }
-                )
-
-    with ThreadPoolExecutor(max_workers=concurrency) as pool:
-        for worker_id in range(concurrency):
-            pool.submit(worker_loop, worker_id)
+            record(worker_id, spec, category, responded, duration_ms, started_at_ms, excerpt)
+
+    def batch_worker_loop(worker_id: int) -> None:
+        # One keep-alive session per worker; each iteration posts batch_size
+        # specs as a single JSON-RPC array (sequential if the server refuses).
+        with McpSession(url, timeout) as session:
+            while time.time() < deadline:
+                batch = [next_spec() for _ in range(batch_size)]
+                t0 = time.time()
+                started_at_ms = int(t0 * 1000)
+                try:
+                    outcomes = session.rpc_batch([spec.payload for spec in batch])
+                except (
+                    urllib.error.URLError,
+                    TimeoutError,
+                    ValueError,
+                    OSError,
+                    http.client.HTTPException,
+                ) as exc:
+                    category, excerpt = classify_exception(exc)
+                    duration_ms = int((time.time() - t0) * 1000)
+                    for spec in batch:
+                        record(worker_id, spec, category, False, duration_ms, started_at_ms, excerpt)
+                    continue
+                for spec, (latency_ms, resp) in zip(batch, outcomes):
+                    category, responded, excerpt = (
+                        classify_response(resp) if isinstance(resp, dict) else ("invalid_result", False, "")
+                    )
+                    record(worker_id, spec, category, responded, int(latency_ms), started_at_ms, excerpt)
+                batch_support[worker_id] = session.batch_supported
+
+    def record_outcome(outcome: mcp_async_load.LoadOutcome) -> None:
+        if outcome.error is not None:
+            category, excerpt = classify_exception(outcome.error)
+            responded = False
+        elif isinstance(outcome.response, dict):
+            category, responded, excerpt = classify_response(outcome.response)
+        else:
+            category, responded, excerpt = "invalid_result", False, ""
+        record(
+            outcome.worker,
+            outcome.request,
+            category,
+            responded,
+            outcome.latency_ms,
+            int(outcome.intended_at * 1000),
+            excerpt,
+            outcome.service_ms,
+        )
+
+    def next_async_request() -> tuple[RequestSpec, dict[str, Any]]:
+        spec = next_spec()
+        return spec, spec.payload
+
+    if engine == "asyncio" and rate:
+        asyncio.run(
+            mcp_async_load.run_open_loop(
+                url=url,
+                next_request=next_async_request,
+                rate=rate,
+                concurrency=concurrency,
+                duration_s=duration,
+                timeout_s=timeout,
+                record=record_outcome,
+            )
+        )
+    elif engine == "asyncio":
+        asyncio.run(
+            mcp_async_load.run_closed_loop(
+                url=url,
+                next_request=next_async_request,
+                concurrency=concurrency,
+                duration_s=duration,
+                timeout_s=timeout,
+                record=record_outcome,
+            )
+        )
+    else:
+        with ThreadPoolExecutor(max_workers=concurrency) as pool:
+            for worker_id in range(concurrency):
+                pool.submit(batch_worker_loop if batch_size > 1 else worker_loop, worker_id)
 
     thresholds = {
         "responsive_rate_warn": 0.99,
@@ -514,6 +609,15 @@ def run_mode(
         "warmup_seconds": warmup,
         "duration_seconds": duration,
         "concurrency": concurrency,
+        "engine": engine,
+        "load_shape": "open_loop" if rate else "closed_loop",
+        "target_rate_rps": rate,
+        "achieved_rate_rps": round(len(events) / duration, 2),
+        "latency_basis": "intended_send_time" if rate else "service_time",
+        "batch_size": batch_size,
+        "batch_server_accepted": next(
+            (value for value in batch_support.values() if value is not None), None
+        ),
         "timeout_seconds": timeout,
         "reset_ist": reset_ist,
     }
@@ -537,6 +641,26 @@ def parse_args(argv: list[str]) -> argparse.Namespace:
     parser.add_argument("--warmup", type=int, default=5, help="Warm-up seconds after runtime readiness")
     parser.add_argument("--concurrency", type=int, default=4, help="Parallel request workers")
     parser.add_argument("--timeout", type=int, default=10, help="Per-request timeout seconds")
+    parser.add_argument(
+        "--engine",
+        choices=["threads", "asyncio"],
+        default="threads",
+        help="Load engine: blocking urllib threads, or asyncio streams for 500+ in-flight requests",
+    )
+    parser.add_argument(
+        "--rate",
+        type=float,
+        help=(
+            "Open-loop arrival rate in requests/sec (asyncio engine). Latency is then measured from the "
+            "scheduled send time (coordinated-omission corrected); --concurrency caps open connections."
+        ),
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=1,
+        help="Requests per JSON-RPC batch POST; 1 disables batching (default: 1)",
+    )
     parser.add_argument("--project", default="BookingSystem", help="Project scope for project-aware MCP tools")
     parser.add_argument("--query", default="booking", help="Query probe used for search-oriented tools")
     parser.add_argument("--symbol", default="parse_batch", help="Symbol probe used for symbol-oriented tools")
@@ -556,6 +680,12 @@ def main(argv: list[str]) -> int:
             raise SystemExit(f"Unsupported mode: {mode}")
     if args.duration <= 0 or args.concurrency <= 0 or args.timeout <= 0 or args.warmup < 0:
         raise SystemExit("duration, concurrency and timeout must be > 0; warmup must be >= 0")
+    if args.batch_size <= 0:
+        raise SystemExit("batch-size must be > 0")
+    if args.rate is not None and (args.rate <= 0 or args.engine != "asyncio"):
+        raise SystemExit("--rate must be > 0 and requires --engine asyncio")
+    if args.engine == "asyncio" and args.batch_size > 1:
+        raise SystemExit("--batch-size > 1 is only supported by --engine threads")
 
     output_root = Path(args.output_root)
     output_root.mkdir(parents=True, exist_ok=True)
@@ -572,6 +702,9 @@ def main(argv: list[str]) -> int:
         "duration_seconds": args.duration,
         "warmup_seconds": args.warmup,
         "concurrency": args.concurrency,
+        "engine": args.engine,
+        "rate_rps": args.rate,
+        "batch_size": args.batch_size,
         "timeout_seconds": args.timeout,
         "project": args.project,
         "query": args.query,
@@ -590,7 +723,10 @@ def main(argv: list[str]) -> int:
 
     mode_summaries = []
     for mode in modes:
-        print(f"[robustness] mode={mode} duration={args.duration}s concurrency={args.concurrency}")
+        print(
+            f"[robustness] mode={mode} duration={args.duration}s concurrency={args.concurrency} "
+            f"engine={args.engine} rate={args.rate or 'closed-loop'}"
+        )
         summary = run_mode(
             mode=mode,
             url=args.url,
@@ -604,6 +740,9 @@ def main(argv: list[str]) -> int:
             timeout=args.timeout,
             reset_ist=args.reset_ist,
             run_dir=run_dir,
+            batch_size=args.batch_size,
+            engine=args.engine,
+            rate=args.rate,
         )
         mode_summaries.append(summary)
 
@@ -5,7 +5,6 @@ from __future__ import annotations
 
 import argparse
 import json
-import statistics
 import sys
 import time
 import urllib.error
@@ -13,6 +12,8 @@ import urllib.request
 from pathlib import Path
 from typing import Any
 
+from latency_histogram import histogram_of
+
 
 PROJECT_ROOT = Path(__file__).resolve().parents[1]
 DEFAULT_URL = "http://127.0.0.1:44129/mcp"
@@ -124,16 +125,6 @@ def count_relevant_items(packet: dict[str, Any], expected_terms: list[str], expe
     return relevant, total
 
 
-def percentile(values: list[int], q: float) -> int:
-    if not values:
-        return 0
-    ordered = sorted(values)
-    if len(ordered) == 1:
-        return ordered[0]
-    index = max(0, min(len(ordered) - 1, int(round((len(ordered) - 1) * q))))
-    return ordered[index]
-
-
 def evaluate_direct_anchor_hit(packet: dict[str, Any], expected_terms: list[str]) -> bool:
     if not expected_terms:
         return True
@@ -353,10 +344,12 @@ def main(argv: list[str]) -> int:
     total_items = sum(result.get("total_items", 0) for result in evaluated)
     useful_context_ratio = round(total_relevant / total_items, 4) if total_items else 0.0
     latencies = [int(result.get("duration_ms", 0)) for result in evaluated]
+    latency_histogram = histogram_of(latencies)
     latency_summary = {
-        "p50": int(statistics.median(latencies)) if latencies else 0,
-        "p95": percentile(latencies, 0.95),
+        "p50": int(round(latency_histogram.value_at(0.50) or 0)),
+        "p95": int(round(latency_histogram.value_at(0.95) or 0)),
         "max": max(latencies) if latencies else 0,
+        "histogram": latency_histogram.to_dict(),
     }
 
     metrics = {
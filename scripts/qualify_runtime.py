@@ -4,7 +4,9 @@
 from __future__ import annotations
 
 import argparse
+import bisect
 import json
+import math
 import os
 import re
 import subprocess
@@ -23,12 +25,18 @@ from runtime_contracts import (
     runtime_authority_contract,
 )
 
+from latency_histogram import histogram_of
+from sample_store import FORMATS as SAMPLE_FORMATS, open_sample_writer, require_pyarrow
+
 sys.path.insert(0, str(Path(__file__).resolve().parent / "lib"))
 import gpu_nvml  # noqa: E402
 
 PROJECT_ROOT = Path(__file__).resolve().parents[1]
 RUNS_ROOT = PROJECT_ROOT / ".axon" / "qualification-suite-runs"
 MIN_RUNTIME_OBSERVATION_SEC = 8
+# Resource series mix percentages, GB and ms; 0.001 keeps small GB values
+# inside the histogram's relative-error bound.
+NUMERIC_SERIES_RESOLUTION = 0.001
 
 
 def utc_now_iso() -> str:
@@ -83,7 +91,19 @@ def parse_args(argv: list[str]) -> argparse.Namespace:
         "--resource-sample-interval-ms",
         type=int,
         default=200,
-        help="Host resource sampling cadence in milliseconds during runtime_smoke. Default: 200",
+        help="Host resource sampling cadence in milliseconds during runtime_smoke (min 50). Default: 200",
+    )
+    parser.add_argument(
+        "--pipeline-sample-interval-ms",
+        type=int,
+        default=1000,
+        help="MCP status polling cadence in milliseconds during runtime_smoke, on its own thread. Default: 1000",
+    )
+    parser.add_argument(
+        "--resource-sample-format",
+        choices=SAMPLE_FORMATS,
+        default="ndjson",
+        help="runtime_smoke sample file format; arrow/parquet need pyarrow. Default: ndjson",
     )
     parser.add_argument("--label", default="qualify-suite", help="Short label for output artifacts")
     parser.add_argument(
@@ -1025,13 +1045,15 @@ def read_meminfo() -> dict[str, int]:
     return result
 
 
-def read_gpu_sample() -> dict[str, Any]:
+def read_gpu_sample(sampler: gpu_nvml.NvmlSampler | None = None) -> dict[str, Any]:
     """NVML-only GPU sample (REQ-AXO-902085) via the shared helper.
 
     Replaces the nvidia-smi subprocess probe; maps the canonical ``gpu_nvml``
-    keys onto this script's ``gpu_*`` sample schema. Never raises.
+    keys onto this script's ``gpu_*`` sample schema. Never raises. Periodic
+    callers pass a persistent ``NvmlSampler`` to skip the per-call NVML
+    init/shutdown.
     """
-    status = gpu_nvml.gpu_status()
+    status = sampler.sample() if sampler is not None else gpu_nvml.gpu_status()
     if not status.get("available"):
         return {"available": False, "reason": status.get("error", "nvml_unavailable")}
     return {
@@ -1046,21 +1068,6 @@ def read_gpu_sample() -> dict[str, Any]:
     }
 
 
-def percentile(values: list[float], pct: float) -> float | None:
-    if not values:
-        return None
-    if len(values) == 1:
-        return values[0]
-    ordered = sorted(values)
-    index = (len(ordered) - 1) * pct
-    lower = int(index)
-    upper = min(lower + 1, len(ordered) - 1)
-    if lower == upper:
-        return ordered[lower]
-    fraction = index - lower
-    return ordered[lower] * (1.0 - fraction) + ordered[upper] * fraction
-
-
 def parse_optional_float(raw: str) -> float | None:
     cleaned = raw.strip()
     if not cleaned or cleaned.upper() in {"N/A", "[N/A]"}:
@@ -1070,13 +1077,34 @@ def parse_optional_float(raw: str) -> float | None:
 
 def summarize_numeric_series(samples: list[dict[str, Any]], key: str) -> dict[str, Any]:
     values = [float(sample[key]) for sample in samples if isinstance(sample.get(key), (int, float))]
+    if not values or min(values) < 0:
+        return summarize_signed_series(values)
+    histogram = histogram_of(values, resolution=NUMERIC_SERIES_RESOLUTION)
+    return {
+        "min": histogram.min,
+        "p50": histogram.value_at(0.50),
+        "p95": histogram.value_at(0.95),
+        "max": histogram.max,
+        "avg": histogram.mean(),
+        "samples": histogram.count,
+    }
+
+
+def summarize_signed_series(values: list[float]) -> dict[str, Any]:
+    # The shared histogram only takes non-negative values; deltas that can
+    # go negative fall back to an exact nearest-rank pass over the list.
     if not values:
         return {}
+    ordered = sorted(values)
+
+    def nearest_rank(q: float) -> float:
+        return ordered[max(0, math.ceil(q * len(ordered) - 1e-9) - 1)]
+
     return {
-        "min": min(values),
-        "p50": percentile(values, 0.50),
-        "p95": percentile(values, 0.95),
-        "max": max(values),
+        "min": ordered[0],
+        "p50": nearest_rank(0.50),
+        "p95": nearest_rank(0.95),
+        "max": ordered[-1],
         "avg": sum(values) / len(values),
         "samples": len(values),
     }
@@ -1337,9 +1365,95 @@ def diagnose_resource_balance(summary: dict[str, Any]) -> dict[str, Any]:
     }
 
 
-def summarize_resource_samples(samples: list[dict[str, Any]], interval_ms: int) -> dict[str, Any]:
+def join_nearest_samples(
+    primary: list[dict[str, Any]],
+    secondary: list[dict[str, Any]],
+    *,
+    tolerance_s: float,
+    prefix: str,
+) -> list[dict[str, Any]]:
+    """Attach to each ``primary`` sample the ``secondary`` sample nearest in ``ts``.
+
+    Secondary fields are merged under their own names (``ts``/``ts_iso`` are
+    kept from the primary) plus ``<prefix>_ts`` and ``<prefix>_skew_ms``.
+    Primary samples with no secondary sample within ``tolerance_s`` are
+    returned unchanged.
+    """
+    ordered = sorted(
+        (sample for sample in secondary if isinstance(sample.get("ts"), (int, float))),
+        key=lambda sample: sample["ts"],
+    )
+    stamps = [sample["ts"] for sample in ordered]
+    joined: list[dict[str, Any]] = []
+    for sample in primary:
+        ts = sample.get("ts")
+        merged = dict(sample)
+        if isinstance(ts, (int, float)) and stamps:
+            index = bisect.bisect_left(stamps, ts)
+            nearest = min(
+                (candidate for candidate in (index - 1, index) if 0 <= candidate < len(stamps)),
+                key=lambda candidate: abs(stamps[candidate] - ts),
+            )
+            if abs(stamps[nearest] - ts) <= tolerance_s:
+                match = ordered[nearest]
+                merged.update({key: value for key, value in match.items() if key not in {"ts", "ts_iso"}})
+                merged[f"{prefix}_ts"] = match["ts"]
+                merged[f"{prefix}_skew_ms"] = round((match["ts"] - ts) * 1000.0, 3)
+        joined.append(merged)
+    return joined
+
+
+def summarize_pipeline_join(joined: list[dict[str, Any]]) -> dict[str, Any]:
+    """Join quality plus the GPU load split by whether vector work was queued."""
+    matched = [sample for sample in joined if sample.get("pipeline_available") is True]
+    skews = [{"abs_skew_ms": abs(sample["pipeline_skew_ms"])} for sample in matched if "pipeline_skew_ms" in sample]
+    gpu_matched = [sample for sample in matched if sample.get("gpu_available") is True]
+
+    def ready_depth(sample: dict[str, Any]) -> Any:
+        value = sample.get("ready_queue_chunks_current")
+        return value if isinstance(value, (int, float)) else sample.get("ready_queue_depth_current")
+
+    return {
+        "host_samples": len(joined),
+        "matched_host_samples": len(matched),
+        "skew_ms": summarize_numeric_series(skews, "abs_skew_ms"),
+        "gpu_util_pct_by_ready_queue": {
+            "empty": summarize_numeric_series(
+                [sample for sample in gpu_matched if ready_depth(sample) == 0], "gpu_util_pct"
+            ),
+            "non_empty": summarize_numeric_series(
+                [
+                    sample
+                    for sample in gpu_matched
+                    if isinstance(ready_depth(sample), (int, float)) and ready_depth(sample) > 0
+                ],
+                "gpu_util_pct",
+            ),
+        },
+    }
+
+
+def summarize_resource_samples(
+    samples: list[dict[str, Any]],
+    interval_ms: int,
+    pipeline_samples: list[dict[str, Any]] | None = None,
+    *,
+    pipeline_interval_ms: int | None = None,
+) -> dict[str, Any]:
+    """Summarise host samples and the pipeline series.
+
+    ``pipeline_samples`` is the independently polled status series; when
+    omitted, pipeline fields are read from ``samples`` (runs recorded before
+    the poller split, where they were merged into host samples).
+    """
     gpu_samples = [sample for sample in samples if sample.get("gpu_available") is True]
-    pipeline_samples = [sample for sample in samples if sample.get("pipeline_available") is True]
+    joined: list[dict[str, Any]] | None = None
+    if pipeline_samples is None:
+        pipeline_samples = [sample for sample in samples if sample.get("pipeline_available") is True]
+    else:
+        tolerance_s = max(interval_ms, pipeline_interval_ms or interval_ms) / 1000.0
+        joined = join_nearest_samples(samples, pipeline_samples, tolerance_s=tolerance_s, prefix="pipeline")
+        pipeline_samples = [sample for sample in pipeline_samples if sample.get("pipeline_available") is True]
     summary = {
         "interval_ms": interval_ms,
         "sample_count": len(samples),
@@ -1472,6 +1586,9 @@ def summarize_resource_samples(samples: list[dict[str, Any]], interval_ms: int)
             ),
         },
     }
+    if joined is not None:
+        summary["pipeline_interval_ms"] = pipeline_interval_ms
+        summary["pipeline_join"] = summarize_pipeline_join(joined)
     summary["diagnosis"] = diagnose_resource_balance(summary)
     summary["conversion_rates"] = summarize_conversion_rates(summary)
     summary["conversion_diagnosis"] = diagnose_conversion_pipeline(summary)
@@ -1479,18 +1596,42 @@ def summarize_resource_samples(samples: list[dict[str, Any]], interval_ms: int)
 
 
 class ResourceSampler:
-    def __init__(self, run_dir: Path, interval_ms: int, mcp_url: str, mcp_timeout: int) -> None:
+    """Host and pipeline samplers on independent threads.
+
+    Host samples (CPU/RAM/GPU) are cheap and keep their cadence; the pipeline
+    snapshot is an MCP ``status`` call that slows down exactly when the brain
+    is saturated, so it is polled on its own thread and cadence. Each series
+    is timestamped and written to its own JSONL file; ``stop()`` joins them
+    by nearest time for the summary.
+    """
+
+    def __init__(
+        self,
+        run_dir: Path,
+        interval_ms: int,
+        mcp_url: str,
+        mcp_timeout: int,
+        pipeline_interval_ms: int = 1000,
+        sample_format: str = "ndjson",
+    ) -> None:
         self.run_dir = run_dir
-        self.interval_ms = max(100, interval_ms)
+        self.interval_ms = max(50, interval_ms)
+        self.pipeline_interval_ms = max(self.interval_ms, pipeline_interval_ms)
         self.mcp_url = mcp_url
         self.mcp_timeout = mcp_timeout
-        self.samples_path = run_dir / "runtime-resource-samples.jsonl"
+        if sample_format != "ndjson":
+            require_pyarrow(f"{sample_format} resource samples")
+        self.sample_format = sample_format
+        suffix = ".jsonl" if sample_format == "ndjson" else f".{sample_format}"
+        self.samples_path = run_dir / f"runtime-resource-samples{suffix}"
+        self.pipeline_samples_path = run_dir / f"runtime-pipeline-samples{suffix}"
         self.summary_path = run_dir / "runtime-resource-summary.json"
         self._stop = threading.Event()
-        self._thread: threading.Thread | None = None
+        self._threads: list[threading.Thread] = []
         self._samples: list[dict[str, Any]] = []
+        self._pipeline_samples: list[dict[str, Any]] = []
         self._prev_cpu: tuple[int, int] | None = None
-        self._last_pipeline_sample_at = 0.0
+        self._gpu = gpu_nvml.NvmlSampler()
 
     def _capture_pipeline_sample(self) -> dict[str, Any]:
         try:
@@ -1721,7 +1862,7 @@ class ResourceSampler:
             sample["ram_available_gb"] = available / (1024**3)
             sample["ram_used_gb"] = used / (1024**3)
 
-        gpu = read_gpu_sample()
+        gpu = read_gpu_sample(self._gpu)
         sample["gpu_available"] = gpu.get("available", False)
         if sample["gpu_available"]:
             sample.update(
@@ -1737,31 +1878,70 @@ class ResourceSampler:
             )
         else:
             sample["gpu_reason"] = gpu.get("reason")
-
-        now = sample["ts"]
-        if now - self._last_pipeline_sample_at >= 1.0:
-            sample.update(self._capture_pipeline_sample())
-            self._last_pipeline_sample_at = now
         return sample
 
-    def _run(self) -> None:
-        with self.samples_path.open("w", encoding="utf-8") as handle:
+    def _capture_timed_pipeline_sample(self) -> dict[str, Any]:
+        started = time.time()
+        snapshot = self._capture_pipeline_sample()
+        finished = time.time()
+        # The brain builds the snapshot somewhere inside the call; the
+        # midpoint is the least biased estimate of when it describes.
+        ts = (started + finished) / 2.0
+        return {
+            "ts": ts,
+            "ts_iso": datetime.fromtimestamp(ts, timezone.utc).isoformat(),
+            "status_latency_ms": round((finished - started) * 1000.0, 3),
+            **snapshot,
+        }
+
+    def _loop(self, path: Path, period_ms: int, capture: Any, sink: list[dict[str, Any]]) -> None:
+        """Sample on a fixed schedule; overruns skip missed slots, no drift."""
+        period_s = period_ms / 1000.0
+        next_due = time.monotonic()
+        with open_sample_writer(path, self.sample_format) as writer:
             while not self._stop.is_set():
-                sample = self._capture_sample()
-                self._samples.append(sample)
-                handle.write(json.dumps(sample, ensure_ascii=False) + "\n")
-                handle.flush()
-                self._stop.wait(self.interval_ms / 1000.0)
+                sample = capture()
+                sink.append(sample)
+                writer.append(sample)
+                next_due += period_s
+                now = time.monotonic()
+                if next_due < now:
+                    next_due += math.ceil((now - next_due) / period_s) * period_s
+                self._stop.wait(next_due - now)
+
+    def _run(self) -> None:
+        try:
+            self._loop(self.samples_path, self.interval_ms, self._capture_sample, self._samples)
+        finally:
+            self._gpu.close()
+
+    def _run_pipeline(self) -> None:
+        self._loop(
+            self.pipeline_samples_path,
+            self.pipeline_interval_ms,
+            self._capture_timed_pipeline_sample,
+            self._pipeline_samples,
+        )
 
     def start(self) -> None:
-        self._thread = threading.Thread(target=self._run, name="qualify-resource-sampler", daemon=True)
-        self._thread.start()
+        self._threads = [
+            threading.Thread(target=self._run, name="qualify-resource-sampler", daemon=True),
+            threading.Thread(target=self._run_pipeline, name="qualify-pipeline-poller", daemon=True),
+        ]
+        for thread in self._threads:
+            thread.start()
 
     def stop(self) -> dict[str, Any]:
         self._stop.set()
-        if self._thread is not None:
-            self._thread.join(timeout=5)
-        summary = summarize_resource_samples(self._samples, self.interval_ms)
+        for thread in self._threads:
+            # An in-flight status call can outlive the host loop by mcp_timeout.
+            thread.join(timeout=max(5, self.mcp_timeout + 1))
+        summary = summarize_resource_samples(
+            list(self._samples),
+            self.interval_ms,
+            list(self._pipeline_samples),
+            pipeline_interval_ms=self.pipeline_interval_ms,
+        )
         write_json(self.summary_path, summary)
         return summary
 
@@ -1856,6 +2036,8 @@ def run_runtime_smoke(
     resource_sample_interval_ms: int,
     gpu_qualified_runtime: bool = False,
     reuse_runtime: bool = False,
+    pipeline_sample_interval_ms: int = 1000,
+    resource_sample_format: str = "ndjson",
 ) -> dict[str, Any]:
     t0 = time.time()
     resource_sampler: ResourceSampler | None = None
@@ -1897,6 +2079,8 @@ def run_runtime_smoke(
         resource_sampler = ResourceSampler(
             run_dir,
             interval_ms=resource_sample_interval_ms,
+            pipeline_interval_ms=pipeline_sample_interval_ms,
+            sample_format=resource_sample_format,
             mcp_url=effective_url,
             mcp_timeout=10,
         )
@@ -2300,6 +2484,8 @@ def run_mode_profile(args: argparse.Namespace, mode: str, suite_run_dir: Path) -
                 args.resource_sample_interval_ms,
                 gpu_qualified_runtime=args.gpu_qualified_runtime,
                 reuse_runtime=args.reuse_runtime,
+                pipeline_sample_interval_ms=args.pipeline_sample_interval_ms,
+                resource_sample_format=args.resource_sample_format,
             )
         elif step_name == "lifecycle_restart":
             # REQ-AXO-902263 — stands alone (profile `lifecycle`): it needs a RUNNING
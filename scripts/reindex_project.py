@@ -2,7 +2,6 @@
 from __future__ import annotations
 
 import argparse
-import json
 import os
 import subprocess
 import sys
@@ -10,6 +9,8 @@ import time
 from pathlib import Path
 from typing import Any
 
+from axon_client import AxonClient
+
 
 DEFAULT_SQL_URL = "http://127.0.0.1:44129/sql"
 PROJECT_ROOT = Path(__file__).resolve().parents[1]
@@ -26,25 +27,14 @@ NOISE_PREDICATE = (
 )
 
 
+_CLIENTS: dict[str, AxonClient] = {}
+
+
 def q(sql_url: str, query: str) -> list[list[Any]]:
-    payload = json.dumps({"query": query})
-    proc = subprocess.run(
-        [
-            "curl",
-            "-sS",
-            "-X",
-            "POST",
-            sql_url,
-            "-H",
-            "Content-Type: application/json",
-            "-d",
-            payload,
-        ],
-        text=True,
-        capture_output=True,
-        check=True,
-    )
-    data = json.loads(proc.stdout or "[]")
+    client = _CLIENTS.get(sql_url)
+    if client is None:
+        client = _CLIENTS[sql_url] = AxonClient.from_env(sql_url.rsplit("/", 1)[0] + "/mcp", sql_url)
+    data = client.sql(query)
     if isinstance(data, list):
         return data
     return []
@@ -13,6 +13,9 @@ from typing import Any
 
 sys.path.insert(0, str(Path(__file__).resolve().parent / "lib"))
 import gpu_nvml  # noqa: E402
+from axon_client import AxonClient  # noqa: E402
+from proc_sampler import ProcSampler  # noqa: E402
+from role_registry import RoleRegistry, primary_role  # noqa: E402
 
 PROJECT_ROOT = Path(__file__).resolve().parents[1]
 DEFAULT_OUTPUT_ROOT = PROJECT_ROOT / ".axon" / "runtime-sensor-runs"
@@ -33,78 +36,15 @@ def shell(args: list[str], *, check: bool = True) -> subprocess.CompletedProcess
     )
 
 
-def detect_axon_pid() -> int | None:
-    try:
-        proc = shell(["pgrep", "-af", "axon-core"], check=True)
-    except subprocess.CalledProcessError:
-        return None
-
-    for line in proc.stdout.splitlines():
-        parts = line.split(maxsplit=1)
-        if len(parts) == 2 and "bin/axon-core" in parts[1]:
-            try:
-                return int(parts[0])
-            except ValueError:
-                continue
-    return None
-
-
-def parse_proc_status(pid: int) -> dict[str, int]:
-    path = Path("/proc") / str(pid) / "status"
-    result = {
-        "rss_bytes": 0,
-        "rss_anon_bytes": 0,
-        "rss_file_bytes": 0,
-        "rss_shmem_bytes": 0,
-    }
-    try:
-        text = path.read_text()
-    except OSError:
-        return result
-
-    key_map = {
-        "VmRSS:": "rss_bytes",
-        "RssAnon:": "rss_anon_bytes",
-        "RssFile:": "rss_file_bytes",
-        "RssShmem:": "rss_shmem_bytes",
-    }
-    for line in text.splitlines():
-        parts = line.split()
-        if len(parts) >= 2 and parts[0] in key_map:
-            try:
-                result[key_map[parts[0]]] = int(parts[1]) * 1024
-            except ValueError:
-                pass
-    return result
-
-
-def ps_value(pid: int, field: str) -> str:
-    try:
-        return shell(["ps", "-o", f"{field}=", "-p", str(pid)]).stdout.strip()
-    except subprocess.CalledProcessError:
-        return ""
+_MCP_CLIENTS: dict[str, AxonClient] = {}
 
 
 def mcp_status(mcp_url: str) -> dict[str, Any]:
-    payload = {
-        "jsonrpc": "2.0",
-        "id": "runtime-sensor-log",
-        "method": "tools/call",
-        "params": {"name": "status", "arguments": {}},
-    }
     try:
-        proc = shell(
-            [
-                "curl",
-                "-sS",
-                mcp_url,
-                "-H",
-                "Content-Type: application/json",
-                "-d",
-                json.dumps(payload),
-            ]
-        )
-        parsed = json.loads(proc.stdout)
+        client = _MCP_CLIENTS.get(mcp_url)
+        if client is None:
+            client = _MCP_CLIENTS[mcp_url] = AxonClient(mcp_url)
+        parsed = client.mcp_call("status", {}, request_id="runtime-sensor-log")
         if isinstance(parsed, dict):
             return parsed
     except Exception as exc:
@@ -158,25 +98,29 @@ def tmux_tail(lines: int = 80) -> str:
     return ""
 
 
-def collect_sample(mcp_url: str, elapsed_seconds: int) -> dict[str, Any]:
-    pid = detect_axon_pid()
-    proc = (
-        {
-            **parse_proc_status(pid),
-            "cpu_percent": ps_value(pid, "%cpu"),
-            "mem_percent": ps_value(pid, "%mem"),
-        }
-        if pid is not None
-        else {}
-    )
+PROC_SAMPLER = ProcSampler()
+
+
+def collect_sample(mcp_url: str, elapsed_seconds: int, registry: RoleRegistry) -> dict[str, Any]:
+    pids = registry.resolve()
+    procs = PROC_SAMPLER.sample(pids)
+    role, pid = primary_role(pids)
+    proc = procs[role] if role is not None else {}
+    gpu = gpu_status()
+    script_status = status_script()
+    runtime_status = mcp_status(mcp_url)
+    client = _MCP_CLIENTS.get(mcp_url)
     return {
         "timestamp": utc_now_iso(),
         "elapsed_seconds": elapsed_seconds,
         "axon_pid": pid,
+        "axon_pids": pids,
         "proc": proc,
-        "gpu": gpu_status(),
-        "status_script": status_script(),
-        "mcp_status": mcp_status(mcp_url),
+        "procs": procs,
+        "gpu": gpu,
+        "status_script": script_status,
+        "mcp_status": runtime_status,
+        "mcp_status_ms": client.last_call_ms if client is not None else None,
     }
 
 
@@ -187,6 +131,12 @@ def parse_args() -> argparse.Namespace:
     parser.add_argument("--label", default="runtime-sensors")
     parser.add_argument("--output-root", default=str(DEFAULT_OUTPUT_ROOT))
     parser.add_argument("--mcp-url", default=DEFAULT_MCP_URL)
+    parser.add_argument(
+        "--instance",
+        choices=("dev", "live"),
+        default=os.environ.get("AXON_INSTANCE_KIND", "").strip().lower() or "live",
+        help="Instance whose run-root pid files identify the brain/indexer processes.",
+    )
     parser.add_argument("--tmux-tail-lines", type=int, default=200)
     return parser.parse_args()
 
@@ -219,11 +169,12 @@ def main() -> int:
     if args.duration % args.interval:
         sample_count += 1
 
+    registry = RoleRegistry(PROJECT_ROOT, args.instance)
     start_monotonic = time.time()
     with samples_path.open("a", encoding="utf-8") as handle:
         for _ in range(sample_count):
             elapsed = int(time.time() - start_monotonic)
-            sample = collect_sample(args.mcp_url, elapsed)
+            sample = collect_sample(args.mcp_url, elapsed, registry)
             handle.write(json.dumps(sample, ensure_ascii=True) + "\n")
             handle.flush()
 
@@ -0,0 +1,481 @@
+#!/usr/bin/env python3
+"""Shared append-only store for qualification sample series.
+
+The qualification scripts used to write one JSON line per sample and
+re-parse the whole text file for every analysis. This module gives them one
+writer interface with three backends:
+
+- ``ndjson``  one JSON object per line (historical format, stdlib only).
+- ``arrow``   Arrow IPC *stream*: one record batch per flush. A run killed
+              mid-way stays readable up to the last complete batch.
+- ``parquet`` one Parquet row group per flush; the footer is written on
+              ``close()``, so prefer ``arrow`` for live runs and convert.
+
+Columnar records have a fixed schema: nested dicts are flattened to dotted
+column names (``gpu.memory_used_mb``) down to ``max_depth`` levels, deeper
+values and lists are stored as JSON strings, and the schema is frozen from
+the first flushed rows. Keys that appear later, or values whose type does
+not fit their column, go into the ``_extra`` JSON column instead of being
+dropped, so ``iter_samples`` always returns the original nested dicts
+(dotted keys in the source data are the one thing that does not
+round-trip).
+
+``pyarrow`` (writing/reading columnar) and ``polars`` (``scan_samples``)
+are optional; the NDJSON path needs neither.
+
+CLI: ``sample_store.py convert RUN/samples.ndjson [--format parquet]``
+rewrites an existing NDJSON run next to the original.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+from typing import Any, Iterable, Iterator
+
+try:
+    import pyarrow as pa
+    import pyarrow.ipc as pa_ipc
+    import pyarrow.parquet as pq
+except ModuleNotFoundError:  # optional: NDJSON works without it
+    pa = None
+    pa_ipc = None
+    pq = None
+
+FORMATS = ("ndjson", "arrow", "parquet")
+SUFFIXES = {"ndjson": ".ndjson", "arrow": ".arrow", "parquet": ".parquet"}
+EXTRA_COLUMN = "_extra"
+JSON_COLUMNS_METADATA_KEY = b"axon.sample_store.json_columns"
+SCHEMA_VERSION_METADATA_KEY = b"axon.sample_store.schema"
+SCHEMA_VERSION = "axon.sample_store/v1"
+DEFAULT_MAX_DEPTH = 3
+DEFAULT_ROWS_PER_FLUSH = 256
+DEFAULT_FLUSH_INTERVAL_S = 30.0
+
+
+def require_pyarrow(purpose: str) -> None:
+    if pa is None:
+        raise RuntimeError(
+            f"pyarrow is required for {purpose}. Run through `devenv shell` or use the ndjson sample format."
+        )
+
+
+def flatten_sample(sample: dict[str, Any], *, max_depth: int = DEFAULT_MAX_DEPTH) -> dict[str, Any]:
+    """Flatten nested dicts to dotted keys; deeper dicts stay as values."""
+    flat: dict[str, Any] = {}
+
+    def visit(prefix: str, value: Any, depth: int) -> None:
+        if isinstance(value, dict) and value and depth < max_depth:
+            for key, nested in value.items():
+                visit(f"{prefix}.{key}" if prefix else str(key), nested, depth + 1)
+        else:
+            flat[prefix] = value
+
+    visit("", sample, 0)
+    return flat
+
+
+def unflatten_sample(flat: dict[str, Any]) -> dict[str, Any]:
+    sample: dict[str, Any] = {}
+    for key, value in flat.items():
+        parts = key.split(".")
+        node = sample
+        for part in parts[:-1]:
+            child = node.get(part)
+            if not isinstance(child, dict):
+                child = {}
+                node[part] = child
+            node = child
+        node[parts[-1]] = value
+    return sample
+
+
+def value_kind(value: Any) -> str | None:
+    """Column kind for one value; None means "no information" (null)."""
+    if value is None:
+        return None
+    if isinstance(value, bool):
+        return "bool"
+    if isinstance(value, int):
+        return "int"
+    if isinstance(value, float):
+        return "float"
+    if isinstance(value, str):
+        return "string"
+    return "json"
+
+
+def unify_kinds(left: str | None, right: str | None) -> str | None:
+    if left is None or left == right:
+        return right if left is None else left
+    if right is None:
+        return left
+    if {left, right} == {"int", "float"}:
+        return "float"
+    return "json"
+
+
+def fits_kind(value: Any, kind: str) -> bool:
+    actual = value_kind(value)
+    if actual is None or actual == kind or kind == "json":
+        return True
+    return kind == "float" and actual == "int"
+
+
+def infer_kinds(rows: Iterable[dict[str, Any]]) -> dict[str, str]:
+    kinds: dict[str, str | None] = {}
+    for row in rows:
+        for key, value in row.items():
+            kinds[key] = unify_kinds(kinds.get(key), value_kind(value))
+    # All-null columns carry no type information; strings are the only kind
+    # every later value can still be JSON-encoded into.
+    return {key: kind or "json" for key, kind in kinds.items()}
+
+
+def encode_column_value(value: Any, kind: str) -> Any:
+    if value is None:
+        return None
+    if kind == "json":
+        return json.dumps(value, ensure_ascii=False, sort_keys=True)
+    if kind == "float":
+        return float(value)
+    return value
+
+
+class NdjsonSampleWriter:
+    """Historical one-JSON-object-per-line writer behind the shared interface."""
+
+    format = "ndjson"
+
+    def __init__(self, path: Path, *, ensure_ascii: bool = False, append: bool = False) -> None:
+        self.path = path
+        self.rows_written = 0
+        self._ensure_ascii = ensure_ascii
+        self._handle = path.open("a" if append else "w", encoding="utf-8")
+
+    def __enter__(self) -> "NdjsonSampleWriter":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def append(self, sample: dict[str, Any]) -> None:
+        self._handle.write(json.dumps(sample, ensure_ascii=self._ensure_ascii) + "\n")
+        self._handle.flush()
+        self.rows_written += 1
+
+    def flush(self) -> None:
+        self._handle.flush()
+
+    def close(self) -> None:
+        if not self._handle.closed:
+            self._handle.close()
+
+
+class ColumnarSampleWriter:
+    """Buffer samples and append them as Arrow IPC batches or Parquet row groups.
+
+    A flush happens every ``rows_per_flush`` samples, when
+    ``flush_interval_s`` has elapsed since the last one, and on ``close()``.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        *,
+        format: str = "arrow",
+        max_depth: int = DEFAULT_MAX_DEPTH,
+        rows_per_flush: int = DEFAULT_ROWS_PER_FLUSH,
+        flush_interval_s: float = DEFAULT_FLUSH_INTERVAL_S,
+        compression: str = "zstd",
+    ) -> None:
+        if format not in {"arrow", "parquet"}:
+            raise ValueError(f"unsupported columnar sample format: {format}")
+        require_pyarrow(f"{format} sample files")
+        self.path = path
+        self.format = format
+        self.max_depth = max_depth
+        self.rows_per_flush = max(1, rows_per_flush)
+        self.flush_interval_s = flush_interval_s
+        self.compression = compression
+        self.rows_written = 0
+        self.kinds: dict[str, str] | None = None
+        self.schema: Any = None
+        self._pending: list[dict[str, Any]] = []
+        self._last_flush = time.monotonic()
+        self._sink: Any = None
+        self._writer: Any = None
+
+    def __enter__(self) -> "ColumnarSampleWriter":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def append(self, sample: dict[str, Any]) -> None:
+        self._pending.append(flatten_sample(sample, max_depth=self.max_depth))
+        if (
+            len(self._pending) >= self.rows_per_flush
+            or time.monotonic() - self._last_flush >= self.flush_interval_s
+        ):
+            self.flush()
+
+    def _freeze_schema(self) -> None:
+        kinds = infer_kinds(self._pending)
+        kinds.pop(EXTRA_COLUMN, None)
+        arrow_types = {
+            "bool": pa.bool_(),
+            "int": pa.int64(),
+            "float": pa.float64(),
+            "string": pa.string(),
+            "json": pa.string(),
+        }
+        fields = [pa.field(name, arrow_types[kind]) for name, kind in kinds.items()]
+        fields.append(pa.field(EXTRA_COLUMN, pa.string()))
+        json_columns = [name for name, kind in kinds.items() if kind == "json"]
+        self.kinds = kinds
+        self.schema = pa.schema(
+            fields,
+            metadata={
+                SCHEMA_VERSION_METADATA_KEY: SCHEMA_VERSION.encode("utf-8"),
+                JSON_COLUMNS_METADATA_KEY: json.dumps(json_columns).encode("utf-8"),
+            },
+        )
+        if self.format == "arrow":
+            self._sink = pa.OSFile(str(self.path), "wb")
+            self._writer = pa_ipc.new_stream(
+                self._sink,
+                self.schema,
+                options=pa_ipc.IpcWriteOptions(compression=self.compression),
+            )
+        else:
+            self._writer = pq.ParquetWriter(str(self.path), self.schema, compression=self.compression)
+
+    def _columns(self, rows: list[dict[str, Any]]) -> dict[str, list[Any]]:
+        assert self.kinds is not None
+        columns: dict[str, list[Any]] = {name: [] for name in self.kinds}
+        extras: list[str | None] = []
+        for row in rows:
+            extra: dict[str, Any] = {}
+            for name, kind in self.kinds.items():
+                value = row.get(name)
+                if fits_kind(value, kind):
+                    columns[name].append(encode_column_value(value, kind))
+                else:
+                    columns[name].append(None)
+                    extra[name] = value
+            for name, value in row.items():
+                if name not in self.kinds:
+                    extra[name] = value
+            extras.append(json.dumps(extra, ensure_ascii=False, sort_keys=True) if extra else None)
+        columns[EXTRA_COLUMN] = extras
+        return columns
+
+    def flush(self) -> None:
+        self._last_flush = time.monotonic()
+        if not self._pending:
+            return
+        if self.schema is None:
+            self._freeze_schema()
+        rows, self._pending = self._pending, []
+        table = pa.Table.from_pydict(self._columns(rows), schema=self.schema)
+        if self.format == "arrow":
+            for batch in table.to_batches():
+                self._writer.write_batch(batch)
+            self._sink.flush()
+        else:
+            self._writer.write_table(table, row_group_size=len(rows))
+        self.rows_written += len(rows)
+
+    def close(self) -> None:
+        self.flush()
+        writer, self._writer = self._writer, None
+        if writer is not None:
+            writer.close()
+        sink, self._sink = self._sink, None
+        if sink is not None:
+            sink.close()
+
+
+def samples_path_for(stem: Path, format: str) -> Path:
+    return stem.with_suffix(SUFFIXES[format])
+
+
+def open_sample_writer(path: Path, format: str = "ndjson", **options: Any) -> Any:
+    """Open a writer for ``path``.
+
+    A suffix that already matches ``format`` is kept (``.jsonl`` counts as
+    NDJSON); otherwise it is replaced with the format's own suffix.
+    """
+    if format not in FORMATS:
+        raise ValueError(f"unsupported sample format: {format}")
+    target = path if path.suffix and sample_format_of(path) == format else samples_path_for(path, format)
+    if format == "ndjson":
+        return NdjsonSampleWriter(target, **options)
+    return ColumnarSampleWriter(target, format=format, **options)
+
+
+def resolve_samples_path(stem: Path) -> Path:
+    """Return the existing samples file for ``stem``, preferring columnar."""
+    for format in ("parquet", "arrow", "ndjson"):
+        candidate = samples_path_for(stem, format)
+        if candidate.exists():
+            return candidate
+    jsonl = stem.with_suffix(".jsonl")
+    if jsonl.exists():
+        return jsonl
+    return samples_path_for(stem, "ndjson")
+
+
+def sample_format_of(path: Path) -> str:
+    suffix = path.suffix.lower()
+    if suffix == ".parquet":
+        return "parquet"
+    if suffix in {".arrow", ".ipc", ".arrows"}:
+        return "arrow"
+    return "ndjson"
+
+
+def _iter_ndjson(path: Path) -> Iterator[dict[str, Any]]:
+    with path.open("r", encoding="utf-8") as handle:
+        for line in handle:
+            if not line.strip():
+                continue
+            try:
+                sample = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            if isinstance(sample, dict):
+                yield sample
+
+
+def _read_columnar_table(path: Path, columns: list[str] | None) -> Any:
+    require_pyarrow("reading columnar sample files")
+    if sample_format_of(path) == "parquet":
+        # ParquetFile resolves flat dotted names ("gpu.memory_used_mb") by
+        # exact column path rather than as nested-field prefixes.
+        return pq.ParquetFile(str(path)).read(columns=columns)
+    with pa.OSFile(str(path), "rb") as source:
+        reader = pa_ipc.open_stream(source)
+        batches = []
+        try:
+            for batch in reader:
+                batches.append(batch)
+        except (pa.ArrowInvalid, OSError):
+            # Writer killed mid-batch: keep every complete batch before it.
+            pass
+        table = pa.Table.from_batches(batches, schema=reader.schema)
+    return table.select(columns) if columns is not None else table
+
+
+def _columnar_schema(path: Path) -> Any:
+    require_pyarrow("reading columnar sample files")
+    if sample_format_of(path) == "parquet":
+        return pq.read_schema(str(path))
+    with pa.OSFile(str(path), "rb") as source:
+        return pa_ipc.open_stream(source).schema
+
+
+def iter_samples(path: Path, *, prefixes: Iterable[str] | None = None) -> Iterator[dict[str, Any]]:
+    """Yield samples as the nested dicts they were written as.
+
+    ``prefixes`` restricts columnar reads to top-level keys (or dotted
+    prefixes) the caller needs, so a big ``runtime_status`` blob is never
+    decoded for an analysis that ignores it. NDJSON files are streamed line
+    by line and filtered on top-level keys only. Null columnar values are
+    omitted, like keys absent from the original sample.
+    """
+    wanted = tuple(prefixes) if prefixes is not None else None
+
+    def keep(name: str) -> bool:
+        return wanted is None or any(name == prefix or name.startswith(prefix + ".") for prefix in wanted)
+
+    if sample_format_of(path) == "ndjson":
+        top_level = {prefix.split(".", 1)[0] for prefix in wanted} if wanted is not None else None
+        for sample in _iter_ndjson(path):
+            if top_level is None:
+                yield sample
+            else:
+                yield {key: value for key, value in sample.items() if key in top_level}
+        return
+
+    schema = _columnar_schema(path)
+    json_columns = set(json.loads((schema.metadata or {}).get(JSON_COLUMNS_METADATA_KEY, b"[]")))
+    columns = [name for name in schema.names if name == EXTRA_COLUMN or keep(name)]
+    table = _read_columnar_table(path, columns)
+    for row in table.to_pylist():
+        extra = row.pop(EXTRA_COLUMN, None)
+        flat = {
+            name: json.loads(value) if name in json_columns else value
+            for name, value in row.items()
+            if value is not None
+        }
+        if extra:
+            flat.update({name: value for name, value in json.loads(extra).items() if keep(name)})
+        yield unflatten_sample(flat)
+
+
+def scan_samples(path: Path) -> Any:
+    """Lazy polars frame over a samples file (flat dotted columns if columnar)."""
+    try:
+        import polars as pl
+    except ModuleNotFoundError as exc:
+        raise RuntimeError("polars is required for scan_samples(); run through `devenv shell`.") from exc
+    format = sample_format_of(path)
+    if format == "parquet":
+        return pl.scan_parquet(path)
+    if format == "arrow":
+        # The writer emits the IPC *stream* format (no footer, readable while
+        # the run is live or after a kill), which pl.scan_ipc cannot open.
+        return pl.from_arrow(_read_columnar_table(path, None)).lazy()
+    return pl.scan_ndjson(path)
+
+
+def convert_samples(source: Path, format: str = "parquet", destination: Path | None = None, **options: Any) -> Path:
+    """Rewrite an existing samples file (typically NDJSON) in ``format``."""
+    target = destination or samples_path_for(source, format)
+    if target.resolve() == source.resolve():
+        raise ValueError(f"conversion would overwrite its source: {source}")
+    if format == "ndjson":
+        writer: Any = NdjsonSampleWriter(target)
+    else:
+        writer = ColumnarSampleWriter(target, format=format, **options)
+    # Freeze the columnar schema from many rows, not the first few.
+    if isinstance(writer, ColumnarSampleWriter):
+        writer.rows_per_flush = max(writer.rows_per_flush, 4096)
+        writer.flush_interval_s = float("inf")
+    with writer:
+        for sample in iter_samples(source):
+            writer.append(sample)
+    return target
+
+
+def parse_args(argv: list[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Qualification sample store utilities.")
+    subcommands = parser.add_subparsers(dest="command", required=True)
+    convert = subcommands.add_parser("convert", help="Convert an NDJSON samples file to a columnar format")
+    convert.add_argument("source", type=Path)
+    convert.add_argument("--format", choices=FORMATS, default="parquet")
+    convert.add_argument("--output", type=Path, default=None)
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str]) -> int:
+    args = parse_args(argv)
+    if args.command == "convert":
+        try:
+            target = convert_samples(args.source, args.format, args.output)
+        except (RuntimeError, ValueError, OSError) as exc:
+            print(f"sample_store: {exc}", file=sys.stderr)
+            return 1
+        before = args.source.stat().st_size
+        after = target.stat().st_size
+        print(f"{args.source} -> {target} ({before} -> {after} bytes)")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main(sys.argv[1:]))
@@ -32,12 +32,15 @@ def _write_pub(pub_dir: Path, nodes: list[dict], edges: list[dict]) -> None:
 
 
 def test_content_hash_excludes_injected_fields() -> None:
-    base = {"id": "A", "title": "x"}
-    injected = {"id": "A", "title": "x", "publication_id": "pub-999", "human_only": True}
-    assert mb.row_content_hash(base) == mb.row_content_hash(injected), (
+    base = pa.record_batch({"id": ["A"], "title": ["x"]})
+    injected = pa.record_batch(
+        {"id": ["A"], "title": ["x"], "publication_id": ["pub-999"], "human_only": [True]}
+    )
+    changed = pa.record_batch({"id": ["A"], "title": ["y"]})
+    assert mb.content_hashes(base) == mb.content_hashes(injected), (
         "injected publication fields must not change the content hash"
     )
-    assert mb.row_content_hash(base) != mb.row_content_hash({"id": "A", "title": "y"})
+    assert mb.content_hashes(base) != mb.content_hashes(changed)
 
 
 def test_incremental_emits_merge_skip_and_delete() -> None:
@@ -0,0 +1,59 @@
+"""Publication dirs for the Memgraph script tests (requires pyarrow)."""
+
+import json
+import math
+from pathlib import Path
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+
+def write_tables(pub_dir: Path, nodes: pa.Table, edges: pa.Table, manifest: dict, *, row_group_size: int) -> None:
+    pub_dir.mkdir(parents=True, exist_ok=True)
+    pq.write_table(nodes, pub_dir / "nodes.parquet", row_group_size=row_group_size)
+    pq.write_table(edges, pub_dir / "edges.parquet", row_group_size=row_group_size)
+    (pub_dir / "manifest.json").write_text(json.dumps(manifest))
+
+
+def write_publication(
+    pub_dir: Path,
+    node_count: int,
+    *,
+    title_suffix: str = "",
+    drop_last: int = 0,
+    nonfinite: bool = True,
+    row_group_size: int = 17,
+) -> None:
+    """Awkward labels, titles, floats and relation types across small row groups.
+
+    ``drop_last`` leaves out the last nodes (and their edges), for a prior
+    that loses rows. ``nonfinite=False`` keeps NaN and infinities out of
+    ``score``: the Bolt loader omits them where the cypherl writes null.
+    """
+    scores = [0.1, math.nan, math.inf, 3.0, None, 1e-7] if nonfinite else [0.1, 0.25, 2.5, 3.0, None, 1e-7]
+    labels = ["File", "Symbol", None, "", "weird label!", "9lives", "Symbol", "Symbol"]
+    titles = ["plain", "it's", "back\\slash", "line\nbreak\r", "émoji ✓", None, "", "{brace}"]
+    count = node_count - drop_last
+    nodes = pa.table(
+        {
+            "id": [f"n{index}" for index in range(count)],
+            "label": [labels[index % len(labels)] for index in range(count)],
+            "title": [
+                None if titles[index % 7] is None else titles[index % 7] + title_suffix for index in range(count)
+            ],
+            "rank": pa.array([index if index % 5 else None for index in range(count)], pa.int64()),
+            "score": [scores[index % len(scores)] for index in range(count)],
+            "hot": [None if index % 4 == 0 else index % 3 == 0 for index in range(count)],
+            "publication_id": [None] * count,
+        }
+    )
+    relations = ["calls", None, "CONTAINS", "depends-on", ""]
+    edges = pa.table(
+        {
+            "from_id": [f"n{index}" for index in range(count)],
+            "to_id": [f"n{(index * 7) % count}" for index in range(count)],
+            "relation_type": [relations[index % len(relations)] for index in range(count)],
+            "project_code": [None if index % 2 else "AXO" for index in range(count)],
+        }
+    )
+    write_tables(pub_dir, nodes, edges, {"publication_id": "pub-it's"}, row_group_size=row_group_size)
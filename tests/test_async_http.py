@@ -0,0 +1,60 @@
+import asyncio
+import importlib.util
+import sys
+import unittest
+from pathlib import Path
+
+
+MODULE_PATH = Path(__file__).resolve().parents[1] / "scripts" / "async_http.py"
+SPEC = importlib.util.spec_from_file_location("async_http", MODULE_PATH)
+MODULE = importlib.util.module_from_spec(SPEC)
+assert SPEC is not None and SPEC.loader is not None
+sys.modules[SPEC.name] = MODULE
+SPEC.loader.exec_module(MODULE)
+
+
+def _parse(raw: bytes, read_size: int = MODULE.READ_SIZE):
+    async def run():
+        reader = asyncio.StreamReader()
+        reader.feed_data(raw)
+        reader.feed_eof()
+        status, reason, headers = await MODULE.read_http_head(reader)
+        pieces = [
+            piece async for piece in MODULE.iter_http_body(reader, status, headers, read_size=read_size)
+        ]
+        return status, reason, headers, pieces, await reader.read()
+
+    return asyncio.run(run())
+
+
+class AsyncHttpTests(unittest.TestCase):
+    def test_chunked_body_is_dechunked_in_bounded_pieces(self) -> None:
+        raw = b"HTTP/1.1 200 OK\r\nTransfer-Encoding: chunked\r\n\r\n5;ext=1\r\nhello\r\n3\r\n!!!\r\n0\r\nX-Trailer: 1\r\n\r\nNEXT"
+
+        status, reason, headers, pieces, rest = _parse(raw, read_size=2)
+
+        self.assertEqual((status, reason, headers["transfer-encoding"]), (200, "OK", "chunked"))
+        self.assertEqual(b"".join(pieces), b"hello!!!")
+        self.assertTrue(all(len(piece) <= 2 for piece in pieces))
+        # The framed end leaves the next response on the connection untouched.
+        self.assertEqual(rest, b"NEXT")
+
+    def test_content_length_and_read_to_close_framing(self) -> None:
+        _, _, _, pieces, rest = _parse(b"HTTP/1.1 200 OK\r\nContent-Length: 4\r\n\r\nbodyNEXT")
+        self.assertEqual((b"".join(pieces), rest), (b"body", b"NEXT"))
+
+        _, _, _, pieces, _ = _parse(b"HTTP/1.0 200 OK\r\n\r\nuntil close")
+        self.assertEqual(b"".join(pieces), b"until close")
+
+        _, _, _, pieces, rest = _parse(b"HTTP/1.1 204 No Content\r\n\r\nNEXT")
+        self.assertEqual((pieces, rest), ([], b"NEXT"))
+
+    def test_truncated_body_and_bad_status_line_raise(self) -> None:
+        with self.assertRaises(asyncio.IncompleteReadError):
+            _parse(b"HTTP/1.1 200 OK\r\nContent-Length: 10\r\n\r\nshort")
+        with self.assertRaises(ConnectionResetError):
+            _parse(b"garbage\r\n\r\n")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,123 @@
+import importlib.util
+import json
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+
+SCRIPTS = Path(__file__).resolve().parents[1] / "scripts"
+sys.path.insert(0, str(SCRIPTS))
+MODULE_PATH = SCRIPTS / "file_indexed_log.py"
+SPEC = importlib.util.spec_from_file_location("file_indexed_log", MODULE_PATH)
+MODULE = importlib.util.module_from_spec(SPEC)
+assert SPEC is not None and SPEC.loader is not None
+sys.modules[SPEC.name] = MODULE
+SPEC.loader.exec_module(MODULE)
+
+
+def stamps(queue_parse_us: int, commit_us: int = 5, *, t0: int = 1_000_000) -> dict[str, int]:
+    """t0..t4 as the runtime stamps them (microseconds since the epoch)."""
+    t2 = t0 + 300
+    return {"t0": t0, "t1": t0 + 100, "t2": t2, "t3": t2 + queue_parse_us, "t4": t2 + queue_parse_us + commit_us}
+
+
+def event_line(index: int, queue_parse_us: int) -> str:
+    payload = {
+        "FileIndexed": {
+            "path": f"/repo/src/file_{index}.rs",
+            "error_reason": "brace } in a string {",
+            "trace_id": f"trace-{index}",
+            **stamps(queue_parse_us),
+        }
+    }
+    return f"2026-10-17T10:00:{index:02d}Z INFO bridge event={json.dumps(payload)} trailing}}"
+
+
+class FileIndexedFollowerTests(unittest.TestCase):
+    def test_decoder_ignores_prefixes_braces_in_strings_and_noise(self) -> None:
+        event = MODULE.decode_file_indexed(event_line(3, 700))
+
+        self.assertEqual(MODULE.event_latencies(event)["queue_parse_us"], 700)
+        self.assertEqual(event["error_reason"], "brace } in a string {")
+        self.assertIsNone(MODULE.decode_file_indexed('INFO {"ScanStarted": {"total_files": 3}}'))
+        self.assertIsNone(MODULE.decode_file_indexed('WARN {"FileIndexed": {"path": "cut'))
+
+    def test_file_source_decodes_each_event_once_across_partial_writes(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            log = Path(tmp) / "indexer.log"
+            log.write_text("boot\n")
+            seen = []
+            follower = MODULE.FileIndexedFollower(
+                MODULE.FileLogSource(log, from_start=False), observers=[seen.append]
+            )
+
+            first, second = event_line(1, 100), event_line(2, 200)
+            with log.open("a") as handle:
+                handle.write(first + "\n" + second[:40])
+            self.assertEqual(follower.poll(), 1)
+            with log.open("a") as handle:
+                handle.write(second[40:] + "\n")
+            self.assertEqual(follower.poll(), 1)
+            self.assertEqual(follower.poll(), 0)
+
+            log.write_text(event_line(3, 250) + "\n")
+            self.assertEqual(follower.poll(), 1)
+
+        stats = follower.stats()
+        self.assertEqual([event["trace_id"] for event in seen], ["trace-1", "trace-2", "trace-3"])
+        self.assertEqual(stats["parsed_file_indexed_events"], 3)
+        self.assertEqual(stats["max_us"]["queue_parse_us"], 250)
+        self.assertEqual(stats["max_us"]["total_us"], 555)
+        self.assertEqual(stats["latency_us"]["queue_parse_us"]["p50"], 200)
+        self.assertEqual(stats["latency_us"]["dispatch_us"]["count"], 3)
+        self.assertEqual(follower.source.restarts, 1)
+
+    def test_endpoint_window_resumes_after_anchor_and_counts_gaps(self) -> None:
+        source = MODULE.ProcessComposeLogSource(ports=(), anchor_lines=2)
+        lines = [f"line {index}" for index in range(10)]
+
+        self.assertEqual(source.unseen(lines[:4]), lines[:4])
+        self.assertEqual(source.unseen(lines[2:7]), lines[4:7])
+        self.assertEqual(source.unseen(lines[2:7]), [])
+        self.assertEqual(source.gaps, 0)
+        self.assertEqual(source.unseen(lines[8:10]), lines[8:10])
+        self.assertEqual(source.gaps, 1)
+
+    def test_breakdown_groups_by_parser_class_and_size_bucket(self) -> None:
+        breakdown = MODULE.IngestCostBreakdown()
+        follower = MODULE.FileIndexedFollower(MODULE.FileLogSource("/nonexistent"), observers=[breakdown])
+        with tempfile.TemporaryDirectory() as tmp:
+            # FileIndexed carries no size: it is read from the file on disk.
+            sizes = {"a.rs": 1000, "b.RS": 3000, "big.rs": 65 * 1024}
+            for name, size in sizes.items():
+                (Path(tmp) / name).write_bytes(b"x" * size)
+            events = [
+                {"path": f"{tmp}/a.rs", **stamps(100, 100)},
+                {"path": f"{tmp}/b.RS", "status": "indexed", **stamps(200, 0)},
+                {"path": f"{tmp}/big.rs", **stamps(900, 100)},
+                # Deleted since; the runtime sends 0 for stamps it did not take.
+                {"path": f"{tmp}/Makefile", **stamps(50, 50), "t0": 0, "t1": 0},
+            ]
+            follower.feed(f"x {json.dumps({'FileIndexed': event})}" for event in events)
+
+        rows = {(row["parser_class"], row["size_bucket"]): row for row in breakdown.table()}
+
+        self.assertEqual(
+            [(row["parser_class"], row["size_bucket"]) for row in breakdown.table()],
+            [("rs", "small"), ("rs", "tiny"), ("unknown", "unknown")],
+        )
+        tiny = rows[("rs", "tiny")]
+        self.assertEqual(tiny["files"], 2)
+        self.assertEqual(tiny["bytes"], 4000)
+        self.assertEqual(tiny["throughput_bytes_per_s"], 10_000_000.0)
+        self.assertEqual(tiny["queue_parse_us"]["total"], 300)
+        self.assertEqual(tiny["commit_us"]["total"], 100)
+        self.assertEqual(rows[("unknown", "unknown")]["total_us"]["count"], 0)
+        self.assertEqual(tiny["statuses"], {"indexed": 1, "unknown": 1})
+        self.assertEqual(rows[("rs", "small")]["service_share"], round(1000 / 1500, 4))
+        self.assertIsNone(rows[("unknown", "unknown")]["throughput_bytes_per_s"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,137 @@
+import ctypes
+import importlib.util
+import sys
+import unittest
+from pathlib import Path
+
+
+MODULE_PATH = Path(__file__).resolve().parents[1] / "scripts" / "lib" / "gpu_nvml.py"
+SPEC = importlib.util.spec_from_file_location("gpu_nvml", MODULE_PATH)
+MODULE = importlib.util.module_from_spec(SPEC)
+assert SPEC is not None and SPEC.loader is not None
+sys.modules[SPEC.name] = MODULE
+SPEC.loader.exec_module(MODULE)
+
+MIB = 1024 * 1024
+
+
+class _FakeNvml:
+    """Stands in for a ctypes.CDLL of libnvidia-ml; counts every call."""
+
+    def __init__(self, *, handle_status: int = 0) -> None:
+        self.calls: dict[str, int] = {}
+        self.handle_status = handle_status
+        self.memory_status = 0
+        self.used_mb = 1024
+
+    def _count(self, name: str) -> None:
+        self.calls[name] = self.calls.get(name, 0) + 1
+
+    def __getattr__(self, name: str):
+        handlers = {
+            "nvmlInit_v2": lambda: 0,
+            "nvmlShutdown": lambda: 0,
+            "nvmlDeviceGetHandleByIndex_v2": self._handle,
+            "nvmlDeviceGetMemoryInfo": self._memory,
+            "nvmlDeviceGetUtilizationRates": self._utilization,
+            "nvmlDeviceGetName": self._name,
+            "nvmlDeviceGetPowerUsage": self._power,
+            "nvmlDeviceGetEnforcedPowerLimit": self._power_limit,
+        }
+        if name not in handlers:
+            raise AttributeError(name)
+        handler = handlers[name]
+
+        def call(*args):
+            self._count(name)
+            return handler(*args)
+
+        return call
+
+    def _handle(self, index, ref) -> int:
+        ref._obj.value = 0x1000 + index
+        return self.handle_status
+
+    def _memory(self, device, ref) -> int:
+        ref._obj.total = 8192 * MIB
+        ref._obj.used = self.used_mb * MIB
+        ref._obj.free = (8192 - self.used_mb) * MIB
+        return self.memory_status
+
+    def _utilization(self, device, ref) -> int:
+        ref._obj.gpu = 42
+        ref._obj.memory = 17
+        return 0
+
+    def _name(self, device, buffer, size) -> int:
+        ctypes.memmove(buffer, b"Fake RTX\0", 9)
+        return 0
+
+    def _power(self, device, ref) -> int:
+        ref._obj.value = 123_456
+        return 0
+
+    def _power_limit(self, device, ref) -> int:
+        ref._obj.value = 250_000
+        return 0
+
+
+class NvmlSamplerTests(unittest.TestCase):
+    def test_sampler_initialises_once_and_caches_static_facts(self) -> None:
+        fake = _FakeNvml()
+        with MODULE.NvmlSampler(0, loader=lambda _path: fake, candidates=["fake-nvml"]) as sampler:
+            first = sampler.sample()
+            fake.used_mb = 2048
+            second = sampler.sample()
+
+        self.assertEqual(fake.calls["nvmlInit_v2"], 1)
+        self.assertEqual(fake.calls["nvmlShutdown"], 1)
+        self.assertEqual(fake.calls["nvmlDeviceGetHandleByIndex_v2"], 1)
+        self.assertEqual(fake.calls["nvmlDeviceGetName"], 1)
+        self.assertEqual(fake.calls["nvmlDeviceGetMemoryInfo"], 2)
+        self.assertEqual(set(first), set(MODULE.KEYS))
+        self.assertEqual(first["name"], "Fake RTX")
+        self.assertEqual(first["library"], "fake-nvml")
+        self.assertEqual((first["memory_used_mb"], second["memory_used_mb"]), (1024, 2048))
+        self.assertEqual(second["utilization_gpu"], 42)
+        self.assertEqual(second["power_w"], 123.456)
+        self.assertEqual(second["power_limit_w"], 250.0)
+        self.assertIsNone(second["temperature_c"])
+
+    def test_failed_open_never_raises_and_backs_off(self) -> None:
+        now = [0.0]
+        attempts = []
+
+        def loader(path):
+            attempts.append(path)
+            raise OSError("no libnvidia-ml")
+
+        sampler = MODULE.NvmlSampler(0, loader=loader, candidates=["a", "b"], retry_interval_s=5, clock=lambda: now[0])
+        self.assertEqual(sampler.sample(), {"available": False, "source": "nvml", "error": "OSError"})
+        self.assertFalse(sampler.sample()["available"])
+        self.assertEqual(attempts, ["a", "b"])
+        now[0] = 6.0
+        sampler.sample()
+        self.assertEqual(attempts, ["a", "b", "a", "b"])
+
+    def test_handle_failure_shuts_down_and_sample_failure_reopens(self) -> None:
+        broken = _FakeNvml(handle_status=1)
+        sampler = MODULE.NvmlSampler(0, loader=lambda _path: broken, candidates=["x"], retry_interval_s=0)
+        self.assertEqual(sampler.sample()["error"], "nvml_device_handle_failed")
+        self.assertEqual(broken.calls["nvmlShutdown"], 1)
+
+        fake = _FakeNvml()
+        sampler = MODULE.NvmlSampler(0, loader=lambda _path: fake, candidates=["x"], retry_interval_s=0)
+        self.assertTrue(sampler.sample()["available"])
+        fake.memory_status = 15  # NVML_ERROR_GPU_IS_LOST
+        self.assertEqual(sampler.sample()["error"], "nvml_memory_info_failed")
+        self.assertFalse(sampler.is_open)
+        fake.memory_status = 0
+        self.assertTrue(sampler.sample()["available"])
+        self.assertEqual(sampler.opens, 2)
+        sampler.close()
+        self.assertEqual(fake.calls["nvmlInit_v2"], fake.calls["nvmlShutdown"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,82 @@
+import importlib.util
+import json
+import random
+import sys
+import unittest
+from pathlib import Path
+
+
+MODULE_PATH = Path(__file__).resolve().parents[1] / "scripts" / "latency_histogram.py"
+SPEC = importlib.util.spec_from_file_location("latency_histogram", MODULE_PATH)
+MODULE = importlib.util.module_from_spec(SPEC)
+assert SPEC is not None and SPEC.loader is not None
+sys.modules[SPEC.name] = MODULE
+SPEC.loader.exec_module(MODULE)
+
+
+def exact_nearest_rank(values, q):
+    ordered = sorted(values)
+    rank = max(1, -(-len(ordered) * q // 1))
+    return ordered[int(rank) - 1]
+
+
+class LatencyHistogramTests(unittest.TestCase):
+    def test_small_integer_latencies_are_exact(self) -> None:
+        values = [40, 55, 65, 120, 250]
+        histogram = MODULE.histogram_of(values)
+
+        self.assertEqual(histogram.value_at(0.50), 65)
+        self.assertEqual(histogram.value_at(0.95), 250)
+        self.assertEqual(histogram.value_at(0.0), 40)
+        self.assertEqual(histogram.value_at(1.0), 250)
+        self.assertEqual(histogram.count, 5)
+        self.assertAlmostEqual(histogram.mean(), 106.0)
+
+    def test_large_values_stay_within_relative_error_bound(self) -> None:
+        rng = random.Random(7)
+        values = [rng.lognormvariate(6, 1.5) for _ in range(20_000)]
+        histogram = MODULE.histogram_of(values, resolution=0.001)
+        bound = 1 / 2 ** (MODULE.DEFAULT_SUB_BUCKET_BITS - 1)
+
+        for q in (0.5, 0.9, 0.95, 0.99, 0.999):
+            expected = exact_nearest_rank(values, q)
+            self.assertLessEqual(abs(histogram.value_at(q) - expected) / expected, bound, q)
+        self.assertLess(len(histogram.counts), 4_000)
+
+    def test_merged_snapshots_match_single_histogram_exactly(self) -> None:
+        rng = random.Random(11)
+        left = [rng.randint(0, 50_000) for _ in range(3_000)]
+        right = [rng.randint(0, 5_000) for _ in range(1_000)]
+        combined = MODULE.histogram_of(left + right)
+
+        snapshots = [
+            json.loads(json.dumps(MODULE.histogram_of(left).to_dict())),
+            json.loads(json.dumps(MODULE.histogram_of(right).to_dict())),
+        ]
+        merged = MODULE.merge_snapshots(snapshots)
+
+        self.assertEqual(merged.to_dict(), combined.to_dict())
+        for q in MODULE.DEFAULT_PERCENTILES:
+            self.assertEqual(merged.value_at(q), combined.value_at(q))
+
+    def test_merge_rejects_incompatible_layouts(self) -> None:
+        with self.assertRaises(ValueError):
+            MODULE.LatencyHistogram(resolution=1.0).merge(MODULE.LatencyHistogram(resolution=0.1))
+
+    def test_empty_histogram_and_negative_values(self) -> None:
+        histogram = MODULE.LatencyHistogram()
+
+        self.assertIsNone(histogram.value_at(0.95))
+        self.assertEqual(histogram.summary()["count"], 0)
+        with self.assertRaises(ValueError):
+            histogram.record(-1)
+
+    def test_summary_uses_stable_percentile_labels(self) -> None:
+        summary = MODULE.histogram_of([1, 2, 3]).summary((0.5, 0.999))
+
+        self.assertIn("p50", summary)
+        self.assertIn("p99_9", summary)
+
+
+if __name__ == "__main__":
+    unittest.main()
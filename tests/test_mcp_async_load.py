@@ -0,0 +1,183 @@
+import asyncio
+import http.server
+import importlib.util
+import json
+import sys
+import threading
+import time
+import unittest
+import urllib.error
+from pathlib import Path
+
+
+SCRIPTS_DIR = Path(__file__).resolve().parents[1] / "scripts"
+sys.path.insert(0, str(SCRIPTS_DIR))
+MODULE_PATH = SCRIPTS_DIR / "mcp_async_load.py"
+SPEC = importlib.util.spec_from_file_location("mcp_async_load", MODULE_PATH)
+MODULE = importlib.util.module_from_spec(SPEC)
+assert SPEC is not None and SPEC.loader is not None
+sys.modules[SPEC.name] = MODULE
+SPEC.loader.exec_module(MODULE)
+
+
+class _JsonHandler(http.server.BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self) -> None:  # noqa: N802 - stdlib hook name
+        length = int(self.headers.get("Content-Length", "0"))
+        payload = json.loads(self.rfile.read(length))
+        self.server.connections.add(self.client_address)
+        if self.server.delay_s:
+            time.sleep(self.server.delay_s)
+        if self.server.status >= 400:
+            self.send_response(self.server.status)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        body = json.dumps({"jsonrpc": "2.0", "id": payload.get("id"), "result": {"echo": payload}}).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        if self.server.chunked:
+            self.send_header("Transfer-Encoding", "chunked")
+            self.end_headers()
+            for start in range(0, len(body), 7):
+                piece = body[start : start + 7]
+                self.wfile.write(f"{len(piece):x}\r\n".encode("ascii") + piece + b"\r\n")
+            self.wfile.write(b"0\r\n\r\n")
+        else:
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+    def log_message(self, format, *args) -> None:  # noqa: A002 - stdlib signature
+        return None
+
+
+class _StandInServer:
+    def __init__(self, *, delay_s: float = 0.0, chunked: bool = False, status: int = 200) -> None:
+        self.delay_s = delay_s
+        self.chunked = chunked
+        self.status = status
+
+    def __enter__(self):
+        self.server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), _JsonHandler)
+        self.server.daemon_threads = True
+        self.server.delay_s = self.delay_s
+        self.server.chunked = self.chunked
+        self.server.status = self.status
+        self.server.connections = set()
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        return self
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.server.server_address[1]}/mcp"
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.server.shutdown()
+        self.server.server_close()
+
+
+def _requests():
+    counter = 0
+
+    def next_request():
+        nonlocal counter
+        counter += 1
+        return f"req-{counter}", {"jsonrpc": "2.0", "id": counter, "method": "tools/list"}
+
+    return next_request
+
+
+class McpAsyncLoadTests(unittest.TestCase):
+    def test_closed_loop_reuses_one_connection_per_worker(self) -> None:
+        outcomes = []
+        with _StandInServer() as stand_in:
+            asyncio.run(
+                MODULE.run_closed_loop(
+                    url=stand_in.url,
+                    next_request=_requests(),
+                    concurrency=8,
+                    duration_s=0.3,
+                    timeout_s=5,
+                    record=outcomes.append,
+                )
+            )
+            connections = len(stand_in.server.connections)
+
+        self.assertGreater(len(outcomes), 8)
+        self.assertTrue(all(outcome.error is None for outcome in outcomes))
+        self.assertEqual(connections, 8)
+        self.assertEqual({outcome.worker for outcome in outcomes}, set(range(8)))
+        self.assertTrue(all(outcome.latency_ms == outcome.service_ms for outcome in outcomes))
+
+    def test_open_loop_charges_queueing_to_latency(self) -> None:
+        outcomes = []
+        # One connection, 50 ms service, 100 req/s target: the schedule runs
+        # ahead of the server, so corrected latency must grow past service time.
+        with _StandInServer(delay_s=0.05) as stand_in:
+            asyncio.run(
+                MODULE.run_open_loop(
+                    url=stand_in.url,
+                    next_request=_requests(),
+                    rate=100,
+                    concurrency=1,
+                    duration_s=0.2,
+                    timeout_s=5,
+                    record=outcomes.append,
+                )
+            )
+
+        self.assertEqual(len(outcomes), 20)
+        self.assertTrue(all(outcome.error is None for outcome in outcomes))
+        last = max(outcomes, key=lambda outcome: outcome.intended_at)
+        self.assertGreater(last.latency_ms, last.service_ms + 500)
+        intended = sorted(outcome.intended_at for outcome in outcomes)
+        self.assertAlmostEqual(intended[-1] - intended[0], 0.19, delta=0.05)
+
+    def test_connection_decodes_chunked_responses(self) -> None:
+        async def scenario():
+            conn = MODULE.AsyncJsonConnection(stand_in.url)
+            try:
+                return [await conn.post({"id": index}) for index in range(3)]
+            finally:
+                await conn.close()
+
+        with _StandInServer(chunked=True) as stand_in:
+            responses = asyncio.run(scenario())
+
+        self.assertEqual([response["id"] for response in responses], [0, 1, 2])
+
+    def test_http_errors_and_timeouts_use_urllib_exception_types(self) -> None:
+        outcomes = []
+        with _StandInServer(status=503) as stand_in:
+            asyncio.run(
+                MODULE.run_closed_loop(
+                    url=stand_in.url,
+                    next_request=_requests(),
+                    concurrency=1,
+                    duration_s=0.05,
+                    timeout_s=5,
+                    record=outcomes.append,
+                )
+            )
+        self.assertIsInstance(outcomes[0].error, urllib.error.HTTPError)
+        self.assertEqual(outcomes[0].error.code, 503)
+
+        outcomes = []
+        with _StandInServer(delay_s=0.3) as stand_in:
+            asyncio.run(
+                MODULE.run_closed_loop(
+                    url=stand_in.url,
+                    next_request=_requests(),
+                    concurrency=1,
+                    duration_s=0.05,
+                    timeout_s=0.05,
+                    record=outcomes.append,
+                )
+            )
+        self.assertIsInstance(outcomes[0].error, TimeoutError)
+
+
+if __name__ == "__main__":
+    unittest.main()
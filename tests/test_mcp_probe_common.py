@@ -1,6 +1,8 @@
+import http.server
 import importlib.util
 import json
 import sys
+import threading
 import unittest
 from pathlib import Path
 
@@ -28,6 +30,77 @@ class _FakeResponse:
         return None
 
 
+class _KeepAliveHandler(http.server.BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self) -> None:  # noqa: N802 - stdlib hook name
+        length = int(self.headers.get("Content-Length", "0"))
+        payload = json.loads(self.rfile.read(length) or b"null")
+        self.server.seen.append(
+            {
+                "path": self.path,
+                "port": self.client_address[1],
+                "protocol": self.headers.get("MCP-Protocol-Version"),
+                "payload": payload,
+            }
+        )
+        if isinstance(payload, list) and self.server.reject_batches:
+            body = b"expected a JSON object"
+            self.send_response(422)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+            return
+        if self.path == "/sql":
+            body = json.dumps([["AXO::main", "main"]]).encode("utf-8")
+        elif isinstance(payload, list):
+            body = json.dumps(
+                [
+                    {"jsonrpc": "2.0", "id": item["id"], "result": {"data": {"tool": item["params"]["name"]}}}
+                    for item in reversed(payload)
+                    if "id" in item
+                ]
+            ).encode("utf-8")
+        elif isinstance(payload, dict) and payload.get("method") == "notifications/initialized":
+            body = b""
+        elif isinstance(payload, dict) and payload.get("method") == "initialize":
+            body = json.dumps({"jsonrpc": "2.0", "id": 1, "result": {"protocolVersion": "2025-06-18"}}).encode("utf-8")
+        else:
+            body = json.dumps({"jsonrpc": "2.0", "id": 1, "result": {"data": {"ok": True}}}).encode("utf-8")
+        self.send_response(202 if not body else 200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        if isinstance(payload, dict) and payload.get("method") == "initialize":
+            self.send_header("MCP-Protocol-Version", "2025-06-18")
+        self.end_headers()
+        self.wfile.write(body)
+        if self.server.drop_after_response:
+            self.server.drop_after_response = False
+            self.close_connection = True
+
+    def log_message(self, format, *args) -> None:  # noqa: A002 - stdlib signature
+        return None
+
+
+class _StandInServer:
+    def __enter__(self):
+        self.server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), _KeepAliveHandler)
+        self.server.seen = []
+        self.server.drop_after_response = False
+        self.server.reject_batches = False
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+        return self
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.server.server_address[1]}/mcp"
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.server.shutdown()
+        self.server.server_close()
+
+
 class McpProbeCommonTests(unittest.TestCase):
     def test_rpc_call_rejects_empty_body_by_default(self) -> None:
         original_urlopen = MODULE.urllib.request.urlopen
@@ -130,6 +203,86 @@ class McpProbeCommonTests(unittest.TestCase):
 
         self.assertEqual(seen_headers.get("Mcp-protocol-version"), "2025-11-25")
 
+    def test_session_reuses_one_connection_and_keeps_protocol(self) -> None:
+        with _StandInServer() as stand_in:
+            with MODULE.open_session(stand_in.url, 5, "measure_test") as session:
+                _, first = session.call_tool("status", {"mode": "brief"})
+                _, second = session.call_tool("query", {"query": "main"})
+                rows = session.sql_query("SELECT 1")
+            seen = stand_in.server.seen
+
+        self.assertEqual(session.protocol_version, "2025-06-18")
+        self.assertEqual(session.connections_opened, 1)
+        self.assertEqual(len({item["port"] for item in seen}), 1)
+        self.assertEqual([item["path"] for item in seen], ["/mcp", "/mcp", "/mcp", "/mcp", "/sql"])
+        self.assertIsNone(seen[0]["protocol"])
+        self.assertEqual(seen[2]["protocol"], "2025-06-18")
+        self.assertEqual(first["result"]["data"], {"ok": True})
+        self.assertEqual(second["result"]["data"], {"ok": True})
+        self.assertEqual(rows, [["AXO::main", "main"]])
+        self.assertNotIn(stand_in.url, MODULE.NEGOTIATED_PROTOCOL_BY_URL)
+
+    def test_session_reconnects_after_server_drops_idle_connection(self) -> None:
+        with _StandInServer() as stand_in:
+            session = MODULE.McpSession(stand_in.url, 5)
+            stand_in.server.drop_after_response = True
+            session.call_tool("status", {})
+            _, response = session.call_tool("status", {})
+            session.close()
+
+        self.assertEqual(response["result"]["data"], {"ok": True})
+        self.assertEqual(session.connections_opened, 2)
+
+    def test_discover_symbol_probe_uses_session_sql_path(self) -> None:
+        with _StandInServer() as stand_in:
+            with MODULE.McpSession(stand_in.url, 5) as session:
+                probe = MODULE.discover_symbol_probe(stand_in.url, 5, "AXO", session=session)
+
+        self.assertEqual(probe, {"symbol": "main", "exact_symbol": "AXO::main"})
+
+    def test_rpc_batch_sends_one_array_and_restores_caller_ids(self) -> None:
+        payloads = [
+            MODULE.tool_call_payload("status", {"mode": "brief"}),
+            MODULE.tool_call_payload("query", {"query": "main"}),
+            MODULE.tool_call_payload("inspect", {"symbol": "main"}),
+        ]
+        with _StandInServer() as stand_in:
+            with MODULE.McpSession(stand_in.url, 5) as session:
+                outcomes = session.rpc_batch(payloads)
+            seen = stand_in.server.seen
+
+        self.assertEqual(len(seen), 1)
+        self.assertIsInstance(seen[0]["payload"], list)
+        self.assertTrue(session.batch_supported)
+        self.assertEqual(
+            [response["result"]["data"]["tool"] for _, response in outcomes],
+            ["status", "query", "inspect"],
+        )
+        self.assertEqual([response["id"] for _, response in outcomes], [1, 1, 1])
+        self.assertEqual(len({latency for latency, _ in outcomes}), 1)
+
+    def test_rpc_batch_falls_back_to_sequential_calls_when_rejected(self) -> None:
+        payloads = [
+            MODULE.tool_call_payload("status", {}),
+            MODULE.tool_call_payload("query", {}),
+        ]
+        with _StandInServer() as stand_in:
+            stand_in.server.reject_batches = True
+            with MODULE.McpSession(stand_in.url, 5) as session:
+                first = session.rpc_batch(payloads)
+                second = session.rpc_batch(payloads)
+            seen = stand_in.server.seen
+
+        self.assertFalse(session.batch_supported)
+        # One rejected array, then per-item POSTs; the rejection is remembered.
+        self.assertEqual(
+            [isinstance(item["payload"], list) for item in seen],
+            [True, False, False, False, False],
+        )
+        self.assertEqual(len(first), 2)
+        self.assertEqual(len(second), 2)
+        self.assertTrue(all(response["result"]["data"] == {"ok": True} for _, response in first))
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,315 @@
+import asyncio
+import http.server
+import importlib.util
+import json
+import os
+import sys
+import threading
+import time
+import unittest
+from pathlib import Path
+from unittest import mock
+
+
+SCRIPTS_DIR = Path(__file__).resolve().parents[1] / "scripts"
+sys.path.insert(0, str(SCRIPTS_DIR))
+MODULE_PATH = SCRIPTS_DIR / "mcp-stdio-proxy.py"
+SPEC = importlib.util.spec_from_file_location("mcp_stdio_proxy", MODULE_PATH)
+MODULE = importlib.util.module_from_spec(SPEC)
+assert SPEC is not None and SPEC.loader is not None
+sys.modules[SPEC.name] = MODULE
+SPEC.loader.exec_module(MODULE)
+
+
+class _UpstreamHandler(http.server.BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self) -> None:  # noqa: N802 - stdlib hook name
+        length = int(self.headers.get("Content-Length", "0"))
+        payload = json.loads(self.rfile.read(length))
+        self.server.connections.add(self.client_address)
+        self.server.workspaces.append(self.headers.get("X-Workspace-Path"))
+        name = (payload.get("params") or {}).get("name")
+        self.server.calls.append(name)
+        time.sleep(self.server.delays.get(name, 0.0))
+        if name in {"stream_events", "big_export"}:
+            self._stream(payload, name)
+            return
+        if "id" not in payload:
+            self.send_response(202)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        body = json.dumps({"jsonrpc": "2.0", "id": payload["id"], "result": {"tool": name}}).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _stream(self, payload, name) -> None:
+        if name == "stream_events":
+            content_type = "text/event-stream"
+            progress = {"jsonrpc": "2.0", "method": "notifications/progress", "params": {"progress": 1}}
+            final = {"jsonrpc": "2.0", "id": payload["id"], "result": {"tool": name}}
+            pieces = [
+                b": keep-alive\n\nevent: message\ndata: " + json.dumps(progress).encode("utf-8") + b"\n\n",
+                b"data: " + json.dumps(final, indent=1).replace("\n", "\ndata: ").encode("utf-8") + b"\r\n\r\n",
+            ]
+        else:
+            content_type = "application/json"
+            body = json.dumps(
+                {"jsonrpc": "2.0", "id": payload["id"], "result": {"rows": ["x" * 64] * 4000}},
+                indent=2,
+            ).encode("utf-8")
+            middle = len(body) // 2
+            pieces = [body[:middle], body[middle:]]
+        self.send_response(200)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+        for index, piece in enumerate(pieces):
+            if index:
+                time.sleep(0.3)
+            self.wfile.write(f"{len(piece):x}\r\n".encode("ascii") + piece + b"\r\n")
+            self.wfile.flush()
+        self.wfile.write(b"0\r\n\r\n")
+
+    def log_message(self, format, *args) -> None:  # noqa: A002 - stdlib signature
+        return None
+
+
+class _QuietServer(http.server.ThreadingHTTPServer):
+    def handle_error(self, request, client_address) -> None:
+        # The proxy drops connections on timeout and cancel by design.
+        return None
+
+
+class _Upstream:
+    def __init__(self, delays=None) -> None:
+        self.delays = delays or {}
+
+    def __enter__(self):
+        self.server = _QuietServer(("127.0.0.1", 0), _UpstreamHandler)
+        self.server.daemon_threads = True
+        self.server.delays = self.delays
+        self.server.connections = set()
+        self.server.workspaces = []
+        self.server.calls = []
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        return self
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.server.server_address[1]}/mcp"
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.server.shutdown()
+        self.server.server_close()
+
+
+def _call(request_id, name, arguments=None):
+    return json.dumps(
+        {
+            "jsonrpc": "2.0",
+            "id": request_id,
+            "method": "tools/call",
+            "params": {"name": name, "arguments": arguments or {}},
+        }
+    ).encode("utf-8")
+
+
+def _stats(request_id):
+    return json.dumps({"jsonrpc": "2.0", "id": request_id, "method": MODULE.STATS_METHOD}).encode("utf-8")
+
+
+def _run(config, lines, *, spacing_s=0.0, writes=None):
+    written = [] if writes is None else writes
+
+    async def source():
+        for line in lines:
+            yield line
+            await asyncio.sleep(spacing_s)
+
+    asyncio.run(MODULE.StdioProxy(config, written.append).run(source()))
+    return [json.loads(line) for line in b"".join(written).splitlines()]
+
+
+def _timed_writes():
+    writes = []
+
+    class _Recorder(list):
+        def append(self, chunk) -> None:
+            writes.append((time.monotonic(), chunk))
+            super().append(chunk)
+
+    return writes, _Recorder()
+
+
+class McpStdioProxyTests(unittest.TestCase):
+    def test_slow_tool_does_not_block_fast_one(self) -> None:
+        with _Upstream({"retrieve_context": 0.4}) as upstream:
+            config = MODULE.ProxyConfig(url=upstream.url, workspace_path="/tmp/ws")
+            started = time.monotonic()
+            responses = _run(config, [_call(1, "retrieve_context"), _call("two", "status"), b"not json\n"])
+            elapsed = time.monotonic() - started
+
+        self.assertEqual([response["id"] for response in responses], ["two", 1])
+        self.assertEqual(responses[1]["result"]["tool"], "retrieve_context")
+        self.assertLess(elapsed, 0.8)
+        self.assertEqual(set(upstream.server.workspaces), {"/tmp/ws"})
+
+    def test_sequential_requests_reuse_keep_alive_connection(self) -> None:
+        with _Upstream() as upstream:
+            config = MODULE.ProxyConfig(url=upstream.url)
+            lines = [_call(index, "status") for index in range(5)]
+            lines.append(json.dumps({"jsonrpc": "2.0", "method": "notifications/initialized"}).encode("utf-8"))
+            responses = _run(config, lines, spacing_s=0.05)
+            connections = len(upstream.server.connections)
+
+        self.assertEqual(sorted(response["id"] for response in responses), list(range(5)))
+        self.assertEqual(connections, 1)
+
+    def test_per_tool_timeout_surfaces_backend_error(self) -> None:
+        with _Upstream({"soll_export": 0.5}) as upstream:
+            config = MODULE.ProxyConfig(
+                url=upstream.url,
+                timeout_s=5,
+                tool_timeouts_s={"soll_export": 0.05},
+            )
+            responses = _run(config, [_call(7, "soll_export"), _call(8, "status")])
+
+        by_id = {response["id"]: response for response in responses}
+        self.assertEqual(by_id[7]["error"]["code"], -32000)
+        self.assertIn("timed out after 0.05s", by_id[7]["error"]["message"])
+        self.assertEqual(by_id[8]["result"]["tool"], "status")
+
+    def test_cancel_notification_drops_inflight_request(self) -> None:
+        cancel = json.dumps(
+            {"jsonrpc": "2.0", "method": "notifications/cancelled", "params": {"requestId": 3}}
+        ).encode("utf-8")
+        with _Upstream({"retrieve_context": 0.3}) as upstream:
+            config = MODULE.ProxyConfig(url=upstream.url)
+            responses = _run(config, [_call(3, "retrieve_context"), cancel], spacing_s=0.05)
+
+        self.assertEqual(responses, [])
+
+    def test_event_stream_forwards_each_event_as_it_arrives(self) -> None:
+        timings, recorder = _timed_writes()
+        with _Upstream() as upstream:
+            config = MODULE.ProxyConfig(url=upstream.url)
+            started = time.monotonic()
+            responses = _run(config, [_call(5, "stream_events")], writes=recorder)
+
+        self.assertEqual(responses[0]["method"], "notifications/progress")
+        self.assertEqual(responses[1], {"jsonrpc": "2.0", "id": 5, "result": {"tool": "stream_events"}})
+        self.assertLess(timings[0][0] - started, 0.25)
+        self.assertGreaterEqual(timings[-1][0] - timings[0][0], 0.25)
+
+    def test_chunked_json_body_is_streamed_in_bounded_pieces(self) -> None:
+        timings, recorder = _timed_writes()
+        with _Upstream() as upstream:
+            config = MODULE.ProxyConfig(url=upstream.url)
+            started = time.monotonic()
+            responses = _run(config, [_call(6, "big_export"), _call(9, "status")], writes=recorder)
+
+        self.assertEqual(sorted(response["id"] for response in responses), [6, 9])
+        big = next(response for response in responses if response["id"] == 6)
+        self.assertEqual(len(big["result"]["rows"]), 4000)
+        # The first half reaches stdout before the second (0.3s later) is sent.
+        first_big = next(at for at, chunk in timings if b'"id": 6' in chunk)
+        self.assertLess(first_big - started, 0.25)
+        self.assertTrue(all(len(chunk) <= MODULE.READ_SIZE for _, chunk in timings))
+        self.assertGreater(len(timings), 3)
+
+    def test_slow_head_does_not_hold_stdout_for_other_replies(self) -> None:
+        timings, recorder = _timed_writes()
+        with _Upstream(delays={"big_export": 0.5}) as upstream:
+            config = MODULE.ProxyConfig(url=upstream.url)
+            started = time.monotonic()
+            responses = _run(config, [_call(6, "big_export"), _call(9, "status")], spacing_s=0.05, writes=recorder)
+
+        self.assertEqual([response["id"] for response in responses], [9, 6])
+        self.assertLess(timings[0][0] - started, 0.25)
+
+    def test_unreachable_upstream_reports_unavailable(self) -> None:
+        config = MODULE.ProxyConfig(url="http://127.0.0.1:9/mcp", timeout_s=1)
+        responses = _run(config, [_call(1, "status")])
+
+        self.assertEqual(responses[0]["id"], 1)
+        self.assertEqual(responses[0]["error"]["code"], -32000)
+
+    def test_cache_serves_repeated_reads_until_a_mutation(self) -> None:
+        with _Upstream() as upstream:
+            config = MODULE.ProxyConfig(url=upstream.url, cache_ttls_s={"query": 30.0})
+            lines = [
+                _call(1, "query", {"query": "x", "limit": 5}),
+                _call(2, "query", {"limit": 5, "query": "x"}),
+                _call(3, "query", {"query": "y"}),
+                _call(4, "soll_manager", {"action": "create"}),
+                _call(5, "query", {"query": "x", "limit": 5}),
+                _call(6, "status"),
+                _stats("s"),
+            ]
+            responses = _run(config, lines, spacing_s=0.05)
+            calls = list(upstream.server.calls)
+
+        by_id = {response["id"]: response for response in responses}
+        self.assertEqual(by_id[2]["result"], {"tool": "query"})
+        self.assertEqual(calls, ["query", "query", "soll_manager", "query", "status"])
+        cache = by_id["s"]["result"]["cache"]
+        self.assertEqual((cache["hits"], cache["misses"]), (1, 3))
+        self.assertEqual(cache["entries"], 1)
+        self.assertEqual(cache["invalidations"], 2)
+
+    def test_cache_expires_entries_and_evicts_least_recent(self) -> None:
+        now = [0.0]
+        cache = MODULE.ResponseCache({"status": 2.0, "inspect": 10.0}, 2, clock=lambda: now[0])
+        status_key = cache.key("status", {}, "/ws")
+        cache.put(status_key, {"ok": 1}, cache.generation)
+        self.assertEqual(cache.get(status_key), {"ok": 1})
+        now[0] = 2.5
+        self.assertIsNone(cache.get(status_key))
+
+        keys = [cache.key("inspect", {"symbol": name}, "/ws") for name in "abc"]
+        for key in keys:
+            cache.put(key, {"symbol": key[1]}, cache.generation)
+        self.assertIsNone(cache.get(keys[0]))
+        self.assertIsNotNone(cache.get(keys[2]))
+        self.assertEqual(cache.evictions, 1)
+
+        stale_generation = cache.generation
+        cache.invalidate()
+        cache.put(keys[1], {"stale": True}, stale_generation)
+        self.assertIsNone(cache.get(keys[1]))
+        self.assertNotEqual(cache.key("status", {}, "/ws"), cache.key("status", {}, "/other"))
+
+    def test_cache_refuses_mutating_tools_and_stats_work_when_disabled(self) -> None:
+        with self.assertRaises(ValueError):
+            MODULE.ProxyConfig(url=MODULE.LIVE_MCP_URL, cache_ttls_s={"soll_apply_plan": 5.0})
+
+        config = MODULE.ProxyConfig(url="http://127.0.0.1:9/mcp")
+        responses = _run(config, [_stats(1)])
+        self.assertEqual(responses[0]["result"]["cache"], {"enabled": False})
+
+    def test_upstream_url_and_tool_timeout_resolution(self) -> None:
+        with mock.patch.dict(os.environ, {"AXON_MCP_URL": "", "AXON_INSTANCE_KIND": "dev"}):
+            self.assertEqual(MODULE.resolve_upstream_url(), MODULE.DEV_MCP_URL)
+        with mock.patch.dict(os.environ, {"AXON_MCP_URL": "http://h:1/mcp", "AXON_INSTANCE_KIND": "dev"}):
+            self.assertEqual(MODULE.resolve_upstream_url(), "http://h:1/mcp")
+            self.assertEqual(MODULE.resolve_upstream_url("http://x:2/mcp"), "http://x:2/mcp")
+        with mock.patch.dict(os.environ, {"AXON_MCP_URL": "", "AXON_INSTANCE_KIND": ""}):
+            self.assertEqual(MODULE.resolve_upstream_url(), MODULE.LIVE_MCP_URL)
+
+        self.assertEqual(
+            MODULE.parse_tool_timeouts(["retrieve_context=60, status=2", "query=1.5"]),
+            {"retrieve_context": 60.0, "status": 2.0, "query": 1.5},
+        )
+        with self.assertRaises(ValueError):
+            MODULE.parse_tool_timeouts(["retrieve_context"])
+        with self.assertRaises(ValueError):
+            MODULE.parse_tool_timeouts(["status=0"])
+
+
+if __name__ == "__main__":
+    unittest.main()
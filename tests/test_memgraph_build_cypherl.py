@@ -0,0 +1,157 @@
+import importlib.util
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+
+SCRIPTS = Path(__file__).resolve().parents[1] / "scripts"
+sys.path.insert(0, str(SCRIPTS))
+HAS_PYARROW = importlib.util.find_spec("pyarrow") is not None
+
+if HAS_PYARROW:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.parquet as pq
+
+    MODULE_PATH = SCRIPTS / "memgraph_build_cypherl.py"
+    SPEC = importlib.util.spec_from_file_location("memgraph_build_cypherl", MODULE_PATH)
+    MODULE = importlib.util.module_from_spec(SPEC)
+    assert SPEC is not None and SPEC.loader is not None
+    sys.modules[SPEC.name] = MODULE
+    SPEC.loader.exec_module(MODULE)
+    from memgraph_fixtures import write_publication
+
+
+@unittest.skipUnless(HAS_PYARROW, "pyarrow not installed")
+class StreamingEncoderTests(unittest.TestCase):
+    def build(self, root: Path, name: str, **kwargs) -> tuple[str, dict]:
+        out = root / f"{name}.cypherl"
+        queries = root / "queries"
+        queries.mkdir(exist_ok=True)
+        summary = MODULE.build_import(
+            root / "pub", out, kwargs.pop("batch_size", 4), False, queries, **kwargs
+        )
+        return out.read_text(encoding="utf-8"), summary
+
+    def assert_same_build(self, root: Path, **kwargs) -> None:
+        expected, expected_summary = self.build(root, "rows", streaming=False, **kwargs)
+        for workers in (1, 2):
+            with mock.patch.object(MODULE, "READ_BATCH_ROWS", 10):
+                actual, summary = self.build(root, f"streaming-{workers}", workers=workers, **kwargs)
+            self.assertEqual(actual, expected)
+            for key in ("nodes", "edges", "labels", "relations", "nodes_skipped", "edges_skipped"):
+                self.assertEqual(summary[key], expected_summary[key])
+        self.assertEqual(list(summary["labels"]), list(expected_summary["labels"]))
+
+    def test_streaming_output_is_byte_identical_to_row_encoder(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            write_publication(root / "pub", 61)
+            for batch_size in (1, 4, 500):
+                self.assert_same_build(root, batch_size=batch_size)
+
+    def test_incremental_streaming_output_is_byte_identical(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            write_publication(root / "prior", 50)
+            write_publication(root / "pub", 61, title_suffix="")
+            prior_nodes = pq.read_table(root / "prior" / "nodes.parquet")
+            titles = prior_nodes.column("title").to_pylist()
+            titles[3] = "changed"
+            pq.write_table(
+                prior_nodes.set_column(2, "title", pa.array(titles)), root / "prior" / "nodes.parquet"
+            )
+            self.assert_same_build(root, incremental=True, prior_publication_dir=root / "prior")
+
+    def test_columnar_diff_keeps_changed_rows_and_lists_removed_keys_in_prior_order(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            prior, current = root / "prior", root / "current"
+            prior.mkdir()
+            current.mkdir()
+            pq.write_table(
+                pa.table(
+                    {
+                        "from_id": ["a", "z", "a", "b", "y", "z"],
+                        "to_id": ["b", "a", "c", "c", "a", "a"],
+                        "relation_type": ["calls", "calls", "calls", None, "uses", "calls"],
+                        "publication_id": ["pub-1"] * 6,
+                    }
+                ),
+                prior / "edges.parquet",
+            )
+            pq.write_table(
+                pa.table(
+                    {
+                        "from_id": ["b", "a", "a"],
+                        "to_id": ["c", "b", "c"],
+                        "relation_type": ["RELATED_TO", "CALLS", "calls"],
+                        "publication_id": ["pub-2"] * 3,
+                    }
+                ),
+                current / "edges.parquet",
+                row_group_size=1,
+            )
+
+            diff = MODULE.diff_publication_file(current, prior, "edge")
+
+        self.assertEqual(diff.keep.to_pylist(), [True, True, False])
+        self.assertEqual(diff.skipped, 1)
+        self.assertEqual(diff.deleted, ["z\x1fa\x1fCALLS", "y\x1fa\x1fUSES"])
+        self.assertEqual(
+            MODULE.diff_keys(pa.record_batch({"from_id": [1], "to_id": [None]}), "edge").to_pylist(),
+            [MODULE.edge_diff_key({"from_id": 1, "to_id": None})],
+        )
+
+    def test_sidecar_merge_join_matches_rehash_and_rejects_stale_sidecars(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            write_publication(root / "prior", 50)
+            write_publication(root / "pub", 61)
+            prior_edges = pq.read_table(root / "prior" / "edges.parquet")
+            # Duplicate keys spanning several merge windows.
+            pq.write_table(pa.concat_tables([prior_edges] * 3), root / "prior" / "edges.parquet")
+
+            kinds = ("node", "edge")
+            rehashed = {kind: MODULE.diff_publication_file(root / "pub", root / "prior", kind) for kind in kinds}
+            entry = MODULE.write_hash_sidecar(root / "prior")
+            MODULE.write_hash_sidecar(root / "pub")
+            self.assertEqual(entry["rows"], {"node": 50, "edge": 150})
+            sidecar = pq.read_table(root / "prior" / MODULE.HASHES_FILE)
+            edge_keys = sidecar.filter(pc.equal(sidecar["kind"], "edge"))["key"].to_pylist()
+            self.assertEqual(edge_keys, sorted(edge_keys))
+
+            with mock.patch.object(MODULE, "HASH_MERGE_ROWS", 2), mock.patch.object(
+                MODULE, "hash_table", side_effect=AssertionError("sidecar not used")
+            ):
+                merged = {kind: MODULE.diff_publication_file(root / "pub", root / "prior", kind) for kind in kinds}
+            for kind in kinds:
+                self.assertEqual(merged[kind].keep.to_pylist(), rehashed[kind].keep.to_pylist())
+                self.assertEqual(merged[kind].skipped, rehashed[kind].skipped)
+                self.assertEqual(merged[kind].deleted, rehashed[kind].deleted)
+
+            pq.write_table(prior_edges, root / "prior" / "edges.parquet")
+            self.assertIsNone(MODULE.sidecar_hashes(root / "prior", "edge"))
+            self.assertIsNotNone(MODULE.sidecar_hashes(root / "prior", "node"))
+
+    def test_changed_mask_sets_only_changed_rows_across_byte_boundaries(self) -> None:
+        changed = pa.array([0, 7, 8, 16], pa.int64())
+        mask = MODULE.changed_mask(changed, 17)
+
+        self.assertEqual([index for index, kept in enumerate(mask.to_pylist()) if kept], [0, 7, 8, 16])
+        self.assertEqual(mask.null_count, 0)
+        self.assertEqual(MODULE.changed_mask(pa.array([], pa.int64()), 0).to_pylist(), [])
+        self.assertEqual(MODULE.row_numbers(3).to_pylist(), [0, 1, 2])
+
+    def test_all_null_rows_encode_as_empty_maps(self) -> None:
+        batch = pa.record_batch(
+            {"a": pa.array([None, "x"], pa.string()), "b": pa.array([None, None], pa.int64())}
+        )
+        maps = MODULE.encode_maps(batch, ["a", "b"]).to_pylist()
+        self.assertEqual(maps, ["  " + MODULE.cypher_map(row) for row in batch.to_pylist()])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,227 @@
+import importlib.util
+import io
+import json
+import os
+import sqlite3
+import sys
+import tempfile
+import textwrap
+import unittest
+from pathlib import Path
+from unittest import mock
+
+
+SCRIPTS = Path(__file__).resolve().parents[1] / "scripts"
+sys.path.insert(0, str(SCRIPTS))
+HAS_PYARROW = importlib.util.find_spec("pyarrow") is not None
+
+if HAS_PYARROW:
+    import pyarrow.parquet as pq
+
+    import memgraph_build_cypherl as BUILDER
+
+    if "memgraph_export_publication" in sys.modules:
+        MODULE = sys.modules["memgraph_export_publication"]
+    else:
+        MODULE_PATH = SCRIPTS / "memgraph_export_publication.py"
+        SPEC = importlib.util.spec_from_file_location("memgraph_export_publication", MODULE_PATH)
+        MODULE = importlib.util.module_from_spec(SPEC)
+        assert SPEC is not None and SPEC.loader is not None
+        sys.modules[SPEC.name] = MODULE
+        SPEC.loader.exec_module(MODULE)
+
+
+# Stand-in `psql`: runs the COPY's SELECT against a SQLite file (FAKE_PSQL_DB)
+# after a small PostgreSQL → SQLite rewrite, and logs every query to
+# FAKE_PSQL_LOG. FAKE_PSQL_FAIL makes the branch reading that table fail.
+FAKE_PSQL = textwrap.dedent(
+    """\
+    #!/usr/bin/env python3
+    import csv, hashlib, os, re, sqlite3, sys
+    assert sys.argv[sys.argv.index("-f") + 1] == "-"
+    script = sys.stdin.read()
+    match = re.fullmatch(r"COPY \\((SELECT .*)\\) TO STDOUT WITH \\(FORMAT csv, HEADER true\\);\\s*", script, re.S)
+    assert match and "UNION" not in script, script
+    query = match.group(1)
+    with open(os.environ["FAKE_PSQL_LOG"], "a") as log:
+        log.write(query.replace("\\n", " ") + "\\n")
+    if re.search(r" FROM (\\S+)", query).group(1) == os.environ.get("FAKE_PSQL_FAIL"):
+        sys.stderr.write("ERROR:  relation does not exist\\n")
+        sys.exit(1)
+    query = query.replace("E'\\\\x1f'", "char(31)")
+    query = re.sub(r"= ANY\\(ARRAY\\[(.*?)\\]::text\\[\\]\\)", r"IN (\\1)", query, flags=re.S)
+    query = query.replace("::text", "").replace("ROW(", "row_text(")
+    query = re.sub(r"\\b(soll|ist)\\.(\\w+)", r"\\1_\\2", query)
+    db = sqlite3.connect(os.environ["FAKE_PSQL_DB"])
+    db.create_function("md5", 1, lambda text: hashlib.md5(text.encode()).hexdigest())
+    db.create_function("row_text", -1, lambda *values: repr(values))
+    cursor = db.execute(query)
+    writer = csv.writer(sys.stdout, lineterminator="\\n")
+    writer.writerow([column[0] for column in cursor.description])
+    writer.writerows(["" if value is None else value for value in row] for row in cursor)
+    """
+)
+
+SCHEMA = """
+CREATE TABLE soll_Node (id TEXT, type TEXT, project_code TEXT, title TEXT, status TEXT);
+CREATE TABLE ist_Symbol (id TEXT, name TEXT, kind TEXT, project_code TEXT);
+CREATE TABLE ist_IndexedFile (path TEXT, project_code TEXT);
+CREATE TABLE soll_Edge (source_id TEXT, target_id TEXT, relation_type TEXT, project_code TEXT);
+CREATE TABLE ist_edge (source_id TEXT, target_id TEXT, relation_type TEXT, project_code TEXT, created_at_ms INTEGER);
+"""
+
+
+@unittest.skipUnless(HAS_PYARROW, "pyarrow not installed")
+class StreamingExportTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmp = tempfile.TemporaryDirectory()
+        root = Path(self.tmp.name)
+        bin_dir = root / "bin"
+        bin_dir.mkdir()
+        psql = bin_dir / "psql"
+        psql.write_text(FAKE_PSQL)
+        psql.chmod(0o755)
+        self.out_dir = root / "pub"
+        self.out_dir.mkdir()
+        self.log = root / "queries.log"
+        self.db = sqlite3.connect(root / "axon.db")
+        self.addCleanup(self.db.close)
+        self.db.executescript(SCHEMA)
+        self.db.executemany(
+            "INSERT INTO soll_Node VALUES (?, 'Requirement', 'AXO', ?, 'current')",
+            [(f"REQ-{i}", f'multi\nline, "quoted" {i}') for i in range(3)],
+        )
+        self.db.executemany(
+            "INSERT INTO ist_Symbol VALUES (?, ?, 'function', 'AXO')", [(f"sym:{i}", f"fn_{i}") for i in range(50)]
+        )
+        self.db.execute("INSERT INTO soll_Edge VALUES ('REQ-0', 'REQ-1', 'SOLVES', 'AXO')")
+        self.db.executemany(
+            "INSERT INTO ist_edge VALUES (?, ?, 'CALLS', 'AXO', ?)",
+            [(f"sym:{i}", f"sym:{i + 1}", 1000 + i) for i in range(40)],
+        )
+        self.db.commit()
+        env = mock.patch.dict(
+            os.environ,
+            {
+                "PATH": f"{bin_dir}{os.pathsep}{os.environ['PATH']}",
+                "FAKE_PSQL_DB": str(root / "axon.db"),
+                "FAKE_PSQL_LOG": str(self.log),
+            },
+        )
+        env.start()
+        self.addCleanup(env.stop)
+        self.addCleanup(self.tmp.cleanup)
+
+    def export(self, pub_id: str, *args: str) -> dict:
+        out_dir = Path(self.tmp.name) / "publications" / pub_id
+        self.log.write_text("")
+        argv = ["export", "--db-url", "postgres://fake", "--out-dir", str(out_dir), "--publication-id", pub_id]
+        with mock.patch.object(sys, "argv", argv + list(args)), mock.patch("sys.stdout", new=io.StringIO()):
+            self.assertEqual(MODULE.main(), 0)
+        return json.loads((out_dir / "manifest.json").read_text())
+
+    def test_branches_stream_into_row_groups_in_union_order(self) -> None:
+        with mock.patch.object(MODULE, "ROW_GROUP_ROWS", 16), mock.patch.object(MODULE, "COPY_BLOCK_BYTES", 256):
+            counts = MODULE.export_tables("postgres://fake", self.out_dir, jobs=3)["row_counts"]
+
+        self.assertEqual(counts, {"nodes": 53, "edges": 41})
+        nodes = pq.read_table(self.out_dir / "nodes.parquet")
+        self.assertEqual(nodes.column_names, MODULE.NODE_COLUMNS)
+        ids = nodes.column("id").to_pylist()
+        self.assertEqual(ids[:4], ["REQ-0", "REQ-1", "REQ-2", "sym:0"])
+        # Each branch arrives sorted by (label, project_code, id).
+        self.assertEqual(ids[3:], sorted(ids[3:]))
+        self.assertEqual(ids[-1], "sym:9")
+        column = pq.ParquetFile(self.out_dir / "nodes.parquet").metadata.row_group(0).column(1)
+        self.assertEqual((column.path_in_schema, column.compression), ("label", "ZSTD"))
+        self.assertTrue(any("DICTIONARY" in encoding for encoding in column.encodings))
+        self.assertEqual(nodes.column("title")[1].as_py(), 'multi\nline, "quoted" 1')
+        self.assertEqual(nodes.column("name")[0].as_py(), "")
+        edges = pq.read_table(self.out_dir / "edges.parquet")
+        self.assertEqual(edges.column("relation_type").to_pylist(), ["SOLVES"] + ["CALLS"] * 40)
+        self.assertGreater(pq.ParquetFile(self.out_dir / "edges.parquet").num_row_groups, 1)
+        self.assertFalse((self.out_dir / MODULE.PARTS_DIR).exists())
+
+    def test_failed_branch_aborts_the_export(self) -> None:
+        with mock.patch.dict(os.environ, {"FAKE_PSQL_FAIL": "ist.Symbol"}), mock.patch("sys.stderr"):
+            with self.assertRaises(SystemExit) as raised:
+                MODULE.export_tables("postgres://fake", self.out_dir, jobs=5)
+        self.assertIn("psql COPY failed", str(raised.exception))
+        self.assertFalse((self.out_dir / MODULE.PARTS_DIR).exists())
+
+    def test_since_exports_only_changed_rows_and_lists_removed_keys(self) -> None:
+        base = self.export("pub-1")
+        self.assertEqual(base["export_state"], {"file": MODULE.STATE_FILE, "rows": 94, "projects": None})
+        self.assertEqual(base["label_counts"], {"Requirement": 3, "Symbol": 50})
+        self.db.execute("UPDATE soll_Node SET title = 'retitled' WHERE id = 'REQ-1'")
+        self.db.execute("DELETE FROM ist_Symbol WHERE id = 'sym:3'")
+        self.db.execute("DELETE FROM ist_edge WHERE 'sym:3' IN (source_id, target_id)")
+        self.db.execute("INSERT INTO ist_Symbol VALUES ('sym:new', 'fn_new', 'function', 'AXO')")
+        self.db.execute("INSERT INTO ist_edge VALUES ('sym:49', 'sym:new', 'CALLS', 'AXO', 5000)")
+        # Same edge moved to another project: re-exported, never deleted.
+        self.db.execute("UPDATE ist_edge SET project_code = 'BKS', created_at_ms = 5001 WHERE source_id = 'sym:10'")
+        self.db.commit()
+
+        delta = self.export("pub-2", "--since", "pub-1")
+        queries = self.log.read_text().splitlines()
+        pub = Path(self.tmp.name) / "publications" / "pub-2"
+
+        self.assertEqual(delta["delta"], {"since": "pub-1", "file": BUILDER.DELETIONS_FILE, "deleted": {"node": 1, "edge": 2}})
+        self.assertEqual(delta["row_counts"], {"nodes": 2, "edges": 2})
+        self.assertEqual(pq.read_table(pub / "nodes.parquet").column("id").to_pylist(), ["REQ-1", "sym:new"])
+        edges = pq.read_table(pub / "edges.parquet").to_pylist()
+        self.assertEqual([(e["from_id"], e["project_code"]) for e in edges], [("sym:49", "AXO"), ("sym:10", "BKS")])
+        self.assertEqual(
+            pq.read_table(pub / BUILDER.DELETIONS_FILE).to_pylist(),
+            [
+                {"kind": "node", "key": "sym:3"},
+                {"kind": "edge", "key": "sym:2\x1fsym:3\x1fCALLS"},
+                {"kind": "edge", "key": "sym:3\x1fsym:4\x1fCALLS"},
+            ],
+        )
+        row_queries = [query for query in queries if " AS version" not in query]
+        self.assertTrue(any("created_at_ms >= 5000" in query for query in row_queries))
+        self.assertTrue(all("= ANY(ARRAY[" in query or "created_at_ms >=" in query for query in row_queries))
+
+        # The delta applies without a prior: MERGE the rows, delete the keys.
+        queries_dir = Path(self.tmp.name) / "queries"
+        queries_dir.mkdir()
+        out = Path(self.tmp.name) / "delta.cypherl"
+        summary = BUILDER.build_import(pub, out, 100, False, queries_dir, workers=1)
+        self.assertEqual((summary["delta_of"], summary["nodes_deleted"], summary["edges_deleted"]), ("pub-1", 1, 2))
+        cypher = out.read_text()
+        self.assertNotIn("MATCH (n) DETACH DELETE n", cypher)
+        self.assertIn("MERGE (n:AxonNode {id: row.id})", cypher)
+
+        # The delta's cumulative sidecar stands for the full state: a fresh full
+        # export diffs clean against it.
+        self.export("pub-3")
+        full = Path(self.tmp.name) / "publications" / "pub-3"
+        for kind in ("node", "edge"):
+            diff = BUILDER.diff_publication_file(full, pub, kind)
+            self.assertEqual((diff.keep.true_count, diff.deleted), (0, []))
+
+    def test_project_filter_scopes_rows_and_prior_state(self) -> None:
+        self.db.execute("INSERT INTO ist_Symbol VALUES ('bks:0', 'fn', 'function', 'BKS')")
+        self.db.commit()
+        self.export("pub-1")
+        scoped = self.export("pub-2", "--project", "BKS", "--project", "BKS")
+        pub = Path(self.tmp.name) / "publications" / "pub-2"
+        self.assertEqual(scoped["projects"], ["BKS"])
+        self.assertEqual(pq.read_table(pub / "nodes.parquet").column("id").to_pylist(), ["bks:0"])
+        self.assertTrue(all("project_code IN ('BKS')" in query for query in self.log.read_text().splitlines()))
+        # A scoped publication never stands in for the full projection.
+        self.assertIsNone(BUILDER.usable_prior(scoped, Path(self.tmp.name) / "publications" / "pub-1"))
+
+        self.db.execute("DELETE FROM ist_Symbol WHERE id = 'sym:0'")
+        self.db.commit()
+        delta = self.export("pub-3", "--since", "pub-1", "--project", "BKS")
+        # sym:0 is outside the delta's scope: not deleted, its watermark kept.
+        self.assertEqual(delta["delta"]["deleted"], {"node": 0, "edge": 0})
+        self.assertEqual(delta["export_state"]["projects"], None)
+        state = pq.read_table(Path(self.tmp.name) / "publications" / "pub-3" / MODULE.STATE_FILE)
+        self.assertIn("sym:0", state.column("key").to_pylist())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,283 @@
+import functools
+import importlib.util
+import json
+import socket
+import struct
+import sys
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+
+
+SCRIPTS = Path(__file__).resolve().parents[1] / "scripts"
+sys.path.insert(0, str(SCRIPTS))
+HAS_PYARROW = importlib.util.find_spec("pyarrow") is not None
+
+
+def load_module(name: str):
+    # Shared with the other memgraph tests: a second copy would break pickling
+    # of the encoder pool's functions.
+    if name in sys.modules:
+        return sys.modules[name]
+    spec = importlib.util.spec_from_file_location(name, SCRIPTS / f"{name}.py")
+    module = importlib.util.module_from_spec(spec)
+    assert spec is not None and spec.loader is not None
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+BOLT = load_module("bolt_client")
+if HAS_PYARROW:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    import memgraph_fixtures
+
+    MB = load_module("memgraph_build_cypherl")
+    LOADER = load_module("memgraph_load_bolt")
+
+
+class _FakeBolt(threading.Thread):
+    """Multi-session Bolt stand-in.
+
+    Records every RUN as ``(query, parameters)``; a query containing one of
+    ``transient`` fails once with a TransientError, one containing one of
+    ``rejected`` always fails with a ClientError. ``count(`` queries return 42.
+    """
+
+    def __init__(self, *, transient=(), rejected=()) -> None:
+        super().__init__(daemon=True)
+        self.listener = socket.create_server(("127.0.0.1", 0))
+        self.port = self.listener.getsockname()[1]
+        self.transient = list(transient)
+        self.rejected = list(rejected)
+        self.lock = threading.Lock()
+        self.runs = []
+        self.hellos = []
+        self.sessions = 0
+
+    @property
+    def uri(self) -> str:
+        return f"bolt://127.0.0.1:{self.port}"
+
+    def run(self) -> None:
+        while True:
+            try:
+                conn, _ = self.listener.accept()
+            except OSError:
+                return
+            conn.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            with self.lock:
+                self.sessions += 1
+            threading.Thread(target=self.serve, args=(conn,), daemon=True).start()
+
+    def stop(self) -> None:
+        self.listener.close()
+
+    @staticmethod
+    def read(conn: socket.socket, size: int) -> bytes:
+        data = b""
+        while len(data) < size:
+            chunk = conn.recv(size - len(data))
+            if not chunk:
+                raise ConnectionError
+            data += chunk
+        return data
+
+    def read_message(self, conn: socket.socket):
+        payload = b""
+        while True:
+            (size,) = struct.unpack(">H", self.read(conn, 2))
+            if size == 0:
+                return BOLT.unpack(payload)[0]
+            payload += self.read(conn, size)
+
+    def serve(self, conn: socket.socket) -> None:
+        with conn:
+            try:
+                assert self.read(conn, 4) == BOLT.BOLT_MAGIC
+                proposals = self.read(conn, 16)
+                conn.sendall(proposals[4:8])  # agree on the second proposal
+                failed = False
+                while True:
+                    message = self.read_message(conn)
+                    if message.tag == BOLT.MSG_GOODBYE:
+                        return
+                    if message.tag == BOLT.MSG_RESET:
+                        failed = False
+                        conn.sendall(BOLT.encode_message(BOLT.MSG_SUCCESS, {}))
+                    elif failed:
+                        conn.sendall(BOLT.encode_message(BOLT.MSG_IGNORED))
+                    elif message.tag == BOLT.MSG_HELLO:
+                        self.hellos.append(message.fields[0])
+                        conn.sendall(BOLT.encode_message(BOLT.MSG_SUCCESS, {"server": "Memgraph/fake"}))
+                    elif message.tag == BOLT.MSG_RUN:
+                        query, parameters = message.fields[0], message.fields[1]
+                        failure = self.failure_for(query)
+                        if failure is not None:
+                            failed = True
+                            conn.sendall(BOLT.encode_message(BOLT.MSG_FAILURE, failure))
+                            continue
+                        with self.lock:
+                            self.runs.append((query, parameters))
+                        conn.sendall(BOLT.encode_message(BOLT.MSG_SUCCESS, {"fields": ["n"]}))
+                        records = [[42]] if "count(" in query else []
+                        message = self.read_message(conn)
+                        assert message.tag == BOLT.MSG_PULL
+                        for record in records:
+                            conn.sendall(BOLT.encode_message(BOLT.MSG_RECORD, record))
+                        conn.sendall(BOLT.encode_message(BOLT.MSG_SUCCESS, {"has_more": False}))
+            except ConnectionError:
+                return
+
+    def failure_for(self, query: str):
+        with self.lock:
+            for needle in self.rejected:
+                if needle in query:
+                    return {"code": "Memgraph.ClientError.MemgraphError.MemgraphError", "message": "no such index"}
+            for needle in list(self.transient):
+                if needle in query:
+                    self.transient.remove(needle)
+                    return {
+                        "code": "Memgraph.TransientError.MemgraphError.MemgraphError",
+                        "message": "Cannot resolve conflicting transactions.",
+                    }
+        return None
+
+
+class BoltClientTests(unittest.TestCase):
+    def test_packstream_round_trip(self) -> None:
+        value = {
+            "ints": [0, -1, -16, -17, 127, 128, -128, -129, 32767, -32769, 2**31, -(2**63)],
+            "text": ["", "émoji ✓", "x" * 70_000],
+            "nested": {"none": None, "flags": [True, False], "pi": 3.25, "raw": b"\x00\x01"},
+        }
+        encoded = bytearray()
+        BOLT.pack(value, encoded)
+        self.assertEqual(BOLT.unpack(bytes(encoded)), (value, len(encoded)))
+        framed = BOLT.chunk(encoded)
+        self.assertEqual(struct.unpack(">H", framed[:2])[0], BOLT.MAX_CHUNK_BYTES)
+        self.assertTrue(framed.endswith(b"\x00\x00"))
+
+    def test_failure_resets_the_session_and_the_connection_stays_usable(self) -> None:
+        server = _FakeBolt(rejected=["BROKEN"], transient=["BUSY"])
+        server.start()
+        try:
+            with BOLT.BoltConnection(server.uri, user="axon", password="secret") as connection:
+                with self.assertRaises(BOLT.BoltError) as rejected:
+                    connection.run("BROKEN")
+                self.assertFalse(rejected.exception.transient)
+                with self.assertRaises(BOLT.BoltError) as busy:
+                    connection.run("BUSY")
+                self.assertTrue(busy.exception.transient)
+                self.assertEqual(connection.run("RETURN count($x)", {"x": [1, "a"]}), [[42]])
+                self.assertEqual(connection.version, BOLT.BOLT_VERSIONS[1])
+                self.assertEqual(connection.server, "Memgraph/fake")
+        finally:
+            server.stop()
+        self.assertEqual(server.runs, [("RETURN count($x)", {"x": [1, "a"]})])
+        self.assertEqual(server.hellos[0]["scheme"], "basic")
+        self.assertEqual(server.hellos[0]["principal"], "axon")
+        self.assertEqual(server.sessions, 1)
+
+
+def write_publication(pub_dir: Path, node_count: int, *, drop_last: int = 0) -> None:
+    memgraph_fixtures.write_publication(pub_dir, node_count, drop_last=drop_last, nonfinite=False, row_group_size=9)
+
+
+def as_file_statement(query: str, rows: list) -> str:
+    """The `.cypherl` text of a Bolt UNWIND statement."""
+    suffix = query[len("UNWIND $rows ") :] + ";"
+    if all(isinstance(row, str) for row in rows):
+        return f"UNWIND {json.dumps(rows)} {suffix}"
+    body = ",\n".join("  " + MB.cypher_map(row) for row in rows)
+    return f"UNWIND [\n{body}\n]\n{suffix}"
+
+
+@unittest.skipUnless(HAS_PYARROW, "pyarrow not installed")
+class BoltLoaderTests(unittest.TestCase):
+    def load_and_compare(self, root: Path, *, workers: int, **kwargs) -> dict:
+        queries = root / "queries"
+        queries.mkdir(exist_ok=True)
+        MB.build_import(root / "pub", root / "import.cypherl", 4, False, queries, streaming=False, **kwargs)
+        file_statements = [
+            block
+            for block in (root / "import.cypherl").read_text(encoding="utf-8").split("\n\n")
+            if block.startswith("UNWIND")
+        ]
+        server = _FakeBolt(transient=["[r:CALLS]"], rejected=["DROP INDEX"])
+        server.start()
+        try:
+            summary = LOADER.load_publication(
+                root / "pub",
+                functools.partial(BOLT.BoltConnection, server.uri),
+                4,
+                False,
+                queries,
+                sessions_per_label=2,
+                max_sessions=3,
+                workers=workers,
+                **kwargs,
+            )
+        finally:
+            server.stop()
+
+        unwinds = [(query, parameters["rows"]) for query, parameters in server.runs if query.startswith("UNWIND $rows")]
+        self.assertEqual(
+            sorted(as_file_statement(query, rows) for query, rows in unwinds), sorted(file_statements)
+        )
+        self.assertTrue(all(len(rows) <= 4 for _, rows in unwinds))
+        # Phase barriers: every node statement lands before the first edge one.
+        kinds = ["edge" if "MATCH (a:AxonNode" in query else "node" for query, _ in unwinds]
+        self.assertEqual(kinds, sorted(kinds, key=lambda kind: kind == "edge"))
+        self.assertEqual(summary["retried"], 1)
+        self.assertEqual(summary["imported_nodes"], 42)
+        self.assertIn(
+            ("MATCH (q:PreparedQuery) RETURN count(q)", {}), server.runs
+        )
+        pack = [parameters for query, parameters in server.runs if query.startswith("CREATE (:PreparedQueryPack")]
+        self.assertEqual(pack, [{"publication_id": "pub-it's"}])
+        return summary
+
+    def test_full_load_sends_the_cypherl_batches_as_parameters(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            write_publication(root / "pub", 40)
+            for workers in (1, 2):
+                summary = self.load_and_compare(root, workers=workers)
+                self.assertEqual(summary["nodes"], 40)
+                self.assertEqual(summary["edges"], 40)
+                self.assertLessEqual(summary["sessions_opened"], 3)
+
+    def test_incremental_load_sends_deltas_and_deletes(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            write_publication(root / "prior", 40)
+            write_publication(root / "pub", 40, drop_last=3)
+            nodes = pq.read_table(root / "pub" / "nodes.parquet")
+            titles = nodes.column("title").to_pylist()
+            titles[5] = "changed"
+            pq.write_table(nodes.set_column(2, "title", pa.array(titles)), root / "pub" / "nodes.parquet")
+            summary = self.load_and_compare(
+                root, workers=1, incremental=True, prior_publication_dir=root / "prior"
+            )
+            self.assertEqual(summary["nodes_emitted"], 1)
+            self.assertEqual(summary["nodes_deleted"], 3)
+            self.assertGreater(summary["edges_deleted"], 0)
+
+    def test_packed_values_drop_what_cypher_renders_as_null(self) -> None:
+        def unpacked(column):
+            return [None if value is None else BOLT.unpack(value)[0] for value in LOADER.packed_values(column).to_pylist()]
+
+        self.assertEqual(unpacked(pa.array([1.5, float("nan"), float("inf"), None])), [1.5, None, None, None])
+        self.assertEqual(unpacked(pa.array([b"ab", None])), ["b'ab'", None])
+        integers = [0, -16, -17, 127, 128, -(2**63), 2**63 - 1, None]
+        self.assertEqual(unpacked(pa.array(integers, pa.int64())), integers)
+        self.assertEqual(unpacked(pa.array([2**64 - 1], pa.uint64())), ["18446744073709551615"])
+        self.assertEqual(unpacked(pa.array(["x" * 70_000, "é", None])), ["x" * 70_000, "é", None])
+        self.assertEqual(unpacked(pa.array([True, None, False]).slice(1)), [None, False])
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,126 @@
+import importlib.util
+import json
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+
+SCRIPTS = Path(__file__).resolve().parents[1] / "scripts"
+sys.path.insert(0, str(SCRIPTS))
+HAS_PYARROW = importlib.util.find_spec("pyarrow") is not None
+
+if HAS_PYARROW:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    if "memgraph_publication_store" in sys.modules:
+        MODULE = sys.modules["memgraph_publication_store"]
+    else:
+        MODULE_PATH = SCRIPTS / "memgraph_publication_store.py"
+        SPEC = importlib.util.spec_from_file_location("memgraph_publication_store", MODULE_PATH)
+        MODULE = importlib.util.module_from_spec(SPEC)
+        assert SPEC is not None and SPEC.loader is not None
+        sys.modules[SPEC.name] = MODULE
+        SPEC.loader.exec_module(MODULE)
+    BUILDER = sys.modules["memgraph_build_cypherl"]
+    from memgraph_fixtures import write_tables
+
+
+def write_publication(pub_dir: Path, publication_id: str, ids: list[int], changed: int | None = None) -> None:
+    nodes = pa.table(
+        {
+            "id": [f"AXO::src/file_{index // 10}.rs::f{index}" for index in ids],
+            "label": ["Symbol"] * len(ids),
+            "project_code": ["AXO"] * len(ids),
+            "title": [None if index % 3 else ("edited" if index == changed else f"T{index}") for index in ids],
+        }
+    )
+    edges = pa.table(
+        {
+            "from_id": nodes["id"],
+            "to_id": nodes["id"].to_pylist()[1:] + nodes["id"].to_pylist()[:1],
+            "relation_type": ["CALLS"] * len(ids),
+            "project_code": ["AXO"] * len(ids),
+        }
+    )
+    manifest = {
+        "publication_id": publication_id,
+        "row_counts": {"nodes": nodes.num_rows, "edges": edges.num_rows},
+    }
+    write_tables(pub_dir, nodes, edges, manifest, row_group_size=300)
+    BUILDER.write_hash_sidecar(pub_dir)
+    manifest["hashes"] = {"file": BUILDER.HASHES_FILE}
+    (pub_dir / "manifest.json").write_text(json.dumps(manifest))
+
+
+@unittest.skipUnless(HAS_PYARROW, "pyarrow not installed")
+class PublicationStoreTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.root = Path(self.tmp.name)
+        self.store = MODULE.PublicationStore(self.root / "store")
+        # Small chunks and read batches, so chunks span batches and churn stays local.
+        sizes = {"AVG_CHUNK_ROWS": 64, "MIN_CHUNK_ROWS": 16, "MAX_CHUNK_ROWS": 256, "READ_BATCH_ROWS": 100}
+        for name, value in sizes.items():
+            patcher = mock.patch.object(MODULE, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def assert_same_publication(self, expected: Path, actual: Path) -> None:
+        manifests = [json.loads((path / "manifest.json").read_text()) for path in (expected, actual)]
+        self.assertEqual(manifests[1], manifests[0])
+        for path in expected.glob("*.parquet"):
+            original, restored = pq.read_table(path), pq.read_table(actual / path.name)
+            self.assertTrue(restored.equals(original, check_metadata=True), path.name)
+
+    def test_round_trip_and_churn_only_adds_changed_chunks(self) -> None:
+        write_publication(self.root / "pub-1", "pub-1", list(range(2000)))
+        first = self.store.put(self.root / "pub-1")
+        self.assertEqual(first["new_chunks"], first["chunks"])
+
+        # One row inserted, one removed, one edited: a handful of node/edge chunks.
+        ids = [index for index in range(2001) if index != 1500]
+        write_publication(self.root / "pub-2", "pub-2", ids[:700] + [99_999] + ids[700:], changed=900)
+        second = self.store.put(self.root / "pub-2")
+        stored = self.store.entry("pub-2")["files"]
+        data_chunks = len(stored["nodes.parquet"]["chunks"]) + len(stored["edges.parquet"]["chunks"])
+        data_new = second["new_chunks"] - len(stored[BUILDER.HASHES_FILE]["chunks"])
+        self.assertGreater(data_chunks, 40)
+        self.assertLessEqual(data_new, 12)
+
+        self.store.materialize("pub-1", self.root / "out-1")
+        self.assert_same_publication(self.root / "pub-1", self.root / "out-1")
+
+        pruned = self.store.prune(keep=1)
+        self.assertEqual(pruned["dropped"], ["pub-1"])
+        self.assertGreater(pruned["removed_chunks"], 0)
+        usage = self.store.usage()
+        self.assertEqual([entry["publication_id"] for entry in usage["publications"]], ["pub-2"])
+        self.assertEqual(usage["objects"], len({digest for entry in stored.values() for digest, _ in entry["chunks"]}))
+        self.store.materialize("pub-2", self.root / "out-2")
+        self.assert_same_publication(self.root / "pub-2", self.root / "out-2")
+        with self.assertRaises(KeyError):
+            self.store.entry("pub-1")
+
+    def test_thin_prior_diffs_like_the_full_publication(self) -> None:
+        write_publication(self.root / "pub-1", "pub-1", list(range(500)))
+        write_publication(self.root / "pub-2", "pub-2", list(range(3, 520)), changed=30)
+        self.store.put(self.root / "pub-1")
+
+        with MODULE.thin_prior(self.store.root, "pub-1") as prior:
+            self.assertEqual(sorted(path.name for path in prior.iterdir()), [BUILDER.HASHES_FILE, "manifest.json"])
+            with mock.patch.object(BUILDER, "hash_table", side_effect=AssertionError("sidecar not used")):
+                thin = {kind: BUILDER.diff_publication_file(self.root / "pub-2", prior, kind) for kind in ("node", "edge")}
+        self.assertFalse(prior.exists())
+        for kind, diff in thin.items():
+            full = BUILDER.diff_publication_file(self.root / "pub-2", self.root / "pub-1", kind)
+            self.assertEqual(diff.keep.to_pylist(), full.keep.to_pylist())
+            self.assertEqual(diff.deleted, full.deleted)
+        self.assertEqual(len(thin["node"].deleted), 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
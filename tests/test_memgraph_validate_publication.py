@@ -0,0 +1,131 @@
+import importlib.util
+import io
+import json
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+
+SCRIPTS = Path(__file__).resolve().parents[1] / "scripts"
+sys.path.insert(0, str(SCRIPTS))
+HAS_PYARROW = importlib.util.find_spec("pyarrow") is not None
+
+if HAS_PYARROW:
+    import pyarrow as pa
+
+    from memgraph_fixtures import write_tables
+
+    if "memgraph_validate_publication" in sys.modules:
+        MODULE = sys.modules["memgraph_validate_publication"]
+    else:
+        MODULE_PATH = SCRIPTS / "memgraph_validate_publication.py"
+        SPEC = importlib.util.spec_from_file_location("memgraph_validate_publication", MODULE_PATH)
+        MODULE = importlib.util.module_from_spec(SPEC)
+        assert SPEC is not None and SPEC.loader is not None
+        sys.modules[SPEC.name] = MODULE
+        SPEC.loader.exec_module(MODULE)
+
+
+def write_publication(pub_dir: Path, nodes: dict, edges: dict, **manifest) -> None:
+    manifest = {
+        "publication_id": "pub-1",
+        "publication_kind": "memgraph_human_ist_soll_projection",
+        "human_only": True,
+        "llm_contract": "use_axon_mcp_not_memgraph",
+        "row_counts": {"nodes": len(nodes["id"]), "edges": len(edges["from_id"])},
+        **manifest,
+    }
+    write_tables(pub_dir, pa.table(nodes), pa.table(edges), manifest, row_group_size=2)
+
+
+@unittest.skipUnless(HAS_PYARROW, "pyarrow not installed")
+class DeepValidationTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.pub = Path(self.tmp.name) / "pub"
+
+    def validate(self, *args: str) -> tuple[int, dict]:
+        argv = ["validate", "--publication-dir", str(self.pub), *args]
+        with mock.patch.object(sys, "argv", argv), mock.patch("sys.stdout", new=io.StringIO()) as out:
+            status = MODULE.main()
+        return status, json.loads(out.getvalue())
+
+    def test_deep_mode_reports_dangling_duplicates_and_label_drift(self) -> None:
+        write_publication(
+            self.pub,
+            {"id": ["a", "b", "c", "b"], "label": ["Symbol", "Symbol", "File", "Symbol"]},
+            {
+                "from_id": ["a", "a", "b", "c", "ghost", None],
+                "to_id": ["b", "b", "c", "missing", "a", "a"],
+                # "calls" and "CALLS" normalise to the same Memgraph type.
+                "relation_type": ["calls", "CALLS", "CALLS", "CALLS", "CALLS", "CALLS"],
+            },
+            label_counts={"Symbol": 3, "File": 2},
+        )
+
+        self.assertEqual(self.validate()[0], 0)
+        status, summary = self.validate("--deep")
+
+        self.assertEqual(status, 1)
+        deep = summary["deep"]
+        self.assertEqual(deep["duplicate_node_ids"], {"keys": 1, "extra_rows": 1, "sample": ["b"]})
+        self.assertEqual(deep["duplicate_edge_keys"], {"keys": 1, "extra_rows": 1, "sample": ["a\x1fb\x1fCALLS"]})
+        self.assertEqual(deep["cross_project_edge_keys"], {"keys": 0, "sample": []})
+        self.assertEqual(
+            deep["dangling_endpoints"],
+            {"edges": 3, "from_id": 2, "to_id": 1, "missing_ids": 3, "sample": ["", "ghost", "missing"]},
+        )
+        self.assertEqual(deep["label_counts"], {"File": 1, "Symbol": 3})
+        self.assertIn("label count mismatch for 'File': manifest=2 parquet=1", summary["errors"])
+        self.assertEqual(len(summary["errors"]), 4)
+
+        status, summary = self.validate("--deep", "--allow-dangling-edges")
+        self.assertEqual(len(summary["errors"]), 3)
+
+    def test_clean_publication_passes_deep_mode(self) -> None:
+        write_publication(
+            self.pub,
+            {"id": ["a", "b"], "label": ["Symbol", "File"]},
+            {"from_id": ["a"], "to_id": ["b"], "relation_type": ["CONTAINS"]},
+            label_counts={"Symbol": 1, "File": 1},
+        )
+        status, summary = self.validate("--deep")
+        self.assertEqual((status, summary["errors"]), (0, []))
+        self.assertEqual(summary["deep"]["dangling_endpoints"]["edges"], 0)
+
+    def test_same_edge_in_several_projects_is_reported_not_failed(self) -> None:
+        write_publication(
+            self.pub,
+            {"id": ["a", "b"], "label": ["Symbol", "Symbol"]},
+            {
+                "from_id": ["a", "a", "a"],
+                "to_id": ["b", "b", "b"],
+                "relation_type": ["CALLS", "CALLS", "CALLS"],
+                "project_code": ["AXO", "BKS", None],
+            },
+        )
+        status, summary = self.validate("--deep")
+        self.assertEqual((status, summary["errors"]), (0, []))
+        self.assertEqual(summary["deep"]["duplicate_edge_keys"]["keys"], 0)
+        self.assertEqual(summary["deep"]["cross_project_edge_keys"], {"keys": 1, "sample": ["a\x1fb\x1fCALLS"]})
+
+        write_publication(
+            self.pub,
+            {"id": ["a", "b"], "label": ["Symbol", "Symbol"]},
+            {
+                "from_id": ["a", "a"],
+                "to_id": ["b", "b"],
+                "relation_type": ["CALLS", "calls"],
+                "project_code": ["AXO", "AXO"],
+            },
+        )
+        status, summary = self.validate("--deep")
+        self.assertEqual(status, 1)
+        self.assertEqual(summary["errors"], ["duplicate edge keys within a project: 1"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,90 @@
+import importlib.util
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+
+MODULE_PATH = Path(__file__).resolve().parents[1] / "scripts" / "lib" / "proc_sampler.py"
+SPEC = importlib.util.spec_from_file_location("proc_sampler", MODULE_PATH)
+MODULE = importlib.util.module_from_spec(SPEC)
+assert SPEC is not None and SPEC.loader is not None
+sys.modules[SPEC.name] = MODULE
+SPEC.loader.exec_module(MODULE)
+
+
+def write_process(root: Path, pid: int, *, utime: int, stime: int, start: int, rchar: int, fds: int) -> None:
+    proc = root / str(pid)
+    (proc / "fd").mkdir(parents=True, exist_ok=True)
+    for fd in (proc / "fd").iterdir():
+        fd.unlink()
+    for index in range(fds):
+        (proc / "fd" / str(index)).touch()
+    fields = ["S"] + ["0"] * 40
+    fields[11], fields[12], fields[17], fields[19] = str(utime), str(stime), "12", str(start)
+    (proc / "stat").write_text(f"{pid} (axon (brain) x) " + " ".join(fields) + "\n")
+    (proc / "status").write_text(
+        "Name:\taxon-brain\nVmHWM:\t  4096 kB\nVmRSS:\t  2048 kB\nRssAnon:\t  1024 kB\n"
+        "RssFile:\t   512 kB\nRssShmem:\t   512 kB\n"
+    )
+    (proc / "smaps_rollup").write_text("Rss:  2048 kB\nPss:  1536 kB\nPss_Anon:  1024 kB\nSwap:  0 kB\n")
+    (proc / "io").write_text(f"rchar: {rchar}\nwchar: 10\nread_bytes: 0\nwrite_bytes: 4096\n")
+
+
+class ProcSamplerTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self.tmp.name)
+        (self.root / "uptime").write_text("1000.00 4000.00\n")
+        (self.root / "meminfo").write_text("MemTotal:  8192 kB\nMemFree:  1 kB\n")
+        self.now = 0.0
+        self.sampler = MODULE.ProcSampler(proc_root=self.root, clock=lambda: self.now, clock_ticks=100)
+
+    def tearDown(self) -> None:
+        self.tmp.cleanup()
+
+    def test_first_sample_uses_lifetime_cpu_then_jiffy_deltas(self) -> None:
+        write_process(self.root, 41, utime=30_000, stime=10_000, start=20_000, rchar=1_000, fds=3)
+        first = self.sampler.sample({"brain": 41, "indexer": None})
+
+        brain = first["brain"]
+        self.assertEqual(brain["cpu_window"], "lifetime")
+        self.assertEqual(brain["cpu_percent"], 50.0)
+        self.assertEqual(brain["rss_bytes"], 2048 * 1024)
+        self.assertEqual(brain["rss_anon_bytes"], 1024 * 1024)
+        self.assertEqual(brain["pss_bytes"], 1536 * 1024)
+        self.assertEqual(brain["mem_percent"], 25.0)
+        self.assertEqual(brain["threads"], 12)
+        self.assertEqual(brain["fd_count"], 3)
+        self.assertNotIn("io_rchar_per_s", brain)
+        self.assertEqual(first["indexer"], {"alive": False, "pid": None})
+
+        self.now = 2.0
+        write_process(self.root, 41, utime=30_100, stime=10_050, start=20_000, rchar=5_000, fds=5)
+        brain = self.sampler.sample({"brain": 41})["brain"]
+
+        self.assertEqual(brain["cpu_window"], "delta")
+        self.assertEqual(brain["cpu_percent"], 75.0)
+        self.assertEqual(brain["io_rchar_per_s"], 2000.0)
+        self.assertEqual(brain["fd_count"], 5)
+
+    def test_recycled_pid_and_missing_process_start_fresh(self) -> None:
+        write_process(self.root, 41, utime=100, stime=0, start=20_000, rchar=0, fds=1)
+        self.sampler.sample({"brain": 41})
+        self.now = 1.0
+        write_process(self.root, 41, utime=50, stime=0, start=90_000, rchar=0, fds=1)
+
+        brain = self.sampler.sample({"brain": 41, "indexer": 77})
+
+        self.assertEqual(brain["brain"]["cpu_window"], "lifetime")
+        self.assertEqual(brain["indexer"], {"alive": False, "pid": 77})
+
+    def test_stat_parsing_survives_parentheses_in_command_name(self) -> None:
+        parsed = MODULE.parse_stat("9 (a) b)) S " + " ".join(str(n) for n in range(4, 45)))
+
+        self.assertEqual(parsed, {"utime": 14, "stime": 15, "threads": 20, "start_ticks": 22})
+        self.assertIsNone(MODULE.parse_stat("garbage"))
+
+
+if __name__ == "__main__":
+    unittest.main()
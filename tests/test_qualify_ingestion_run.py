@@ -0,0 +1,135 @@
+import importlib.util
+import json
+import sys
+import unittest
+from pathlib import Path
+from unittest import mock
+
+
+SCRIPTS = Path(__file__).resolve().parents[1] / "scripts"
+sys.path.insert(0, str(SCRIPTS))
+MODULE_PATH = SCRIPTS / "qualify_ingestion_run.py"
+SPEC = importlib.util.spec_from_file_location("qualify_ingestion_run", MODULE_PATH)
+MODULE = importlib.util.module_from_spec(SPEC)
+assert SPEC is not None and SPEC.loader is not None
+sys.modules[SPEC.name] = MODULE
+SPEC.loader.exec_module(MODULE)
+
+
+FOUR_QUERY_ROWS = {
+    MODULE.SQL_OVERVIEW: [[120, 80, 30, 10, 3, 5, 1, 70, "64"]],
+    MODULE.SQL_TOP_REASONS: [["needs_reindex", 25], ["hot_file", 15]],
+    MODULE.SQL_STAGE_COUNTS: [["graph_indexed", 70], ["promoted", 50]],
+    MODULE.SQL_GRAPH_PROJECTION_QUEUE: [[4, 2, 6]],
+}
+
+PACK_DOCUMENT = {
+    "overview": {
+        "known": 120,
+        "completed": 80,
+        "pending": 30,
+        "indexing": 10,
+        "degraded": 3,
+        "skipped": 5,
+        "oversized": 1,
+        "graph_ready": 70,
+        "vector_ready": 64,
+    },
+    "top_reasons": [{"reason": "needs_reindex", "count": 25}, {"reason": "hot_file", "count": 15}],
+    "stages": [{"stage": "graph_indexed", "count": 70}, {"stage": "promoted", "count": 50}],
+    "graph_projection_queue": {"queued": 4, "inflight": 2, "total": 6},
+}
+
+
+class IngestionOverviewPackTests(unittest.TestCase):
+    def four_query_snapshot(self) -> dict:
+        with mock.patch.object(MODULE, "sql_query", side_effect=FOUR_QUERY_ROWS.get):
+            snapshot = MODULE.sql_overview()
+            snapshot["top_reasons"] = MODULE.sql_top_reasons()
+            snapshot["stages"] = MODULE.sql_stage_counts()
+            snapshot["graph_projection_queue"] = MODULE.sql_graph_projection_queue()
+        return snapshot
+
+    def test_pack_decodes_to_the_four_helper_dicts(self) -> None:
+        expected = self.four_query_snapshot()
+
+        for document in (PACK_DOCUMENT, json.dumps(PACK_DOCUMENT)):
+            self.assertEqual(MODULE.decode_ingestion_overview_pack([[document]]), expected)
+
+        calls = []
+
+        def one_round_trip(query):
+            calls.append(query)
+            return [[json.dumps(PACK_DOCUMENT)]]
+
+        with mock.patch.object(MODULE, "_OVERVIEW_PACK_UNSUPPORTED", False), mock.patch.object(
+            MODULE, "_OVERVIEW_PACK_SKIP", 0
+        ), mock.patch.object(MODULE, "sql_query", side_effect=one_round_trip):
+            self.assertEqual(MODULE.sql_ingestion_snapshot(), expected)
+        self.assertEqual(calls, [MODULE.SQL_INGESTION_OVERVIEW_PACK])
+
+    def test_unusable_pack_falls_back_to_separate_queries(self) -> None:
+        expected = self.four_query_snapshot()
+        for bad in ({"error": "syntax error"}, [], [["not json"]], [[{"overview": {}}]]):
+            self.assertIsNone(MODULE.decode_ingestion_overview_pack(bad))
+
+        responses = {**FOUR_QUERY_ROWS, MODULE.SQL_INGESTION_OVERVIEW_PACK: {"error": "unknown function"}}
+        with mock.patch.object(MODULE, "_OVERVIEW_PACK_UNSUPPORTED", False), mock.patch.object(
+            MODULE, "_OVERVIEW_PACK_SKIP", 0
+        ), mock.patch.object(MODULE, "sql_query", side_effect=responses.get) as sql_query:
+            self.assertEqual(MODULE.sql_ingestion_snapshot(), expected)
+            self.assertEqual(sql_query.call_count, 5)
+            # The failed pack is not re-sent on the next sample.
+            self.assertEqual(MODULE.sql_ingestion_snapshot(), expected)
+            self.assertEqual(sql_query.call_count, 9)
+        self.assertNotIn(MODULE.SQL_INGESTION_OVERVIEW_PACK, [call.args[0] for call in sql_query.call_args_list[5:]])
+
+    def test_transient_pack_failure_is_retried_on_a_later_sample(self) -> None:
+        expected = self.four_query_snapshot()
+        packs = iter([None, {"error": "Task Panic: JoinError"}, [[json.dumps(PACK_DOCUMENT)]]])
+
+        def answer(query):
+            return next(packs) if query == MODULE.SQL_INGESTION_OVERVIEW_PACK else FOUR_QUERY_ROWS[query]
+
+        with mock.patch.object(MODULE, "_OVERVIEW_PACK_UNSUPPORTED", False), mock.patch.object(
+            MODULE, "_OVERVIEW_PACK_SKIP", 0
+        ), mock.patch.object(MODULE, "OVERVIEW_PACK_RETRY_SAMPLES", 2), mock.patch.object(
+            MODULE, "sql_query", side_effect=answer
+        ) as sql_query:
+            for _ in range(5):
+                self.assertEqual(MODULE.sql_ingestion_snapshot(), expected)
+            self.assertFalse(MODULE._OVERVIEW_PACK_UNSUPPORTED)
+        sent = [call.args[0] == MODULE.SQL_INGESTION_OVERVIEW_PACK for call in sql_query.call_args_list]
+        # Pack + fallback, fallback only, pack + fallback, fallback only, pack.
+        self.assertEqual(sent.count(True), 3)
+        self.assertEqual(len(sent), 3 + 4 * 4)
+
+    def test_only_missing_objects_disable_the_pack(self) -> None:
+        for failure in (
+            {"error": 'Catalog Error: Scalar Function with name json_build_object does not exist!'},
+            {"error": 'ERROR: column "graph_ready" does not exist'},
+            {"error": 'Binder Error: Referenced column "status" not found in FROM clause!'},
+            MODULE.PgError({"C": "42P01", "M": 'relation "ist.graphprojectionqueue" does not exist'}),
+        ):
+            self.assertTrue(MODULE.overview_pack_unsupported(failure), failure)
+        for failure in (None, [], {"error": "Task Panic: JoinError"}, MODULE.PgError({"C": "57014"})):
+            self.assertFalse(MODULE.overview_pack_unsupported(failure), failure)
+
+    def test_empty_tables_decode_to_zeroes(self) -> None:
+        document = {
+            "overview": dict.fromkeys(MODULE.SQL_OVERVIEW_KEYS, 0),
+            "top_reasons": [],
+            "stages": [],
+            "graph_projection_queue": {"queued": 0, "inflight": 0, "total": 0},
+        }
+        with mock.patch.object(MODULE, "sql_query", return_value=[]):
+            fallback = MODULE.sql_overview()
+
+        decoded = MODULE.decode_ingestion_overview_pack([[document]])
+
+        self.assertEqual({key: decoded[key] for key in MODULE.SQL_OVERVIEW_KEYS}, fallback)
+        self.assertEqual(decoded["stages"], [])
+
+
+if __name__ == "__main__":
+    unittest.main()
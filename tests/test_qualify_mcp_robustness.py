@@ -125,6 +125,14 @@ class QualifyMcpRobustnessTests(unittest.TestCase):
         self.assertEqual(delta["backend_unavailable_delta"], 1)
         self.assertEqual(delta["verdict"], "degraded")
 
+    def test_classify_exception_counts_unusable_bodies_as_invalid_json(self) -> None:
+        empty = ValueError("empty MCP response body")
+        undecodable = UnicodeDecodeError("utf-8", b"\xff", 0, 1, "invalid start byte")
+
+        self.assertEqual(MODULE.classify_exception(empty)[0], "invalid_json")
+        self.assertEqual(MODULE.classify_exception(undecodable)[0], "invalid_json")
+        self.assertEqual(MODULE.classify_exception(TimeoutError("slow"))[0], "timeout")
+
 
 if __name__ == "__main__":
     unittest.main()
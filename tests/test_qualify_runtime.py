@@ -207,6 +207,50 @@ class QualifyRuntimeTests(unittest.TestCase):
         self.assertEqual(result["status"], "pass")
         self.assertIn("exceeded", result["note"])
 
+    def test_join_nearest_samples_respects_tolerance(self) -> None:
+        host = [{"ts": 10.0, "cpu_usage_pct": 1}, {"ts": 10.4, "cpu_usage_pct": 2}, {"ts": 13.0, "cpu_usage_pct": 3}]
+        pipeline = [
+            {"ts": 10.35, "ts_iso": "x", "pipeline_available": True, "vector_ready_current": 7},
+            {"ts": 9.9, "ts_iso": "y", "pipeline_available": True, "vector_ready_current": 5},
+        ]
+
+        joined = MODULE.join_nearest_samples(host, pipeline, tolerance_s=1.0, prefix="pipeline")
+
+        self.assertEqual([sample.get("vector_ready_current") for sample in joined], [5, 7, None])
+        self.assertEqual(joined[1]["ts"], 10.4)
+        self.assertAlmostEqual(joined[1]["pipeline_skew_ms"], -50.0)
+        self.assertNotIn("pipeline_ts", joined[2])
+
+    def test_resource_sampler_keeps_host_cadence_when_status_is_slow(self) -> None:
+        def slow_status(url, timeout=20):
+            MODULE.time.sleep(0.3)
+            raise MODULE.urllib.error.URLError("saturated")
+
+        original_fetch = MODULE.fetch_status_snapshot
+        original_gpu = MODULE.read_gpu_sample
+        try:
+            MODULE.fetch_status_snapshot = slow_status
+            MODULE.read_gpu_sample = lambda sampler=None: {"available": False, "reason": "test"}
+            with tempfile.TemporaryDirectory() as tmpdir:
+                sampler = MODULE.ResourceSampler(
+                    Path(tmpdir), interval_ms=50, mcp_url="http://127.0.0.1:9/mcp", mcp_timeout=1, pipeline_interval_ms=100
+                )
+                sampler.start()
+                MODULE.time.sleep(0.62)
+                summary = sampler.stop()
+                pipeline_lines = (Path(tmpdir) / "runtime-pipeline-samples.jsonl").read_text().splitlines()
+        finally:
+            MODULE.fetch_status_snapshot = original_fetch
+            MODULE.read_gpu_sample = original_gpu
+
+        self.assertGreaterEqual(summary["sample_count"], 10)
+        self.assertIn(len(pipeline_lines), {2, 3, 4})
+        first = json.loads(pipeline_lines[0])
+        self.assertFalse(first["pipeline_available"])
+        self.assertGreaterEqual(first["status_latency_ms"], 300)
+        self.assertEqual(summary["pipeline_interval_ms"], 100)
+        self.assertEqual(summary["pipeline_join"]["host_samples"], summary["sample_count"])
+
 
 if __name__ == "__main__":
     unittest.main()
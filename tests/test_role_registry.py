@@ -0,0 +1,79 @@
+import importlib.util
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+
+MODULE_PATH = Path(__file__).resolve().parents[1] / "scripts" / "lib" / "role_registry.py"
+SPEC = importlib.util.spec_from_file_location("role_registry", MODULE_PATH)
+MODULE = importlib.util.module_from_spec(SPEC)
+assert SPEC is not None and SPEC.loader is not None
+sys.modules[SPEC.name] = MODULE
+SPEC.loader.exec_module(MODULE)
+
+
+class RoleRegistryTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmp = tempfile.TemporaryDirectory()
+        base = Path(self.tmp.name)
+        self.project = base / "project"
+        self.proc = base / "proc"
+        self.registry = MODULE.RoleRegistry(self.project, "dev", proc_root=self.proc)
+
+    def tearDown(self) -> None:
+        self.tmp.cleanup()
+
+    def spawn(self, pid: int, start: int, argv0: str) -> None:
+        proc = self.proc / str(pid)
+        proc.mkdir(parents=True, exist_ok=True)
+        fields = ["S"] + ["0"] * 30
+        fields[19] = str(start)
+        (proc / "stat").write_text(f"{pid} (x) " + " ".join(fields))
+        (proc / "cmdline").write_bytes(argv0.encode() + b"\x00--flag\x00")
+
+    def kill(self, pid: int) -> None:
+        for entry in (self.proc / str(pid)).iterdir():
+            entry.unlink()
+        (self.proc / str(pid)).rmdir()
+
+    def write_pid(self, relative: str, pid: int) -> None:
+        path = self.project / ".axon-dev" / relative
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(f"{pid}\n")
+
+    def test_resolves_each_role_and_detects_restart_by_start_time(self) -> None:
+        self.spawn(100, 5000, "/repo/.axon/cargo-target/debug/axon-brain")
+        self.spawn(200, 6000, "/repo/bin/axon-indexer")
+        self.write_pid("run-brain/axon-brain.pid", 100)
+        self.write_pid("run-indexer/axon-indexer.pid", 200)
+
+        self.assertEqual(self.registry.resolve(), {"brain": 100, "indexer": 200})
+        self.assertEqual(self.registry.primary_pid(), 200)
+        self.assertEqual(self.registry.primary_pid("brain"), 100)
+
+        # Same pid recycled by a restarted indexer: the pid file is untouched
+        # but the start time moved, so the cached entry must not be trusted.
+        self.spawn(200, 9000, "/repo/bin/axon-indexer")
+        self.assertEqual(self.registry.resolve()["indexer"], 200)
+        self.assertEqual(self.registry.restarts["indexer"], 1)
+
+        self.spawn(200, 9500, "/usr/bin/sleep")
+        self.kill(100)
+        self.assertEqual(self.registry.resolve(), {"brain": None, "indexer": None})
+
+    def test_stale_pid_files_and_legacy_monolith(self) -> None:
+        self.spawn(300, 100, "/usr/bin/python3")
+        self.write_pid("run-brain/axon-brain.pid", 300)
+        self.write_pid("run-indexer/axon-indexer.pid", 999)
+        self.assertEqual(self.registry.resolve(), {"brain": None, "indexer": None})
+        self.assertIsNone(self.registry.primary_pid())
+
+        self.spawn(400, 100, "bin/axon-core")
+        self.write_pid("run/axon-core.pid", 400)
+        self.assertEqual(self.registry.resolve(), {"brain": None, "indexer": None, "core": 400})
+        self.assertEqual(self.registry.primary_pid("brain"), 400)
+
+
+if __name__ == "__main__":
+    unittest.main()
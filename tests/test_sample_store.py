@@ -0,0 +1,131 @@
+import importlib.util
+import json
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+
+MODULE_PATH = Path(__file__).resolve().parents[1] / "scripts" / "sample_store.py"
+SPEC = importlib.util.spec_from_file_location("sample_store", MODULE_PATH)
+MODULE = importlib.util.module_from_spec(SPEC)
+assert SPEC is not None and SPEC.loader is not None
+sys.modules[SPEC.name] = MODULE
+SPEC.loader.exec_module(MODULE)
+
+HAS_PYARROW = MODULE.pa is not None
+HAS_POLARS = importlib.util.find_spec("polars") is not None
+
+
+def _samples():
+    return [
+        {
+            "timestamp": "2026-01-01T00:00:00Z",
+            "elapsed_seconds": 0,
+            "pid": 41,
+            "proc": {"rss_anon_bytes": 1024, "cpu_percent": ""},
+            "gpu": {"available": False, "error": "nvml_unavailable"},
+            "cockpit": {"known": 10, "graph_projection_queue": {"total": 3, "queued": 2}},
+            "runtime_status": {"runtime_authority": {"lanes": {"graph": {"depth": 1}}}, "tags": ["a"]},
+        },
+        {
+            "timestamp": "2026-01-01T00:00:05Z",
+            "elapsed_seconds": 5,
+            "pid": 41,
+            "proc": {"rss_anon_bytes": 2048, "cpu_percent": 12.5},
+            "gpu": {"available": True, "memory_used_mb": 900},
+            "cockpit": {"known": 12.5, "graph_projection_queue": {"total": 1, "queued": 0}},
+            "late_key": {"x": 1},
+        },
+    ]
+
+
+class SampleStoreTests(unittest.TestCase):
+    def test_flatten_respects_depth_and_round_trips(self) -> None:
+        sample = _samples()[0]
+        flat = MODULE.flatten_sample(sample, max_depth=3)
+
+        self.assertEqual(flat["cockpit.graph_projection_queue.total"], 3)
+        self.assertEqual(flat["runtime_status.runtime_authority.lanes"], {"graph": {"depth": 1}})
+        self.assertEqual(MODULE.unflatten_sample(flat), sample)
+
+    def test_infer_kinds_widens_numbers_and_falls_back_to_json(self) -> None:
+        kinds = MODULE.infer_kinds(
+            [{"a": 1, "b": "x", "c": None, "d": True}, {"a": 2.5, "b": 3, "c": None, "d": False}]
+        )
+
+        self.assertEqual(kinds, {"a": "float", "b": "json", "c": "json", "d": "bool"})
+        self.assertTrue(MODULE.fits_kind(3, "float"))
+        self.assertFalse(MODULE.fits_kind("3", "int"))
+
+    def test_ndjson_writer_and_prefix_filtered_reader(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            stem = Path(tmpdir) / "samples"
+            with MODULE.open_sample_writer(stem, "ndjson", ensure_ascii=True) as writer:
+                for sample in _samples():
+                    writer.append(sample)
+            path = MODULE.resolve_samples_path(stem)
+            self.assertEqual(path.name, "samples.ndjson")
+            with path.open("a", encoding="utf-8") as handle:
+                handle.write("{truncated\n")
+
+            full = list(MODULE.iter_samples(path))
+            filtered = list(MODULE.iter_samples(path, prefixes=("pid", "cockpit.known")))
+            jsonl = MODULE.open_sample_writer(Path(tmpdir) / "runtime.jsonl", "ndjson")
+            jsonl.close()
+
+        self.assertEqual(full, _samples())
+        self.assertEqual(set(filtered[0]), {"pid", "cockpit"})
+        self.assertEqual(jsonl.path.name, "runtime.jsonl")
+
+    def test_columnar_formats_require_pyarrow_or_round_trip(self) -> None:
+        if not HAS_PYARROW:
+            with self.assertRaises(RuntimeError):
+                MODULE.ColumnarSampleWriter(Path("unused.arrow"))
+            return
+        for format in ("arrow", "parquet"):
+            with self.subTest(format=format), tempfile.TemporaryDirectory() as tmpdir:
+                path = Path(tmpdir) / f"samples.{format}"
+                with MODULE.ColumnarSampleWriter(path, format=format, rows_per_flush=1) as writer:
+                    for sample in _samples():
+                        writer.append(sample)
+                back = list(MODULE.iter_samples(path))
+                projected = list(MODULE.iter_samples(path, prefixes=("cockpit",)))
+
+                # The schema froze on the first row: the float "known" and the
+                # late key survive through the _extra column.
+                self.assertEqual(back[1]["cockpit"]["known"], 12.5)
+                self.assertEqual(back[1]["late_key"], {"x": 1})
+                self.assertEqual(back[1]["proc"]["cpu_percent"], 12.5)
+                self.assertEqual(back[0]["runtime_status"]["tags"], ["a"])
+                self.assertEqual(set(projected[0]), {"cockpit"})
+
+    @unittest.skipUnless(HAS_PYARROW and HAS_POLARS, "pyarrow/polars not installed")
+    def test_scan_samples_reads_arrow_writer_output(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "samples.arrow"
+            with MODULE.ColumnarSampleWriter(path, format="arrow", rows_per_flush=1) as writer:
+                for sample in _samples():
+                    writer.append(sample)
+            frame = MODULE.scan_samples(path).select("pid", "cockpit.known").collect()
+
+        self.assertEqual(frame.height, 2)
+        self.assertEqual(frame.get_column("pid").to_list(), [41, 41])
+        # The frozen int column keeps row 0; row 1's float went to _extra.
+        self.assertEqual(frame.get_column("cockpit.known").to_list(), [10, None])
+
+    @unittest.skipUnless(HAS_PYARROW, "pyarrow not installed")
+    def test_convert_ndjson_run_to_parquet(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            source = Path(tmpdir) / "samples.ndjson"
+            source.write_text("".join(json.dumps(sample) + "\n" for sample in _samples()))
+            target = MODULE.convert_samples(source, "parquet")
+            back = list(MODULE.iter_samples(target))
+
+        self.assertEqual(target.name, "samples.parquet")
+        self.assertEqual(back[0]["cockpit"]["graph_projection_queue"], {"total": 3, "queued": 2})
+        self.assertEqual(back[1]["gpu"], {"available": True, "memory_used_mb": 900})
+
+
+if __name__ == "__main__":
+    unittest.main()